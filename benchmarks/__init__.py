@@ -0,0 +1,10 @@
+"""Reproducible performance benchmarks for open-swarm.
+
+Run from the repository root (see docs/BENCHMARKS.md)::
+
+    python -m benchmarks run --quick --out bench.json
+    python -m benchmarks compare baseline.json bench.json
+
+Agent CLIs and the LLM are replaced by deterministic fakes
+(:mod:`benchmarks.fakes`), so runs need no network or credentials.
+"""
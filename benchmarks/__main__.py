@@ -0,0 +1,119 @@
+"""Command line: ``python -m benchmarks {list,run,compare}``.
+
+Usage::
+
+    python -m benchmarks list
+    python -m benchmarks run [--only PATTERN ...] [--quick] [--repeat N] [--out results.json]
+    python -m benchmarks compare baseline.json current.json [--threshold 0.15] [--json]
+
+``run`` prints progress to stderr and the result document to ``--out`` (or
+stdout). ``compare`` exits 1 when any benchmark regressed or errored.
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import logging
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks import suites  # noqa: F401 - registers the benchmarks
+from benchmarks.compare import (
+    DEFAULT_MIN_DELTA,
+    DEFAULT_THRESHOLD,
+    compare_results,
+    format_table,
+    has_failures,
+    load_results,
+    rows_to_json,
+)
+from benchmarks.harness import REGISTRY, run_suite
+
+
+def _select(patterns: list[str] | None) -> list[str]:
+    names = list(REGISTRY)
+    if not patterns:
+        return names
+    return [n for n in names if any(fnmatch.fnmatch(n, p) or n.startswith(p + ".") or n == p for p in patterns)]
+
+
+def _cmd_list(args: argparse.Namespace) -> int:
+    for name in _select(args.only):
+        bench = REGISTRY[name]
+        print(f"{name:<28} {bench.group:<10} {bench.description}")
+    return 0
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    names = _select(args.only)
+    if not names:
+        print("no benchmarks match", file=sys.stderr)
+        return 2
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)  # swarm logs would drown the progress lines
+    with tempfile.TemporaryDirectory(prefix="swarm-bench-") as tmp:
+        doc = run_suite(
+            names,
+            workdir=Path(tmp),
+            quick=args.quick,
+            repeat=args.repeat,
+            seed=args.seed,
+            progress=lambda line: print(line, file=sys.stderr, flush=True),
+        )
+    text = json.dumps(doc, indent=2, sort_keys=True) + "\n"
+    if args.out:
+        Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.out).write_text(text, encoding="utf-8")
+    else:
+        sys.stdout.write(text)
+    return 1 if any("error" in r for r in doc["results"].values()) else 0
+
+
+def _cmd_compare(args: argparse.Namespace) -> int:
+    rows = compare_results(
+        load_results(args.baseline),
+        load_results(args.current),
+        threshold=args.threshold,
+        min_delta=args.min_delta,
+    )
+    if args.json:
+        print(json.dumps(rows_to_json(rows), indent=2))
+    else:
+        print(format_table(rows))
+    return 1 if has_failures(rows) else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("list", help="list registered benchmarks")
+    p.add_argument("--only", nargs="*", help="names, groups or glob patterns")
+    p.set_defaults(func=_cmd_list)
+
+    p = sub.add_parser("run", help="run benchmarks and write a result file")
+    p.add_argument("--only", nargs="*", help="names, groups or glob patterns")
+    p.add_argument("--quick", action="store_true", help="a quarter of the iterations (smoke run)")
+    p.add_argument("--repeat", type=int, help="override iterations per benchmark")
+    p.add_argument("--seed", type=int, default=0, help="seed for the fakes (default 0)")
+    p.add_argument("--out", help="write results here instead of stdout")
+    p.add_argument("--verbose", action="store_true", help="keep swarm's log output")
+    p.set_defaults(func=_cmd_run)
+
+    p = sub.add_parser("compare", help="flag regressions against a saved baseline")
+    p.add_argument("baseline")
+    p.add_argument("current")
+    p.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD, help="relative slowdown that counts (default 0.15)")
+    p.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA, help="absolute slowdown in seconds that counts (default 0.001)")
+    p.add_argument("--json", action="store_true", help="machine-readable output")
+    p.set_defaults(func=_cmd_compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+"""Compare two result files and flag regressions.
+
+A benchmark regresses when its current median is slower than the baseline
+median by more than ``threshold`` (relative, default 15%) *and* by more than
+``min_delta`` seconds (absolute, default 1 ms) — the second guard keeps
+sub-millisecond cases from flapping on scheduler noise. The mirror-image test
+marks improvements. Benchmarks missing from either side, or that errored in
+the current run, are reported but only an error counts as a failure.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_THRESHOLD = 0.15
+DEFAULT_MIN_DELTA = 0.001
+
+STATUS_OK = "ok"
+STATUS_REGRESSION = "regression"
+STATUS_IMPROVEMENT = "improvement"
+STATUS_NEW = "new"
+STATUS_MISSING = "missing"
+STATUS_ERROR = "error"
+
+
+@dataclass
+class Comparison:
+    name: str
+    status: str
+    baseline: float | None = None
+    current: float | None = None
+    change: float | None = None  # (current - baseline) / baseline
+    detail: str = ""
+
+
+def load_results(path: str | Path) -> dict[str, Any]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(data, dict) or not isinstance(data.get("results"), dict):
+        raise ValueError(f"{path}: not a benchmark result file")
+    return data
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+    min_delta: float = DEFAULT_MIN_DELTA,
+) -> list[Comparison]:
+    """One :class:`Comparison` per benchmark in either document, sorted by name."""
+    base, cur = baseline["results"], current["results"]
+    rows: list[Comparison] = []
+    for name in sorted(set(base) | set(cur)):
+        b, c = base.get(name), cur.get(name)
+        if c is None:
+            rows.append(Comparison(name, STATUS_MISSING, baseline=(b or {}).get("median")))
+            continue
+        if "error" in c:
+            rows.append(Comparison(name, STATUS_ERROR, baseline=(b or {}).get("median"), detail=c["error"]))
+            continue
+        if b is None or "error" in b:
+            rows.append(Comparison(name, STATUS_NEW, current=c["median"]))
+            continue
+        bm, cm = float(b["median"]), float(c["median"])
+        delta = cm - bm
+        change = delta / bm if bm > 0 else 0.0
+        status = STATUS_OK
+        if abs(delta) > min_delta and abs(change) > threshold:
+            status = STATUS_REGRESSION if delta > 0 else STATUS_IMPROVEMENT
+        rows.append(Comparison(name, status, baseline=bm, current=cm, change=change))
+    return rows
+
+
+def has_failures(rows: list[Comparison]) -> bool:
+    return any(r.status in (STATUS_REGRESSION, STATUS_ERROR) for r in rows)
+
+
+def _ms(value: float | None) -> str:
+    return "-" if value is None else f"{value * 1000:.2f}"
+
+
+def format_table(rows: list[Comparison]) -> str:
+    width = max([len("benchmark"), *(len(r.name) for r in rows)])
+    lines = [f"{'benchmark':<{width}}  {'base ms':>10}  {'cur ms':>10}  {'change':>8}  status"]
+    for r in rows:
+        change = "-" if r.change is None else f"{r.change * 100:+.1f}%"
+        status = r.status.upper() if r.status in (STATUS_REGRESSION, STATUS_ERROR) else r.status
+        line = f"{r.name:<{width}}  {_ms(r.baseline):>10}  {_ms(r.current):>10}  {change:>8}  {status}"
+        lines.append(line + (f" ({r.detail})" if r.detail else ""))
+    return "\n".join(lines)
+
+
+def rows_to_json(rows: list[Comparison]) -> list[dict[str, Any]]:
+    return [asdict(r) for r in rows]
+
+
+__all__ = [
+    "DEFAULT_MIN_DELTA",
+    "DEFAULT_THRESHOLD",
+    "Comparison",
+    "compare_results",
+    "format_table",
+    "has_failures",
+    "load_results",
+    "rows_to_json",
+]
@@ -0,0 +1,247 @@
+"""Deterministic stand-ins for agent CLIs and an OpenAI-compatible model.
+
+Both are tuned through plain numbers (latency, output size, failure rate) and
+seeded, so the same benchmark run does the same work every time:
+
+* :class:`FakeCli` writes a small executable Python script that behaves like
+  an agent CLI: it reads the prompt from ``argv[1]``, waits, then prints
+  ``output_bytes`` of text in ``chunks`` flushed pieces (so streaming
+  consumers see incremental output) or exits non-zero. Whether a call fails is
+  derived from ``seed`` and the prompt, never from wall-clock randomness.
+* :class:`FakeLLMServer` is a threaded stdlib HTTP server speaking enough of
+  the OpenAI chat-completions API (``/v1/models``, ``/v1/chat/completions``
+  with and without ``stream``) for ``openai.AsyncOpenAI`` and the agents SDK.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+_WORDS = [
+    "token", "bucket", "rate", "limit", "rollback", "monitoring", "latency", "budget",
+    "queue", "worker", "retry", "backoff", "jitter", "cache", "shard", "replica",
+    "quorum", "deadline", "stream",
+]
+
+
+def _rng(seed: int, *parts: Any) -> random.Random:
+    digest = hashlib.sha256(":".join(map(str, (seed, *parts))).encode()).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def fake_text(seed: int, prompt: str, size: int) -> str:
+    """``size`` characters of deterministic filler words for ``prompt``."""
+    rng = _rng(seed, prompt)
+    out: list[str] = []
+    length = 0
+    while length < size:
+        word = rng.choice(_WORDS)
+        out.append(word)
+        length += len(word) + 1
+    return " ".join(out)[:size]
+
+
+_CLI_TEMPLATE = '''\
+#!{python}
+"""Fake agent CLI generated by benchmarks.fakes.FakeCli."""
+import hashlib, random, sys, time
+
+SEED, LATENCY, JITTER, SIZE, CHUNKS, FAILURE_RATE = {seed!r}, {latency!r}, {jitter!r}, {size!r}, {chunks!r}, {failure_rate!r}
+WORDS = {words!r}
+
+prompt = sys.argv[1] if len(sys.argv) > 1 else sys.stdin.read()
+digest = hashlib.sha256(f"{{SEED}}:{{prompt}}".encode()).digest()
+rng = random.Random(int.from_bytes(digest[:8], "big"))
+if rng.random() < FAILURE_RATE:
+    print("fake cli: simulated failure", file=sys.stderr)
+    sys.exit(3)
+delay = LATENCY + (rng.uniform(-JITTER, JITTER) if JITTER else 0.0)
+words, length = [], 0
+while length < SIZE:
+    word = rng.choice(WORDS)
+    words.append(word)
+    length += len(word) + 1
+text = " ".join(words)[:SIZE]
+step = max(1, -(-len(text) // CHUNKS))
+pieces = [text[i:i + step] for i in range(0, len(text), step)] or [""]
+for piece in pieces:
+    time.sleep(max(0.0, delay) / len(pieces))
+    sys.stdout.write(piece)
+    sys.stdout.flush()
+sys.stdout.write("\\n")
+'''
+
+
+@dataclass
+class FakeCli:
+    """Parameters of one fake agent CLI (see module docstring)."""
+
+    name: str = "fake"
+    latency: float = 0.05
+    jitter: float = 0.0
+    output_bytes: int = 512
+    chunks: int = 4
+    failure_rate: float = 0.0
+    seed: int = 0
+
+    def write(self, directory: str | Path) -> Path:
+        """Write the executable script into ``directory``; returns its path."""
+        path = Path(directory) / f"fake_cli_{self.name}"
+        path.write_text(
+            _CLI_TEMPLATE.format(
+                python=sys.executable,
+                seed=self.seed,
+                latency=self.latency,
+                jitter=self.jitter,
+                size=self.output_bytes,
+                chunks=max(1, self.chunks),
+                failure_rate=self.failure_rate,
+                words=_WORDS,
+            ),
+            encoding="utf-8",
+        )
+        path.chmod(0o755)
+        return path
+
+    def agent_config(self, directory: str | Path) -> dict[str, Any]:
+        """A ``cli_agents`` entry running this fake (writes the script)."""
+        return {"cmd": [str(self.write(directory)), "{prompt}"], "parse": "text"}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: FakeLLMServer._Server
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - stdlib signature
+        pass
+
+    def _json(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802 - stdlib naming
+        if self.path.rstrip("/").endswith("/models"):
+            self._json(200, {"object": "list", "data": [{"id": self.server.fake.model, "object": "model"}]})
+        else:
+            self._json(404, {"error": {"message": "not found"}})
+
+    def do_POST(self) -> None:  # noqa: N802 - stdlib naming
+        fake = self.server.fake
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._json(400, {"error": {"message": "invalid json"}})
+            return
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._json(404, {"error": {"message": "not found"}})
+            return
+        fake.requests += 1
+        messages = request.get("messages") or []
+        prompt = json.dumps(messages[-1:], sort_keys=True)
+        rng = _rng(fake.seed, prompt, "llm")
+        time.sleep(fake.ttft)
+        if rng.random() < fake.failure_rate:
+            self._json(500, {"error": {"message": "fake llm: simulated failure"}})
+            return
+        text = fake_text(fake.seed, prompt, fake.output_chars)
+        tokens = text.split(" ")
+        model = request.get("model") or fake.model
+        created = int(time.time())
+        cid = f"chatcmpl-fake{fake.requests}"
+        usage = {"prompt_tokens": len(prompt) // 4, "completion_tokens": len(tokens), "total_tokens": len(prompt) // 4 + len(tokens)}
+        if not request.get("stream"):
+            time.sleep(fake.token_delay * len(tokens))
+            self._json(200, {
+                "id": cid, "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": usage,
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+
+        def _send(delta: dict[str, Any], finish: str | None = None, **extra: Any) -> None:
+            chunk = {
+                "id": cid, "object": "chat.completion.chunk", "created": created, "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish}], **extra,
+            }
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+
+        _send({"role": "assistant", "content": ""})
+        for i, token in enumerate(tokens):
+            if i:
+                time.sleep(fake.token_delay)
+            _send({"content": token if i == 0 else " " + token})
+        _send({}, "stop", usage=usage)
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+class FakeLLMServer:
+    """OpenAI-compatible chat-completions server on ``127.0.0.1`` (context manager)."""
+
+    class _Server(ThreadingHTTPServer):
+        daemon_threads = True
+        fake: FakeLLMServer
+
+    def __init__(
+        self,
+        *,
+        model: str = "fake-model",
+        ttft: float = 0.02,
+        token_delay: float = 0.001,
+        output_chars: int = 400,
+        failure_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.model = model
+        self.ttft = ttft
+        self.token_delay = token_delay
+        self.output_chars = output_chars
+        self.failure_rate = failure_rate
+        self.seed = seed
+        self.requests = 0
+        self._server: FakeLLMServer._Server | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        assert self._server is not None, "server not started"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> FakeLLMServer:
+        self._server = self._Server(("127.0.0.1", 0), _Handler)
+        self._server.fake = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-llm", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> FakeLLMServer:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
@@ -0,0 +1,222 @@
+"""Benchmark registry, timing and the result-file format.
+
+A benchmark is a function registered with :func:`benchmark` that receives a
+:class:`BenchContext` and returns a :class:`Case`: a zero-argument callable
+(sync or ``async``) timed once per iteration, plus optional ``setup`` /
+``teardown`` hooks that run outside the timed region. A case may return a
+dict of extra per-iteration metrics (for example time-to-first-byte); those
+are summarised with the same statistics as the wall time.
+
+Results are plain JSON (:data:`RESULT_SCHEMA`)::
+
+    {"schema": 1, "created": ..., "environment": {...}, "params": {...},
+     "results": {"<name>": {"group", "unit", "n", "min", "median", "mean",
+                            "p95", "max", "stdev", "metrics": {...}}}}
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import io
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+RESULT_SCHEMA = 1
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+
+@dataclass
+class BenchContext:
+    """Shared state handed to every benchmark factory."""
+
+    workdir: Path
+    quick: bool = False
+    seed: int = 0
+    # Lazily-started shared fixtures (Django, fake LLM server), keyed by name.
+    fixtures: dict[str, Any] = field(default_factory=dict)
+    _closers: list[Callable[[], Any]] = field(default_factory=list)
+
+    def on_close(self, fn: Callable[[], Any]) -> None:
+        self._closers.append(fn)
+
+    def close(self) -> None:
+        while self._closers:
+            with contextlib.suppress(Exception):
+                self._closers.pop()()
+
+
+@dataclass
+class Case:
+    """What to time: ``run`` once per iteration, hooks outside the timing."""
+
+    run: Callable[[], Any]
+    setup: Callable[[], Any] | None = None
+    teardown: Callable[[], Any] | None = None
+    iterations: int | None = None
+
+
+@dataclass
+class Benchmark:
+    name: str
+    group: str
+    factory: Callable[[BenchContext], Case]
+    description: str = ""
+    iterations: int = 20
+    warmup: int = 2
+
+
+REGISTRY: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, *, group: str, iterations: int = 20, warmup: int = 2):
+    """Register ``factory(ctx) -> Case`` under ``name`` (first docstring line = description)."""
+
+    def decorator(factory: Callable[[BenchContext], Case]) -> Callable[[BenchContext], Case]:
+        doc = (inspect.getdoc(factory) or "").splitlines()
+        REGISTRY[name] = Benchmark(
+            name=name,
+            group=group,
+            factory=factory,
+            description=doc[0] if doc else "",
+            iterations=iterations,
+            warmup=warmup,
+        )
+        return factory
+
+    return decorator
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """min/median/mean/p95/max/stdev of ``samples`` (nearest-rank p95)."""
+    ordered = sorted(samples)
+    n = len(ordered)
+    return {
+        "n": n,
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "mean": statistics.fmean(ordered),
+        "p95": ordered[max(0, math.ceil(0.95 * n) - 1)],
+        "max": ordered[-1],
+        "stdev": statistics.stdev(ordered) if n > 1 else 0.0,
+    }
+
+
+def _call(fn: Callable[[], Any] | None, loop: asyncio.AbstractEventLoop) -> Any:
+    if fn is None:
+        return None
+    out = fn()
+    if inspect.isawaitable(out):
+        out = loop.run_until_complete(out)
+    return out
+
+
+def run_benchmark(bench: Benchmark, ctx: BenchContext, loop: asyncio.AbstractEventLoop, *, repeat: int | None = None) -> dict[str, Any]:
+    """Time one benchmark; returns its result entry."""
+    case = bench.factory(ctx)
+    iterations = repeat or case.iterations or bench.iterations
+    if ctx.quick:
+        iterations = max(3, iterations // 4)
+    times: list[float] = []
+    metrics: dict[str, list[float]] = {}
+    _call(case.setup, loop)
+    try:
+        for i in range(bench.warmup + iterations):
+            start = time.perf_counter()
+            out = case.run()
+            if inspect.isawaitable(out):
+                out = loop.run_until_complete(out)
+            elapsed = time.perf_counter() - start
+            if i < bench.warmup:
+                continue
+            times.append(elapsed)
+            for key, value in (out or {}).items() if isinstance(out, dict) else ():
+                metrics.setdefault(key, []).append(float(value))
+    finally:
+        _call(case.teardown, loop)
+    return {
+        "group": bench.group,
+        "unit": "s",
+        **summarize(times),
+        "metrics": {key: summarize(values) for key, values in metrics.items()},
+    }
+
+
+def _git_revision() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=REPO_ROOT, capture_output=True, text=True, timeout=5, check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "git": _git_revision(),
+    }
+
+
+def run_suite(
+    names: list[str],
+    *,
+    workdir: Path,
+    quick: bool = False,
+    repeat: int | None = None,
+    seed: int = 0,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """Run the named benchmarks in order and return the result document.
+
+    Blueprint output printed to stdout while a case runs is discarded so the
+    caller's stdout stays machine-readable. A benchmark that raises is
+    recorded as ``{"error": ...}`` and the run continues.
+    """
+    ctx = BenchContext(workdir=workdir, quick=quick, seed=seed)
+    loop = asyncio.new_event_loop()
+    results: dict[str, Any] = {}
+    try:
+        for name in names:
+            bench = REGISTRY[name]
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    results[name] = run_benchmark(bench, ctx, loop, repeat=repeat)
+            except Exception as e:  # noqa: BLE001 - keep going, report per benchmark
+                results[name] = {"group": bench.group, "error": f"{type(e).__name__}: {e}"}
+            if progress:
+                entry = results[name]
+                progress(f"{name}: " + (entry["error"] if "error" in entry else f"median {entry['median'] * 1000:.2f} ms (n={entry['n']})"))
+    finally:
+        ctx.close()
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.close()
+    return {
+        "schema": RESULT_SCHEMA,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "environment": environment(),
+        "params": {"quick": quick, "repeat": repeat, "seed": seed},
+        "results": results,
+    }
+
+
+def ensure_src_on_path() -> None:
+    src = str(REPO_ROOT / "src")
+    if src not in sys.path:
+        sys.path.insert(0, src)
@@ -0,0 +1,56 @@
+"""Frozen copies of implementations that have since been optimized.
+
+Benchmarks run the current code and these side by side on the same input and
+fail if the outputs differ. A speed-up therefore cannot silently change
+behaviour.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+
+def is_sensitive_key(key: str, keys: set[str]) -> bool:
+    """``swarm.utils.redact.is_sensitive_key`` before the compiled matcher."""
+    kl = key.lower().replace("-", "_")
+    if kl in keys:
+        return True
+    parts = [p for p in kl.split("_") if p]
+    if not parts:
+        return False
+    for sk in keys:
+        sk_parts = [p for p in sk.split("_") if p]
+        if not sk_parts:
+            continue
+        n = len(sk_parts)
+        for i in range(len(parts) - n + 1):
+            if parts[i : i + n] == sk_parts:
+                return True
+    return False
+
+
+def redact_sensitive_data(data: Any, keys: set[str], mask: str = "[REDACTED]") -> Any:
+    """Recursive, copy-everything ``redact_sensitive_data`` (``reveal_chars=0``)."""
+    from swarm.utils.redact import _COMPILED_SENSITIVE_PATTERNS, redact_uri_credentials
+
+    def text(value: str) -> str:
+        for pattern in _COMPILED_SENSITIVE_PATTERNS:
+            value = pattern.sub(mask, value)
+        return redact_uri_credentials(value, mask=mask)
+
+    def walk(value: Any) -> Any:
+        if isinstance(value, dict):
+            out = {}
+            for k, v in value.items():
+                if isinstance(k, str) and is_sensitive_key(k, keys):
+                    out[k] = mask
+                elif isinstance(v, dict | list):
+                    out[k] = walk(v)
+                elif isinstance(v, str):
+                    out[k] = text(v)
+                else:
+                    out[k] = v
+            return out
+        return [walk(v) if isinstance(v, dict | list) else text(v) if isinstance(v, str) else v for v in value]
+
+    return walk(data) if isinstance(data, dict | list) else data
@@ -0,0 +1,546 @@
+"""The registered benchmarks.
+
+Every case runs against the fakes in :mod:`benchmarks.fakes` — no network, no
+API keys, no real agent CLIs — so results only move when swarm's own code
+does. Groups:
+
+* ``discovery`` / ``store`` — blueprint discovery and ``responses_store``
+  save/load/list/delete on a scratch directory.
+* ``fanout`` — MoA participant collection and CLI consensus rounds over fake
+  seats/CLIs, plus a single fake CLI call as the subprocess baseline.
+* ``api`` — the Django app in-process via ``django.test.AsyncClient``:
+  streamed chat completions (time to first byte), a chat completion through
+  an LLM-backed blueprint, ``/v1/responses`` background submit→poll and a
+  hybrid-team response.
+* ``profiler`` — what the on-demand sampling profiler costs the code it
+  samples.
+* ``redact`` — ``redact_sensitive_data`` over large nested payloads, checked
+  against the frozen pre-optimization copy in :mod:`benchmarks.reference`, and
+  :class:`~swarm.utils.redact.StreamRedactor` throughput in MB/s.
+* ``logging`` — event-loop stalls from DEBUG logging on the hot paths, with
+  synchronous handlers and eager f-strings versus the queue pipeline, lazy
+  formatting and rate limits of :mod:`swarm.utils.logger_setup`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+import uuid
+from typing import Any
+
+from benchmarks.fakes import FakeCli, FakeLLMServer
+from benchmarks.harness import (
+    REPO_ROOT,
+    BenchContext,
+    Case,
+    benchmark,
+    ensure_src_on_path,
+)
+
+ensure_src_on_path()
+
+PANEL = ("alpha", "beta", "gamma", "delta")
+TERMINAL = ("completed", "failed", "cancelled")
+
+
+def _fake_llm(ctx: BenchContext) -> FakeLLMServer:
+    if "llm" not in ctx.fixtures:
+        server = FakeLLMServer(ttft=0.01, token_delay=0.0005, output_chars=400, seed=ctx.seed).start()
+        ctx.on_close(server.stop)
+        ctx.fixtures["llm"] = server
+    return ctx.fixtures["llm"]
+
+
+def _swarm_config(ctx: BenchContext) -> dict[str, Any]:
+    """Blueprint config wiring every model and CLI to the fakes."""
+    clis = ctx.workdir / "clis"
+    clis.mkdir(parents=True, exist_ok=True)
+    llm = _fake_llm(ctx)
+    agents = {
+        name: FakeCli(name=name, latency=0.02, output_bytes=1024, chunks=8, seed=ctx.seed).agent_config(clis)
+        for name in ("fake", "grok", *PANEL)
+    }
+    return {
+        "llm": {"default": {"provider": "openai", "model": llm.model, "base_url": llm.base_url, "api_key": "sk-bench"}},
+        "cli_agents": agents,
+        "cli_fusion": {"default_cli": "fake"},
+        "hybrid_team": {"grok": "grok", "panel": list(PANEL[:2])},
+    }
+
+
+def _config(ctx: BenchContext) -> dict[str, Any]:
+    if "config" not in ctx.fixtures:
+        ctx.fixtures["config"] = _swarm_config(ctx)
+    return ctx.fixtures["config"]
+
+
+def _django(ctx: BenchContext):
+    """Configure Django once per process (scratch SQLite DB + responses dir)."""
+    if "django" in ctx.fixtures:
+        return ctx.fixtures["django"]
+    root = ctx.workdir / "django"
+    root.mkdir(parents=True, exist_ok=True)
+    os.environ.update(
+        DJANGO_SETTINGS_MODULE="swarm.settings",
+        DJANGO_DEBUG="true",
+        DJANGO_DB_NAME=str(root / "bench.sqlite3"),
+        DJANGO_ALLOW_ASYNC_UNSAFE="true",
+        SWARM_RESPONSES_DIR=str(root / "responses"),
+        OPENAI_API_KEY=os.environ.get("OPENAI_API_KEY") or "sk-bench",
+        # The API rate limits would otherwise answer 429 partway through a run.
+        SWARM_THROTTLE_ANON="1000000/min",
+        SWARM_THROTTLE_USER="1000000/min",
+    )
+    os.environ.pop("DATABASE_URL", None)
+    # Test mode short-circuits the background worker we want to measure.
+    os.environ.pop("SWARM_TEST_MODE", None)
+
+    import django
+    from django.apps import apps
+    from django.core.management import call_command
+    from django.test.utils import setup_test_environment
+
+    django.setup()
+    call_command("migrate", verbosity=0)
+    setup_test_environment()
+    apps.get_app_config("swarm").config = _config(ctx)
+
+    from django.test import AsyncClient
+
+    client = AsyncClient()
+    ctx.fixtures["django"] = client
+    return client
+
+
+def _post_json(client, path: str, payload: dict[str, Any], **extra: Any):
+    return client.post(path, data=json.dumps(payload), content_type="application/json", **extra)
+
+
+def _checked(response, *ok: int) -> Any:
+    if response.status_code not in ok:
+        raise RuntimeError(f"HTTP {response.status_code}: {response.content[:200]!r}")
+    return response
+
+
+@benchmark("discovery.blueprints", group="discovery", iterations=10)
+def bench_discovery(ctx: BenchContext) -> Case:
+    """Discover every bundled blueprint (uncached)."""
+    _django(ctx)  # some blueprints configure Django at import time
+    from swarm.core.blueprint_discovery import discover_blueprints
+
+    root = str(REPO_ROOT / "src" / "swarm" / "blueprints")
+
+    def run() -> dict[str, float]:
+        return {"blueprints": len(discover_blueprints(root))}
+
+    return Case(run)
+
+
+@benchmark("store.responses_ops", group="store", iterations=10)
+def bench_responses_store(ctx: BenchContext) -> Case:
+    """Save, load, list and delete 50 stored responses."""
+    from swarm.core import responses_store
+
+    base = ctx.workdir / "store"
+    count = 50
+    body = "x" * 2048
+
+    def run() -> None:
+        ids = [f"resp_bench{uuid.uuid4().hex}" for _ in range(count)]
+        for rid in ids:
+            responses_store.save(
+                {"id": rid, "object": "response", "response": {"id": rid, "status": "completed", "output_text": body}},
+                base_dir=base,
+            )
+        for rid in ids:
+            responses_store.load(rid, base_dir=base)
+        responses_store.list_summaries(limit=count, base_dir=base)
+        for rid in ids:
+            responses_store.delete(rid, base_dir=base)
+
+    return Case(run)
+
+
+@benchmark("fanout.moa_collect", group="fanout", iterations=20)
+def bench_moa_fanout(_ctx: BenchContext) -> Case:
+    """Collect opinions from 8 fake MoA seats (20 ms each, concurrent)."""
+    from swarm.core.moa.backends import FakeParticipantBackend
+    from swarm.core.moa.orchestrator import MoAOrchestrator
+
+    seats = [f"seat{i}" for i in range(8)]
+    answer = json.dumps({"claim": "use a token bucket", "confidence": 0.8})
+    backend = FakeParticipantBackend(dict.fromkeys(seats, answer), delays=dict.fromkeys(seats, 0.02))
+    orchestrator = MoAOrchestrator(backend)
+
+    async def run() -> None:
+        opinions = await orchestrator.collect_opinions("How should we rate limit?", seats)
+        if not all(o.ok for o in opinions):
+            raise RuntimeError("fake MoA seat failed")
+
+    return Case(run)
+
+
+@benchmark("fanout.cli_single", group="fanout", iterations=20)
+def bench_cli_single(ctx: BenchContext) -> Case:
+    """One fake CLI call (20 ms, 1 KiB, 8 chunks) through CliAdapter."""
+    from swarm.core.cli_adapter import CliAdapterRegistry
+
+    adapter = CliAdapterRegistry.from_config(_config(ctx)).get("fake")
+
+    async def run() -> None:
+        result = await adapter.run("bench prompt")
+        if not result.ok:
+            raise RuntimeError(result.error or "fake CLI failed")
+
+    return Case(run)
+
+
+@benchmark("fanout.consensus", group="fanout", iterations=10)
+def bench_consensus(ctx: BenchContext) -> Case:
+    """Consensus round: 4 fake CLI panelists plus a fake judge."""
+    from swarm.core.cli_adapter import CliAdapterRegistry
+    from swarm.core.consensus import run_consensus
+
+    registry = CliAdapterRegistry.from_config(_config(ctx))
+    panel = [registry.get(name) for name in PANEL]
+    judge = registry.get("grok")
+
+    async def run() -> None:
+        result = await run_consensus("Pick a rate limiter", panel, judge)
+        if not result.ok_results:
+            raise RuntimeError("every fake panelist failed")
+
+    return Case(run)
+
+
+@benchmark("api.chat_stream_cli", group="api", iterations=10)
+def bench_chat_stream(ctx: BenchContext) -> Case:
+    """Streamed /v1/chat/completions via the cli_agent blueprint (records ttfb)."""
+    client = _django(ctx)
+    payload = {"model": "cli_agent", "messages": [{"role": "user", "content": "stream please"}], "stream": True}
+
+    async def run() -> dict[str, float]:
+        start = time.perf_counter()
+        response = _checked(await _post_json(client, "/v1/chat/completions", payload), 200)
+        ttfb = None
+        chunks = 0
+        async for _ in response.streaming_content:
+            if ttfb is None:
+                ttfb = time.perf_counter() - start
+            chunks += 1
+        return {"ttfb": ttfb if ttfb is not None else time.perf_counter() - start, "chunks": chunks}
+
+    return Case(run)
+
+
+@benchmark("api.chat_llm", group="api", iterations=10)
+def bench_chat_llm(ctx: BenchContext) -> Case:
+    """Non-streamed /v1/chat/completions via chatbot against the fake LLM."""
+    client = _django(ctx)
+    payload = {"model": "chatbot", "messages": [{"role": "user", "content": "hello"}], "stream": False}
+
+    async def run() -> None:
+        _checked(await _post_json(client, "/v1/chat/completions", payload), 200)
+
+    return Case(run)
+
+
+async def _submit_and_poll(client, payload: dict[str, Any]) -> dict[str, float]:
+    start = time.perf_counter()
+    response = _checked(await _post_json(client, "/v1/responses", payload), 200, 202)
+    accepted = time.perf_counter() - start
+    body = response.json()
+    polls = 0
+    while body.get("status") not in TERMINAL:
+        await asyncio.sleep(0.01)
+        polls += 1
+        body = _checked(await client.get(f"/v1/responses/{body['id']}"), 200).json()
+        if time.perf_counter() - start > 60:
+            raise TimeoutError(f"response {body.get('id')} still {body.get('status')} after 60s")
+    if body["status"] != "completed":
+        raise RuntimeError(f"response ended {body['status']}: {body.get('error')}")
+    return {"accepted": accepted, "polls": polls}
+
+
+@benchmark("api.responses_background", group="api", iterations=10)
+def bench_responses_background(ctx: BenchContext) -> Case:
+    """POST /v1/responses with background:true, then poll until completed."""
+    client = _django(ctx)
+    payload = {"model": "cli_agent", "input": "background work", "background": True}
+    return Case(lambda: _submit_and_poll(client, payload))
+
+
+@benchmark("api.responses_hybrid", group="api", iterations=5)
+def bench_responses_hybrid(ctx: BenchContext) -> Case:
+    """hybrid_team /v1/responses (fake LLM lead, fake CLI panel), submit→poll."""
+    client = _django(ctx)
+    payload = {"model": "hybrid_team", "input": "design a rate limiter", "max_wait_seconds": 0}
+    return Case(lambda: _submit_and_poll(client, payload))
+
+
+def _encode_chunks(seconds: float) -> float:
+    """Encode SSE-sized chat chunks for ``seconds``; returns chunks per second."""
+    chunk = {"id": "chatcmpl-bench", "object": "chat.completion.chunk", "model": "cli_agent",
+             "choices": [{"index": 0, "delta": {"role": "assistant", "content": "token " * 8}, "finish_reason": None}]}
+    count = 0
+    start = time.perf_counter()
+    while (elapsed := time.perf_counter() - start) < seconds:
+        for _ in range(50):
+            json.dumps(chunk)
+        count += 50
+    return count / elapsed
+
+
+@benchmark("profiler.overhead", group="profiler", iterations=10)
+def bench_profiler_overhead(_ctx: BenchContext) -> Case:
+    """Chunk-encoding throughput with and without the sampling profiler (records slowdown)."""
+    import threading
+
+    from swarm.core import profiler
+
+    window = 0.2
+
+    def run() -> dict[str, float]:
+        baseline = _encode_chunks(window)
+        profiles: list[profiler.Profile] = []
+        sampler = threading.Thread(target=lambda: profiles.append(profiler.sample(window)))
+        sampler.start()
+        profiled = _encode_chunks(window)
+        sampler.join()
+        return {
+            "slowdown": baseline / profiled - 1,
+            "sampler_cpu_share": profiles[0].overhead,
+            "samples": profiles[0].samples,
+        }
+
+    return Case(run)
+
+
+def _nested_payload(records: int, seed: int) -> dict[str, Any]:
+    """Config/log-shaped payload: env-style keys, nested dicts and lists, a few secrets."""
+    import random
+
+    rng = random.Random(seed)
+    prefixes = ["OPENAI", "GITHUB", "AWS", "SWARM", "DJANGO", "REDIS", "app", "svc"]
+    leaves = ["name", "base_url", "timeout", "api_key", "token", "region", "access_key_id", "model",
+              "database_url", "tokenizer", "retries", "client_secret", "description", "mytokenized"]
+    texts = ["plain text", "Bearer abc.def-123", "postgres://app:hunter2@db/app", "sk-abcdef123456",
+             "https://example.com/path", "password = letmein", "no secrets here at all"]
+
+    def record(i: int) -> dict[str, Any]:
+        env = {f"{rng.choice(prefixes)}_{rng.choice(leaves).upper()}": rng.choice(texts) for _ in range(6)}
+        return {
+            "id": i,
+            "env": env,
+            "settings": {rng.choice(leaves): rng.choice(texts + [i, None, True]) for _ in range(8)},
+            "history": [{"role": "user", "content": rng.choice(texts)} for _ in range(4)],
+            "tags": [rng.choice(texts) for _ in range(3)],
+        }
+
+    return {"records": [record(i) for i in range(records)], "meta": {"count": records}}
+
+
+@benchmark("redact.nested_payload", group="redact", iterations=10)
+def bench_redact_nested(ctx: BenchContext) -> Case:
+    """redact_sensitive_data over ~2k nested records; fails if output differs from the reference."""
+    from benchmarks import reference
+    from swarm.utils.redact import _DEFAULT_SENSITIVE_KEYS_LOWER, redact_sensitive_data
+
+    payload = _nested_payload(500 if ctx.quick else 2000, ctx.seed)
+    keys = set(_DEFAULT_SENSITIVE_KEYS_LOWER)
+
+    def run() -> dict[str, float]:
+        start = time.perf_counter()
+        expected = reference.redact_sensitive_data(payload, keys)
+        reference_s = time.perf_counter() - start
+        start = time.perf_counter()
+        actual = redact_sensitive_data(payload)
+        current_s = time.perf_counter() - start
+        if actual != expected:
+            raise RuntimeError("redact_sensitive_data output differs from the reference implementation")
+        return {"current_s": current_s, "reference_s": reference_s, "speedup": reference_s / current_s}
+
+    return Case(run)
+
+
+def _stream_text(size: int, seed: int) -> str:
+    """Model/CLI-output-shaped text of about ``size`` characters with some secrets."""
+    import random
+
+    rng = random.Random(seed)
+    words = ["the", "swarm", "agent", "returned", "result", "for", "your", "request", "ok",
+             "function", "def", "return", "None", "=", "(x)", "\n", "  ", "config:", "value"]
+    secrets = ["sk-abcDEF1234567890", "Bearer abc.def-123", "postgres://app:hunter2@db/app",
+               "password = letmein", "ssh-rsa AAAAB3NzaC1yc2EAAAADAQAB=="]
+    parts: list[str] = []
+    length = 0
+    while length < size:
+        part = rng.choice(secrets) if rng.random() < 0.01 else rng.choice(words)
+        parts.append(part)
+        length += len(part) + 1
+    return " ".join(parts)
+
+
+@benchmark("redact.stream", group="redact", iterations=5)
+def bench_redact_stream(ctx: BenchContext) -> Case:
+    """StreamRedactor MB/s for token-sized and 4 KiB deltas vs redact_text on the whole text."""
+    from swarm.utils.redact import StreamRedactor, redact_text
+
+    text = _stream_text(256_000 if ctx.quick else 1_000_000, ctx.seed)
+    megabytes = len(text.encode("utf-8")) / 1e6
+
+    def stream(step: int) -> float:
+        redactor = StreamRedactor()
+        start = time.perf_counter()
+        out = [redactor.feed(text[i:i + step]) for i in range(0, len(text), step)]
+        out.append(redactor.flush())
+        elapsed = time.perf_counter() - start
+        if "".join(out) != expected:
+            raise RuntimeError(f"StreamRedactor output ({step}-char deltas) differs from redact_text")
+        return megabytes / elapsed
+
+    expected = redact_text(text)
+
+    def run() -> dict[str, float]:
+        start = time.perf_counter()
+        redact_text(text)
+        whole = megabytes / (time.perf_counter() - start)
+        return {"delta16_mb_s": stream(16), "chunk4k_mb_s": stream(4096), "whole_mb_s": whole}
+
+    return Case(run)
+
+
+class _SlowSink:
+    """File-backed stream whose ``flush`` takes ``delay`` seconds, like a busy terminal or pipe."""
+
+    def __init__(self, path, delay: float):
+        self._file = open(path, "a", encoding="utf-8")  # noqa: SIM115 - closed by close()
+        self.delay = delay
+        self.writes = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        return self._file.write(text)
+
+    def flush(self) -> None:
+        self._file.flush()
+        time.sleep(self.delay)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def _log_workload(log, lazy: bool, messages: list[dict[str, Any]], chunks: int) -> dict[str, float]:
+    """Heartbeat lateness while a truncation pass and a chunk stream log at DEBUG."""
+    lateness: list[float] = []
+    done = False
+
+    async def heartbeat() -> None:
+        tick = 0.001
+        while not done:
+            start = time.perf_counter()
+            await asyncio.sleep(tick)
+            lateness.append(time.perf_counter() - start - tick)
+
+    beat = asyncio.create_task(heartbeat())
+    await asyncio.sleep(0.005)
+    spent = 0.0
+    for _ in range(3):
+        # Context truncation: one line per message, no await in between.
+        start = time.perf_counter()
+        for i, msg in enumerate(messages):
+            if lazy:
+                log.debug("Msg %d (%s): tokens=%d, action=%s", i, msg["role"], msg["tokens"], "KEEP")
+            else:
+                log.debug(f"Msg {i} ({msg['role']}): tokens={msg['tokens']}, action=KEEP, msg={msg}")
+        spent += time.perf_counter() - start
+        await asyncio.sleep(0)
+        # Streaming: one line per chunk, yielding to the loop after each.
+        for i in range(chunks):
+            start = time.perf_counter()
+            if lazy:
+                log.debug("Streaming chunk %d: %s", i, "delta text")
+            else:
+                log.debug(f"Streaming chunk {i}: {messages[i % len(messages)]}")
+            spent += time.perf_counter() - start
+            await asyncio.sleep(0)
+    done = True
+    await beat
+    lateness.sort()
+    return {
+        "p99_ms": lateness[int(len(lateness) * 0.99)] * 1000,
+        "max_ms": lateness[-1] * 1000,
+        "loop_log_s": spent,
+    }
+
+
+@benchmark("logging.event_loop_stall", group="logging", iterations=5)
+def bench_logging_stall(ctx: BenchContext) -> Case:
+    """Heartbeat lateness (p99/max ms) at DEBUG: sync + f-strings, queued + lazy, and queued + rate limit."""
+    import logging
+
+    from swarm.utils import logger_setup
+
+    messages = [{"role": "user", "content": "word " * 40, "tokens": 60 + i} for i in range(200)]
+    chunks = 100 if ctx.quick else 300
+    delay = 0.0002
+
+    def scenario(name: str, lazy: bool, limit: bool) -> tuple[dict[str, float], int]:
+        sink = _SlowSink(ctx.workdir / f"{name}.log", delay)
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(logging.Formatter("[%(levelname)s] %(asctime)s - %(name)s - %(message)s"))
+        log = logging.getLogger(f"bench.logging.{name}")
+        log.handlers[:] = [handler]
+        log.filters[:] = []
+        log.setLevel(logging.DEBUG)
+        log.propagate = False
+        if limit:
+            log.addFilter(logger_setup.RateLimitFilter(50))
+        if lazy:
+            logger_setup.install_queue_logging([log])
+        try:
+            stats = asyncio.run(_log_workload(log, lazy, messages, chunks))
+        finally:
+            if lazy:
+                logger_setup.uninstall_queue_logging()
+            log.handlers[:] = []
+            sink.close()
+        return stats, sink.writes
+
+    def run() -> dict[str, float]:
+        disabled = logging.root.manager.disable  # the runner silences logging; this case needs it
+        logging.disable(logging.NOTSET)
+        try:
+            before, written_before = scenario("before", lazy=False, limit=False)
+            queued, written_queued = scenario("queued", lazy=True, limit=False)
+            after, written_after = scenario("after", lazy=True, limit=True)
+        finally:
+            logging.disable(disabled)
+        return {
+            "stall_p99_ms_before": before["p99_ms"],
+            "stall_p99_ms_queued": queued["p99_ms"],
+            "stall_p99_ms_after": after["p99_ms"],
+            "stall_max_ms_before": before["max_ms"],
+            "stall_max_ms_queued": queued["max_ms"],
+            "stall_max_ms_after": after["max_ms"],
+            "loop_log_s_before": before["loop_log_s"],
+            "loop_log_s_queued": queued["loop_log_s"],
+            "loop_log_s_after": after["loop_log_s"],
+            "records_before": written_before,
+            "records_queued": written_queued,
+            "records_after": written_after,
+        }
+
+    return Case(run)
+
+
+def group_names(group: str | None = None) -> list[str]:
+    from benchmarks.harness import REGISTRY
+
+    return [name for name, bench in REGISTRY.items() if group is None or bench.group == group]
+
+
+__all__ = ["PANEL", "group_names"]
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+"""Benchmark websocket chat persistence with many concurrent long conversations.
+
+Drives ``DjangoChatConsumer`` turn handling directly (no sockets or LLM) in
+waves of ``--concurrency`` conversations that each run user/assistant turns
+(wave ``k`` runs ``k * --turns`` turns), then disconnect. Per wave it reports
+DB queries per persisted message (flat as transcripts grow, because turns are
+appended through the write-behind queue) and traced memory after the wave
+(flat, because the transcript cache is bounded). For comparison it also runs
+the previous full-transcript rewrite on one conversation. Uses a throwaway
+SQLite database.
+
+Usage:
+    python scripts/bench_chat_persistence.py [--concurrency 100] [--turns 25] [--waves 4] [--think-ms 20]
+
+Prints a JSON report to stdout.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+
+def _setup_django(db_path: Path) -> None:
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "swarm.settings")
+    os.environ.setdefault("DJANGO_DEBUG", "true")
+    os.environ.pop("DATABASE_URL", None)
+    os.environ["DJANGO_DB_NAME"] = str(db_path)
+    import django
+    from django.core.management import call_command
+
+    django.setup()
+    call_command("migrate", verbosity=0)
+    logging.disable(logging.INFO)
+    from django.conf import settings
+
+    settings.DEBUG = False  # DJANGO_DEBUG only satisfies the settings boot checks
+
+
+class _WriteCounter:
+    """Wraps ``persist_pending_messages`` to count batches, rows and queries."""
+
+    def __init__(self, consumers_module):
+        self.batches = self.rows = self.queries = 0
+        self._original = consumers_module.persist_pending_messages
+        consumers_module.persist_pending_messages = self
+
+    def __call__(self, batch):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as ctx:
+            written = self._original(batch)
+        self.batches += 1
+        self.rows += written
+        self.queries += len(ctx.captured_queries)
+        connection.queries_log.clear()  # keep the capture itself out of the memory numbers
+        return written
+
+    def snapshot(self) -> tuple[int, int, int]:
+        return self.batches, self.rows, self.queries
+
+
+async def _conversation(user, conversation_id: str, turns: int, think_s: float) -> None:
+    from swarm import consumers
+
+    consumer = consumers.DjangoChatConsumer()
+    consumer.user = user
+    consumer.conversation_id = conversation_id
+    await consumers.CONVERSATION_WRITER.flush()
+    consumer.messages = await consumer.fetch_conversation(conversation_id)
+    for turn in range(turns):
+        consumer.append_message("user", f"{conversation_id} question {turn}")
+        await asyncio.sleep(think_s)  # stand-in for model latency
+        consumer.append_message("assistant", f"{conversation_id} answer {turn}")
+    await consumer.disconnect(1000)
+
+
+def _legacy_rewrite(user, turns: int) -> tuple[float, float, int]:
+    """Previous behaviour: rewrite the whole transcript; returns first/last ms and rows written."""
+    from swarm.consumers import DjangoChatConsumer
+
+    consumer = DjangoChatConsumer()
+    consumer.user = user
+    save_sync = DjangoChatConsumer.__dict__["save_conversation"].func
+    transcript: list[dict] = []
+    timings = []
+    rows = 0
+    for turn in range(turns):
+        transcript += [{"role": "user", "content": f"q{turn}"}, {"role": "assistant", "content": f"a{turn}"}]
+        start = time.perf_counter()
+        save_sync(consumer, "legacy-rewrite", transcript)
+        timings.append(time.perf_counter() - start)
+        rows += len(transcript)
+    return round(timings[0] * 1000, 3), round(timings[-1] * 1000, 3), rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--turns", type=int, default=25)
+    parser.add_argument("--waves", type=int, default=4)
+    parser.add_argument("--think-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        _setup_django(Path(tmp) / "bench.sqlite3")
+        from django.contrib.auth import get_user_model
+
+        from swarm import consumers
+
+        user = get_user_model().objects.create_user(username="bench", password="x")
+        counter = _WriteCounter(consumers)
+        waves = []
+
+        async def run() -> None:
+            for wave in range(args.waves):
+                turns = args.turns * (wave + 1)
+                before = counter.snapshot()
+                start = time.perf_counter()
+                await asyncio.gather(*(
+                    _conversation(user, f"w{wave}-c{i}", turns, args.think_ms / 1000)
+                    for i in range(args.concurrency)
+                ))
+                elapsed = time.perf_counter() - start
+                batches, rows, queries = (a - b for a, b in zip(counter.snapshot(), before, strict=True))
+                waves.append({
+                    "turns_per_conversation": turns,
+                    "messages": rows,
+                    "batches": batches,
+                    "queries_per_message": round(queries / rows, 3) if rows else None,
+                    "messages_per_s": round(rows / elapsed, 1),
+                    "traced_mb_after_wave": round(tracemalloc.get_traced_memory()[0] / (1024 * 1024), 2),
+                    "cached_conversations": len(consumers.IN_MEMORY_CONVERSATIONS),
+                })
+
+        tracemalloc.start()
+        asyncio.run(run())
+        tracemalloc.stop()
+
+        longest = args.turns * args.waves
+        legacy_first_ms, legacy_last_ms, legacy_rows = _legacy_rewrite(user, longest)
+
+    report = {
+        "concurrency": args.concurrency,
+        "think_ms": args.think_ms,
+        "waves": waves,
+        "legacy_full_rewrite": {
+            "turns": longest,
+            "rows_written": legacy_rows,
+            "append_rows_written": 2 * longest,
+            "ms_first_turn": legacy_first_ms,
+            "ms_last_turn": legacy_last_ms,
+        },
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+"""Benchmark FilesystemToolset grep against the previous read-everything loop.
+
+Generates ``--files`` small source files plus ``--large`` multi-megabyte logs
+and a few binaries, then times (best of ``--repeat``):
+
+- a rare pattern (every file searched, few hits),
+- a common pattern with a small ``max_matches`` (early termination),
+- a pattern whose only hits sit near the top of the large files,
+
+for the legacy per-line loop (full read + decode + ``splitlines``) and for
+the streaming engine with 1 and ``--workers`` workers. Outputs are asserted
+equal. No index is used.
+
+Usage:
+    python scripts/bench_fs_grep.py [--files 5000] [--large 4] [--large-mb 8] [--workers 4] [--repeat 3]
+
+Prints a JSON report to stdout.
+"""
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+WORDS = [
+    "alpha", "beta", "gamma", "delta", "request", "response", "handler", "service", "config", "agent", "queue",
+    "worker",
+]
+
+
+def _make_tree(root: Path, n_files: int, n_large: int, large_mb: int, seed: int = 11) -> None:
+    rng = random.Random(seed)
+    for i in range(n_files):
+        d = root / f"pkg{i % 50}"
+        d.mkdir(parents=True, exist_ok=True)
+        body = [f"def fn_{i}_{j}(x):  # {' '.join(rng.choices(WORDS, k=6))}\n    return x + {j}\n" for j in range(30)]
+        if i % 997 == 0:
+            body.append("# zebra_unicorn marker\n")
+        (d / f"file_{i}.py").write_text("".join(body))
+    logs = root / "logs"
+    logs.mkdir(parents=True, exist_ok=True)
+    line = "2025-01-01T00:00:00 INFO worker handled request id=%d status=ok\n"
+    for i in range(n_large):
+        with open(logs / f"service_{i}.log", "w") as fh:
+            fh.write("BOOT banner_token version=1\n")
+            written = 0
+            n = 0
+            while written < large_mb * 1024 * 1024:
+                chunk = "".join(line % (n + k) for k in range(1000))
+                fh.write(chunk)
+                written += len(chunk)
+                n += 1000
+    for i in range(5):
+        (root / f"blob_{i}.bin").write_bytes(b"\x00" + os.urandom(256 * 1024))
+
+
+def _legacy_grep(fs, pattern: str, root: Path, max_matches: int) -> str:
+    """The pre-streaming loop: whole-file read, decode and per-line regex."""
+    from swarm.core.filesystem_toolset import _is_noise, _sensitive_path_reason
+
+    rx = re.compile(pattern, re.IGNORECASE)
+    hits: list[str] = []
+    for fp in [p for p in sorted(root.rglob("*")) if p.is_file() and not _is_noise(p)]:
+        if len(hits) >= max_matches:
+            break
+        if _sensitive_path_reason(fp) or not fs._within_roots(fp):
+            continue
+        if fp.stat().st_size > fs.max_read_bytes:
+            continue
+        raw = fp.read_bytes()
+        if b"\x00" in raw[:1024]:
+            continue
+        for n, text in enumerate(raw.decode("utf-8", "replace").splitlines(), 1):
+            if rx.search(text):
+                hits.append(f"{fp.relative_to(root)}:{n}: {text.strip()[:200]}")
+                if len(hits) >= max_matches:
+                    hits.append("…[truncated]")
+                    break
+    return "\n".join(hits) if hits else f"(no matches for /{pattern}/ under {root})"
+
+
+def _timed(fn, repeat: int):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 1), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--large", type=int, default=4)
+    parser.add_argument("--large-mb", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from swarm.core.filesystem_toolset import FilesystemToolset
+
+    cases = {
+        "rare": ("zebra_unicorn", 200),
+        "common_capped": ("return x", 50),
+        "large_file_head": ("banner_token", 200),
+    }
+    report: dict = {"files": args.files, "large_files": args.large, "large_mb": args.large_mb,
+                    "workers": args.workers, "cpu_count": os.cpu_count(), "cases": {}}
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "tree"
+        _make_tree(root, args.files, args.large, args.large_mb)
+        root = root.resolve()
+        common = {"allowed_paths": [str(root)], "audit": False, "max_read_bytes": (args.large_mb + 1) * 1024 * 1024}
+        serial = FilesystemToolset(**common, grep_workers=1)
+        parallel = FilesystemToolset(**common, grep_workers=args.workers)
+        for name, (pattern, cap) in cases.items():
+            legacy_ms, expected = _timed(lambda p=pattern, c=cap: _legacy_grep(serial, p, root, c), args.repeat)
+            serial_ms, got = _timed(lambda p=pattern, c=cap: serial.grep(p, str(root), max_matches=c), args.repeat)
+            assert got == expected, name
+            parallel_ms, got = _timed(lambda p=pattern, c=cap: parallel.grep(p, str(root), max_matches=c), args.repeat)
+            assert got == expected, name
+            report["cases"][name] = {
+                "pattern": pattern,
+                "max_matches": cap,
+                "legacy_ms": legacy_ms,
+                "streaming_1_worker_ms": serial_ms,
+                f"streaming_{args.workers}_workers_ms": parallel_ms,
+            }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
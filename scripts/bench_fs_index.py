@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+"""Benchmark FilesystemToolset grep/find with and without the trigram index.
+
+Generates a synthetic tree of ``--files`` small source files (plus a few
+noise/binary files), then times:
+
+- a full-scan grep/find (index disabled),
+- the first indexed grep (lazy index build),
+- warm indexed greps (stat walk + signature filter + exact match),
+- warm grep/find with ``index_refresh_seconds`` set (no stat walk),
+- an incremental refresh after modifying ``--touch`` files.
+
+Results of indexed and full-scan searches are asserted equal. Uses only the
+stdlib (SQLite) plus this package.
+
+Usage:
+    python scripts/bench_fs_index.py [--files 100000] [--touch 100] [--repeat 3]
+
+Prints a JSON report to stdout.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+WORDS = [
+    "alpha", "beta", "gamma", "delta", "request", "response", "handler", "service",
+    "config", "agent", "blueprint", "queue", "worker", "token", "stream", "buffer",
+    "index", "cache", "record", "update",
+]
+
+
+def _make_tree(root: Path, n_files: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    for i in range(n_files):
+        d = root / f"pkg{i % 100:02d}" / f"mod{(i // 100) % 100:02d}"
+        if i < 10_000 or not d.exists():
+            d.mkdir(parents=True, exist_ok=True)
+        body = []
+        for j in range(rng.randint(15, 40)):
+            words = " ".join(rng.choice(WORDS) for _ in range(6))
+            body.append(f"def fn_{i}_{j}(x):  # {words}\n    return x + {j}\n")
+        if i % 5000 == 0:
+            body.append("RARE_MARKER = 'zebra_unicorn'\n")
+        (d / f"file_{i}.py").write_text("".join(body))
+    (root / "node_modules").mkdir(exist_ok=True)
+    (root / "node_modules" / "dep.js").write_text("zebra_unicorn\n")
+    (root / "blob.bin").write_bytes(b"\x00zebra_unicorn\x00" * 10)
+
+
+def _timed(fn, repeat: int = 1):
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return round(best * 1000, 1), result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000)
+    parser.add_argument("--touch", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    from swarm.core.filesystem_toolset import FilesystemToolset
+    from swarm.core.fs_index import get_index
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "tree"
+        start = time.perf_counter()
+        _make_tree(root, args.files)
+        generate_s = time.perf_counter() - start
+        index_dir = str(Path(tmp) / "index")
+        common = {"allowed_paths": [str(root)], "audit": False, "max_read_bytes": 1_000_000}
+        plain = FilesystemToolset(**common)
+        indexed = FilesystemToolset(**common, index=True, index_dir=index_dir)
+        throttled = FilesystemToolset(**common, index=True, index_dir=index_dir, index_refresh_seconds=3600)
+
+        rare, common_pat = "zebra_unicorn", "return x"
+        scan_rare_ms, expected_rare = _timed(lambda: plain.grep(rare, str(root)))
+        scan_common_ms, expected_common = _timed(lambda: plain.grep(common_pat, str(root), max_matches=50))
+        scan_find_ms, expected_find = _timed(lambda: plain.find("file_99*.py", str(root)))
+
+        build_ms, got = _timed(lambda: indexed.grep(rare, str(root)))
+        assert got == expected_rare
+        warm_rare_ms, got = _timed(lambda: indexed.grep(rare, str(root)), args.repeat)
+        assert got == expected_rare
+        warm_common_ms, got = _timed(lambda: indexed.grep(common_pat, str(root), max_matches=50), args.repeat)
+        assert got == expected_common
+        throttled.grep(rare, str(root))  # prime the refresh timestamp
+        no_walk_ms, got = _timed(lambda: throttled.grep(rare, str(root)), args.repeat)
+        assert got == expected_rare
+        # find only consults the index when a refresh interval is configured.
+        warm_find_ms, got = _timed(lambda: throttled.find("file_99*.py", str(root)), args.repeat)
+        assert got == expected_find
+
+        files = sorted(root.rglob("file_*.py"))[: args.touch]
+        for fp in files:
+            fp.write_text(fp.read_text() + "# touched zebra_unicorn\n")
+            st = fp.stat()
+            os.utime(fp, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        idx = get_index(root.resolve(), index_dir=index_dir)
+        incremental_ms, stats = _timed(lambda: idx.refresh(force=True))
+        index_bytes = sum(p.stat().st_size for p in Path(index_dir).iterdir())
+
+    report = {
+        "files": args.files,
+        "generate_s": round(generate_s, 1),
+        "full_scan_grep_rare_ms": scan_rare_ms,
+        "full_scan_grep_common_ms": scan_common_ms,
+        "full_scan_find_ms": scan_find_ms,
+        "index_build_plus_first_grep_ms": build_ms,
+        "indexed_grep_rare_ms": warm_rare_ms,
+        "indexed_grep_common_ms": warm_common_ms,
+        "indexed_grep_rare_no_stat_walk_ms": no_walk_ms,
+        "indexed_find_no_stat_walk_ms": warm_find_ms,
+        "incremental_refresh_ms": incremental_ms,
+        "incremental_reindexed": stats.indexed,
+        "index_bytes": index_bytes,
+        "cpu_count": os.cpu_count(),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""Benchmark job log tailing on large logs.
+
+Writes a synthetic log of ``--size-mb`` megabytes and compares the
+reverse-seeking ``DefaultJobService.get_log_tail`` against the previous
+read-everything-then-splitlines approach, then measures ``follow_log``
+throughput over the same file. Uses only the stdlib.
+
+Usage:
+    python scripts/bench_job_log_tail.py [--size-mb 256] [--lines 20] [--repeat 5]
+
+Prints a JSON report to stdout.
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+
+def _write_log(path: Path, size_mb: int) -> int:
+    line = b"2026-01-01T00:00:00 INFO worker[42] processed item with a moderately long payload\n"
+    target = size_mb * 1024 * 1024
+    chunk = line * 4096
+    written = 0
+    with path.open("wb") as f:
+        while written < target:
+            f.write(chunk)
+            written += len(chunk)
+    return written
+
+
+def _naive_tail(path: Path, n_lines: int) -> list[str]:
+    with path.open("r", encoding="utf-8", errors="replace") as f:
+        return f.read().splitlines()[-n_lines:]
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=256)
+    parser.add_argument("--lines", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        outputs = data_dir / "outputs"
+        outputs.mkdir()
+        with patch("swarm.services.job.SWARM_JOB_DATA_DIR", data_dir), \
+             patch("swarm.services.job.JOBS_METADATA_FILE", data_dir / "jobs_metadata.json"), \
+             patch("swarm.services.job.JOB_OUTPUTS_DIR", outputs):
+            from swarm.services.job import DefaultJobService, Job
+
+            service = DefaultJobService()
+            job = Job(id="bench", command_list=["true"], status="COMPLETED")
+            size = _write_log(job.output_file_path, args.size_mb)
+            service._jobs[job.id] = job
+
+            tail = service.get_log_tail(job.id, args.lines)
+            assert tail == _naive_tail(job.output_file_path, args.lines)
+
+            tail_s = _best_of(lambda: service.get_log_tail(job.id, args.lines), args.repeat)
+            naive_s = _best_of(lambda: _naive_tail(job.output_file_path, args.lines), min(args.repeat, 2))
+            start = time.perf_counter()
+            followed = sum(len(text) for _, text in service.follow_log(job.id))
+            follow_s = time.perf_counter() - start
+            assert followed == size
+
+    report = {
+        "log_bytes": size,
+        "tail_lines": args.lines,
+        "reverse_tail_ms": round(tail_s * 1000, 3),
+        "full_read_tail_ms": round(naive_s * 1000, 3),
+        "speedup": round(naive_s / tail_s, 1) if tail_s else None,
+        "follow_mb_per_s": round(size / (1024 * 1024) / follow_s, 1),
+        "cpu_count": os.cpu_count(),
+    }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
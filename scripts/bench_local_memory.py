@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+"""Recall/latency benchmark for the ``local`` memory backend.
+
+For each size in ``--sizes`` builds a fresh store from a synthetic
+topic-structured corpus (Zipfian vocabulary, one topic per entry), then
+reports:
+
+- ingest throughput (``add_many`` in batches, including index training),
+- reopen time (loading codes and centroids from SQLite),
+- ANN ``search`` latency (p50/p95) and recall@k against an exact
+  brute-force cosine scan over the same embeddings, for each search effort
+  in ``--scan`` (entries scored by code per query),
+- the brute-force latency for comparison.
+
+The corpus is deliberately hard: hundreds of entries share each topic, so
+the exact top-k is decided by small differences in incidental words.
+
+Usage:
+    python scripts/bench_local_memory.py [--sizes 10000,100000] [--scan 1024,4096,16384] [--queries 50] [--k 10]
+    python scripts/bench_local_memory.py --sizes 1000000 --queries 10   # slow: ~1M entries
+
+Prints a JSON report to stdout.
+"""
+import argparse
+import json
+import operator
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+N_TOPICS = 200
+VOCAB = 5000
+
+
+def _corpus(n: int, seed: int):
+    rng = random.Random(seed)
+    vocab = [f"w{i}" for i in range(VOCAB)]
+    weights = [1 / (i + 1) for i in range(VOCAB)]
+    topics = [rng.sample(vocab, 25) for _ in range(N_TOPICS)]
+    for i in range(n):
+        topic = topics[rng.randrange(N_TOPICS)]
+        words = rng.choices(topic, k=rng.randint(3, 6)) + rng.choices(vocab, weights, k=rng.randint(4, 10))
+        rng.shuffle(words)
+        yield f"entry {i} " + " ".join(words)
+
+
+def _percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def run(size: int, scans: list[int], n_queries: int, k: int, batch: int) -> dict:
+    from swarm.memory.local_memory import LocalVectorMemory
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "mem.sqlite3")
+        mem = LocalVectorMemory({"path": path, "min_score": -1.0})
+        texts = list(_corpus(size, seed=1))
+        start = time.perf_counter()
+        for i in range(0, size, batch):
+            mem.add_many(texts[i:i + batch], user_id="bench")
+        mem.wait_for_training()
+        ingest_s = time.perf_counter() - start
+        mem.close()
+
+        start = time.perf_counter()
+        mem = LocalVectorMemory({"path": path, "min_score": -1.0})
+        reopen_s = time.perf_counter() - start
+
+        vectors = mem.embedder.embed(texts)
+        queries, exact, exact_ms = list(_corpus(n_queries, seed=2)), [], []
+        for query in queries:
+            start = time.perf_counter()
+            qvec = mem.embedder.embed([query])[0]
+            scores = [sum(map(operator.mul, qvec, v)) for v in vectors]
+            exact.append({texts[i] for i in sorted(range(size), key=scores.__getitem__, reverse=True)[:k]})
+            exact_ms.append((time.perf_counter() - start) * 1000)
+
+        efforts = {}
+        for effort in scans:
+            mem.index.scan = effort
+            ann_ms, recalls = [], []
+            for query, expected in zip(queries, exact, strict=True):
+                start = time.perf_counter()
+                got = mem.search(query, user_id="bench", limit=k)
+                ann_ms.append((time.perf_counter() - start) * 1000)
+                recalls.append(len(set(got) & expected) / k)
+            efforts[f"scan_{effort}"] = {
+                f"recall@{k}": round(statistics.mean(recalls), 3),
+                "p50_ms": round(_percentile(ann_ms, 50), 2),
+                "p95_ms": round(_percentile(ann_ms, 95), 2),
+            }
+        trained = mem.index.trained
+        mem.close()
+    return {
+        "entries": size,
+        "ingest_per_s": round(size / ingest_s),
+        "reopen_s": round(reopen_s, 2),
+        "trained": trained,
+        "ann": efforts,
+        "brute_force_p50_ms": round(_percentile(exact_ms, 50), 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--scan", default="1024,4096,16384")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--batch", type=int, default=1000)
+    args = parser.parse_args()
+
+    scans = [int(s) for s in args.scan.split(",")]
+    report = {"runs": [run(int(s), scans, args.queries, args.k, args.batch) for s in args.sizes.split(",")]}
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
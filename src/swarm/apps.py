@@ -27,6 +27,9 @@ class SwarmConfig(AppConfig):
                 f"Failed to configure logging using dictConfig: {e}. Using basicConfig.",
                 exc_info=True
             )
+        # Queue/rate-limit the hot-path loggers (SWARM_LOG_QUEUE, SWARM_LOG_LIMITS)
+        from swarm.utils.logger_setup import configure_hot_path_logging
+        configure_hot_path_logging()
 
 
         # The blueprint discovery and URL registration should ideally happen
@@ -79,6 +82,10 @@ class SwarmConfig(AppConfig):
         self._check_uvicorn_workers()
         self._maybe_resume_async_tasks()
 
+        # Multi-worker /metrics: each process snapshots into SWARM_METRICS_DIR.
+        from swarm.core import metrics
+        metrics.start_flusher()
+
         logger.info("Swarm app initialization checks completed.")
 
     @staticmethod
@@ -1,4 +1,5 @@
 import hmac
+import ipaddress
 import logging
 
 from django.conf import settings
@@ -153,6 +154,66 @@ def api_permission_classes():
     return [AllowAny]
 
 
+class IsSwarmAdmin(BasePermission):
+    """
+    Allows operator endpoints (e.g. the profiler) to staff/superuser sessions
+    and to static tokens listed in ``settings.SWARM_ADMIN_API_KEYS``.
+    """
+    message = 'Admin access required (staff session or a token in SWARM_ADMIN_API_KEYS).'
+
+    def has_permission(self, request, _view):
+        return is_admin_request(request)
+
+
+def is_admin_request(request) -> bool:
+    """True for staff/superuser sessions and ``SWARM_ADMIN_API_KEYS`` tokens."""
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated and (user.is_staff or user.is_superuser):
+        return True
+    auth = getattr(request, 'auth', None)
+    if auth is None:
+        return False
+    provided = str(auth)
+    admin_keys = getattr(settings, 'SWARM_ADMIN_API_KEYS', None) or []
+    # Check every key (no early exit) so timing does not reveal which matched.
+    matched = False
+    for key in admin_keys:
+        matched |= hmac.compare_digest(provided, str(key))
+    return matched
+
+
+class IsSwarmAdminOrLoopback(IsSwarmAdmin):
+    """
+    :class:`IsSwarmAdmin`, plus any client connecting from a loopback address.
+    Used for operator endpoints while ``ENABLE_API_AUTH`` is off (local use).
+    """
+    message = 'Admin access required (local clients only while API auth is disabled).'
+
+    def has_permission(self, request, _view):
+        return is_loopback_request(request) or is_admin_request(request)
+
+
+def is_loopback_request(request) -> bool:
+    """True when ``REMOTE_ADDR`` is a loopback address (proxy headers are ignored)."""
+    addr = (getattr(request, 'META', None) or {}).get('REMOTE_ADDR') or ''
+    try:
+        return ipaddress.ip_address(addr).is_loopback
+    except ValueError:
+        return False
+
+
+def admin_permission_classes():
+    """Permission classes for operator endpoints.
+
+    Never open to anonymous remote callers: admins only (:class:`IsSwarmAdmin`)
+    when ``ENABLE_API_AUTH`` is on, and admins or loopback clients when it is
+    off (:class:`IsSwarmAdminOrLoopback`).
+    """
+    if getattr(settings, "ENABLE_API_AUTH", False):
+        return [IsSwarmAdmin]
+    return [IsSwarmAdminOrLoopback]
+
+
 def token_principal(token: str) -> str:
     """Ownership principal for a static API token (``token:<sha256-prefix>``)."""
     import hashlib
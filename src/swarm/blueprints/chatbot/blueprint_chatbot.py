@@ -48,6 +48,8 @@ logger = logging.getLogger(__name__)
 
 # --- Define the Blueprint ---
 class ChatbotBlueprint(BlueprintBase):
+    prebuild_starting_agent = True
+
     def __init__(self, blueprint_id: str, config_path: Path | None = None, **kwargs):
         super().__init__(blueprint_id, config_path=config_path, **kwargs)
         class DummyLLM:
@@ -328,7 +330,7 @@ Use them responsibly when the user asks for file or system operations.
 
     async def _run_non_interactive(self, instruction: str, **kwargs) -> Any:
         mcp_servers = kwargs.get("mcp_servers", [])
-        agent = self.create_starting_agent(mcp_servers=mcp_servers)
+        agent = self.starting_agent(mcp_servers)
 
         from agents import Runner
         try:
@@ -14,10 +14,20 @@ See :mod:`swarm.core.cli_adapter` for the lifecycle layer and
 from __future__ import annotations
 
 import logging
+from contextlib import aclosing
 from typing import Any, ClassVar
 
 from swarm.blueprints.common import cli_fusion_support as support
 from swarm.core.blueprint_base import BlueprintBase
+from swarm.core.cli_hedge import (
+    EVENT_FAILED,
+    EVENT_HEDGED,
+    EVENT_LAUNCHED,
+    EVENT_SKIPPED,
+    EVENT_WON,
+    HedgePolicy,
+    run_hedged,
+)
 from swarm.core.consensus import run_consensus
 
 logger = logging.getLogger(__name__)
@@ -153,10 +163,16 @@ class CliAgentBlueprint(BlueprintBase):
             )
             return
 
+        # Optional hedged failover: start the next candidate once the running
+        # one is slow (param `hedge`, else config `cli_fusion.hedge`).
+        hedge_raw = params.get(support.PARAM_HEDGE, ((config or {}).get("cli_fusion") or {}).get("hedge"))
+        policy = HedgePolicy.parse(hedge_raw)
+
         # Streaming-text fast path: stream the first *installed* candidate
         # incrementally. No mid-stream failover — once bytes are on the wire we
-        # can't unsend them — so this commits to one CLI.
-        if kwargs.get("stream"):
+        # can't unsend them — so this commits to one CLI. Hedging needs to pick
+        # a winner first, so with a policy the answer arrives as one message.
+        if kwargs.get("stream") and policy is None:
             target = next((n for n in chain if registry.get(n).is_available()), None)
             if target is not None and (registry.get(target).config.parse or "text") == "text":
                 adapter = registry.get(target)
@@ -176,22 +192,38 @@ class CliAgentBlueprint(BlueprintBase):
                 return
             # json-parse target (or nothing installed): fall through to failover.
 
-        # Non-streaming (and json-in-stream): try each candidate, first ok wins.
+        # Non-streaming (and json-in-stream / hedged): try each candidate, first ok wins.
         last: tuple[str, str] | None = None
-        for name in chain:
-            adapter = registry.get(name)
-            if not adapter.is_available():
-                yield support.progress_chunk(f"_Skipping `{name}` (not installed); failing over…_")
-                continue
-            yield support.progress_chunk(f"_Running CLI agent `{name}`…_")
-            result = await adapter.run(prompt, workdir=workdir)
-            if result.ok:
-                if result.parse_error:
-                    logger.warning("CLI %s parse issue: %s", name, result.parse_error)
-                yield support.message_chunk(result.text, final=True, meta=support.backend_meta([name]))
-                return
-            last = (name, result.error or "unknown error")
-            yield support.progress_chunk(f"_`{name}` failed: {last[1]} — failing over…_")
+        launched: list[str] = []
+        adapters = [registry.get(name) for name in chain]
+        async with aclosing(run_hedged(adapters, prompt, workdir=workdir, policy=policy)) as events:
+            async for event in events:
+                name = event.name
+                if event.kind == EVENT_SKIPPED:
+                    yield support.progress_chunk(f"_Skipping `{name}` (not installed); failing over…_")
+                elif event.kind == EVENT_LAUNCHED:
+                    launched.append(name)
+                    yield support.progress_chunk(f"_Running CLI agent `{name}`…_")
+                elif event.kind == EVENT_HEDGED:
+                    launched.append(name)
+                    yield support.progress_chunk(f"_Hedging with CLI agent `{name}` ({event.reason})…_")
+                elif event.kind == EVENT_FAILED:
+                    last = (name, event.result.error or "unknown error")
+                    yield support.progress_chunk(f"_`{name}` failed: {last[1]} — failing over…_")
+                elif event.kind == EVENT_WON:
+                    result = event.result
+                    if result.parse_error:
+                        logger.warning("CLI %s parse issue: %s", name, result.parse_error)
+                    meta = support.backend_meta([name])
+                    if policy is not None and len(launched) > 1:
+                        # Which candidate won a hedged/failed-over race, and who was stopped.
+                        meta["hedge"] = {"winner": name, "launched": launched, "terminated": list(event.others)}
+                    if event.others:
+                        yield support.progress_chunk(
+                            f"_`{name}` answered first; stopping {', '.join(f'`{o}`' for o in event.others)}._"
+                        )
+                    yield support.message_chunk(result.text, final=True, meta=meta)
+                    return
 
         detail = f" (last — {last[0]}: {last[1]})" if last else ""
         yield support.message_chunk(f"All CLI candidates failed{detail}.", final=True)
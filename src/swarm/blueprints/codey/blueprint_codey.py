@@ -229,7 +229,7 @@ def _cli_main():
     blueprint = CodeyBlueprint(blueprint_id="cli", audit_logger=audit_logger)
     # Ensure coordinator attr for CLI shim compatibility (create if missing)
     if not hasattr(blueprint, 'coordinator') or blueprint.coordinator is None:
-        blueprint.coordinator = blueprint.create_starting_agent([])
+        blueprint.coordinator = blueprint.starting_agent([])
     blueprint.coordinator.model = args.model
 
     def get_codey_agent_name():
@@ -326,6 +326,8 @@ class CodeyBlueprint(BlueprintBase):
     Codey Blueprint: Code and semantic code search/analysis.
     """
 
+    prebuild_starting_agent = True
+
     metadata = {
         "name": "codey",
         "emoji": "🤖",
@@ -852,7 +854,7 @@ class CodeyBlueprint(BlueprintBase):
 
         op_start = time.monotonic()
         try:
-            result = await Runner.run(self.create_starting_agent([]), instruction)
+            result = await Runner.run(self.starting_agent([]), instruction)
             if hasattr(result, "__aiter__"):
                 async for item in result:
                     result_content = getattr(item, "final_output", str(item))
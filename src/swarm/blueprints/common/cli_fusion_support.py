@@ -28,6 +28,7 @@ PARAM_FAILOVER = "failover"  # single-CLI: enable auto-failover (default True)
 PARAM_CONSENSUS = "consensus"  # single-CLI: per-request consensus override (bool/int/list/dict)
 PARAM_SKILL = "skill"        # apply a named skill's instructions to the prompt
 PARAM_PROFILE = "profile"    # desired inference traits {intelligence,speed,cost} 0..1
+PARAM_HEDGE = "hedge"        # single-CLI: hedged failover policy (bool / seconds / dict)
 
 
 def resolve_workdir(
@@ -32,9 +32,7 @@ class DynamicTeamBlueprint(BlueprintBase):
 
         base_url = profile.get("base_url")
         api_key = profile.get("api_key") or "ollama"  # Ollama usually doesn't require a key
-        # No hardcoded model fallback: the profile's model is authoritative, with
-        # env overrides as the only escape hatch (consistent with BlueprintBase).
-        model_name = profile.get("model") or os.getenv("LITELLM_MODEL") or os.getenv("DEFAULT_LLM")
+        model_name = self._profile_model(profile)
 
         if not base_url or not model_name:
             missing = "base_url" if not base_url else "model"
@@ -62,6 +60,10 @@ class DynamicTeamBlueprint(BlueprintBase):
                             continue
                 # No explicit final aggregation here; ChatCompletionsView handles [DONE]
                 return
+            elif self._team_mcp_servers():
+                # Tool-using team: function-calling loop over the team's MCP tools
+                text = await self._run_with_tools(client, model_name, messages)
+                yield {"messages": [{"role": "assistant", "content": text}]}
             else:
                 # Non-streaming single-shot
                 resp = await client.chat.completions.create(model=model_name, messages=messages, stream=False)
@@ -70,3 +72,62 @@ class DynamicTeamBlueprint(BlueprintBase):
         except Exception as e:
             logger.exception("Dynamic team LLM call failed: %s", e)
             yield {"messages": [{"role": "assistant", "content": f"[DynamicTeam Error] {e}"}]}
+
+    async def prepare_run(self, _messages: list[dict[str, Any]], **kwargs: Any) -> None:
+        """Discover the team's MCP tools while memory retrieval is in flight.
+
+        Replaces the base model pre-build: this blueprint creates its own
+        client per run. ``_run_with_tools`` takes the prepared tool agent if
+        there is one and discovers the tools itself otherwise. Streaming runs
+        never use tools, so nothing is prepared for them.
+        """
+        if kwargs.get("stream") or not self._team_mcp_servers():
+            return
+        try:
+            model_name = self._profile_model(self.get_llm_profile(self.llm_profile_name))
+            self._prepared_tool_agent = await self._tool_agent(model_name)
+        except Exception as e:  # run() reports discovery errors itself
+            logger.debug("prepare_run could not discover MCP tools for '%s': %s", self.blueprint_id, e)
+
+    @staticmethod
+    def _profile_model(profile: dict[str, Any]) -> str | None:
+        # No hardcoded model fallback: the profile's model is authoritative, with
+        # env overrides as the only escape hatch (consistent with BlueprintBase).
+        return profile.get("model") or os.getenv("LITELLM_MODEL") or os.getenv("DEFAULT_LLM")
+
+    def _team_settings(self) -> dict[str, Any]:
+        """This team's entry under ``blueprints`` in swarm_config.json (may be empty)."""
+        blueprints = (self._config or {}).get("blueprints") or {}
+        settings = blueprints.get(self.blueprint_id)
+        return settings if isinstance(settings, dict) else {}
+
+    def _team_mcp_servers(self) -> list[str]:
+        servers = self._team_settings().get("mcp_servers") or []
+        return [s for s in servers if isinstance(s, str)]
+
+    async def _tool_agent(self, model_name: str):
+        """A swarm Agent carrying the team's instructions and discovered MCP tools."""
+        from swarm.extensions.mcp.mcp_utils import discover_and_merge_agent_tools
+        from swarm.types import Agent as SwarmAgent
+
+        settings = self._team_settings()
+        agent = SwarmAgent(
+            name=self.blueprint_id,
+            model=model_name,
+            instructions=settings.get("instructions") or "",
+            mcp_servers=self._team_mcp_servers(),
+            parallel_tool_calls=True,
+            max_tool_concurrency=settings.get("max_tool_concurrency"),
+        )
+        agent.functions = await discover_and_merge_agent_tools(agent, self._config or {})
+        return agent
+
+    async def _run_with_tools(self, client: AsyncOpenAI, model_name: str, messages: list[dict[str, Any]]) -> str:
+        """Answer with the team's MCP tools available; tool calls in a turn run concurrently."""
+        from swarm.tool_executor import run_tool_loop
+
+        prepared, self._prepared_tool_agent = getattr(self, "_prepared_tool_agent", None), None
+        agent = prepared if prepared is not None and prepared.model == model_name else await self._tool_agent(model_name)
+        result = await run_tool_loop(client, model_name, agent, messages)
+        final = next((m for m in reversed(result.messages) if m.get("role") == "assistant"), {})
+        return (final.get("content") or "").strip()
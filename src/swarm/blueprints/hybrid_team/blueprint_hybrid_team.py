@@ -58,6 +58,7 @@ from swarm.core.blueprint_base import BlueprintBase
 from swarm.core.cli_adapter import CliAdapterRegistry
 from swarm.core.cli_tools import cli_persona, consensus_fn  # the granular tool layer
 from swarm.core.consensus import run_consensus  # noqa: F401  (Option B; see run())
+from swarm.core.loop_bridge import run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -298,7 +299,8 @@ class HybridTeamBlueprint(BlueprintBase):
 
     async def _execute_delegations(self, delegations: list[dict]) -> AsyncGenerator[dict, None]:
         """Run delegations in parallel on a ThreadPoolExecutor, yielding each result
-        dict as it completes (out of order).
+        dict as it completes (out of order). Each worker waits on its delegation,
+        which runs on the shared background loop (:func:`run_sync`).
 
         Each result is ``{role, task, status: completed|failed, result|error,
         model_used}``. Failures are isolated (one bad sub-task never kills the
@@ -316,10 +318,9 @@ class HybridTeamBlueprint(BlueprintBase):
                 time.sleep(self._DELEGATION_LAUNCH_DELAY_S)
             base = {"role": role, "task": task, "model_used": model_used}
             try:
-                # Own event loop per worker thread, with a hard per-task timeout.
-                out = asyncio.run(
-                    asyncio.wait_for(self._run_delegation(d), timeout=self._DELEGATION_TIMEOUT_S)
-                )
+                # On the shared background loop (loop-bound clients survive
+                # between delegations), with a hard per-task timeout.
+                out = run_sync(self._run_delegation(d), timeout=self._DELEGATION_TIMEOUT_S)
                 return {**base, "status": "completed", "result": out}
             except (TimeoutError, asyncio.TimeoutError):
                 return {**base, "status": "failed", "error": f"timed out after {self._DELEGATION_TIMEOUT_S:.0f}s"}
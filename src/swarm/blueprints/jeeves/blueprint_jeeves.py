@@ -161,6 +161,8 @@ execute_shell_command_tool = function_tool(execute_shell_command)
 
 # --- Unified Operation/Result Box for UX ---
 class JeevesBlueprint(BlueprintBase):
+    prebuild_starting_agent = True
+
     @staticmethod
     def print_search_progress_box(*args, **kwargs):
         from swarm.core.output_utils import (
@@ -319,7 +321,7 @@ class JeevesBlueprint(BlueprintBase):
         # Actually run the agent and get the LLM response (reference geese blueprint)
         llm_response = ""
         try:
-            agent = self.create_starting_agent([])
+            agent = self.starting_agent([])
             response = await Runner.run(agent, instruction)
             llm_response = getattr(response, 'final_output', str(response))
             results = [llm_response.strip() or "(No response from LLM)"]
@@ -361,7 +363,7 @@ class JeevesBlueprint(BlueprintBase):
     async def _run_non_interactive(self, messages: list[dict[str, Any]], **kwargs) -> Any:
         logger.info(f"Running Jeeves non-interactively with instruction: '{messages[-1].get('content', '')[:100]}...'")
         mcp_servers = kwargs.get("mcp_servers", [])
-        agent = self.create_starting_agent(mcp_servers=mcp_servers)
+        agent = self.starting_agent(mcp_servers)
         os.getenv("LITELLM_MODEL") or os.getenv("DEFAULT_LLM") or "gpt-3.5-turbo"
         try:
             result = await Runner.run(agent, messages[-1].get("content", ""))
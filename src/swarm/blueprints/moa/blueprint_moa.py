@@ -6,6 +6,7 @@ Legacy aliases: ``cli_fusion``, ``cli_ensemble`` (same blueprint class; read-onl
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, ClassVar
 
@@ -13,6 +14,8 @@ from swarm.core.blueprint_base import BlueprintBase
 from swarm.core.moa import MoAOrchestrator, PermissionMode
 from swarm.core.moa.backends import FakeParticipantBackend
 from swarm.core.moa.cli import build_backend
+from swarm.core.moa.orchestrator import relay_progress
+from swarm.core.moa.scheduling import get_seat_stats
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +91,34 @@ class MoABlueprint(BlueprintBase):
             return FakeParticipantBackend(stubs)
         return build_backend(backend=kind, timeout=timeout)
 
+    def _quorum(self) -> tuple[int, float]:
+        """``(quorum, grace_seconds)`` from params or ``moa`` config (0 = all seats)."""
+        moa_cfg = (self._config or {}).get("moa") or {}
+        quorum = self._params.get("quorum") or moa_cfg.get("quorum") or 0
+        grace = self._params.get("quorum_grace") or moa_cfg.get("quorum_grace") or 0.0
+        return int(quorum), float(grace)
+
+    def _scheduling(self, backend: Any) -> dict[str, Any]:
+        """Failover chain and latency-aware scheduling options for the orchestrator.
+
+        ``moa.adaptive`` (default on) enables persisted seat latency stats for
+        live backends; they steer hedging and failover order but never shorten
+        ``default_timeout``. The fake backend never records history.
+        """
+        moa_cfg = (self._config or {}).get("moa") or {}
+        failover = self._params.get("failover") or moa_cfg.get("failover") or []
+        if isinstance(failover, str):
+            failover = [f.strip() for f in failover.split(",") if f.strip()]
+        adaptive = self._params.get("adaptive", moa_cfg.get("adaptive", True))
+        stats = None
+        if adaptive and not isinstance(backend, FakeParticipantBackend):
+            stats = get_seat_stats()
+        return {
+            "failover": list(failover),
+            "stats": stats,
+            "hedge": bool(self._params.get("hedge", moa_cfg.get("hedge", True))),
+        }
+
     def _permission(self) -> str:
         moa_cfg = (self._config or {}).get("moa") or {}
         raw = self._params.get("permission") or moa_cfg.get("permission") or "approve-reads"
@@ -120,9 +151,14 @@ class MoABlueprint(BlueprintBase):
             }
             return
 
+        quorum, quorum_grace = self._quorum()
+        backend = self._backend()
         orch = MoAOrchestrator(
-            backend=self._backend(),
+            backend=backend,
             participant_permission=self._permission(),
+            quorum=quorum,
+            quorum_grace=quorum_grace,
+            **self._scheduling(backend),
         )
         from swarm.core.workdir import (
             WorkdirEscapeError,
@@ -146,13 +182,28 @@ class MoABlueprint(BlueprintBase):
             return
         try:
             # Determination always orchestrator-side (default synthesizer or inject later).
-            result = await orch.run(
-                question,
-                participants,
-                cwd=cwd,
-                act=bool(self._params.get("act")),
-                action=self._params.get("action"),
+            # Seat progress is forwarded as side-channel chunks (no role/content,
+            # so chat completions skip them) while the panel is still answering.
+            progress: asyncio.Queue = asyncio.Queue()
+            run = asyncio.ensure_future(
+                orch.run(
+                    question,
+                    participants,
+                    cwd=cwd,
+                    act=bool(self._params.get("act")),
+                    action=self._params.get("action"),
+                    on_progress=progress.put_nowait,
+                )
             )
+            async for delta in relay_progress(progress, run):
+                if delta.done:
+                    status = "ok" if delta.opinion.ok else f"failed: {delta.opinion.error}"
+                    yield {"type": "progress", "seat": delta.name, "done": True,
+                           "ok": delta.opinion.ok, "progress": f"{delta.name}: {status}"}
+                else:
+                    yield {"type": "progress", "seat": delta.name, "delta": delta.text,
+                           "progress": f"{delta.name} answering"}
+            result = run.result()
             det = result.determination
             answer = det.answer if det else "No determination."
             ok_names = [o.name for o in result.ok_opinions]
@@ -163,6 +214,7 @@ class MoABlueprint(BlueprintBase):
                 "participants": [o.name for o in result.opinions],
                 "ok_participants": ok_names,
                 "act": bool(result.act_result),
+                "skipped_participants": result.meta.get("skipped") or [],
             }
             message = {"role": "assistant", "content": answer}
             # ChatCompletionsView accepts {messages: [...]} final shape + meta side-channel.
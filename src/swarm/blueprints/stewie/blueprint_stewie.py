@@ -60,6 +60,8 @@ brian_instructions = (
 class StewieBlueprint(BlueprintBase):
     """Manages WordPress content with a Stewie agent team using the `server-wp-mcp` server."""
 
+    prebuild_starting_agent = True
+
     def __init__(
         self,
         blueprint_id: str = "stewie",
@@ -234,7 +236,7 @@ class StewieBlueprint(BlueprintBase):
     async def _run_non_interactive(self, instruction: str, **kwargs) -> Any:
         logger.info(f"Running Stewie non-interactively with instruction: '{instruction[:100]}...'")
         mcp_servers = kwargs.get("mcp_servers", [])
-        agent = self.create_starting_agent(mcp_servers=mcp_servers)
+        agent = self.starting_agent(mcp_servers)
         # Use Runner.run as a classmethod for portability
         import os
 
@@ -163,6 +163,8 @@ You MUST plan extensively before each function call, and reflect extensively on
 class SuggestionBlueprint(BlueprintBase):
     """A blueprint defining an agent that generates structured JSON suggestions using output_type."""
 
+    prebuild_starting_agent = True
+
     metadata: ClassVar[dict[str, Any]] = {
         "name": "SuggestionBlueprint",
         "title": "Suggestion Blueprint (Structured Output)",
@@ -250,7 +252,7 @@ class SuggestionBlueprint(BlueprintBase):
     async def _run_non_interactive(self, instruction: str, **kwargs) -> Any:
         logger.info(f"Running SuggestionBlueprint non-interactively with instruction: '{instruction[:100]}...'")
         mcp_servers = kwargs.get("mcp_servers", [])
-        agent = self.create_starting_agent(mcp_servers=mcp_servers)
+        agent = self.starting_agent(mcp_servers)
         import os
 
         from agents import Runner
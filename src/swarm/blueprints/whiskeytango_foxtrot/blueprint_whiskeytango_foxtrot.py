@@ -115,6 +115,8 @@ Available MCP Tools: mcp-doc-forge.
 # --- Define the Blueprint ---
 class WhiskeyTangoFoxtrotBlueprint(BlueprintBase):
     """Tracks free online services with a hierarchical spy-inspired agent team using SQLite and web search."""
+
+    prebuild_starting_agent = True
     metadata: ClassVar[dict[str, Any]] = {
         "name": "WhiskeyTangoFoxtrotBlueprint",
         "title": "WhiskeyTangoFoxtrot Service Tracker",
@@ -235,7 +237,7 @@ class WhiskeyTangoFoxtrotBlueprint(BlueprintBase):
         yielded_spinner = False
         result_chunks = []
         try:
-            runner_gen = Runner.run(self.create_starting_agent([]), instruction)
+            runner_gen = Runner.run(self.starting_agent([]), instruction)
             while True:
                 now = time.time()
                 try:
@@ -44,6 +44,7 @@ class ZeusCoordinatorBlueprint(BlueprintBase):
     CLI_NAME = "zeus"
     DESCRIPTION = "Zeus: The coordinator agent for Open Swarm, using all other gods as tools."
     VERSION = "1.0.0"
+    prebuild_starting_agent = True
     # Add more Zeus features here as needed
 
     @classmethod
@@ -104,7 +105,7 @@ class ZeusCoordinatorBlueprint(BlueprintBase):
         yielded_spinner = True  # We already yielded one spinner
         result_chunks = []
         try:
-            agent = self.create_starting_agent()
+            agent = self.starting_agent()
 
             # If the underlying Agent instance doesn't implement an async
             # ``run`` method we try to fall back to the canonical Runner from
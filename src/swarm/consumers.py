@@ -1,11 +1,15 @@
+import asyncio
 import json
 import logging
 import os
 import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
 from urllib.parse import parse_qs
 
 from channels.db import database_sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
+from django.db import transaction
 from django.template.loader import render_to_string
 from django.utils.html import escape
 
@@ -16,9 +20,272 @@ logger = logging.getLogger(__name__)
 # Lazy sentinel — replaced on first use so the module-level name is patchable in tests.
 AsyncOpenAI = None
 
-# In-memory conversation storage (populated lazily).
+# Upper bounds for the in-memory transcript cache. Evicted conversations are
+# rehydrated from the DB on the next fetch, so these only trade memory for
+# reconnect latency.
+CONVERSATION_CACHE_MAX_CONVERSATIONS = int(os.environ.get("SWARM_WS_CACHE_CONVERSATIONS", "256"))
+CONVERSATION_CACHE_MAX_MESSAGES = int(os.environ.get("SWARM_WS_CACHE_MESSAGES", "20000"))
+
+# Write-behind batching for per-turn message persistence.
+MESSAGE_FLUSH_INTERVAL = float(os.environ.get("SWARM_WS_FLUSH_INTERVAL", "0.05"))
+MESSAGE_FLUSH_MAX_BATCH = 500
+# A batch that fails this many flushes in a row is dropped (and logged).
+MESSAGE_FLUSH_MAX_ATTEMPTS = 3
+
+
+class ConversationCache(OrderedDict):
+    """LRU mapping of transcripts bounded by conversations and total messages.
+
+    Reads (``[]``/``get``) and :meth:`touch` mark an entry as recently used;
+    inserts and touches evict least-recently-used entries until both bounds
+    hold. The most recent entry is never evicted, so a single oversized
+    transcript stays cached while it is live. The message total is kept as a
+    running count, refreshed per entry on insert and :meth:`touch`.
+    """
+
+    def __init__(self, *args, max_conversations=None, max_messages=None, **kwargs):
+        self.max_conversations = (
+            CONVERSATION_CACHE_MAX_CONVERSATIONS if max_conversations is None else max_conversations
+        )
+        self.max_messages = CONVERSATION_CACHE_MAX_MESSAGES if max_messages is None else max_messages
+        self._sizes = {}
+        self._total = 0
+        super().__init__(*args, **kwargs)
+
+    def _resize(self, key, value):
+        size = len(value) if isinstance(value, list) else 0
+        self._total += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+    def _forget(self, key):
+        self._total -= self._sizes.pop(key, 0)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._resize(key, value)
+        self.move_to_end(key)
+        self._evict()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._forget(key)
+
+    def pop(self, key, *default):
+        value = super().pop(key, *default)
+        self._forget(key)
+        return value
+
+    def popitem(self, last=True):
+        key, value = super().popitem(last=last)
+        self._forget(key)
+        return key, value
+
+    def clear(self):
+        super().clear()
+        self._sizes.clear()
+        self._total = 0
+
+    def copy(self):
+        # Plain items() does not go through __getitem__, so iteration order is stable.
+        return self.__class__(
+            list(self.items()),
+            max_conversations=self.max_conversations,
+            max_messages=self.max_messages,
+        )
+
+    def touch(self, key):
+        """Mark ``key`` as recently used and re-apply the bounds (transcripts grow in place)."""
+        if key in self:
+            self.move_to_end(key)
+            self._resize(key, super().__getitem__(key))
+            self._evict()
+
+    def total_messages(self):
+        return self._total
+
+    def _evict(self):
+        while len(self) > 1 and (
+            len(self) > self.max_conversations or self.total_messages() > self.max_messages
+        ):
+            self.popitem(last=False)
+
+
+# In-memory conversation storage (populated lazily, LRU-bounded).
 # Keys are (user_id, conversation_id) to prevent cross-user cache IDOR.
-IN_MEMORY_CONVERSATIONS = {}
+IN_MEMORY_CONVERSATIONS = ConversationCache()
+
+
+@dataclass
+class PendingMessage:
+    """A transcript turn queued for write-behind persistence."""
+
+    student_id: int
+    conversation_id: str
+    role: str
+    content: str
+
+
+def persist_pending_messages(batch):
+    """Append queued turns to the DB: O(1) queries per conversation in the batch.
+
+    Conversations are created on first write. Turns for a conversation owned
+    by another user are dropped (same ownership rule as ``save_conversation``).
+    """
+    by_conversation = {}
+    for entry in batch:
+        by_conversation.setdefault(entry.conversation_id, []).append(entry)
+
+    with transaction.atomic():
+        existing = {
+            chat.conversation_id: chat
+            for chat in ChatConversation.objects.filter(conversation_id__in=list(by_conversation))
+        }
+        rows = []
+        for conversation_id, entries in by_conversation.items():
+            student_id = entries[0].student_id
+            chat = existing.get(conversation_id)
+            if chat is None:
+                chat, _ = ChatConversation.objects.get_or_create(
+                    conversation_id=conversation_id,
+                    defaults={"student_id": student_id},
+                )
+            if chat.student_id is None:
+                chat.student_id = student_id
+                chat.save(update_fields=["student"])
+            for entry in entries:
+                if entry.student_id != chat.student_id:
+                    logger.warning(
+                        "Refusing to append to conversation %s: owned by another user (requested by %s)",
+                        conversation_id,
+                        entry.student_id,
+                    )
+                    continue
+                rows.append(ChatMessage(conversation=chat, sender=entry.role, content=entry.content))
+        ChatMessage.objects.bulk_create(rows)
+    return len(rows)
+
+
+class ConversationWriteBehind:
+    """Process-wide write-behind queue for chat turns.
+
+    :meth:`enqueue` is non-blocking; a flush is scheduled ``flush_interval``
+    seconds later so turns from many concurrent conversations share one
+    transaction and one ``bulk_create``. :meth:`flush` drains everything
+    queued so far and waits for in-flight writes; given a conversation it
+    drains only that conversation's turns, so a connect or disconnect that
+    needs a consistent DB view does not wait on every other user's backlog.
+
+    A batch whose write fails goes back to the front of the queue and is
+    retried on the next timer; after ``MESSAGE_FLUSH_MAX_ATTEMPTS`` failures
+    in a row it is dropped and counted in ``dropped``.
+    """
+
+    def __init__(self, flush_interval=None, max_batch=None):
+        self.flush_interval = MESSAGE_FLUSH_INTERVAL if flush_interval is None else flush_interval
+        self.max_batch = max_batch or MESSAGE_FLUSH_MAX_BATCH
+        self.pending = []
+        self.failures = 0
+        self.dropped = 0
+        self._loop = None
+        self._lock = None
+        self._flush_task = None
+
+    def _bind_loop(self):
+        # Lock and timer task belong to the running loop; rebind if it changed.
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._flush_task = None
+        return loop
+
+    def enqueue(self, user, conversation_id, role, content):
+        student_id = getattr(user, "pk", None)
+        self.pending.append(PendingMessage(student_id, conversation_id, role, content))
+        loop = self._bind_loop()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = loop.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    def _take_batch(self, key=None):
+        """Pop up to ``max_batch`` queued turns, optionally only those for ``key``."""
+        if key is None:
+            batch = self.pending[: self.max_batch]
+            del self.pending[: self.max_batch]
+            return batch
+        batch, rest = [], []
+        for entry in self.pending:
+            if len(batch) < self.max_batch and (entry.student_id, entry.conversation_id) == key:
+                batch.append(entry)
+            else:
+                rest.append(entry)
+        self.pending[:] = rest
+        return batch
+
+    async def flush(self, user=None, conversation_id=None):
+        """Persist queued turns; returns the number of rows written.
+
+        With ``conversation_id`` only ``user``'s turns for that conversation
+        are written. The lock is held per batch, so such a flush waits for at
+        most the batch already in flight (which may hold its earlier turns).
+        """
+        if not self.pending and self._lock is None:
+            return 0
+        self._bind_loop()
+        key = None if conversation_id is None else (getattr(user, "pk", None), conversation_id)
+        written = 0
+        while True:
+            async with self._lock:
+                batch = self._take_batch(key)
+                if not batch:
+                    break
+                try:
+                    written += await database_sync_to_async(persist_pending_messages)(batch)
+                except Exception:
+                    self.failures += 1
+                    if self.failures >= MESSAGE_FLUSH_MAX_ATTEMPTS:
+                        logger.exception(
+                            "Dropping %d chat message(s) after %d failed flushes", len(batch), self.failures
+                        )
+                        self.dropped += len(batch)
+                        self.failures = 0
+                        continue
+                    logger.warning(
+                        "Failed to persist %d chat message(s) (attempt %d); will retry",
+                        len(batch),
+                        self.failures,
+                        exc_info=True,
+                    )
+                    self.pending[:0] = batch
+                    self._flush_task = self._loop.create_task(self._flush_later())
+                    break
+                self.failures = 0
+        return written
+
+    def discard(self):
+        """Drop queued turns and cancel the pending timer (test/shutdown helper)."""
+        self.pending.clear()
+        if self._flush_task is not None and not self._flush_task.done():
+            loop = self._flush_task.get_loop()
+            if not loop.is_closed():
+                self._flush_task.cancel()
+        self._flush_task = None
+
+
+CONVERSATION_WRITER = ConversationWriteBehind()
 
 # Custom close code for anonymous connects (HTTP 401 analogue). Accept-then-close
 # so browsers receive a CloseEvent with this code instead of opaque 1006.
@@ -68,6 +335,8 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
         self.default_blueprint = (query_params.get("blueprint") or [None])[0]
 
         if self.user.is_authenticated:
+            # Queued turns from an earlier connection must land before rehydrating.
+            await CONVERSATION_WRITER.flush(self.user, self.conversation_id)
             self.messages = await self.fetch_conversation(self.conversation_id)
             await self.accept()
         else:
@@ -83,7 +352,8 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
 
     async def disconnect(self, close_code):
         if self.user.is_authenticated:
-            await self.save_conversation(self.conversation_id, self.messages)
+            # Turns were appended as they happened; just drain this conversation's.
+            await CONVERSATION_WRITER.flush(self.user, self.conversation_id)
 
             # Delete conversation from DB and memory if empty
             if not self.messages:
@@ -116,12 +386,7 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
             self, "default_blueprint", None
         )
 
-        self.messages.append(
-            {
-                "role": "user",
-                "content": message_text,
-            }
-        )
+        self.append_message("user", message_text)
 
         user_message_html = render_to_string(
             "websocket_partials/user_message.html",
@@ -142,6 +407,12 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
         else:
             await self.respond_with_default_model(contents_div_id)
 
+    def append_message(self, role, content):
+        """Add a turn to the live transcript and queue its DB append."""
+        self.messages.append({"role": role, "content": content})
+        CONVERSATION_WRITER.enqueue(self.user, self.conversation_id, role, content)
+        IN_MEMORY_CONVERSATIONS.touch(_conversation_cache_key(self.user, self.conversation_id))
+
     async def respond_with_blueprint(self, blueprint_id, contents_div_id):
         """Generate the assistant reply by running a discovered blueprint."""
         # In test mode, skip slow blueprint instantiation and return canned output.
@@ -159,7 +430,7 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
             instruction = self.messages[-1]["content"] if self.messages else ""
             canned = f"[TEST-MODE] Jeeves at your service. You said: '{instruction}'" if blueprint_id == "jeeves" else f"[TEST-MODE] {blueprint_id} at your service. You said: '{instruction}'"
             await self.send(text_data=_oob_append_html(contents_div_id, canned))
-            self.messages.append({"role": "assistant", "content": canned})
+            self.append_message("assistant", canned)
             final_html = render_to_string(
                 "websocket_partials/final_system_message.html",
                 {"contents_div_id": contents_div_id, "message": canned},
@@ -217,12 +488,7 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
         full_message = final_message["content"]
         await self.send(text_data=_oob_append_html(contents_div_id, full_message))
 
-        self.messages.append(
-            {
-                "role": "assistant",
-                "content": full_message,
-            }
-        )
+        self.append_message("assistant", full_message)
 
         final_message_html = render_to_string(
             "websocket_partials/final_system_message.html",
@@ -308,12 +574,7 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
                     text_data=_oob_append_html(contents_div_id, message_chunk)
                 )
 
-        self.messages.append(
-            {
-                "role": "assistant",
-                "content": full_message,
-            }
-        )
+        self.append_message("assistant", full_message)
 
         final_message = render_to_string(
             "websocket_partials/final_system_message.html",
@@ -328,7 +589,8 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
     @database_sync_to_async
     def fetch_conversation(self, conversation_id):
         """
-        Fetch conversation messages from memory or DB. If missing from memory, load from DB.
+        Fetch conversation messages from memory or DB. If missing from memory
+        (never loaded, or evicted by the LRU bound), rehydrate from the DB.
         """
         cache_key = _conversation_cache_key(self.user, conversation_id)
         if cache_key in IN_MEMORY_CONVERSATIONS:
@@ -336,7 +598,8 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
 
         try:
             chat = ChatConversation.objects.get(conversation_id=conversation_id, student=self.user)
-            messages = [{'role': m['sender'], 'content': m['content']} for m in chat.messages.values("sender", "content")]
+            rows = chat.messages.order_by("timestamp", "pk").values("sender", "content")
+            messages = [{'role': m['sender'], 'content': m['content']} for m in rows]
             IN_MEMORY_CONVERSATIONS[cache_key] = messages  # Cache it
             return messages
         except ChatConversation.DoesNotExist:
@@ -345,10 +608,11 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
 
     @database_sync_to_async
     def save_conversation(self, conversation_id, new_messages):
-        """Replace DB messages with the current in-memory transcript.
+        """Replace DB messages with the given transcript.
 
-        Disconnect always persists the full transcript. Without clearing
-        prior rows, reconnect → disconnect would bulk_create duplicates.
+        Normal turns are appended incrementally via ``append_message``; this
+        is the explicit full resync. Without clearing prior rows, a repeat
+        save would bulk_create duplicates.
 
         Lookup is by conversation_id PK only (avoids IntegrityError when the
         row exists for another student); ownership is then validated.
@@ -396,4 +660,4 @@ class DjangoChatConsumer(AsyncWebsocketConsumer):
                 if cache_key in IN_MEMORY_CONVERSATIONS:
                     del IN_MEMORY_CONVERSATIONS[cache_key]  # Cleanup memory cache
         except ChatConversation.DoesNotExist:
-            logger.warning(f"Attempted to delete non-existent conversation: {conversation_id} for user: {self.user}")
+            logger.debug(f"Attempted to delete non-existent conversation: {conversation_id} for user: {self.user}")
@@ -1,6 +1,9 @@
 # --- REMOVE noisy debug/framework prints unless SWARM_DEBUG=1 ---
+import asyncio
 import os
 
+from swarm.core import server_timing
+
 
 def _should_debug():
     # Standardize debug detection: SWARM_DEBUG, SWARM_LOGLEVEL, LOGLEVEL, LOG_LEVEL, DEBUG
@@ -56,6 +59,10 @@ from swarm.core.config_loader import (
 )
 
 logger = logging.getLogger(__name__)
+
+# How long a run waits for memory retrieval before proceeding without it
+# (per blueprint: memory.deadline_ms).
+MEMORY_DEADLINE_MS = float(os.getenv("SWARM_MEMORY_DEADLINE_MS", "300"))
 # --- PATCH: Suppress OpenAI tracing/telemetry errors if using LiteLLM/custom endpoint ---
 import logging
 
@@ -148,6 +155,9 @@ class BlueprintBase(ABC):
     """
     enable_terminal_commands: bool = False  # By default, terminal command execution is disabled
     approval_required: bool = False
+    # Set by blueprints whose run() takes its agent from starting_agent(), so
+    # prepare_run() builds it while memory retrieval is in flight.
+    prebuild_starting_agent: bool = False
     console = Console()
     session_logger = None
 
@@ -162,6 +172,8 @@ class BlueprintBase(ABC):
         # --- Optional memory integration (strict no-op unless configured) ---
         self._memory_backend = None
         self._memory_settings = {}
+        self._memory_namespace = ""
+        self._prepared_agent = None  # (mcp_servers, agent) from prepare_run()
         self._init_memory_backend()
         # Add any additional initialization logic here
 
@@ -411,33 +423,33 @@ class BlueprintBase(ABC):
         profile_source = None
         import logging
         logger = logging.getLogger(__name__)
-        logger.debug(f"[DEBUG _resolve_llm_profile] blueprint_id/name: {name}")
-        logger.debug(f"[DEBUG _resolve_llm_profile] self._config: {self._config}")
+        logger.debug("[DEBUG _resolve_llm_profile] blueprint_id/name: %s", name)
+        logger.debug("[DEBUG _resolve_llm_profile] self._config: %s", self._config)
 
         # 1. Explicit override
         if getattr(self, '_llm_profile_name', None):
             profile = self._llm_profile_name
             profile_source = "programmatic override"
-            logger.debug(f"[DEBUG _resolve_llm_profile] Using programmatic override: {profile}")
+            logger.debug("[DEBUG _resolve_llm_profile] Using programmatic override: %s", profile)
         # 2. Blueprint config (top-level) — llm_profile or documented default_model
         elif self._config:
             top = self._config.get('llm_profile') or self._config.get('default_model')
             if top:
                 profile = str(top)
                 profile_source = "top-level llm_profile/default_model"
-                logger.debug(f"[DEBUG _resolve_llm_profile] Using top-level profile: {profile}")
+                logger.debug("[DEBUG _resolve_llm_profile] Using top-level profile: %s", profile)
 
         # 3. Per-blueprint section (do not elif-skip settings when blueprints
         #    exists but has no profile key — that was the silent-default bug).
         if not profile and self._config and self._config.get('blueprints'):
-            logger.debug(f"[DEBUG _resolve_llm_profile] Checking per-blueprint config for: {name}")
+            logger.debug("[DEBUG _resolve_llm_profile] Checking per-blueprint config for: %s", name)
             bp_cfg = self._config['blueprints'].get(name) or self._config['blueprints'].get(name.replace('Blueprint', ''))
-            logger.debug(f"[DEBUG _resolve_llm_profile] bp_cfg: {bp_cfg}")
+            logger.debug("[DEBUG _resolve_llm_profile] bp_cfg: %s", bp_cfg)
             bp_profile = self._blueprint_section_profile_name(bp_cfg if isinstance(bp_cfg, dict) else None)
             if bp_profile:
                 profile = bp_profile
                 profile_source = "blueprints[].llm_profile/default_model"
-                logger.debug(f"[DEBUG _resolve_llm_profile] Using per-blueprint profile: {profile}")
+                logger.debug("[DEBUG _resolve_llm_profile] Using per-blueprint profile: %s", profile)
 
         # 4. settings.default_llm_profile / legacy default_llm
         if not profile:
@@ -445,7 +457,7 @@ class BlueprintBase(ABC):
             if settings_profile:
                 profile = settings_profile
                 profile_source = "settings.default_llm_profile"
-                logger.debug(f"[DEBUG _resolve_llm_profile] Using settings default: {profile}")
+                logger.debug("[DEBUG _resolve_llm_profile] Using settings default: %s", profile)
 
         # 5–6. Global file lookup only when local config did not name a profile
         if not profile:
@@ -498,7 +510,7 @@ class BlueprintBase(ABC):
         ):
             profile = self._fallback_llm_profile_name(str(profile), source=profile_source)
 
-        logger.debug(f"[DEBUG _resolve_llm_profile] Final resolved profile: {profile}")
+        logger.debug("[DEBUG _resolve_llm_profile] Final resolved profile: %s", profile)
         self._resolved_llm_profile = profile
         return profile
 
@@ -614,9 +626,9 @@ class BlueprintBase(ABC):
         if not hasattr(self, '_openai_client_cache'):
             self._openai_client_cache = {}
         if profile_name in self._model_instance_cache:
-            logger.debug(f"Using cached Model instance for profile '{profile_name}'.")
+            logger.debug("Using cached Model instance for profile '%s'.", profile_name)
             return self._model_instance_cache[profile_name]
-        logger.debug(f"Creating new Model instance for profile '{profile_name}'.")
+        logger.debug("Creating new Model instance for profile '%s'.", profile_name)
         profile_data = self.get_llm_profile(profile_name)
         import os
         # --- PATCH: API mode selection ---
@@ -629,7 +641,7 @@ class BlueprintBase(ABC):
         client_kwargs = { "api_key": profile_data.get("api_key"), "base_url": profile_data.get("base_url") }
         filtered_kwargs = {k: v for k, v in client_kwargs.items() if v is not None}
         log_kwargs = {k:v for k,v in filtered_kwargs.items() if k != 'api_key'}
-        logger.debug(f"Creating new AsyncOpenAI client for '{profile_name}' with {log_kwargs} and api_mode={api_mode}")
+        logger.debug("Creating new AsyncOpenAI client for '%s' with %s and api_mode=%s", profile_name, log_kwargs, api_mode)
         client_cache_key = f"{provider}_{profile_data.get('base_url')}_{api_mode}"
         if client_cache_key not in self._openai_client_cache:
             from openai import AsyncOpenAI
@@ -690,14 +702,43 @@ class BlueprintBase(ABC):
                 return
             self._memory_settings = mem_cfg
             self._memory_backend = backend
+            self._memory_namespace = json.dumps(mem_cfg, sort_keys=True, default=str)
             self._wrap_run_with_memory()
-            logger.debug(f"Memory backend '{mem_cfg.get('backend')}' enabled for blueprint '{self.blueprint_id}'.")
+            logger.debug("Memory backend '%s' enabled for blueprint '%s'.", mem_cfg.get('backend'), self.blueprint_id)
         except Exception as e:
-            logger.warning(f"Failed to initialize memory backend for '{self.blueprint_id}': {e}")
+            logger.warning("Failed to initialize memory backend for '%s': %s", self.blueprint_id, e)
 
     def _memory_user_id(self, user_id: str = None) -> str:
         return user_id or getattr(self, "_memory_settings", {}).get("user_id") or "default"
 
+    @staticmethod
+    def _memory_query(messages: list) -> str:
+        """Content of the latest user message ('' when there is none)."""
+        for msg in reversed(messages or []):
+            if isinstance(msg, dict) and msg.get("role") == "user" and msg.get("content"):
+                return str(msg["content"])
+        return ""
+
+    @staticmethod
+    def _with_memories(messages: list, memories: list) -> list:
+        memories = [str(m).strip() for m in memories or [] if str(m).strip()]
+        if not memories:
+            return messages
+        memory_text = "\n".join(f"- {m}" for m in memories)
+        memory_message = {
+            "role": "system",
+            "content": f"Relevant memories from previous conversations:\n{memory_text}",
+        }
+        return [memory_message, *list(messages)]
+
+    def _memory_cache_ttl(self) -> float:
+        from swarm.memory.query_cache import MEMORY_CACHE_TTL
+        return float(getattr(self, "_memory_settings", {}).get("cache_ttl", MEMORY_CACHE_TTL))
+
+    def _memory_deadline(self) -> float:
+        """Seconds a run waits for memory retrieval (``memory.deadline_ms``)."""
+        return max(0.0, float(getattr(self, "_memory_settings", {}).get("deadline_ms", MEMORY_DEADLINE_MS))) / 1000
+
     def inject_memory_context(self, messages: list, user_id: str = None) -> list:
         """Prepend a system message with memories relevant to the latest user message.
 
@@ -705,35 +746,120 @@ class BlueprintBase(ABC):
         message is present, or no relevant memories are found.
         """
         backend = self.memory_backend
-        if backend is None or not messages:
-            return messages
-        query = ""
-        for msg in reversed(messages):
-            if isinstance(msg, dict) and msg.get("role") == "user" and msg.get("content"):
-                query = str(msg["content"])
-                break
+        query = self._memory_query(messages) if backend is not None else ""
         if not query:
             return messages
+        from swarm.memory import MEMORY_QUERY_CACHE
+        user_id = self._memory_user_id(user_id)
+        memories = MEMORY_QUERY_CACHE.get(self._memory_namespace, user_id, query, self._memory_cache_ttl())
+        if memories is None:
+            generation = MEMORY_QUERY_CACHE.generation(self._memory_namespace, user_id)
+            try:
+                memories = backend.search(query, user_id=user_id) or []
+            except Exception as e:
+                logger.warning("Memory search failed for '%s': %s", self.blueprint_id, e)
+                return messages
+            MEMORY_QUERY_CACHE.put(self._memory_namespace, user_id, query, memories, generation)
+        return self._with_memories(messages, memories)
+
+    async def _search_memories(self, query: str, user_id: str) -> list:
+        """Backend search through the query cache; errors are logged and yield ``[]``."""
+        from swarm.memory import asearch_cached
         try:
-            memories = backend.search(query, user_id=self._memory_user_id(user_id)) or []
+            return await asearch_cached(self.memory_backend, self._memory_namespace, user_id, query)
         except Exception as e:
-            logger.warning(f"Memory search failed for '{self.blueprint_id}': {e}")
-            return messages
-        memories = [str(m).strip() for m in memories if str(m).strip()]
-        if not memories:
+            logger.warning("Memory search failed for '%s': %s", self.blueprint_id, e)
+            return []
+
+    def prefetch_memory(self, messages: list, user_id: str = None) -> "asyncio.Future | None":
+        """Start retrieving memories for ``messages`` without waiting for them.
+
+        Returns a future resolving to the memory snippets (already done on a
+        cache hit), or ``None`` when there is nothing to look up. Must be
+        called from a running event loop.
+        """
+        backend = self.memory_backend
+        query = self._memory_query(messages) if backend is not None else ""
+        if not query:
+            return None
+        from swarm.memory import MEMORY_QUERY_CACHE
+        user_id = self._memory_user_id(user_id)
+        cached = MEMORY_QUERY_CACHE.get(self._memory_namespace, user_id, query, self._memory_cache_ttl())
+        if cached is not None:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(cached)
+            return future
+        return asyncio.ensure_future(self._search_memories(query, user_id))
+
+    async def ainject_memory_context(
+        self, messages: list, user_id: str = None, *, pending: "asyncio.Future | None" = None,
+        deadline: float | None = None,
+    ) -> list:
+        """Async :meth:`inject_memory_context` with a deadline.
+
+        Waits for ``pending`` (from :meth:`prefetch_memory`; started here when
+        omitted) until the loop time ``deadline`` (default: now plus
+        ``memory.deadline_ms``). Past the deadline the run goes ahead without
+        memory context; the search keeps going and fills the query cache for
+        the next run.
+        """
+        if pending is None:
+            pending = self.prefetch_memory(messages, user_id=user_id)
+            if pending is None:
+                return messages
+        loop = asyncio.get_running_loop()
+        if deadline is None:
+            deadline = loop.time() + self._memory_deadline()
+        try:
+            with server_timing.phase("memory"):
+                memories = await asyncio.wait_for(asyncio.shield(pending), max(0.0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            logger.info("Memory retrieval for '%s' missed its deadline; running without it.", self.blueprint_id)
             return messages
-        memory_text = "\n".join(f"- {m}" for m in memories)
-        memory_message = {
-            "role": "system",
-            "content": f"Relevant memories from previous conversations:\n{memory_text}",
-        }
-        return [memory_message, *list(messages)]
+        return self._with_memories(messages, memories)
+
+    async def prepare_run(self, _messages: list, **kwargs) -> None:
+        """Startup work that does not need memory context.
+
+        With memory configured, the run wrapper awaits this concurrently with
+        memory retrieval, so setup and the search overlap instead of adding
+        up. Blueprints that set ``prebuild_starting_agent`` get their agent
+        graph (``create_starting_agent``: model clients, tools,
+        :meth:`make_agent`) built here, off the event loop, and must pick it
+        up through :meth:`starting_agent`; others get the LLM client for their
+        profile pre-built. Subclasses may override this to
+        start other setup early (e.g. MCP tool discovery), but ``run()`` must
+        not depend on it being called.
+        """
+        mcp_servers = list(kwargs.get("mcp_servers") or [])
+        try:
+            if self.prebuild_starting_agent:
+                agent = await asyncio.to_thread(self.create_starting_agent, mcp_servers)
+                self._prepared_agent = (mcp_servers, agent)
+            else:
+                await asyncio.to_thread(lambda: self._get_model_instance(self._resolve_llm_profile()))
+        except Exception as e:  # run() surfaces real configuration errors
+            logger.debug("prepare_run could not pre-build the agent for '%s': %s", self.blueprint_id, e)
+
+    def starting_agent(self, mcp_servers: list = None):
+        """The starting agent for this run.
+
+        Hands over the agent :meth:`prepare_run` built for the same MCP
+        servers (once), otherwise calls ``create_starting_agent``.
+        """
+        mcp_servers = list(mcp_servers or [])
+        prepared, self._prepared_agent = getattr(self, "_prepared_agent", None), None
+        if prepared is not None and prepared[0] == mcp_servers:
+            return prepared[1]
+        return self.create_starting_agent(mcp_servers)
 
     def store_run_memory(self, messages: list, run_chunks: list = None, user_id: str = None) -> None:
-        """Persist the conversation (input messages plus assistant output) after a run.
+        """Queue the conversation (input messages plus assistant output) for storage.
 
-        No-op when no memory backend is configured; storage errors are logged,
-        never raised.
+        The write is handed to the background :data:`swarm.memory.MEMORY_WRITER`
+        so it adds no latency to the run; use :func:`swarm.memory.flush_memory_writes`
+        to wait for it. No-op when no memory backend is configured; storage
+        errors are logged, never raised.
         """
         backend = self.memory_backend
         if backend is None:
@@ -743,26 +869,38 @@ class BlueprintBase(ABC):
             if isinstance(m, dict) and m.get("role") and m.get("content")
         ]
         for chunk in run_chunks or []:
-            if not isinstance(chunk, dict):
-                continue
-            chunk_messages = chunk.get("messages") or []
-            if isinstance(chunk_messages, dict):
-                chunk_messages = [chunk_messages]
-            for m in chunk_messages:
-                if isinstance(m, dict) and m.get("content"):
-                    conversation.append({"role": m.get("role", "assistant"), "content": m["content"]})
+            conversation.extend(self._chunk_messages(chunk))
         if not conversation:
             return
-        try:
-            backend.add(conversation, user_id=self._memory_user_id(user_id))
-        except Exception as e:
-            logger.warning(f"Memory add failed for '{self.blueprint_id}': {e}")
+        from swarm.memory import MEMORY_WRITER
+        # The writer drops this user's cached searches once the write has landed.
+        MEMORY_WRITER.submit(
+            backend, conversation, user_id=self._memory_user_id(user_id), cache_namespace=self._memory_namespace
+        )
+
+    @staticmethod
+    def _chunk_messages(chunk: Any) -> list[dict]:
+        """Role/content pairs worth remembering from one run chunk."""
+        if not isinstance(chunk, dict):
+            return []
+        chunk_messages = chunk.get("messages") or []
+        if isinstance(chunk_messages, dict):
+            chunk_messages = [chunk_messages]
+        return [
+            {"role": m.get("role", "assistant"), "content": m["content"]}
+            for m in chunk_messages
+            if isinstance(m, dict) and m.get("content")
+        ]
 
     def _wrap_run_with_memory(self) -> None:
         """Wrap this instance's run() so memory retrieval/storage happen around each run.
 
         Only invoked when a memory backend is configured, so unconfigured
-        blueprints keep their original run() untouched.
+        blueprints keep their original run() untouched. Retrieval starts
+        first and overlaps :meth:`prepare_run`; the run waits for it at most
+        ``memory.deadline_ms`` in total. Only the messages worth storing are
+        kept from the stream (not every chunk), and the store is queued, so
+        the stream completes as soon as the blueprint's does.
         """
         if getattr(self, "_memory_run_wrapped", False):
             return
@@ -770,12 +908,22 @@ class BlueprintBase(ABC):
 
         async def run_with_memory(messages, **kwargs):
             user_id = kwargs.get("user_id")
-            augmented = self.inject_memory_context(messages, user_id=user_id)
-            collected = []
-            async for chunk in original_run(augmented, **kwargs):
-                collected.append(chunk)
-                yield chunk
-            self.store_run_memory(messages, collected, user_id=user_id)
+            deadline = asyncio.get_running_loop().time() + self._memory_deadline()
+            pending = self.prefetch_memory(messages, user_id=user_id)
+            await self.prepare_run(messages, **kwargs)
+            augmented = messages
+            if pending is not None:
+                augmented = await self.ainject_memory_context(
+                    messages, user_id=user_id, pending=pending, deadline=deadline
+                )
+            produced: list[dict] = []
+            try:
+                async for chunk in original_run(augmented, **kwargs):
+                    produced.extend(self._chunk_messages(chunk))
+                    yield chunk
+            finally:
+                self._prepared_agent = None  # never outlives its run
+            self.store_run_memory(messages, [{"messages": produced}], user_id=user_id)
 
         self.run = run_with_memory
         self._memory_run_wrapped = True
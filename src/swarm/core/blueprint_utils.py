@@ -2,10 +2,10 @@
 Utility functions for blueprint management.
 """
 
-import asyncio
 from pathlib import Path
 
 from .blueprint_discovery import discover_blueprints
+from .loop_bridge import run_sync
 
 
 def filter_blueprints(all_blueprints: dict, allowed_blueprints_str: str) -> dict:
@@ -49,7 +49,7 @@ class BlueprintFunctionTool:
                 if msgs:
                     last_content = msgs[-1].get('content', last_content)
             return last_content
-        return asyncio.run(runner())
+        return run_sync(runner())
 
 def blueprint_tool(blueprint_name: str) -> BlueprintFunctionTool:
     """Factory to create a BlueprintFunctionTool for the given blueprint name."""
@@ -27,8 +27,12 @@ import os
 import shutil
 import signal
 import time
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field, replace
-from typing import Any, AsyncIterator
+from typing import Any
+
+from swarm.core import metrics, tracing
+from swarm.utils.redact import StreamRedactor, output_redaction_enabled, redact_text
 
 logger = logging.getLogger(__name__)
 
@@ -103,6 +107,10 @@ class CliAgentConfig:
         Informational label describing the safety posture (e.g. ``"readonly"``,
         ``"write"``). Not enforced here — it documents intent and is surfaced in
         results/logs.
+    redact:
+        Mask secrets (API keys, bearer tokens, URI passwords, see
+        :mod:`swarm.utils.redact`) in the CLI's output, including streamed
+        deltas. None (default) follows ``SWARM_REDACT_OUTPUT``.
     """
 
     name: str
@@ -120,6 +128,7 @@ class CliAgentConfig:
     # a preferred whitelist (falls back to all-available if none match); a dict
     # ``{"panel": [...], "judge": "<cli>"}`` => explicit. None (default) => normal.
     consensus: bool | list[str] | dict[str, Any] | None = None
+    redact: bool | None = None
 
     def __post_init__(self) -> None:
         if not self.cmd:
@@ -215,6 +224,28 @@ def _extract_json_path(data: Any, dotpath: str) -> Any:
     return cur
 
 
+def _record_exit(adapter: str, result: CliResult) -> None:
+    """Exit-code counter and run-time histogram for one finished CLI run."""
+    if result.timed_out:
+        code = "timeout"
+    elif result.returncode is None:
+        code = "launch_error"
+    else:
+        code = str(result.returncode)
+    metrics.CLI_EXITS.inc(adapter=adapter, code=code)
+    if code != "launch_error":
+        metrics.CLI_RUN_SECONDS.observe(result.duration or 0.0, adapter=adapter)
+
+
+def _redact_result(result: CliResult) -> CliResult:
+    return replace(
+        result,
+        text=redact_text(result.text),
+        stderr=redact_text(result.stderr),
+        error=redact_text(result.error) if result.error else result.error,
+    )
+
+
 class CliAdapter:
     """Runs one configured agentic CLI as an awaitable one-shot subagent."""
 
@@ -245,6 +276,7 @@ class CliAdapter:
             mode=raw.get("mode", "default"),
             auth_check=raw.get("auth_check"),
             consensus=raw.get("consensus"),
+            redact=raw.get("redact"),
         )
         return cls(cfg)
 
@@ -316,7 +348,7 @@ class CliAdapter:
         *,
         workdir: str | None = None,
         extra_env: dict[str, str] | None = None,
-    ) -> AsyncIterator[CliStreamChunk]:
+    ) -> AsyncGenerator[CliStreamChunk, None]:
         """Like :meth:`run`, but yield stdout incrementally as it arrives.
 
         Yields :class:`CliStreamChunk` deltas while the CLI produces output, then
@@ -326,7 +358,69 @@ class CliAdapter:
         (the parsed value only exists once the whole document is read), so callers
         that need clean incremental text should stream only ``parse="text"``
         adapters. Never raises for runtime failures.
+
+        Traced as a ``cli.run`` span with a ``first_byte`` event (see
+        :mod:`swarm.core.tracing`).
+
+        When the adapter redacts (see :attr:`CliAgentConfig.redact`), deltas go
+        through a :class:`~swarm.utils.redact.StreamRedactor`: a delta may be
+        held back until the token it ends in is complete, and the terminal
+        result's text, stderr and error are masked too.
         """
+        # Ended explicitly rather than entered: this generator yields to its
+        # caller, which must keep its own current span between chunks.
+        span = tracing.span("cli.run", kind="CLIENT", agent=self.config.name)
+        inner = self._stream_run(prompt, workdir=workdir, extra_env=extra_env)
+        redact = self.config.redact if self.config.redact is not None else output_redaction_enabled()
+        redactor = StreamRedactor() if redact else None
+        first = True
+        finished = False
+        try:
+            async for chunk in inner:
+                if chunk.final and chunk.result is not None:
+                    result = chunk.result
+                    finished = True
+                    _record_exit(self.config.name, result)
+                    span.set_attribute("returncode", result.returncode)
+                    span.set_attribute("timed_out", result.timed_out or None)
+                    span.set_attribute("output_chars", len(result.text or ""))
+                    if not result.ok:
+                        span.set_error(result.error or "failed")
+                    if redactor is not None:
+                        tail = redactor.flush()
+                        if tail:
+                            yield CliStreamChunk(delta=tail)
+                        chunk = CliStreamChunk(final=True, result=_redact_result(result))
+                elif chunk.delta:
+                    if first:
+                        first = False
+                        span.add_event("first_byte")
+                    if redactor is not None:
+                        chunk = CliStreamChunk(delta=redactor.feed(chunk.delta))
+                        if not chunk.delta:
+                            continue
+                yield chunk
+        except (GeneratorExit, asyncio.CancelledError):
+            if not finished:
+                span.set_attribute("cancelled", True)
+                metrics.CLI_EXITS.inc(adapter=self.config.name, code="cancelled")
+            raise
+        except BaseException as exc:
+            span.record_exception(exc)
+            raise
+        finally:
+            # Close the inner generator now, not at GC, so the subprocess is
+            # still killed promptly on disconnect/cancel.
+            await inner.aclose()
+            span.end()
+
+    async def _stream_run(
+        self,
+        prompt: str,
+        *,
+        workdir: str | None = None,
+        extra_env: dict[str, str] | None = None,
+    ) -> AsyncGenerator[CliStreamChunk, None]:
         cfg = self.config
         effective_workdir = (
             _apply_tokens(cfg.cwd, prompt, workdir or os.getcwd())
@@ -357,6 +451,7 @@ class CliAdapter:
                 env=env,
                 start_new_session=True,
             )
+            metrics.CLI_SPAWN_SECONDS.observe(time.monotonic() - start, adapter=cfg.name)
         except (OSError, ValueError) as exc:
             yield CliStreamChunk(
                 final=True,
@@ -0,0 +1,210 @@
+"""Hedged failover across CLI adapters.
+
+A failover chain tried strictly in order pays the primary's full timeout
+(``CliAgentConfig.timeout``, 180 s by default) before the first fallback
+even starts. :func:`run_hedged` runs the same chain, but when a
+:class:`HedgePolicy` is given it also starts the next candidate while the
+current one is still running once either
+
+* ``after`` seconds have passed without an answer (latency threshold), or
+* ``first_byte`` seconds have passed without any stdout (first-byte deadline).
+
+The first successful result wins; every other attempt is cancelled, which
+makes :meth:`CliAdapter.stream_run` terminate its process group. At most
+``max_parallel`` CLIs run at once. Without a policy the chain is tried one
+candidate at a time, exactly like plain failover.
+
+Progress is reported as :class:`HedgeEvent` items so callers (the
+``cli_agent`` blueprint) can relay it as it happens.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Any
+
+from swarm.core.cli_adapter import CliAdapter, CliResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEDGE_AFTER = 30.0
+
+# HedgeEvent.kind values.
+EVENT_SKIPPED = "skipped"      # candidate not installed
+EVENT_LAUNCHED = "launched"    # candidate started (primary or after a failure)
+EVENT_HEDGED = "hedged"        # candidate started alongside a slow one (reason says why)
+EVENT_FAILED = "failed"        # candidate finished unsuccessfully
+EVENT_WON = "won"              # first successful result
+EVENT_CANCELLED = "cancelled"  # a losing attempt was terminated
+
+
+def _seconds(value: Any) -> float | None:
+    if value is None or isinstance(value, bool):
+        return None
+    seconds = float(value)
+    return seconds if seconds > 0 else None
+
+
+@dataclass
+class HedgePolicy:
+    """When to start the next candidate while the current one is still running."""
+
+    after: float | None = DEFAULT_HEDGE_AFTER
+    first_byte: float | None = None
+    max_parallel: int = 2
+
+    @classmethod
+    def parse(cls, raw: Any) -> HedgePolicy | None:
+        """Policy from a config/param value; ``None`` means plain sequential failover.
+
+        Accepts ``True`` (defaults), a number (``after`` seconds) or a dict with
+        ``after`` / ``first_byte`` / ``max_parallel``.
+        """
+        if raw is None or raw is False:
+            return None
+        if raw is True:
+            return cls()
+        try:
+            if isinstance(raw, dict):
+                policy = cls(
+                    after=_seconds(raw.get("after")),
+                    first_byte=_seconds(raw.get("first_byte")),
+                    max_parallel=max(1, int(raw.get("max_parallel", 2))),
+                )
+            else:
+                policy = cls(after=_seconds(raw))
+        except (TypeError, ValueError):
+            logger.warning("Ignoring invalid hedge policy %r", raw)
+            return None
+        if policy.after is None and policy.first_byte is None:
+            return None
+        return policy
+
+
+@dataclass
+class HedgeEvent:
+    """One step of a hedged run (see the ``EVENT_*`` kinds)."""
+
+    kind: str
+    name: str
+    reason: str = ""
+    result: CliResult | None = None
+    # EVENT_WON: names of the attempts still running (about to be terminated).
+    others: tuple[str, ...] = ()
+
+
+class _Attempt:
+    """One running candidate; tracks when it produced its first stdout."""
+
+    def __init__(self, adapter: CliAdapter, prompt: str, workdir: str | None) -> None:
+        self.adapter = adapter
+        self.started = time.monotonic()
+        self.first_byte: float | None = None
+        self.task = asyncio.ensure_future(self._run(prompt, workdir))
+
+    async def _run(self, prompt: str, workdir: str | None) -> CliResult:
+        result: CliResult | None = None
+        # aclosing: a cancel must reach stream_run's process-group cleanup.
+        async with aclosing(self.adapter.stream_run(prompt, workdir=workdir)) as chunks:
+            async for chunk in chunks:
+                if chunk.final:
+                    result = chunk.result
+                elif chunk.delta and self.first_byte is None:
+                    self.first_byte = time.monotonic()
+        assert result is not None  # stream_run always ends with a final chunk
+        return result
+
+    def hedge_due(self, policy: HedgePolicy) -> tuple[float, str] | None:
+        """Earliest ``(monotonic deadline, reason)`` at which to hedge this attempt."""
+        due: list[tuple[float, str]] = []
+        if policy.after is not None:
+            due.append((self.started + policy.after, f"no answer after {policy.after:g}s"))
+        if policy.first_byte is not None and self.first_byte is None:
+            due.append((self.started + policy.first_byte, f"no output after {policy.first_byte:g}s"))
+        return min(due) if due else None
+
+
+async def run_hedged(
+    adapters: list[CliAdapter],
+    prompt: str,
+    *,
+    workdir: str | None = None,
+    policy: HedgePolicy | None = None,
+) -> AsyncIterator[HedgeEvent]:
+    """Try ``adapters`` in order (hedging per ``policy``), yielding progress events.
+
+    Ends after an ``EVENT_WON`` (followed by one ``EVENT_CANCELLED`` per
+    terminated loser) or when every candidate failed or was skipped. Closing
+    the iterator early terminates every attempt still running.
+    """
+    pending = list(adapters)
+    running: dict[asyncio.Future, _Attempt] = {}
+    latest: _Attempt | None = None
+
+    def _next() -> tuple[list[str], CliAdapter | None]:
+        skipped: list[str] = []
+        while pending:
+            adapter = pending.pop(0)
+            if adapter.is_available():
+                return skipped, adapter
+            skipped.append(adapter.name)
+        return skipped, None
+
+    try:
+        hedge_reason = ""
+        while True:
+            skipped, adapter = _next()
+            for name in skipped:
+                yield HedgeEvent(EVENT_SKIPPED, name)
+            if adapter is not None:
+                latest = _Attempt(adapter, prompt, workdir)
+                running[latest.task] = latest
+                kind = EVENT_HEDGED if hedge_reason else EVENT_LAUNCHED
+                yield HedgeEvent(kind, adapter.name, hedge_reason)
+                hedge_reason = ""
+            if not running:
+                return
+
+            # Wait for a result, or until the newest attempt is due a hedge.
+            while running:
+                due = None
+                if policy is not None and latest is not None and pending and len(running) < policy.max_parallel:
+                    due = latest.hedge_due(policy)
+                timeout = None if due is None else max(0.0, due[0] - time.monotonic())
+                done, _ = await asyncio.wait(
+                    running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    # Only a hedge deadline times the wait out, which needs both.
+                    assert policy is not None and latest is not None
+                    due = latest.hedge_due(policy)  # first byte may have arrived meanwhile
+                    if due is not None and due[0] <= time.monotonic():
+                        hedge_reason = f"`{latest.adapter.name}` {due[1]}"
+                        break
+                    continue
+                for task in done:
+                    attempt = running.pop(task)
+                    result = task.result()
+                    if result.ok:
+                        others = tuple(a.adapter.name for a in running.values())
+                        yield HedgeEvent(EVENT_WON, attempt.adapter.name, result=result, others=others)
+                        for loser in list(running.values()):
+                            loser.task.cancel()
+                        await asyncio.gather(*running, return_exceptions=True)
+                        for name in others:
+                            yield HedgeEvent(EVENT_CANCELLED, name)
+                        running.clear()
+                        return
+                    yield HedgeEvent(EVENT_FAILED, attempt.adapter.name, result=result)
+                if not running:
+                    break
+    finally:
+        for attempt in running.values():
+            attempt.task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
@@ -20,6 +20,7 @@ import re
 from dataclasses import dataclass, field
 from typing import Any
 
+from swarm.core import tracing
 from swarm.core.cli_adapter import CliAdapter, CliResult
 
 DEFAULT_MAX_CONCURRENCY = 8
@@ -137,20 +138,25 @@ async def run_consensus(
                 prompt, workdir=workdirs.get(adapter.name), extra_env=child_env
             )
 
-    results = list(await asyncio.gather(*(_one(a) for a in panel)))
-    ok = [r for r in results if r.ok]
-    if not ok:
-        return ConsensusResult(answer="", analysis=None, results=results)
-
-    analysis: dict[str, Any] | None = None
-    if judge is not None:
-        panel_text = "\n\n".join(f"### Agent: {r.name}\n{r.text}" for r in ok)
-        jr = await judge.run(
-            JUDGE_TEMPLATE.format(prompt=prompt, panel=panel_text),
-            workdir=workdirs.get(judge.name),
-            extra_env=child_env,
-        )
-        if jr.ok:
-            analysis = safe_json(jr.text)
-
-    return ConsensusResult(answer=synthesize(analysis, ok), analysis=analysis, results=results)
+    with tracing.span("consensus", panel=[a.name for a in panel], judge=judge.name if judge else None) as span:
+        with tracing.span("consensus.panel"):
+            results = list(await asyncio.gather(*(_one(a) for a in panel)))
+        ok = [r for r in results if r.ok]
+        span.set_attribute("panel_ok", len(ok))
+        if not ok:
+            span.set_error("every panelist failed")
+            return ConsensusResult(answer="", analysis=None, results=results)
+
+        analysis: dict[str, Any] | None = None
+        if judge is not None:
+            panel_text = "\n\n".join(f"### Agent: {r.name}\n{r.text}" for r in ok)
+            with tracing.span("consensus.judge", agent=judge.name):
+                jr = await judge.run(
+                    JUDGE_TEMPLATE.format(prompt=prompt, panel=panel_text),
+                    workdir=workdirs.get(judge.name),
+                    extra_env=child_env,
+                )
+            if jr.ok:
+                analysis = safe_json(jr.text)
+
+        return ConsensusResult(answer=synthesize(analysis, ok), analysis=analysis, results=results)
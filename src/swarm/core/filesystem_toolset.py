@@ -24,6 +24,12 @@ Integration
 - The plain methods (``read``/``list``/``stat``/``tree``/``write``) are also
   usable directly (e.g. by the ``fs_introspect`` blueprint for instant,
   LLM-free introspection over the OpenAI-compatible API).
+- With ``index`` enabled, ``grep``/``find`` consult a per-root on-disk trigram
+  index (:mod:`swarm.core.fs_index`) to skip files that cannot match; results
+  are the same as a full scan.
+- ``grep`` streams files through :mod:`swarm.core.fs_search` (``mmap`` for
+  large files, binary sniffing, ``grep_workers`` files in flight) and stops
+  at ``max_matches``; hit order is the sorted path order either way.
 """
 
 from __future__ import annotations
@@ -105,7 +111,7 @@ def _sensitive_basename_reason(name: str) -> str | None:
         return f"dotenv file {name!r}"
     if lower.startswith("id_rsa") or lower.startswith("id_ed25519") or lower.startswith("id_ecdsa"):
         return f"private key {name!r}"
-    suffix = Path(lower).suffix
+    suffix = os.path.splitext(lower)[1]
     if suffix in _SENSITIVE_SUFFIXES:
         return f"key material {name!r}"
     return None
@@ -187,13 +193,14 @@ def _clamp_limit(cfg_val: Any, override_val: Any, default: int) -> int:
 
 
 _NOISE_DIRS = {"__pycache__", ".git", "node_modules", ".pytest_cache", ".mypy_cache", ".venv"}
+_NOISE_SUFFIXES = frozenset({".pyc", ".pyo", ".so", ".o", ".class"})
 
 
 def _is_noise(p: Path) -> bool:
     """Skip VCS/build/cache dirs and obvious compiled artifacts during scans."""
     if any(part in _NOISE_DIRS for part in p.parts):
         return True
-    return p.suffix in {".pyc", ".pyo", ".so", ".o", ".class"}
+    return p.suffix in _NOISE_SUFFIXES
 
 
 @dataclass
@@ -206,6 +213,10 @@ class FilesystemToolset:
     max_write_bytes: int = 1_000_000
     max_list_entries: int = 2000
     audit: bool = True
+    index: bool = False                      # trigram index for grep/find (opt-in)
+    index_dir: str | None = None             # default: <swarm cache>/fs_index
+    index_refresh_seconds: float = 0.0       # min seconds between index stat walks
+    grep_workers: int = 4                    # files searched concurrently by grep
 
     # Default roots when config supplies none: swarm config + data dirs only.
     # Deliberately excludes the project checkout (``~/open-swarm``) so a bare
@@ -257,6 +268,45 @@ class FilesystemToolset:
         if self.audit:
             audit_logger.info("op=%s ok=%s path=%s %s", op, ok, path, detail)
 
+    def _within_roots(self, p: Path) -> bool:
+        rp = p.resolve()
+        return any(_is_within(rp, r) or rp == r for r in self._roots)
+
+    @staticmethod
+    def _skip_name(name: str, is_dir: bool) -> bool:
+        """Tree-walk prune rules by basename: the noise/sensitive checks a scan applies."""
+        if is_dir:
+            return name in _NOISE_DIRS or name.lower() in (".ssh", ".aws")
+        return os.path.splitext(name)[1] in _NOISE_SUFFIXES or _sensitive_basename_reason(name) is not None
+
+    def _index_for(self, root: Path):
+        """``(index, subdir)`` covering *root*, refreshed; ``None`` if disabled/unavailable."""
+        if not self.index:
+            return None
+        owners = [r for r in self._roots if _is_within(root, r) or root == r]
+        if not owners:
+            return None
+        owner = max(owners, key=lambda r: len(r.parts))
+        if _is_noise(owner):
+            return None  # a scan finds nothing here either
+        try:
+            from swarm.core.fs_index import get_index
+
+            subdir = root.relative_to(owner).as_posix()
+            subdir = "" if subdir == "." else subdir
+            idx = get_index(
+                owner,
+                index_dir=self.index_dir,
+                skip=self._skip_name,
+                allow_link=lambda path: self._within_roots(Path(path)),
+                refresh_interval=self.index_refresh_seconds,
+            )
+            idx.refresh(subdir)
+        except Exception as exc:  # index is an optimisation; fall back to a scan
+            logger.warning("filesystem toolset: index unavailable for %s: %s", owner, exc)
+            return None
+        return idx, subdir
+
     def _require(self, *levels: str) -> None:
         if self.permission not in levels:
             raise PermissionDenied(
@@ -354,34 +404,39 @@ class FilesystemToolset:
             rx = re.compile(pattern, flags)
         except re.error as exc:
             raise FilesystemError(f"bad regex: {exc}") from exc
-        targets = [root] if root.is_file() else [
-            p for p in sorted(root.rglob("*")) if p.is_file() and not _is_noise(p)
-        ]
+        from swarm.core.fs_search import grep_paths, iter_files
+
+        indexed = self._index_for(root) if root.is_dir() else None
+        confined = self._within_roots
+        if root.is_file():
+            targets = [root]
+        elif indexed:
+            from swarm.core.fs_index import required_trigrams
+
+            idx, subdir = indexed
+            targets = sorted(idx.candidates(subdir, required_trigrams(pattern, ignore_case=ignore_case)))
+        elif any(part in _NOISE_DIRS for part in root.parts):
+            targets = []  # every file below would be noise
+        else:
+            targets = iter_files(root, self._skip_name)
+            # The live walk starts at a resolved root and never enters symlinked
+            # dirs, so only symlinked files can point elsewhere.
+            confined = lambda fp: not fp.is_symlink() or self._within_roots(fp)  # noqa: E731
+
+        found, scanned = grep_paths(
+            targets,
+            rx,
+            max_matches=max_matches,
+            max_bytes=self.max_read_bytes,
+            workers=self.grep_workers,
+            accept=lambda fp: not _sensitive_path_reason(fp) and confined(fp),
+        )
         hits: list[str] = []
-        scanned = 0
-        for fp in targets:
-            if len(hits) >= max_matches:
-                break
-            try:
-                if _sensitive_path_reason(fp):
-                    continue
-                if not any(_is_within(fp.resolve(), r) or fp.resolve() == r for r in self._roots):
-                    continue
-                if fp.stat().st_size > self.max_read_bytes:
-                    continue
-                raw = fp.read_bytes()
-                if b"\x00" in raw[:1024]:  # looks binary — skip
-                    continue
-                scanned += 1
-                for n, line in enumerate(raw.decode("utf-8", "replace").splitlines(), 1):
-                    if rx.search(line):
-                        rel = fp.relative_to(root) if root.is_dir() else fp.name
-                        hits.append(f"{rel}:{n}: {line.strip()[:200]}")
-                        if len(hits) >= max_matches:
-                            hits.append("…[truncated]")
-                            break
-            except OSError:
-                continue
+        for fp, n, line in found:
+            rel = fp.relative_to(root) if root.is_dir() else fp.name
+            hits.append(f"{rel}:{n}: {line.strip()[:200]}")
+        if len(hits) >= max_matches:
+            hits.append("…[truncated]")
         self._audit("grep", str(root), True, f"{len(hits)} hits in {scanned} files")
         return "\n".join(hits) if hits else f"(no matches for /{pattern}/ under {root})"
 
@@ -391,15 +446,24 @@ class FilesystemToolset:
         root = self._resolve(path) if path else self._roots[0]
         if not root.is_dir():
             raise FilesystemError(f"not a directory: {root}")
+        # A refreshing stat walk costs as much as rglob itself, so find only
+        # uses the index when a refresh interval lets it skip the walk.
+        use_index = self.index_refresh_seconds > 0 and "**" not in glob
+        indexed = self._index_for(root) if use_index else None
+        if indexed:
+            idx, subdir = indexed
+            matches = sorted(idx.glob(subdir, glob))
+        else:
+            matches = sorted(root.rglob(glob))
         out: list[str] = []
-        for p in sorted(root.rglob(glob)):
+        for p in matches:
             if len(out) >= max_results:
                 out.append("…[truncated]")
                 break
             if _is_noise(p) or _sensitive_path_reason(p):
                 continue
             try:
-                if any(_is_within(p.resolve(), r) or p.resolve() == r for r in self._roots):
+                if self._within_roots(p):
                     out.append(str(p))
             except OSError:
                 continue
@@ -500,7 +564,9 @@ class FilesystemToolset:
         """Build a toolset from the ``filesystem`` block of swarm_config.
 
         Recognised keys: ``permission``, ``allowed_paths``, ``max_read_bytes``,
-        ``max_write_bytes``, ``max_list_entries``, ``audit``. ``overrides`` (e.g.
+        ``max_write_bytes``, ``max_list_entries``, ``audit``, ``index``,
+        ``index_dir``, ``index_refresh_seconds`` (index settings come from
+        config only; overrides may just turn ``index`` off), ``grep_workers``. ``overrides`` (e.g.
         per-request params) take precedence but can NEVER escalate: permission
         rank is clamped (``none`` < ``readonly`` < ``readwrite``),
         ``allowed_paths`` may only narrow under configured roots, and numeric
@@ -533,6 +599,10 @@ class FilesystemToolset:
                 cfg_block.get("max_list_entries", 2000), ov.get("max_list_entries"), 2000
             ),
             audit=bool(block.get("audit", True)),
+            index=bool(cfg_block.get("index", False)) and ov.get("index", True) is not False,
+            index_dir=cfg_block.get("index_dir"),
+            index_refresh_seconds=float(cfg_block.get("index_refresh_seconds", 0.0) or 0.0),
+            grep_workers=max(1, _clamp_limit(cfg_block.get("grep_workers", 4), ov.get("grep_workers"), 4)),
         )
 
     def as_function_tools(self) -> list[Any]:
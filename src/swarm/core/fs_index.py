@@ -0,0 +1,434 @@
+"""On-disk trigram index that narrows ``FilesystemToolset`` grep/find candidates.
+
+One SQLite database per workspace root records every file's relative path,
+mtime/size and a *trigram signature*: a small Bloom filter of the
+(ASCII-lowercased) byte trigrams in the file. A grep extracts the literal
+trigrams its regex requires (:func:`required_trigrams`) and only files whose
+signature contains all of them are read and matched exactly, so results are
+identical to a full scan — the index can only produce false positives, never
+drop a file.
+
+Per-file signatures (rather than per-trigram posting lists) keep incremental
+updates O(changed files): :meth:`TrigramIndex.refresh` stats the tree and
+re-reads only files whose mtime/size changed. The index never reads a file the
+caller's ``skip``/``allow_link`` predicates reject (noise / sensitive /
+out-of-root paths) and does not descend into symlinked directories.
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+try:  # Python 3.11+
+    from re import _constants as _sre_constants
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover - Python < 3.11
+    import sre_constants as _sre_constants
+    import sre_parse as _sre_parse
+
+logger = logging.getLogger(__name__)
+
+INDEX_SCHEMA_VERSION = 1
+# Larger files are recorded without a signature and always treated as candidates.
+MAX_INDEXED_FILE_BYTES = 4 * 1024 * 1024
+BINARY_SNIFF_BYTES = 1024
+# Signature sizing: ~8 bits per distinct trigram, one hash probe, power-of-two
+# sizes so query masks can be shared across files of similar size.
+_BITS_PER_TRIGRAM = 8
+_MIN_SIGNATURE_BITS = 256
+_MAX_SIGNATURE_BITS = 1 << 17
+
+KIND_FILE = "f"
+KIND_DIR = "d"
+KIND_BINARY = "b"
+
+# Under re.IGNORECASE these ASCII letters also match non-ASCII code points
+# (dotless i, long s, Kelvin sign), which a lowercased byte index cannot see.
+_UNSAFE_CASEFOLD = frozenset("iks")
+
+
+def file_trigrams(data: bytes) -> set[bytes]:
+    """Distinct byte trigrams of ``data`` after ASCII lowercasing."""
+    lowered = data.lower()
+    return {lowered[i : i + 3] for i in range(len(lowered) - 2)}
+
+
+# trigram -> 32-bit hash; a source tree has a few hundred thousand distinct
+# trigrams at most, and hashing dominates signature building otherwise.
+_TRIGRAM_HASHES: dict[bytes, int] = {}
+_TRIGRAM_HASHES_MAX = 1 << 20
+
+
+def _trigram_hash(trigram: bytes) -> int:
+    h = _TRIGRAM_HASHES.get(trigram)
+    if h is None:
+        if len(_TRIGRAM_HASHES) >= _TRIGRAM_HASHES_MAX:
+            _TRIGRAM_HASHES.clear()
+        h = _TRIGRAM_HASHES[trigram] = (int.from_bytes(trigram, "little") * 0x9E3779B1 >> 7) & 0xFFFFFFFF
+    return h
+
+
+def _signature_bits(n_trigrams: int) -> int:
+    nbits = _MIN_SIGNATURE_BITS
+    while nbits < n_trigrams * _BITS_PER_TRIGRAM and nbits < _MAX_SIGNATURE_BITS:
+        nbits <<= 1
+    return nbits
+
+
+def build_signature(trigrams: set[bytes]) -> bytes:
+    """Bloom-filter signature for a set of trigrams (length encodes its size)."""
+    nbits = _signature_bits(len(trigrams))
+    top = nbits - 1
+    sig = bytearray(nbits // 8)
+    hashes = _TRIGRAM_HASHES
+    for tri in trigrams:
+        bit = hashes.get(tri)
+        if bit is None:
+            bit = _trigram_hash(tri)
+        bit &= top
+        sig[bit >> 3] |= 1 << (bit & 7)
+    return bytes(sig)
+
+
+def _query_mask(trigrams: set[bytes], nbits: int) -> int:
+    mask = 0
+    for tri in trigrams:
+        mask |= 1 << (_trigram_hash(tri) & (nbits - 1))
+    return mask
+
+
+def required_literals(pattern: str, *, ignore_case: bool = True) -> list[tuple[bytes, bool]]:
+    """ASCII literal runs (3+ bytes) every match of ``pattern`` must contain.
+
+    Returns ``(run, folded)`` pairs; folded runs come from case-insensitive
+    parts of the pattern and are lowercased. Only literals on the mandatory
+    path of the regex are used (groups are descended into; alternations,
+    classes and optional repeats end a run), so the result is always a safe
+    under-approximation.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return []
+    if parsed.state.flags & _sre_constants.SRE_FLAG_IGNORECASE:
+        ignore_case = True
+    runs: list[tuple[bytes, bool]] = []
+    current = bytearray()
+    current_folded = False
+
+    def flush() -> None:
+        if len(current) >= 3:
+            runs.append((bytes(current), current_folded))
+        current.clear()
+
+    def walk(items, icase: bool) -> None:
+        nonlocal current_folded
+        for op, av in items:
+            if op is _sre_constants.LITERAL and av < 0x80:
+                if icase and chr(av).lower() in _UNSAFE_CASEFOLD:
+                    flush()
+                    continue
+                if current and current_folded != icase:
+                    flush()
+                current_folded = icase
+                current.append(ord(chr(av).lower()) if icase else av)
+            elif op is _sre_constants.SUBPATTERN:
+                add_flags = av[1] or 0
+                walk(av[-1], icase or bool(add_flags & _sre_constants.SRE_FLAG_IGNORECASE))
+            elif op is _sre_constants.AT:
+                continue  # anchors consume nothing
+            else:
+                flush()
+                if op in (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT) and av[0] >= 1:
+                    walk(av[2], icase)  # at least one copy of the body must appear
+                    flush()
+
+    walk(parsed, ignore_case)
+    flush()
+    return runs
+
+
+def required_trigrams(pattern: str, *, ignore_case: bool = True) -> set[bytes] | None:
+    """Lowercased trigrams every match of ``pattern`` must contain, or ``None`` if unknown."""
+    trigrams: set[bytes] = set()
+    for run, _folded in required_literals(pattern, ignore_case=ignore_case):
+        run = run.lower()
+        trigrams.update(run[i : i + 3] for i in range(len(run) - 2))
+    return trigrams or None
+
+
+@dataclass
+class RefreshStats:
+    files: int = 0
+    indexed: int = 0
+    removed: int = 0
+    seconds: float = 0.0
+
+
+def default_index_dir() -> Path:
+    from swarm.core.paths import get_user_cache_dir_for_swarm
+
+    return get_user_cache_dir_for_swarm() / "fs_index"
+
+
+def index_db_path(root: Path, index_dir: str | os.PathLike | None = None) -> Path:
+    base = Path(index_dir).expanduser() if index_dir else default_index_dir()
+    digest = hashlib.sha1(str(root).encode("utf-8")).hexdigest()[:16]
+    return base / f"{root.name or 'root'}-{digest}.sqlite3"
+
+
+class TrigramIndex:
+    """Trigram signature index for all files under one resolved ``root``.
+
+    ``skip(name, is_dir)`` prunes entries by basename (a pruned directory is
+    never descended into); ``allow_link(path)`` decides whether a symlink is
+    indexed at all (default: only if it resolves inside ``root``). Symlinked
+    directories are recorded but, like ``Path.rglob``, not followed.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        db_path: Path,
+        *,
+        skip: Callable[[str, bool], bool] | None = None,
+        allow_link: Callable[[str], bool] | None = None,
+        refresh_interval: float = 0.0,
+    ) -> None:
+        self.root = Path(root)
+        self.db_path = Path(db_path)
+        self.skip = skip or (lambda _name, _is_dir: False)
+        self.allow_link = allow_link or self._link_within_root
+        self.refresh_interval = refresh_interval
+        self._refreshed: dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+                CREATE TABLE IF NOT EXISTS entries (
+                    path TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    signature BLOB
+                ) WITHOUT ROWID;
+                """
+            )
+            row = conn.execute("SELECT value FROM meta WHERE key='schema'").fetchone()
+            if row is None or int(row[0]) != INDEX_SCHEMA_VERSION:
+                conn.execute("DELETE FROM entries")
+                conn.execute(
+                    "INSERT OR REPLACE INTO meta(key, value) VALUES ('schema', ?)",
+                    (str(INDEX_SCHEMA_VERSION),),
+                )
+
+    def _link_within_root(self, path: str) -> bool:
+        return Path(path).resolve().is_relative_to(self.root)
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection per operation (toolsets run on worker threads)."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    # ---- maintenance -----------------------------------------------------
+    def _walk(self, subdir: str = "") -> Iterator[tuple[str, str, int, int]]:
+        """Yield ``(relpath, kind, mtime_ns, size)`` for every kept entry under ``subdir``.
+
+        Uses ``os.scandir`` so the common case costs one ``stat`` per file and
+        no ``Path`` objects; symlinks are the only entries resolved.
+        """
+        if subdir and any(self.skip(part, True) for part in subdir.split("/")):
+            return
+        skip, allow_link = self.skip, self.allow_link
+        stack = [(os.path.join(self.root, subdir) if subdir else str(self.root), subdir + "/" if subdir else "")]
+        while stack:
+            dirpath, prefix = stack.pop()
+            try:
+                it = os.scandir(dirpath)
+            except OSError:
+                continue
+            with it:
+                for entry in it:
+                    name = entry.name
+                    try:
+                        link = entry.is_symlink()
+                        is_dir = entry.is_dir()
+                        if skip(name, is_dir) or (link and not allow_link(entry.path)):
+                            continue
+                        if is_dir:
+                            yield prefix + name, KIND_DIR, 0, 0
+                            if not link:
+                                stack.append((entry.path, prefix + name + "/"))
+                            continue
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    yield prefix + name, KIND_FILE, st.st_mtime_ns, st.st_size
+
+    def _index_file(self, rel: str, size: int) -> tuple[str, bytes | None]:
+        if size > MAX_INDEXED_FILE_BYTES:
+            return KIND_FILE, None
+        try:
+            with open(os.path.join(self.root, rel), "rb") as fh:
+                data = fh.read()
+        except OSError:
+            return KIND_FILE, None
+        if b"\x00" in data[:BINARY_SNIFF_BYTES]:
+            return KIND_BINARY, None
+        return KIND_FILE, build_signature(file_trigrams(data))
+
+    def _is_fresh(self, subdir: str, now: float) -> bool:
+        for done, at in self._refreshed.items():
+            covers = not done or subdir == done or subdir.startswith(done + "/")
+            if covers and now - at < self.refresh_interval:
+                return True
+        return False
+
+    def refresh(self, subdir: str = "", *, force: bool = False) -> RefreshStats:
+        """Bring the index for ``subdir`` (default: everything) up to date.
+
+        Only new or changed files are read. Skipped (returning empty stats)
+        when ``subdir`` was covered by a refresh younger than
+        ``refresh_interval`` seconds, unless ``force`` is set.
+        """
+        with self._lock:
+            if not force and self.refresh_interval and self._is_fresh(subdir, time.monotonic()):
+                return RefreshStats()
+            start = time.perf_counter()
+            stats = RefreshStats()
+            with self._connect() as conn:
+                known = {
+                    path: (kind, mtime_ns, size)
+                    for path, kind, mtime_ns, size in self._rows_under(
+                        conn, subdir, "path, kind, mtime_ns, size", (KIND_FILE, KIND_BINARY, KIND_DIR),
+                        ordered=False,
+                    )
+                }
+                upserts = []
+                for rel, kind, mtime_ns, size in self._walk(subdir):
+                    stats.files += 1
+                    previous = known.pop(rel, None)
+                    if previous is not None and previous[1:] == (mtime_ns, size) and (
+                        (previous[0] == KIND_DIR) == (kind == KIND_DIR)
+                    ):
+                        continue
+                    signature = None
+                    if kind == KIND_FILE:
+                        kind, signature = self._index_file(rel, size)
+                    upserts.append((rel, kind, mtime_ns, size, signature))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries(path, kind, mtime_ns, size, signature) VALUES (?, ?, ?, ?, ?)",
+                    upserts,
+                )
+                conn.executemany("DELETE FROM entries WHERE path = ?", [(p,) for p in known])
+            stats.indexed = len(upserts)
+            stats.removed = len(known)
+            stats.seconds = time.perf_counter() - start
+            self._refreshed[subdir] = time.monotonic()
+        if stats.indexed or stats.removed:
+            logger.debug(
+                "fs index %s: %d entries, %d (re)indexed, %d removed in %.3fs",
+                self.root, stats.files, stats.indexed, stats.removed, stats.seconds,
+            )
+        return stats
+
+    # ---- queries ---------------------------------------------------------
+    def _rows_under(
+        self,
+        conn: sqlite3.Connection,
+        subdir: str,
+        columns: str,
+        kinds: tuple[str, ...],
+        *,
+        ordered: bool = True,
+    ):
+        where = f"kind IN ({','.join('?' for _ in kinds)})"
+        params: tuple = kinds
+        if subdir:
+            # '/' < '0' in byte order, so [subdir + '/', subdir + '0') is exactly the subtree.
+            where += " AND path >= ? AND path < ?"
+            params = (*kinds, subdir + "/", subdir + "0")
+        order = " ORDER BY path" if ordered else ""
+        return conn.execute(f"SELECT {columns} FROM entries WHERE {where}{order}", params)
+
+    def candidates(self, subdir: str = "", trigrams: set[bytes] | None = None) -> list[Path]:
+        """Text files under ``subdir`` (relative, POSIX) that may contain all ``trigrams``."""
+        masks: dict[int, int] = {}
+        out: list[Path] = []
+        with self._connect() as conn:
+            for path, signature in self._rows_under(conn, subdir, "path, signature", (KIND_FILE,)):
+                if trigrams and signature is not None:
+                    nbits = len(signature) * 8
+                    mask = masks.get(nbits)
+                    if mask is None:
+                        mask = masks[nbits] = _query_mask(trigrams, nbits)
+                    if int.from_bytes(signature, "little") & mask != mask:
+                        continue
+                out.append(self.root / path)
+        return out
+
+    def glob(self, subdir: str, pattern: str) -> list[Path]:
+        """Entries under ``subdir`` matching ``pattern`` the way ``rglob`` would."""
+        out: list[Path] = []
+        offset = len(subdir) + 1 if subdir else 0
+        if "/" in pattern:
+            def matches(rel: str) -> bool:
+                return PurePosixPath(rel[offset:]).match(pattern)
+        else:
+            # Single-component patterns only ever look at the basename.
+            name_rx = re.compile(fnmatch.translate(pattern))
+
+            def matches(rel: str) -> bool:
+                return name_rx.match(rel[rel.rfind("/") + 1 :]) is not None
+        with self._connect() as conn:
+            for (path,) in self._rows_under(conn, subdir, "path", (KIND_FILE, KIND_BINARY, KIND_DIR)):
+                if matches(path):
+                    out.append(self.root / path)
+        return out
+
+
+_INDEXES: dict[Path, TrigramIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_index(
+    root: Path,
+    *,
+    index_dir: str | os.PathLike | None = None,
+    skip: Callable[[str, bool], bool] | None = None,
+    allow_link: Callable[[str], bool] | None = None,
+    refresh_interval: float = 0.0,
+) -> TrigramIndex:
+    """Process-wide :class:`TrigramIndex` for ``root`` (toolsets are per-request)."""
+    db_path = index_db_path(root, index_dir)
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(db_path)
+        if index is None:
+            index = _INDEXES[db_path] = TrigramIndex(
+                root, db_path, skip=skip, allow_link=allow_link, refresh_interval=refresh_interval
+            )
+        else:
+            index.skip = skip or index.skip
+            index.allow_link = allow_link or index.allow_link
+            index.refresh_interval = refresh_interval
+        return index
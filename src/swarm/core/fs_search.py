@@ -0,0 +1,331 @@
+"""Streaming, early-terminating regex search behind ``FilesystemToolset.grep``.
+
+Semantics are those of the original per-line loop: each file is decoded as
+UTF-8 (``errors="replace"``), split with ``str.splitlines`` and every line is
+tested with ``rx.search``; hits come back in ``paths`` order, then line order,
+so output is reproducible regardless of worker timing. What changes is the
+cost:
+
+- files at or below :data:`MMAP_THRESHOLD` are read in one call; larger ones
+  are ``mmap``-ed and decoded in :data:`WINDOW_BYTES` windows cut at newlines,
+  so a match near the top never decodes the rest of the file;
+- files whose first :data:`~swarm.core.fs_index.BINARY_SNIFF_BYTES` bytes
+  contain NUL are skipped without reading further;
+- raw bytes lacking a literal run the regex requires
+  (:func:`~swarm.core.fs_index.required_literals`) are rejected with a C-level
+  substring test before any decoding or regex work;
+- when the pattern is context-free (no anchors or lookarounds), one C-level
+  ``rx.search`` over the decoded text jumps straight to candidate lines
+  instead of running the regex once per line;
+- :func:`iter_files` lists the tree lazily in ``sorted(rglob("*"))`` order,
+  pruning ignored directories, so an early stop also stops the walk;
+- files fan out to a bounded thread pool (``SWARM_GREP_THREADS``) through a
+  sliding window, and the search stops — including files already in flight —
+  once ``max_matches`` hits are collected in order.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import threading
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from swarm.core.fs_index import (
+    BINARY_SNIFF_BYTES,
+    _sre_constants,
+    _sre_parse,
+    required_literals,
+)
+
+MMAP_THRESHOLD = 256 * 1024
+WINDOW_BYTES = 1024 * 1024
+DEFAULT_GREP_WORKERS = 4
+GREP_THREAD_POOL_SIZE = int(os.getenv("SWARM_GREP_THREADS", "8"))
+
+# Line breaks other than "\n" that str.splitlines() honours (and their UTF-8
+# encodings); text containing any of them takes the plain per-line path.
+# Checked with substring tests, which run at memchr speed unlike a regex class.
+_OTHER_LINE_BREAKS = ("\r", "\x0b", "\x0c", "\x1c", "\x1d", "\x1e", "\x85", "\u2028", "\u2029")
+_OTHER_LINE_BREAK_BYTES = tuple(ch.encode("utf-8") for ch in _OTHER_LINE_BREAKS)
+# Zero-width checks whose outcome depends on text outside the line.
+_CONTEXT_AT_CODES = frozenset({
+    _sre_constants.AT_BEGINNING,
+    _sre_constants.AT_BEGINNING_LINE,
+    _sre_constants.AT_BEGINNING_STRING,
+    _sre_constants.AT_END,
+    _sre_constants.AT_END_LINE,
+    _sre_constants.AT_END_STRING,
+})
+
+_grep_pool: ThreadPoolExecutor | None = None
+_grep_pool_lock = threading.Lock()
+
+
+def _get_grep_pool() -> ThreadPoolExecutor:
+    """Lazily create the bounded pool shared by all grep calls."""
+    global _grep_pool
+    if _grep_pool is None:
+        with _grep_pool_lock:
+            if _grep_pool is None:
+                _grep_pool = ThreadPoolExecutor(
+                    max_workers=GREP_THREAD_POOL_SIZE, thread_name_prefix="swarm-grep"
+                )
+    return _grep_pool
+
+
+def is_context_free(pattern: str) -> bool:
+    """True if a match of ``pattern`` inside a line is also found in the whole text.
+
+    Anchors and lookarounds can see past line boundaries, so patterns using
+    them are matched line by line.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return False
+
+    def walk(items) -> bool:
+        for op, av in items:
+            if op is _sre_constants.AT:
+                if av in _CONTEXT_AT_CODES:
+                    return False
+            elif op in (_sre_constants.ASSERT, _sre_constants.ASSERT_NOT):
+                return False
+            elif op is _sre_constants.SUBPATTERN:
+                if not walk(av[-1]):
+                    return False
+            elif op in (_sre_constants.MAX_REPEAT, _sre_constants.MIN_REPEAT):
+                if not walk(av[2]):
+                    return False
+            elif op is _sre_constants.BRANCH:
+                if not all(walk(branch) for branch in av[1]):
+                    return False
+            elif op is _sre_constants.GROUPREF_EXISTS:
+                if not all(walk(branch) for branch in av[1:] if branch is not None):
+                    return False
+            elif op is getattr(_sre_constants, "ATOMIC_GROUP", None):
+                if not walk(av):
+                    return False
+            elif op is getattr(_sre_constants, "POSSESSIVE_REPEAT", None) and not walk(av[2]):
+                return False
+        return True
+
+    return walk(parsed)
+
+
+def iter_files(root: Path, skip: Callable[[str, bool], bool] | None = None) -> Iterator[Path]:
+    """Files under ``root``, lazily, in the order ``sorted(root.rglob("*"))`` gives.
+
+    Depth-first with each directory's entries sorted by name, which is the
+    same as ordering paths by their parts. Like ``rglob`` it does not descend
+    into symlinked directories. ``skip(name, is_dir)`` prunes entries.
+    """
+    stack = [iter(sorted(os.scandir(root), key=lambda e: e.name))]
+    while stack:
+        entry = next(stack[-1], None)
+        if entry is None:
+            stack.pop()
+            continue
+        try:
+            if entry.is_dir() and not entry.is_symlink():
+                if skip is None or not skip(entry.name, True):
+                    stack.append(iter(sorted(os.scandir(entry.path), key=lambda e: e.name)))
+                continue
+            if entry.is_file() and (skip is None or not skip(entry.name, False)):
+                yield Path(entry.path)
+        except OSError:
+            continue
+
+
+def _lacks_literals(data: bytes, literals: Sequence[tuple[bytes, bool]]) -> bool:
+    lowered = None
+    for run, folded in literals:
+        if folded:
+            if lowered is None:
+                lowered = data.lower()
+            if run not in lowered:
+                return True
+        elif run not in data:
+            return True
+    return False
+
+
+def _count_lines(chunk: bytes) -> int:
+    """``len(chunk.decode(...).splitlines())`` without decoding in the common case."""
+    if any(brk in chunk for brk in _OTHER_LINE_BREAK_BYTES):
+        return len(chunk.decode("utf-8", "replace").splitlines())
+    return chunk.count(b"\n") + (1 if chunk and not chunk.endswith(b"\n") else 0)
+
+
+@dataclass
+class FileHits:
+    path: Path
+    scanned: bool = False
+    hits: list[tuple[int, str]] = field(default_factory=list)
+
+
+def _search_text(
+    text: str, rx: re.Pattern, first_lineno: int, limit: int, jump: bool
+) -> tuple[list[tuple[int, str]], int]:
+    """``(hits, line_count)`` for ``text`` whose first line is ``first_lineno``."""
+    hits: list[tuple[int, str]] = []
+    if not jump or any(brk in text for brk in _OTHER_LINE_BREAKS):
+        lines = text.splitlines()
+        if jump and rx.search(text) is None:
+            return hits, len(lines)
+        for n, line in enumerate(lines, first_lineno):
+            if rx.search(line):
+                hits.append((n, line))
+                if len(hits) >= limit:
+                    break
+        return hits, len(lines)
+
+    size = len(text)
+    line_count = text.count("\n") + (1 if size and text[-1] != "\n" else 0)
+    lineno, counted_to, pos = first_lineno, 0, 0
+    while pos < size:
+        m = rx.search(text, pos)
+        if m is None:
+            break
+        start = text.rfind("\n", 0, m.start()) + 1
+        if start >= size:
+            break  # an empty match after the final newline is not a line
+        end = text.find("\n", start)
+        if end < 0:
+            end = size
+        lineno += text.count("\n", counted_to, start)
+        counted_to = start
+        line = text[start:end]
+        if rx.search(line):
+            hits.append((lineno, line))
+            if len(hits) >= limit:
+                break
+        pos = end + 1
+    return hits, line_count
+
+
+def search_file(
+    path: Path,
+    rx: re.Pattern,
+    *,
+    limit: int,
+    max_bytes: int | None = None,
+    jump: bool = False,
+    literals: Sequence[tuple[bytes, bool]] = (),
+    stop: threading.Event | None = None,
+) -> FileHits:
+    """Search one file; binaries and files over ``max_bytes`` are not scanned.
+
+    ``literals`` (from :func:`~swarm.core.fs_index.required_literals`) lets
+    whole files or windows be rejected before decoding.
+    """
+    result = FileHits(path)
+    with open(path, "rb") as fh:
+        size = os.fstat(fh.fileno()).st_size
+        if max_bytes is not None and size > max_bytes:
+            return result
+        if size <= MMAP_THRESHOLD:
+            data = fh.read()
+            if b"\x00" in data[:BINARY_SNIFF_BYTES]:
+                return result
+            result.scanned = True
+            if not _lacks_literals(data, literals):
+                result.hits, _ = _search_text(data.decode("utf-8", "replace"), rx, 1, limit, jump)
+            return result
+        if b"\x00" in fh.read(BINARY_SNIFF_BYTES):
+            return result
+        result.scanned = True
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            lineno, offset = 1, 0
+            while offset < size and len(result.hits) < limit:
+                if stop is not None and stop.is_set():
+                    break
+                end = min(offset + WINDOW_BYTES, size)
+                if end < size:
+                    cut = mm.rfind(b"\n", offset, end)
+                    if cut < 0:
+                        cut = mm.find(b"\n", end)
+                    end = size if cut < 0 else cut + 1
+                chunk = mm[offset:end]
+                if _lacks_literals(chunk, literals):
+                    lineno += _count_lines(chunk)
+                else:
+                    hits, lines = _search_text(
+                        chunk.decode("utf-8", "replace"), rx, lineno, limit - len(result.hits), jump,
+                    )
+                    result.hits.extend(hits)
+                    lineno += lines
+                offset = end
+    return result
+
+
+def grep_paths(
+    paths: Iterable[Path],
+    rx: re.Pattern,
+    *,
+    max_matches: int,
+    max_bytes: int | None = None,
+    workers: int = DEFAULT_GREP_WORKERS,
+    accept: Callable[[Path], bool] | None = None,
+) -> tuple[list[tuple[Path, int, str]], int]:
+    """Search ``paths`` in order; return ``(hits, files_scanned)``.
+
+    At most ``max_matches`` hits are returned, always the first ones in
+    ``paths``/line order. At most ``workers`` files are in flight at once;
+    ``accept`` (run on the worker) can veto a file before it is opened;
+    unreadable files are skipped.
+    """
+    jump = is_context_free(rx.pattern)
+    literals = required_literals(rx.pattern, ignore_case=bool(rx.flags & re.IGNORECASE))
+    stop = threading.Event()
+
+    def task(path: Path) -> FileHits:
+        if stop.is_set() or (accept is not None and not accept(path)):
+            return FileHits(path)
+        try:
+            return search_file(
+                path, rx, limit=max_matches, max_bytes=max_bytes, jump=jump, literals=literals, stop=stop
+            )
+        except (OSError, ValueError):
+            return FileHits(path)
+
+    hits: list[tuple[Path, int, str]] = []
+    scanned = 0
+
+    def collect(result: FileHits) -> bool:
+        nonlocal scanned
+        scanned += result.scanned
+        for n, line in result.hits:
+            hits.append((result.path, n, line))
+            if len(hits) >= max_matches:
+                return True
+        return False
+
+    paths = iter(paths)
+    if workers <= 1:
+        for path in paths:
+            if collect(task(path)):
+                break
+        return hits, scanned
+
+    pool = _get_grep_pool()
+    window: deque[Future] = deque()
+    try:
+        for path in paths:
+            window.append(pool.submit(task, path))
+            if len(window) >= workers and collect(window.popleft().result()):
+                return hits, scanned
+        while window:
+            if collect(window.popleft().result()):
+                return hits, scanned
+        return hits, scanned
+    finally:
+        stop.set()
+        for future in window:
+            future.cancel()
@@ -0,0 +1,422 @@
+"""Load generator behind ``swarm-cli bench``.
+
+Answers "how many concurrent requests/streams can this instance sustain?"
+by driving the API with a weighted mix of request kinds:
+
+- ``chat``      — ``POST /v1/chat/completions`` (non-streamed)
+- ``stream``    — ``POST /v1/chat/completions`` with ``stream: true``; the
+  first response body chunk marks time-to-first-token (TTFT)
+- ``responses`` — ``POST /v1/responses``; a ``202`` handle is polled via
+  ``GET /v1/responses/<id>`` until the task reaches a terminal status
+
+Two arrival models:
+
+- **closed loop** (``concurrency=N``): N workers each send the next request
+  as soon as their previous one finishes — measures sustainable throughput.
+- **open loop** (``rate=R``): requests arrive at R/s (seeded exponential
+  inter-arrival times) whether or not earlier ones finished — shows queueing
+  and 429 behaviour once arrivals outpace the ``SWARM_MAX_INFLIGHT`` limit.
+
+Targets are either the in-process ASGI app (:class:`AsgiTarget`, no sockets,
+no server) or a running server (:class:`HttpTarget`). The ASGI target talks
+to the app directly rather than through ``httpx.ASGITransport`` because that
+transport buffers the whole body, which would hide TTFT.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+REQUEST_KINDS = ("chat", "stream", "responses")
+TERMINAL_STATUSES = ("completed", "failed", "cancelled", "incomplete")
+DEFAULT_PROMPT = "Reply with one short sentence about load testing."
+
+
+@dataclass
+class TargetResponse:
+    status: int
+    body: bytes
+    ttfb: float | None  # seconds from send to the first non-empty body chunk
+
+
+class Target(Protocol):
+    async def request(
+        self, method: str, path: str, payload: dict[str, Any] | None = None
+    ) -> TargetResponse: ...
+
+    async def aclose(self) -> None: ...
+
+
+def _header_list(headers: dict[str, str]) -> list[tuple[bytes, bytes]]:
+    return [(k.lower().encode("latin-1"), v.encode("latin-1")) for k, v in headers.items()]
+
+
+class AsgiTarget:
+    """Call an ASGI application in-process, recording the first body chunk."""
+
+    def __init__(self, app: Callable[..., Awaitable[None]], headers: dict[str, str] | None = None, host: str = "localhost") -> None:
+        self.app = app
+        self.headers = {"host": host, **(headers or {})}
+
+    async def request(self, method: str, path: str, payload: dict[str, Any] | None = None) -> TargetResponse:
+        body = b"" if payload is None else json.dumps(payload).encode()
+        headers = dict(self.headers)
+        if payload is not None:
+            headers["content-type"] = "application/json"
+        headers["content-length"] = str(len(body))
+        path_only, _, query = path.partition("?")
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.3"},
+            "http_version": "1.1",
+            "method": method,
+            "scheme": "http",
+            "path": path_only,
+            "raw_path": path_only.encode(),
+            "query_string": query.encode(),
+            "root_path": "",
+            "headers": _header_list(headers),
+            "client": ("127.0.0.1", 50000),
+            "server": ("127.0.0.1", 80),
+        }
+        done = asyncio.Event()
+        sent_body = False
+        start = time.perf_counter()
+        status = 500
+        chunks: list[bytes] = []
+        ttfb: float | None = None
+
+        async def receive() -> dict[str, Any]:
+            nonlocal sent_body
+            if not sent_body:
+                sent_body = True
+                return {"type": "http.request", "body": body, "more_body": False}
+            await done.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message: dict[str, Any]) -> None:
+            nonlocal status, ttfb
+            if message["type"] == "http.response.start":
+                status = int(message["status"])
+            elif message["type"] == "http.response.body":
+                chunk = message.get("body", b"")
+                if chunk:
+                    if ttfb is None:
+                        ttfb = time.perf_counter() - start
+                    chunks.append(chunk)
+                if not message.get("more_body", False):
+                    done.set()
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            done.set()
+        return TargetResponse(status, b"".join(chunks), ttfb)
+
+    async def aclose(self) -> None:
+        return None
+
+
+class HttpTarget:
+    """Send requests to a running server over HTTP (httpx, streamed reads)."""
+
+    def __init__(self, base_url: str, headers: dict[str, str] | None = None, timeout: float = 600.0) -> None:
+        import httpx
+
+        limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+        self.client = httpx.AsyncClient(base_url=base_url.rstrip("/"), headers=headers or {}, timeout=timeout, limits=limits)
+
+    async def request(self, method: str, path: str, payload: dict[str, Any] | None = None) -> TargetResponse:
+        start = time.perf_counter()
+        ttfb: float | None = None
+        chunks: list[bytes] = []
+        async with self.client.stream(method, path, json=payload) as response:
+            async for chunk in response.aiter_raw():
+                if chunk:
+                    if ttfb is None:
+                        ttfb = time.perf_counter() - start
+                    chunks.append(chunk)
+        return TargetResponse(response.status_code, b"".join(chunks), ttfb)
+
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
+
+@dataclass
+class Sample:
+    kind: str
+    status: int  # 0 = transport error
+    latency: float
+    ttft: float | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300 and self.error is None
+
+
+@dataclass
+class LoadConfig:
+    model: str
+    mix: dict[str, float] = field(default_factory=lambda: {"chat": 1.0})
+    concurrency: int = 4  # closed loop (ignored when ``rate`` is set)
+    rate: float | None = None  # open loop, requests per second
+    requests: int | None = 50  # stop after this many (None = duration only)
+    duration: float | None = None  # stop issuing after this many seconds
+    prompt: str = DEFAULT_PROMPT
+    poll_interval: float = 0.2
+    max_wait_seconds: float | None = None  # forwarded on /v1/responses
+    seed: int = 0
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """``"chat=2,stream=1"`` (or ``"chat,stream"``) → normalised weights."""
+    weights: dict[str, float] = {}
+    for part in (p.strip() for p in spec.split(",")):
+        if not part:
+            continue
+        kind, _, raw = part.partition("=")
+        kind = kind.strip()
+        if kind not in REQUEST_KINDS:
+            raise ValueError(f"unknown request kind {kind!r} (expected one of {', '.join(REQUEST_KINDS)})")
+        try:
+            weight = float(raw) if raw else 1.0
+        except ValueError:
+            raise ValueError(f"invalid weight for {kind!r}: {raw!r}") from None
+        if weight < 0 or not math.isfinite(weight):
+            raise ValueError(f"invalid weight for {kind!r}: {raw!r}")
+        weights[kind] = weights.get(kind, 0.0) + weight
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("request mix is empty")
+    return {kind: w / total for kind, w in weights.items() if w > 0}
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def _distribution(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return {
+        "p50": _percentile(ordered, 50),
+        "p95": _percentile(ordered, 95),
+        "p99": _percentile(ordered, 99),
+        "mean": sum(ordered) / len(ordered),
+        "max": ordered[-1],
+    }
+
+
+def _counts(samples: list[Sample]) -> dict[str, Any]:
+    n = len(samples)
+    ok = sum(1 for s in samples if s.ok)
+    limited = sum(1 for s in samples if s.status == 429)
+    return {
+        "requests": n,
+        "ok": ok,
+        "errors": n - ok - limited,
+        "rate_limited": limited,
+        "error_rate": (n - ok - limited) / n if n else 0.0,
+        "rate_limited_rate": limited / n if n else 0.0,
+        "latency": _distribution([s.latency for s in samples if s.ok]),
+        "ttft": _distribution([s.ttft for s in samples if s.ok and s.ttft is not None]),
+    }
+
+
+def summarize(samples: list[Sample], elapsed: float, *, peak_outstanding: int = 0, max_inflight: int | None = None) -> dict[str, Any]:
+    """Aggregate report: totals, rates and per-kind breakdown."""
+    report = _counts(samples)
+    ok = report["ok"]
+    report.update(
+        duration=elapsed,
+        rps=len(samples) / elapsed if elapsed > 0 else 0.0,
+        ok_rps=ok / elapsed if elapsed > 0 else 0.0,
+        peak_outstanding=peak_outstanding,
+        max_inflight=max_inflight,
+        by_kind={kind: _counts([s for s in samples if s.kind == kind]) for kind in REQUEST_KINDS if any(s.kind == kind for s in samples)},
+        status_codes=dict(sorted(_status_histogram(samples).items())),
+        sample_errors=sorted({s.error for s in samples if s.error})[:5],
+    )
+    return report
+
+
+def _status_histogram(samples: list[Sample]) -> dict[str, int]:
+    hist: dict[str, int] = {}
+    for s in samples:
+        key = str(s.status) if s.status else "transport_error"
+        hist[key] = hist.get(key, 0) + 1
+    return hist
+
+
+def _payload(kind: str, cfg: LoadConfig, n: int) -> tuple[str, dict[str, Any]]:
+    prompt = f"{cfg.prompt} (#{n})"
+    if kind == "responses":
+        payload: dict[str, Any] = {"model": cfg.model, "input": prompt}
+        if cfg.max_wait_seconds is not None:
+            payload["max_wait_seconds"] = cfg.max_wait_seconds
+        return "/v1/responses", payload
+    return "/v1/chat/completions", {
+        "model": cfg.model,
+        "messages": [{"role": "user", "content": prompt}],
+        "stream": kind == "stream",
+    }
+
+
+async def _one(target: Target, kind: str, cfg: LoadConfig, n: int) -> Sample:
+    path, payload = _payload(kind, cfg, n)
+    start = time.perf_counter()
+    try:
+        response = await target.request("POST", path, payload)
+        ttft = response.ttfb if kind == "stream" else None
+        if kind == "responses" and response.status == 202:
+            response = await _poll_response(target, response, cfg.poll_interval)
+        error = None
+        if kind == "responses" and response.status == 200:
+            status = _json_body(response.body).get("status")
+            if status in ("failed", "cancelled"):
+                error = f"response {status}"
+        return Sample(kind, response.status, time.perf_counter() - start, ttft, error)
+    except Exception as e:  # transport failure: count it, keep generating load
+        return Sample(kind, 0, time.perf_counter() - start, None, f"{type(e).__name__}: {e}")
+
+
+def _json_body(body: bytes) -> dict[str, Any]:
+    try:
+        data = json.loads(body or b"{}")
+    except ValueError:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+async def _poll_response(target: Target, accepted: TargetResponse, interval: float) -> TargetResponse:
+    response_id = _json_body(accepted.body).get("id")
+    if not response_id:
+        return accepted
+    while True:
+        await asyncio.sleep(interval)
+        current = await target.request("GET", f"/v1/responses/{response_id}")
+        if current.status != 200 or _json_body(current.body).get("status") in TERMINAL_STATUSES:
+            return current
+
+
+class _Tracker:
+    def __init__(self) -> None:
+        self.outstanding = 0
+        self.peak = 0
+        self.samples: list[Sample] = []
+
+    async def run(self, coro: Awaitable[Sample]) -> None:
+        self.outstanding += 1
+        self.peak = max(self.peak, self.outstanding)
+        try:
+            self.samples.append(await coro)
+        finally:
+            self.outstanding -= 1
+
+
+async def run_load(
+    target: Target,
+    cfg: LoadConfig,
+    *,
+    max_inflight: int | None = None,
+    on_sample: Callable[[Sample], None] | None = None,
+) -> dict[str, Any]:
+    """Generate load against ``target`` and return the :func:`summarize` report."""
+    if cfg.requests is None and cfg.duration is None:
+        raise ValueError("set requests and/or duration")
+    rng = random.Random(cfg.seed)
+    kinds, weights = zip(*cfg.mix.items(), strict=True)
+    counter = itertools.count()
+    tracker = _Tracker()
+    start = time.perf_counter()
+    deadline = start + cfg.duration if cfg.duration is not None else math.inf
+
+    def next_index() -> int | None:
+        n = next(counter)
+        if (cfg.requests is not None and n >= cfg.requests) or time.perf_counter() >= deadline:
+            return None
+        return n
+
+    def pick() -> str:
+        return rng.choices(kinds, weights)[0]
+
+    async def issue(n: int, kind: str) -> None:
+        await tracker.run(_one(target, kind, cfg, n))
+        if on_sample:
+            on_sample(tracker.samples[-1])
+
+    if cfg.rate:
+        tasks: list[asyncio.Task[None]] = []
+        next_at = start
+        while (n := next_index()) is not None:
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.ensure_future(issue(n, pick())))
+            next_at += rng.expovariate(cfg.rate)
+        await asyncio.gather(*tasks)
+    else:
+
+        async def worker() -> None:
+            while (n := next_index()) is not None:
+                await issue(n, pick())
+
+        await asyncio.gather(*(worker() for _ in range(max(1, cfg.concurrency))))
+    return summarize(
+        tracker.samples,
+        time.perf_counter() - start,
+        peak_outstanding=tracker.peak,
+        max_inflight=max_inflight,
+    )
+
+
+def _ms(dist: dict[str, float] | None, key: str) -> str:
+    return "-" if not dist else f"{dist[key] * 1000:.1f}"
+
+
+def format_report(report: dict[str, Any]) -> str:
+    """Human-readable summary of a :func:`run_load` report."""
+    limit = report.get("max_inflight")
+    lines = [
+        f"requests {report['requests']}  ok {report['ok']}  errors {report['errors']} ({report['error_rate']:.1%})"
+        f"  429 {report['rate_limited']} ({report['rate_limited_rate']:.1%})",
+        f"duration {report['duration']:.2f}s  rps {report['rps']:.2f}  ok rps {report['ok_rps']:.2f}"
+        f"  peak outstanding {report['peak_outstanding']}" + (f"  SWARM_MAX_INFLIGHT {limit}" if limit is not None else ""),
+        "",
+        f"{'kind':<10} {'n':>5} {'ok':>5} {'429':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'ttft p50':>9} {'ttft p95':>9}",
+    ]
+    rows = [("all", report), *report["by_kind"].items()]
+    for name, row in rows:
+        lat, ttft = row["latency"], row["ttft"]
+        lines.append(
+            f"{name:<10} {row['requests']:>5} {row['ok']:>5} {row['rate_limited']:>5} "
+            f"{_ms(lat, 'p50'):>9} {_ms(lat, 'p95'):>9} {_ms(lat, 'p99'):>9} {_ms(ttft, 'p50'):>9} {_ms(ttft, 'p95'):>9}"
+        )
+    if report.get("sample_errors"):
+        lines += ["", "errors:", *(f"  {e}" for e in report["sample_errors"])]
+    return "\n".join(lines)
+
+
+__all__ = [
+    "DEFAULT_PROMPT",
+    "REQUEST_KINDS",
+    "AsgiTarget",
+    "HttpTarget",
+    "LoadConfig",
+    "Sample",
+    "format_report",
+    "parse_mix",
+    "run_load",
+    "summarize",
+]
@@ -0,0 +1,142 @@
+"""Shared background event loop for calling async code from sync code.
+
+Sync callbacks (agents SDK ``function_tool`` wrappers, blueprint-as-tool,
+MCP blueprint tools) used to call ``asyncio.run`` — often inside a throwaway
+``ThreadPoolExecutor`` when a loop was already running — which builds and
+tears down an event loop, and every client bound to it, on each call.
+
+:func:`run_sync` instead submits the coroutine to one long-lived loop that
+runs in a daemon thread (``swarm-async-bridge``) via
+:func:`asyncio.run_coroutine_threadsafe`, so loop-bound clients and pooled
+connections survive between calls. A ``timeout`` or an interrupt of the
+waiting thread cancels the coroutine on the loop. The loop starts lazily and
+is restarted if it was shut down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Coroutine
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class LoopBridge:
+    """One event loop in a daemon thread, fed from any other thread."""
+
+    def __init__(self, name: str = "swarm-async-bridge") -> None:
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running background loop (started on first use)."""
+        with self._lock:
+            return self._running_loop()
+
+    def _running_loop(self) -> asyncio.AbstractEventLoop:
+        # Caller holds the lock, so shutdown() cannot clear the loop meanwhile.
+        if self._loop is None or self._thread is None or not self._thread.is_alive():
+            self._start()
+        if self._loop is None:
+            raise RuntimeError(f"background event loop {self.name} did not start")
+        return self._loop
+
+    def _start(self) -> None:
+        loop = asyncio.new_event_loop()
+        ready = threading.Event()
+
+        def _serve() -> None:
+            asyncio.set_event_loop(loop)
+            loop.call_soon(ready.set)
+            try:
+                loop.run_forever()
+            finally:
+                try:
+                    pending = asyncio.all_tasks(loop)
+                    for task in pending:
+                        task.cancel()
+                    if pending:
+                        loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                    loop.run_until_complete(loop.shutdown_asyncgens())
+                finally:
+                    loop.close()
+
+        thread = threading.Thread(target=_serve, name=self.name, daemon=True)
+        thread.start()
+        ready.wait()
+        self._loop, self._thread = loop, thread
+
+    def in_loop_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule ``coro`` on the background loop; returns a thread-safe future."""
+        # Under the lock: a concurrent shutdown() queues loop.stop behind this
+        # coroutine, which is then cancelled rather than never started.
+        with self._lock:
+            return asyncio.run_coroutine_threadsafe(coro, self._running_loop())
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run ``coro`` on the background loop and block until it finishes.
+
+        Raises :class:`TimeoutError` (after cancelling ``coro``) when ``timeout``
+        seconds pass. Must not be called from the loop's own thread, where
+        waiting would deadlock.
+        """
+        if self.in_loop_thread():
+            coro.close()
+            raise RuntimeError("LoopBridge.run called from its own loop thread (would deadlock)")
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            if future.done():  # the coroutine itself raised TimeoutError
+                raise
+            future.cancel()
+            raise TimeoutError(f"coroutine did not finish within {timeout}s") from None
+        except BaseException:
+            # KeyboardInterrupt etc. in the waiting thread: do not leave it running.
+            future.cancel()
+            raise
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the loop, cancelling whatever is still scheduled on it."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+            if loop is None or thread is None or not thread.is_alive():
+                return
+            loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.warning("Background event loop %s did not stop within %.1fs", self.name, timeout)
+
+
+_bridge: LoopBridge | None = None
+_bridge_lock = threading.Lock()
+
+
+def get_loop_bridge() -> LoopBridge:
+    """Process-wide :class:`LoopBridge` (stopped at interpreter exit)."""
+    global _bridge
+    if _bridge is None:
+        with _bridge_lock:
+            if _bridge is None:
+                _bridge = LoopBridge()
+                atexit.register(_bridge.shutdown)
+    return _bridge
+
+
+def run_sync(coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+    """Run ``coro`` on the shared background loop from sync code (see :meth:`LoopBridge.run`)."""
+    return get_loop_bridge().run(coro, timeout=timeout)
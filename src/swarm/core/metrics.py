@@ -0,0 +1,515 @@
+"""Dependency-free Prometheus metrics for the API hot paths.
+
+Counters, gauges and histograms live in a process-wide :data:`REGISTRY`, and
+:func:`render` produces the Prometheus text exposition format (0.0.4) served
+at ``/metrics``. Updates take one short per-metric lock and no I/O, so they
+are cheap enough for the streaming paths.
+
+**Multiple workers.** Each uvicorn worker has its own registry. Set
+``SWARM_METRICS_DIR`` to a directory shared by the workers and each process
+writes an atomic JSON snapshot of its metrics there
+(``metrics-<pid>.json``, every ``SWARM_METRICS_FLUSH_SECONDS``, default 5,
+and at exit). A scrape of any worker flushes its own snapshot, then merges
+every file: counters and histograms are summed across all processes,
+including exited ones, and gauges are summed across live processes only.
+Clear the directory on deploy, as with other multi-process Prometheus
+exporters. Without ``SWARM_METRICS_DIR`` a scrape reports the answering
+process only.
+
+The metrics themselves are defined at the bottom of this module so the
+exported names stay in one place (see docs/METRICS.md).
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import math
+import os
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; spans sub-millisecond store operations to multi-minute agent runs.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0,
+)
+FAST_BUCKETS: tuple[float, ...] = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: dict[tuple[str, ...], Any] = {}
+
+    def _key(self, labels: dict[str, Any]) -> tuple[str, ...]:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        try:
+            return tuple(str(labels[n]) for n in self.labelnames)
+        except KeyError as e:
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}") from e
+
+    def samples(self) -> list[tuple[tuple[str, ...], Any]]:
+        with self._lock:
+            return [(k, _copy(v)) for k, v in self._values.items()]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+
+def _copy(value: Any) -> Any:
+    return {"buckets": list(value["buckets"]), "sum": value["sum"], "count": value["count"]} if isinstance(value, dict) else value
+
+
+class Counter(_Metric):
+    """Monotonically increasing total."""
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        if amount < 0:
+            raise ValueError("counters only go up")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+
+class Gauge(_Metric):
+    """A value that goes up and down. With ``fn``, it is read at collection time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), *, fn: Callable[[], float] | None = None,
+    ) -> None:
+        if fn is not None and labelnames:
+            raise ValueError("callback gauges take no labels")
+        super().__init__(name, documentation, labelnames)
+        self._fn = fn
+
+    def set(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: Any) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: Any) -> float:
+        if self._fn is not None:
+            return self.samples()[0][1]
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[tuple[str, ...], Any]]:
+        if self._fn is None:
+            return super().samples()
+        try:
+            return [((), float(self._fn()))]
+        except Exception as e:  # a broken callback must not break the scrape
+            logger.debug("metrics: gauge %s callback failed: %s", self.name, e)
+            return []
+
+
+class Histogram(_Metric):
+    """Bucketed observations plus their sum and count."""
+
+    kind = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), *, buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets if not math.isinf(b)))
+
+    def observe(self, value: float, **labels: Any) -> None:
+        key = self._key(labels)
+        index = len(self.buckets)  # +Inf
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = {"buckets": [0] * (len(self.buckets) + 1), "sum": 0.0, "count": 0}
+            entry["buckets"][index] += 1
+            entry["sum"] += value
+            entry["count"] += 1
+
+
+class Registry:
+    """Named metrics; ``counter`` / ``gauge`` / ``histogram`` get or create."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls: type[_Metric], name: str, *args: Any, **kwargs: Any) -> Any:
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, *args, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"metric {name} is already registered as a {metric.kind}")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = (), *, fn: Callable[[], float] | None = None) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames, fn=fn)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: Sequence[str] = (), *, buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> _Metric | None:
+        return self._metrics.get(name)
+
+    def reset(self) -> None:
+        """Zero every non-callback metric (tests)."""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-serialisable state of every metric in this process."""
+        out: dict[str, Any] = {}
+        for metric in list(self._metrics.values()):
+            entry: dict[str, Any] = {
+                "type": metric.kind,
+                "help": metric.documentation,
+                "labelnames": list(metric.labelnames),
+                "samples": [[list(k), v] for k, v in metric.samples()],
+            }
+            if isinstance(metric, Histogram):
+                entry["buckets"] = list(metric.buckets)
+            out[metric.name] = entry
+        return {"pid": os.getpid(), "metrics": out}
+
+
+REGISTRY = Registry()
+
+
+# -- merging and exposition ---------------------------------------------------
+
+def merge(snapshots: Iterable[dict[str, Any]], live_pids: set[int] | None = None) -> dict[str, Any]:
+    """Combine per-process snapshots.
+
+    Counters and histograms are summed. Gauges are summed across processes in
+    ``live_pids`` (all processes when ``None``).
+    """
+    merged: dict[str, Any] = {}
+    for snap in snapshots:
+        alive = live_pids is None or snap.get("pid") in live_pids
+        for name, metric in (snap.get("metrics") or {}).items():
+            if metric["type"] == "gauge" and not alive:
+                continue
+            target = merged.get(name)
+            if target is None:
+                target = merged[name] = {**metric, "samples": {}}
+            elif target["type"] != metric["type"] or target.get("buckets") != metric.get("buckets"):
+                continue  # definition changed between deploys; keep the first
+            for labels, value in metric["samples"]:
+                key = tuple(labels)
+                current = target["samples"].get(key)
+                if current is None:
+                    target["samples"][key] = _copy(value)
+                elif isinstance(value, dict):
+                    current["buckets"] = [a + b for a, b in zip(current["buckets"], value["buckets"], strict=True)]
+                    current["sum"] += value["sum"]
+                    current["count"] += value["count"]
+                else:
+                    target["samples"][key] = current + value
+    for metric in merged.values():
+        metric["samples"] = [[list(k), v] for k, v in metric["samples"].items()]
+    return merged
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: tuple[str, str] | None = None) -> str:
+    pairs = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values, strict=True)]
+    if extra is not None:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _num(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _with_hit_ratio(metrics: dict[str, Any]) -> dict[str, Any]:
+    """Derive ``swarm_cache_hit_ratio`` from the cache lookup counter."""
+    lookups = metrics.get(CACHE_LOOKUPS.name)
+    if not lookups:
+        return metrics
+    totals: dict[str, list[float]] = {}
+    for (cache, result), value in lookups["samples"]:
+        hits_total = totals.setdefault(cache, [0.0, 0.0])
+        hits_total[1] += value
+        if result == "hit":
+            hits_total[0] += value
+    metrics = dict(metrics)
+    metrics["swarm_cache_hit_ratio"] = {
+        "type": "gauge",
+        "help": "Share of cache lookups that were hits, per cache.",
+        "labelnames": ["cache"],
+        "samples": [[[cache], hits / total] for cache, (hits, total) in sorted(totals.items()) if total],
+    }
+    return metrics
+
+
+def render_snapshot(metrics: dict[str, Any]) -> str:
+    """Prometheus text format for a (merged) snapshot's ``metrics`` mapping."""
+    lines: list[str] = []
+    metrics = _with_hit_ratio(metrics)
+    for name in sorted(metrics):
+        metric = metrics[name]
+        names = metric["labelnames"]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for labels, value in sorted(metric["samples"], key=lambda s: s[0]):
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_labels(names, labels)} {_num(value)}")
+                continue
+            cumulative = 0
+            for bound, count in zip([*metric["buckets"], math.inf], value["buckets"], strict=True):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(names, labels, ('le', _num(bound)))} {cumulative}")
+            lines.append(f"{name}_sum{_labels(names, labels)} {_num(value['sum'])}")
+            lines.append(f"{name}_count{_labels(names, labels)} {value['count']}")
+    return "\n".join(lines) + "\n"
+
+
+# -- multi-process snapshots --------------------------------------------------
+
+def metrics_dir() -> Path | None:
+    raw = os.getenv("SWARM_METRICS_DIR")
+    return Path(raw).expanduser() if raw else None
+
+
+def flush(directory: Path | None = None) -> Path | None:
+    """Atomically write this process's snapshot into the shared directory."""
+    directory = directory or metrics_dir()
+    if directory is None:
+        return None
+    path = directory / f"metrics-{os.getpid()}.json"
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(REGISTRY.snapshot(), fh, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning("metrics: could not write snapshot to %s: %s", directory, e)
+        return None
+    return path
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def collect(directory: Path | None = None) -> dict[str, Any]:
+    """Merged metrics for every process sharing ``directory`` (or just this one)."""
+    directory = directory or metrics_dir()
+    if directory is None:
+        return merge([REGISTRY.snapshot()])
+    flush(directory)
+    snapshots, pids = [], set()
+    for path in sorted(directory.glob("metrics-*.json")):
+        try:
+            snap = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue  # being replaced, or torn by a crash
+        snapshots.append(snap)
+        pid = snap.get("pid")
+        if isinstance(pid, int) and (pid == os.getpid() or _pid_alive(pid)):
+            pids.add(pid)
+    return merge(snapshots, live_pids=pids)
+
+
+def render(directory: Path | None = None) -> str:
+    """Prometheus text for this process, or for every worker with ``SWARM_METRICS_DIR``."""
+    return render_snapshot(collect(directory))
+
+
+_flusher: threading.Thread | None = None
+_flusher_lock = threading.Lock()
+_flusher_stop = threading.Event()
+
+
+def start_flusher() -> bool:
+    """Start the periodic snapshot writer when ``SWARM_METRICS_DIR`` is set."""
+    global _flusher
+    directory = metrics_dir()
+    if directory is None:
+        return False
+    try:
+        interval = max(0.5, float(os.getenv("SWARM_METRICS_FLUSH_SECONDS", "5")))
+    except ValueError:
+        interval = 5.0
+    with _flusher_lock:
+        if _flusher is not None and _flusher.is_alive():
+            return True
+
+        def _loop() -> None:
+            while not _flusher_stop.wait(interval):
+                flush(directory)
+
+        _flusher = threading.Thread(target=_loop, name="swarm-metrics-flush", daemon=True)
+        _flusher.start()
+        atexit.register(flush, directory)
+    return True
+
+
+# -- swarm metrics --------------------------------------------------------------
+
+def _current_inflight() -> float:
+    from swarm.core.concurrency import current_inflight
+
+    return current_inflight()
+
+
+def _max_inflight() -> float:
+    from swarm.core.concurrency import max_inflight
+
+    return max_inflight()
+
+
+def _memory_write_queue() -> float:
+    # Only when memory is in use; never import the memory stack for a scrape.
+    module = sys.modules.get("swarm.memory.write_behind")
+    return module.MEMORY_WRITER.pending() if module is not None else 0
+
+
+INFLIGHT = REGISTRY.gauge("swarm_inflight_requests", "Blueprint runs holding an in-flight slot.", fn=_current_inflight)
+INFLIGHT_LIMIT = REGISTRY.gauge("swarm_inflight_limit", "SWARM_MAX_INFLIGHT for this process.", fn=_max_inflight)
+BACKGROUND_RESPONSES = REGISTRY.gauge(
+    "swarm_background_responses", "Background /v1/responses tasks by state (queued, running).", ("state",),
+)
+MEMORY_WRITE_QUEUE = REGISTRY.gauge(
+    "swarm_memory_write_queue", "Conversations waiting for the memory write-behind worker.", fn=_memory_write_queue,
+)
+HTTP_REQUESTS = REGISTRY.counter("swarm_http_requests_total", "API requests by view and status code.", ("view", "status"))
+REQUEST_SECONDS = REGISTRY.histogram(
+    "swarm_request_duration_seconds",
+    "Request latency per blueprint; streamed requests end with their last chunk.",
+    ("view", "blueprint", "stream"),
+)
+TTFT_SECONDS = REGISTRY.histogram(
+    "swarm_time_to_first_token_seconds", "Time from request start to the first answer chunk.", ("view", "blueprint"),
+)
+BACKGROUND_RUN_SECONDS = REGISTRY.histogram(
+    "swarm_background_run_seconds", "Background /v1/responses run time by final status.", ("blueprint", "status"),
+)
+TOKENS = REGISTRY.counter(
+    "swarm_tokens_total", "Estimated tokens in reported usage, by blueprint and kind (prompt, completion).",
+    ("blueprint", "kind"),
+)
+CLI_SPAWN_SECONDS = REGISTRY.histogram(
+    "swarm_cli_spawn_seconds", "Time to start an agent CLI subprocess.", ("adapter",), buckets=FAST_BUCKETS,
+)
+CLI_RUN_SECONDS = REGISTRY.histogram("swarm_cli_run_seconds", "Agent CLI run time, spawn to exit.", ("adapter",))
+CLI_EXITS = REGISTRY.counter(
+    "swarm_cli_exits_total",
+    "Agent CLI runs by exit code (or timeout, launch_error, cancelled).",
+    ("adapter", "code"),
+)
+STORE_SECONDS = REGISTRY.histogram(
+    "swarm_store_operation_seconds", "responses_store operation latency.", ("op",), buckets=FAST_BUCKETS,
+)
+MCP_SECONDS = REGISTRY.histogram("swarm_mcp_call_seconds", "MCP client call latency.", ("op", "status"))
+CACHE_LOOKUPS = REGISTRY.counter("swarm_cache_lookups_total", "Cache lookups by cache and result (hit, miss).", ("cache", "result"))
+
+
+@contextmanager
+def timed(histogram: Histogram, **labels: Any):
+    """Observe the block's wall time (also usable as a decorator on sync functions)."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - start, **labels)
+
+
+def record_response(view: str, response: Any, started: float, blueprint: str | None) -> None:
+    """Count an API response; observe its latency unless it is still streaming.
+
+    Streamed bodies observe :data:`REQUEST_SECONDS` themselves when their last
+    chunk is sent. Latency is only recorded once a blueprint was resolved, so
+    the ``blueprint`` label only ever holds real model names.
+    """
+    HTTP_REQUESTS.inc(view=view, status=getattr(response, "status_code", 500))
+    if blueprint and not getattr(response, "streaming", False):
+        REQUEST_SECONDS.observe(time.monotonic() - started, view=view, blueprint=blueprint, stream="false")
+
+
+def record_stream_end(view: str, blueprint: str, started: float) -> None:
+    REQUEST_SECONDS.observe(time.monotonic() - started, view=view, blueprint=blueprint, stream="true")
+
+
+def record_first_chunk(view: str, blueprint: str, started: float) -> None:
+    TTFT_SECONDS.observe(time.monotonic() - started, view=view, blueprint=blueprint)
+
+
+__all__ = [
+    "CONTENT_TYPE",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "REGISTRY",
+    "Registry",
+    "collect",
+    "flush",
+    "merge",
+    "record_first_chunk",
+    "record_response",
+    "record_stream_end",
+    "render",
+    "render_snapshot",
+    "start_flusher",
+    "timed",
+]
@@ -54,6 +54,7 @@ from swarm.core.moa.policy import (
     assert_participant_permission,
     participant_acpx_flags,
 )
+from swarm.core.moa.scheduling import SeatStats, get_seat_stats
 from swarm.core.moa.team import (
     MOA_NESTED_PAYLOAD_KEYS,
     SPECIALIST_PAYLOAD_KEYS,
@@ -73,6 +74,7 @@ from swarm.core.moa.team import (
 from swarm.core.moa.types import (
     ActResult,
     Determination,
+    OpinionDelta,
     ParticipantOpinion,
     PermissionMode,
 )
@@ -88,9 +90,11 @@ __all__ = [
     "MoAOrchestrator",
     "MoAResult",
     "MoATeamResult",
+    "OpinionDelta",
     "ParticipantOpinion",
     "PermissionMode",
     "SPECIALIST_PAYLOAD_KEYS",
+    "SeatStats",
     "SpecialistTask",
     "TEAM_CLI_ENVELOPE_KEYS",
     "TEAM_RESULT_PAYLOAD_KEYS",
@@ -99,6 +103,7 @@ __all__ = [
     "assert_participant_name",
     "assert_participant_permission",
     "format_team_text",
+    "get_seat_stats",
     "default_output_path",
     "parse_team_tasks",
     "participant_acpx_flags",
@@ -97,8 +97,7 @@ def build_moa_orchestrator_agents(
     moa_calls: list[dict[str, Any]] = agents.get("_moa_calls") or []
 
     def _consult_configured(question: str) -> str:
-        import asyncio
-        import concurrent.futures
+        from swarm.core.loop_bridge import run_sync
 
         # Match scripted run_moa_then_team / run_moa_agents_orchestrator defaults.
         fakes = fakes_override
@@ -114,15 +113,7 @@ def build_moa_orchestrator_agents(
                 cwd=str(tools.root),
             )
 
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                    payload = pool.submit(lambda: asyncio.run(_run())).result()
-            else:
-                payload = loop.run_until_complete(_run())
-        except RuntimeError:
-            payload = asyncio.run(_run())
+        payload = run_sync(_run())
 
         moa_calls.append({"question": question, "payload": payload})
         det = (payload or {}).get("determination") or {}
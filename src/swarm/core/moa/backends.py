@@ -3,14 +3,21 @@
 Codex is **not** required. Preferred live path is local ``grok -p`` via
 :class:`GrokParticipantBackend`. acpx remains available for multi-vendor CLIs
 when those agents are installed and authenticated.
+
+Every backend offers ``consult`` (one complete opinion) and ``stream`` (an
+async iterator of :class:`OpinionDelta` fragments ending with the complete
+opinion), which the orchestrator uses to forward per-seat progress.
 """
 
 from __future__ import annotations
 
 import asyncio
+import codecs
 import logging
 import os
 import shutil
+from collections.abc import AsyncIterator, Callable
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from typing import Any, Protocol, runtime_checkable
 
@@ -20,7 +27,7 @@ from swarm.core.moa.policy import (
     assert_participant_name,
     assert_participant_permission,
 )
-from swarm.core.moa.types import ParticipantOpinion, PermissionMode
+from swarm.core.moa.types import OpinionDelta, ParticipantOpinion, PermissionMode
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +60,79 @@ async def _kill_process(proc: asyncio.subprocess.Process) -> None:
         pass
 
 
+# Bytes read from a participant's stdout per streamed delta (upper bound).
+STREAM_READ_SIZE = 4096
+
+
+async def _stream_process(
+    argv: list[str],
+    *,
+    agent: str,
+    mode: str,
+    label: str,
+    timeout: float | None,
+    finish: Callable[[str, str, int], ParticipantOpinion],
+) -> AsyncIterator[OpinionDelta]:
+    """Spawn ``argv`` and yield its stdout as deltas, then ``finish(stdout, stderr, rc)``.
+
+    stderr is drained concurrently so a chatty child cannot block on a full
+    pipe. ``timeout`` bounds the whole run; on timeout, cancellation or an
+    early ``aclose()`` the child is killed (same contract as ``consult``).
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+    except FileNotFoundError as e:
+        yield OpinionDelta(
+            agent,
+            opinion=ParticipantOpinion(
+                name=agent, text="", ok=False, permission_mode=mode,
+                error=f"{label} not found: {e}",
+            ),
+        )
+        return
+    loop = asyncio.get_running_loop()
+    deadline = None if timeout is None else loop.time() + float(timeout)
+    stderr_task = asyncio.ensure_future(proc.stderr.read())
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    parts: list[str] = []
+    try:
+        try:
+            while True:
+                remaining = None if deadline is None else max(0.0, deadline - loop.time())
+                chunk = await asyncio.wait_for(proc.stdout.read(STREAM_READ_SIZE), remaining)
+                text = decoder.decode(chunk, final=not chunk)
+                if text:
+                    parts.append(text)
+                    yield OpinionDelta(agent, text)
+                if not chunk:
+                    break
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            stderr_b = await asyncio.wait_for(asyncio.shield(stderr_task), remaining)
+            await asyncio.wait_for(proc.wait(), remaining)
+        except asyncio.TimeoutError:
+            await _kill_process(proc)
+            yield OpinionDelta(
+                agent,
+                opinion=ParticipantOpinion(
+                    name=agent, text="", ok=False, permission_mode=mode,
+                    error=f"{label} timed out after {timeout}s",
+                ),
+            )
+            return
+    finally:
+        # Cancelled, timed out or closed early by the consumer — free the child.
+        stderr_task.cancel()
+        await _kill_process(proc)
+    stdout = "".join(parts).strip()
+    stderr = (stderr_b or b"").decode("utf-8", errors="replace").strip()
+    rc = proc.returncode if proc.returncode is not None else -1
+    yield OpinionDelta(agent, opinion=finish(stdout, stderr, rc))
+
 
 @runtime_checkable
 class ParticipantBackend(Protocol):
@@ -68,6 +148,26 @@ class ParticipantBackend(Protocol):
     ) -> ParticipantOpinion: ...
 
 
+@runtime_checkable
+class StreamingParticipantBackend(ParticipantBackend, Protocol):
+    """Participant backend that can also report an answer while it is produced.
+
+    ``stream`` yields :class:`OpinionDelta` text fragments as the participant
+    emits them and always finishes with one delta whose ``opinion`` is the
+    same :class:`ParticipantOpinion` ``consult`` would have returned.
+    Closing the iterator early must release the participant (kill its CLI).
+    """
+
+    def stream(
+        self,
+        agent: str,
+        prompt: str,
+        *,
+        cwd: str | None = None,
+        permission: str = DEFAULT_PARTICIPANT_PERMISSION.value,
+    ) -> AsyncIterator[OpinionDelta]: ...
+
+
 # ---------------------------------------------------------------------------
 # Write surface (orchestrator-only)
 # ---------------------------------------------------------------------------
@@ -98,7 +198,13 @@ class RecordingWriteSurface:
 
 
 class FakeParticipantBackend:
-    """In-memory participant backend; records calls and never writes."""
+    """In-memory participant backend; records calls and never writes.
+
+    ``delays`` (seat → seconds) makes a seat take that long to answer, and
+    ``chunk_size`` splits streamed answers into fragments of that many
+    characters (``0`` streams each answer as one fragment); both exist to
+    exercise streaming and quorum behaviour in tests.
+    """
 
     def __init__(
         self,
@@ -106,9 +212,13 @@ class FakeParticipantBackend:
         *,
         write_surface: RecordingWriteSurface | None = None,
         errors: dict[str, str] | None = None,
+        delays: dict[str, float] | None = None,
+        chunk_size: int = 0,
     ) -> None:
         self.responses = dict(responses)
         self.errors = dict(errors or {})
+        self.delays = dict(delays or {})
+        self.chunk_size = max(0, int(chunk_size))
         self.write_surface = write_surface or RecordingWriteSurface()
         self.calls: list[dict[str, Any]] = []
 
@@ -119,6 +229,39 @@ class FakeParticipantBackend:
         *,
         cwd: str | None = None,
         permission: str = DEFAULT_PARTICIPANT_PERMISSION.value,
+    ) -> ParticipantOpinion:
+        opinion: ParticipantOpinion | None = None
+        async for delta in self.stream(agent, prompt, cwd=cwd, permission=permission):
+            opinion = delta.opinion or opinion
+        assert opinion is not None
+        return opinion
+
+    async def stream(
+        self,
+        agent: str,
+        prompt: str,
+        *,
+        cwd: str | None = None,
+        permission: str = DEFAULT_PARTICIPANT_PERMISSION.value,
+    ) -> AsyncIterator[OpinionDelta]:
+        opinion = self._answer(agent, prompt, cwd=cwd, permission=permission)
+        text = opinion.text if opinion.ok else ""
+        size = self.chunk_size or len(text) or 1
+        pieces = [text[i:i + size] for i in range(0, len(text), size)]
+        pause = float(self.delays.get(agent, 0.0)) / (len(pieces) + 1)
+        for piece in pieces:
+            await asyncio.sleep(pause)
+            yield OpinionDelta(agent, piece)
+        await asyncio.sleep(pause)
+        yield OpinionDelta(agent, opinion=opinion)
+
+    def _answer(
+        self,
+        agent: str,
+        prompt: str,
+        *,
+        cwd: str | None,
+        permission: str,
     ) -> ParticipantOpinion:
         mode = assert_participant_permission(permission)
         self.calls.append(
@@ -204,14 +347,10 @@ class GrokParticipantBackend:
             argv.extend(["--cwd", cwd])
         return argv
 
-    async def consult(
-        self,
-        agent: str,
-        prompt: str,
-        *,
-        cwd: str | None = None,
-        permission: str = DEFAULT_PARTICIPANT_PERMISSION.value,
-    ) -> ParticipantOpinion:
+    def _prepare(
+        self, agent: str, prompt: str, *, cwd: str | None, permission: str
+    ) -> tuple[str, list[str]]:
+        """Validated permission mode and argv for one seat (records the call)."""
         mode = assert_participant_permission(permission)
         # Multi-seat: label is recorded; each seat is a separate one-shot.
         seat_prompt = prompt
@@ -224,7 +363,36 @@ class GrokParticipantBackend:
             {"agent": agent, "prompt": seat_prompt, "cwd": cwd, "permission": mode}
         )
         full = READ_ONLY_PARTICIPANT_PREAMBLE + (seat_prompt or "")
-        argv = self.build_command(full, cwd=cwd)
+        return mode, self.build_command(full, cwd=cwd)
+
+    @staticmethod
+    def _opinion(agent: str, mode: str, stdout: str, stderr: str, rc: int) -> ParticipantOpinion:
+        if rc == 0 and stdout:
+            return ParticipantOpinion(
+                name=agent,
+                text=stdout,
+                ok=True,
+                permission_mode=mode,
+                meta={"returncode": rc, "backend": "grok"},
+            )
+        return ParticipantOpinion(
+            name=agent,
+            text=stdout,
+            ok=False,
+            permission_mode=mode,
+            error=stderr or stdout or f"grok exited {rc}",
+            meta={"returncode": rc, "backend": "grok"},
+        )
+
+    async def consult(
+        self,
+        agent: str,
+        prompt: str,
+        *,
+        cwd: str | None = None,
+        permission: str = DEFAULT_PARTICIPANT_PERMISSION.value,
+    ) -> ParticipantOpinion:
+        mode, argv = self._prepare(agent, prompt, cwd=cwd, permission=permission)
         try:
             proc = await asyncio.create_subprocess_exec(
                 *argv,
@@ -260,22 +428,29 @@ class GrokParticipantBackend:
         stdout = (stdout_b or b"").decode("utf-8", errors="replace").strip()
         stderr = (stderr_b or b"").decode("utf-8", errors="replace").strip()
         rc = proc.returncode if proc.returncode is not None else -1
-        if rc == 0 and stdout:
-            return ParticipantOpinion(
-                name=agent,
-                text=stdout,
-                ok=True,
-                permission_mode=mode,
-                meta={"returncode": rc, "backend": "grok"},
-            )
-        return ParticipantOpinion(
-            name=agent,
-            text=stdout,
-            ok=False,
-            permission_mode=mode,
-            error=stderr or stdout or f"grok exited {rc}",
-            meta={"returncode": rc, "backend": "grok"},
-        )
+        return self._opinion(agent, mode, stdout, stderr, rc)
+
+    async def stream(
+        self,
+        agent: str,
+        prompt: str,
+        *,
+        cwd: str | None = None,
+        permission: str = DEFAULT_PARTICIPANT_PERMISSION.value,
+    ) -> AsyncIterator[OpinionDelta]:
+        """Like :meth:`consult`, yielding stdout as grok flushes it."""
+        mode, argv = self._prepare(agent, prompt, cwd=cwd, permission=permission)
+        # aclosing: closing this iterator early must reach the subprocess cleanup.
+        async with aclosing(_stream_process(
+            argv,
+            agent=agent,
+            mode=mode,
+            label="grok",
+            timeout=self.default_timeout,
+            finish=lambda out, err, rc: self._opinion(agent, mode, out, err, rc),
+        )) as deltas:
+            async for delta in deltas:
+                yield delta
 
 
 # ---------------------------------------------------------------------------
@@ -330,6 +505,26 @@ class AcpxParticipantBackend:
             return os.path.isfile(self.acpx_bin) and os.access(self.acpx_bin, os.X_OK)
         return shutil.which(self.acpx_bin) is not None
 
+    @staticmethod
+    def _opinion(agent: str, mode: str, stdout: str, stderr: str, rc: int) -> ParticipantOpinion:
+        if rc == 0 and stdout:
+            return ParticipantOpinion(
+                name=agent,
+                text=stdout,
+                ok=True,
+                permission_mode=mode,
+                meta={"returncode": rc},
+            )
+        err = stderr or stdout or f"acpx exited {rc}"
+        return ParticipantOpinion(
+            name=agent,
+            text=stdout,
+            ok=False,
+            permission_mode=mode,
+            error=err,
+            meta={"returncode": rc, "stderr": stderr},
+        )
+
     async def consult(
         self,
         agent: str,
@@ -384,20 +579,35 @@ class AcpxParticipantBackend:
         stdout = (stdout_b or b"").decode("utf-8", errors="replace").strip()
         stderr = (stderr_b or b"").decode("utf-8", errors="replace").strip()
         rc = proc.returncode if proc.returncode is not None else -1
-        if rc == 0 and stdout:
-            return ParticipantOpinion(
-                name=agent,
-                text=stdout,
-                ok=True,
-                permission_mode=mode,
-                meta={"returncode": rc},
-            )
-        err = stderr or stdout or f"acpx exited {rc}"
-        return ParticipantOpinion(
-            name=agent,
-            text=stdout,
-            ok=False,
-            permission_mode=mode,
-            error=err,
-            meta={"returncode": rc, "stderr": stderr},
+        return self._opinion(agent, mode, stdout, stderr, rc)
+
+    async def stream(
+        self,
+        agent: str,
+        prompt: str,
+        *,
+        cwd: str | None = None,
+        permission: str = DEFAULT_PARTICIPANT_PERMISSION.value,
+        timeout: float | None = None,
+    ) -> AsyncIterator[OpinionDelta]:
+        """Like :meth:`consult`, yielding stdout as acpx flushes it.
+
+        With the default ``--format quiet`` acpx prints only the final
+        assistant text, so deltas arrive when the seat is nearly done.
+        """
+        mode = assert_participant_permission(permission)
+        full_prompt = READ_ONLY_PARTICIPANT_PREAMBLE + (prompt or "")
+        argv = self.build_command(
+            agent, full_prompt, cwd=cwd, permission=mode, timeout=timeout
         )
+        # aclosing: closing this iterator early must reach the subprocess cleanup.
+        async with aclosing(_stream_process(
+            argv,
+            agent=agent,
+            mode=mode,
+            label="acpx",
+            timeout=timeout if timeout is not None else self.default_timeout,
+            finish=lambda out, err, rc: self._opinion(agent, mode, out, err, rc),
+        )) as deltas:
+            async for delta in deltas:
+                yield delta
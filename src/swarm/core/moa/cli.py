@@ -23,6 +23,7 @@ from swarm.core.moa.backends import (
     RecordingWriteSurface,
 )
 from swarm.core.moa.orchestrator import MoAOrchestrator
+from swarm.core.moa.scheduling import get_seat_stats
 from swarm.core.moa.types import ActResult, PermissionMode
 
 logger = logging.getLogger(__name__)
@@ -139,6 +140,8 @@ async def run_moa_cli(
         backend=be,
         act_fn=act_fn if act else None,
         participant_permission=permission,
+        # Live CLIs learn per-seat latency across runs (hedging, failover order).
+        stats=None if isinstance(be, FakeParticipantBackend) else get_seat_stats(),
     )
     result = await orch.run(
         question,
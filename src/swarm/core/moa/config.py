@@ -8,6 +8,12 @@ Top-level keys (panel / consensus only)::
     participants     list of read-only seat names
     permission       approve-reads | deny-all  (never approve-all)
     default_timeout  seconds (per participant)
+    quorum           start determination after N successful seats (0 = all)
+    quorum_grace     extra seconds stragglers get once quorum is reached
+    failover         ordered backup seat names for failed/slow seats
+    adaptive         persisted per-seat latency stats → best-first failover,
+                     hedging (default true; live backends; timeouts unchanged)
+    hedge            launch the next failover seat past a seat's p95 (default true)
     presets          named overlays; see below
     fake_responses   optional dict (usually under a ``ci`` preset)
 
@@ -5,10 +5,12 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
-from collections.abc import Awaitable, Callable
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import Any
 
+from swarm.core import tracing
 from swarm.core.moa.backends import ParticipantBackend
 from swarm.core.moa.policy import (
     DEFAULT_PARTICIPANT_PERMISSION,
@@ -16,9 +18,11 @@ from swarm.core.moa.policy import (
     assert_participant_name,
     assert_participant_permission,
 )
+from swarm.core.moa.scheduling import SeatStats
 from swarm.core.moa.types import (
     ActResult,
     Determination,
+    OpinionDelta,
     ParticipantOpinion,
     PermissionMode,
 )
@@ -27,6 +31,7 @@ logger = logging.getLogger(__name__)
 
 DetermineFn = Callable[[str, list[ParticipantOpinion]], Awaitable[Determination]]
 ActFn = Callable[[Determination, str], Awaitable[ActResult]]
+ProgressFn = Callable[[OpinionDelta], None]
 
 
 @dataclass
@@ -164,6 +169,60 @@ def apply_vote_weights(
     return out
 
 
+def _answered(
+    primary: str, candidate: str, opinion: ParticipantOpinion, hedged_from: str | None
+) -> ParticipantOpinion:
+    """Successful ``opinion`` reported under the panel slot ``primary``."""
+    if hedged_from is not None:
+        opinion.meta = {**(opinion.meta or {}), "hedged": True, "hedged_from": hedged_from}
+    if candidate == primary:
+        return opinion
+    # Preserve original slot name in meta for tracing failover.
+    logger.info(
+        "moa.consult failover primary=%s answered_by=%s",
+        primary,
+        candidate,
+    )
+    return ParticipantOpinion(
+        name=primary,  # keep panel slot id stable
+        text=opinion.text,
+        ok=True,
+        permission_mode=opinion.permission_mode,
+        error=None,
+        meta={
+            **(opinion.meta or {}),
+            "failover_to": candidate,
+            "answered_by": candidate,
+            "failover_from": primary,
+        },
+    )
+
+
+async def relay_progress(
+    queue: asyncio.Queue[OpinionDelta], task: asyncio.Future
+) -> AsyncIterator[OpinionDelta]:
+    """Yield deltas an ``on_progress=queue.put_nowait`` run produces until ``task`` ends.
+
+    Closing the iterator early cancels ``task``; its result (or exception) is
+    left for the caller to collect.
+    """
+    getter: asyncio.Future | None = None
+    try:
+        while not (task.done() and queue.empty()):
+            getter = asyncio.ensure_future(queue.get())
+            await asyncio.wait({getter, task}, return_when=asyncio.FIRST_COMPLETED)
+            if getter.done():
+                yield getter.result()
+            else:
+                getter.cancel()
+    finally:
+        if getter is not None and not getter.done():
+            getter.cancel()
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+
 class MoAOrchestrator:
     """Run Mixture of Agents: read-only collect → orchestrator determine → optional act.
 
@@ -183,6 +242,10 @@ class MoAOrchestrator:
         per_participant_timeout: float | None = None,
         vote_weights: dict[str, float] | None = None,
         failover: list[str] | None = None,
+        quorum: int | None = None,
+        quorum_grace: float = 0.0,
+        stats: SeatStats | None = None,
+        hedge: bool = True,
     ) -> None:
         self.backend = backend
         self.determine_fn: DetermineFn = determine_fn or _default_determine
@@ -202,6 +265,17 @@ class MoAOrchestrator:
         # Ordered failover chain tried when a primary participant fails.
         # Validate labels at construction so flag-like names never reach argv.
         self.failover = [assert_participant_name(str(n)) for n in (failover or []) if n]
+        # Determination may start once this many seats answered successfully
+        # (None/0 = wait for every seat). Stragglers get ``quorum_grace`` more
+        # seconds, then are cancelled and reported as skipped.
+        self.quorum = max(0, int(quorum or 0))
+        self.quorum_grace = max(0.0, float(quorum_grace or 0.0))
+        # Latency/error history (see scheduling.SeatStats). When set, timeouts
+        # adapt to each seat's p95 (capped by per_participant_timeout), failover
+        # candidates are tried best-first and, with ``hedge``, a seat running
+        # past its p95 gets the next candidate launched alongside it.
+        self.stats = stats
+        self.hedge = bool(hedge)
 
     async def collect_opinions(
         self,
@@ -210,14 +284,22 @@ class MoAOrchestrator:
         *,
         cwd: str | None = None,
         permission: PermissionMode | str | None = None,
+        on_progress: ProgressFn | None = None,
     ) -> list[ParticipantOpinion]:
         """Fan out to participants under read-only permission only.
 
-        Seats run concurrently via ``asyncio.gather``, bounded by
-        ``self.max_concurrency`` (default 8 — full parallelism for typical
-        2–N seat panels). Failed primaries are replaced by the next unused
-        name from ``self.failover`` (if configured). Per-participant timeouts
-        produce an unsuccessful opinion rather than aborting the whole panel.
+        Seats run concurrently, bounded by ``self.max_concurrency`` (default
+        8 — full parallelism for typical 2–N seat panels). Failed primaries are
+        replaced by the next unused name from ``self.failover`` (if
+        configured). Per-participant timeouts produce an unsuccessful opinion
+        rather than aborting the whole panel. Once ``self.quorum`` seats have
+        answered successfully the rest are cancelled (after
+        ``self.quorum_grace`` seconds) and returned as skipped opinions.
+
+        With ``on_progress``, seats are consulted through the backend's
+        ``stream`` (when it has one) and the callback receives every text
+        fragment plus one completed delta per seat, labelled with the seat's
+        panel name.
         """
         if permission is not None:
             mode = assert_participant_permission(permission)
@@ -249,30 +331,72 @@ class MoAOrchestrator:
         sem = asyncio.Semaphore(self.max_concurrency)
         used: set[str] = set()
 
-        async def _consult(name: str) -> ParticipantOpinion:
+        stream = getattr(self.backend, "stream", None) if on_progress else None
+
+        async def _streamed(name: str, slot: str) -> ParticipantOpinion:
+            opinion: ParticipantOpinion | None = None
+            deltas = stream(name, question, cwd=cwd, permission=mode)
+            try:
+                async for delta in deltas:
+                    if delta.opinion is not None:
+                        opinion = delta.opinion
+                    elif delta.text:
+                        on_progress(OpinionDelta(slot, delta.text))
+            finally:
+                # Cancel/timeout: closing the stream kills the participant CLI.
+                await deltas.aclose()
+            return opinion or ParticipantOpinion(
+                name=name,
+                text="",
+                ok=False,
+                permission_mode=mode,
+                error="stream ended without an opinion",
+            )
+
+        async def _consult_seat(name: str, slot: str) -> ParticipantOpinion:
             async with sem:
                 logger.info("moa.consult seat=%s permission=%s", name, mode)
-                coro = self.backend.consult(
-                    name,
-                    question,
-                    cwd=cwd,
-                    permission=mode,
-                )
-                if self.per_participant_timeout is None:
-                    opinion = await coro
+                if stream is not None:
+                    coro = _streamed(name, slot)
                 else:
-                    try:
-                        opinion = await asyncio.wait_for(
-                            coro, timeout=float(self.per_participant_timeout)
-                        )
-                    except asyncio.TimeoutError:
-                        opinion = ParticipantOpinion(
-                            name=name,
-                            text="",
-                            ok=False,
-                            permission_mode=mode,
-                            error=f"timeout after {self.per_participant_timeout}s",
+                    coro = self.backend.consult(
+                        name,
+                        question,
+                        cwd=cwd,
+                        permission=mode,
+                    )
+                # Stats only steer hedging and failover order: a learned p95
+                # never cuts a seat off before its configured timeout.
+                timeout = self.per_participant_timeout
+                started = time.monotonic()
+                try:
+                    if timeout is None:
+                        opinion = await coro
+                    else:
+                        try:
+                            opinion = await asyncio.wait_for(coro, timeout=float(timeout))
+                        except asyncio.TimeoutError:
+                            opinion = ParticipantOpinion(
+                                name=name,
+                                text="",
+                                ok=False,
+                                permission_mode=mode,
+                                error=f"timeout after {timeout}s",
+                            )
+                except asyncio.CancelledError:
+                    if self.stats is not None:
+                        # Hedge losers and quorum skips are the slow tail: keep
+                        # their elapsed time as a lower bound so p95 is not censored.
+                        self.stats.record(
+                            self.stats.key(self.backend, name), time.monotonic() - started, None
                         )
+                    raise
+                if self.stats is not None:
+                    self.stats.record(
+                        self.stats.key(self.backend, name),
+                        time.monotonic() - started,
+                        opinion.ok,
+                    )
                 # Log lengths + short error only — never opinion text / secrets.
                 err = None if opinion.ok else (opinion.error or "unknown")[:120]
                 logger.info(
@@ -285,41 +409,85 @@ class MoAOrchestrator:
                 )
                 return opinion
 
+        async def _consult(name: str, slot: str) -> ParticipantOpinion:
+            with tracing.span("moa.consult", seat=name, slot=slot) as span:
+                opinion = await _consult_seat(name, slot)
+                span.set_attribute("ok", opinion.ok)
+                if not opinion.ok:
+                    span.set_error((opinion.error or "unknown")[:120])
+                return opinion
+
+        def _next_candidate(primary: str, tried: list[str]) -> str | None:
+            backups = [f for f in self.failover if f != primary]
+            if self.stats is not None:
+                backups = self.stats.rank(self.backend, backups)
+            for candidate in [primary] + backups:
+                if candidate not in tried and (candidate == primary or candidate not in used):
+                    used.add(candidate)
+                    return candidate
+            return None
+
+        def _hedge_delay(candidate: str, launched: float) -> float | None:
+            """Seconds until ``candidate`` exceeds its observed p95 (``None`` = never hedge)."""
+            if self.stats is None or not self.hedge:
+                return None
+            p95 = self.stats.p95(self.stats.key(self.backend, candidate))
+            if p95 is None:
+                return None
+            return max(0.0, launched + p95 - time.monotonic())
+
         async def _one_with_failover(primary: str) -> ParticipantOpinion:
-            chain = [primary] + [f for f in self.failover if f != primary]
+            # Candidates run one at a time, except that a seat still running past
+            # its p95 gets one hedge: the next candidate starts alongside it and
+            # the first successful answer wins (the other is cancelled).
+            tried: list[str] = []
+            running: dict[asyncio.Future, tuple[str, float]] = {}
             last: ParticipantOpinion | None = None
-            for candidate in chain:
-                if candidate in used and candidate != primary:
-                    continue
-                used.add(candidate)
-                opinion = await _consult(candidate)
-                last = opinion
-                if opinion.ok:
-                    # Preserve original slot name in meta for tracing failover.
-                    if candidate != primary:
-                        logger.info(
-                            "moa.consult failover primary=%s answered_by=%s",
-                            primary,
-                            candidate,
-                        )
-                        opinion.meta = {
-                            **(opinion.meta or {}),
-                            "failover_from": primary,
-                            "failover_to": candidate,
-                        }
-                        opinion = ParticipantOpinion(
-                            name=primary,  # keep panel slot id stable
-                            text=opinion.text,
-                            ok=True,
-                            permission_mode=opinion.permission_mode,
-                            error=None,
-                            meta={
-                                **(opinion.meta or {}),
-                                "answered_by": candidate,
-                                "failover_from": primary,
-                            },
-                        )
-                    return opinion
+            hedged_from: str | None = None
+
+            def _launch() -> bool:
+                candidate = _next_candidate(primary, tried)
+                if candidate is None:
+                    return False
+                tried.append(candidate)
+                task = asyncio.ensure_future(_consult(candidate, primary))
+                running[task] = (candidate, time.monotonic())
+                return True
+
+            _launch()
+            hedge_spent = False
+            try:
+                while running:
+                    delay = None
+                    if not hedge_spent and len(running) == 1:
+                        ((slow, launched),) = running.values()
+                        delay = _hedge_delay(slow, launched)
+                    done, _ = await asyncio.wait(
+                        running, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not done:
+                        hedge_spent = True  # at most one extra CLI per seat
+                        if _launch():
+                            hedged_from = slow
+                            logger.info(
+                                "moa.consult hedge primary=%s slow=%s hedge=%s",
+                                primary,
+                                slow,
+                                tried[-1],
+                            )
+                        continue
+                    for task in done:
+                        candidate, _launched = running.pop(task)
+                        opinion = task.result()
+                        last = opinion
+                        if opinion.ok:
+                            return _answered(primary, candidate, opinion, hedged_from)
+                    if not running:
+                        _launch()
+            finally:
+                for task in running:
+                    task.cancel()
+                await asyncio.gather(*running, return_exceptions=True)
             return last or ParticipantOpinion(
                 name=primary,
                 text="",
@@ -328,7 +496,39 @@ class MoAOrchestrator:
                 error="no candidates",
             )
 
-        opinions = list(await asyncio.gather(*[_one_with_failover(n) for n in names]))
+        async def _seat(primary: str) -> ParticipantOpinion:
+            opinion = await _one_with_failover(primary)
+            if on_progress is not None:
+                on_progress(OpinionDelta(primary, opinion=opinion))
+            return opinion
+
+        with tracing.span("moa.collect", seats=len(names), quorum=self.quorum or None) as span:
+            tasks = [asyncio.ensure_future(_seat(n)) for n in names]
+            try:
+                await self._await_quorum(tasks)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+            opinions = []
+            for name, task in zip(names, tasks, strict=True):
+                if task.cancelled():
+                    opinion = ParticipantOpinion(
+                        name=name,
+                        text="",
+                        ok=False,
+                        permission_mode=mode,
+                        error=f"skipped: quorum of {self.quorum} reached",
+                        meta={"quorum_skipped": True},
+                    )
+                    if on_progress is not None:
+                        on_progress(OpinionDelta(name, opinion=opinion))
+                else:
+                    opinion = task.result()
+                opinions.append(opinion)
+            span.set_attribute("ok", sum(1 for o in opinions if o.ok))
+        if self.stats is not None:
+            await asyncio.to_thread(self.stats.save)
         ok_n = sum(1 for o in opinions if o.ok)
         logger.info(
             "moa.collect done ok=%d total=%d permissions=%s",
@@ -338,6 +538,56 @@ class MoAOrchestrator:
         )
         return opinions
 
+    async def _await_quorum(self, tasks: list[asyncio.Future]) -> None:
+        """Wait for every seat, or for ``quorum`` successes plus the grace period."""
+        pending = set(tasks)
+        if not self.quorum or self.quorum >= len(tasks):
+            await asyncio.wait(pending)
+            return
+        ok_n = 0
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            ok_n += sum(1 for t in done if not t.cancelled() and t.exception() is None and t.result().ok)
+            if ok_n >= self.quorum:
+                break
+        if pending and self.quorum_grace:
+            await asyncio.wait(pending, timeout=self.quorum_grace)
+        pending = {t for t in pending if not t.done()}
+        if pending:
+            logger.info(
+                "moa.collect quorum=%d reached; skipping %d seat(s)",
+                self.quorum,
+                len(pending),
+            )
+
+    async def stream_opinions(
+        self,
+        question: str,
+        participants: list[str],
+        *,
+        cwd: str | None = None,
+        permission: PermissionMode | str | None = None,
+    ) -> AsyncIterator[OpinionDelta]:
+        """Async-iterator form of :meth:`collect_opinions` with ``on_progress``.
+
+        Yields each seat's text fragments as they arrive and one delta with the
+        completed ``opinion`` per seat (in completion order). Closing the
+        iterator early cancels the seats still running.
+        """
+        queue: asyncio.Queue[OpinionDelta] = asyncio.Queue()
+        collect = asyncio.ensure_future(
+            self.collect_opinions(
+                question,
+                participants,
+                cwd=cwd,
+                permission=permission,
+                on_progress=queue.put_nowait,
+            )
+        )
+        async for delta in relay_progress(queue, collect):
+            yield delta
+        collect.result()  # surface WriteDeniedError / ValueError
+
     async def determine(
         self, question: str, opinions: list[ParticipantOpinion]
     ) -> Determination:
@@ -441,8 +691,13 @@ class MoAOrchestrator:
         act: bool = False,
         action: str | None = None,
         permission: PermissionMode | str | None = None,
+        on_progress: ProgressFn | None = None,
     ) -> MoAResult:
-        """Full MoA path: collect → determine → optional act."""
+        """Full MoA path: collect → determine → optional act.
+
+        ``on_progress`` is forwarded to :meth:`collect_opinions`; with a
+        ``quorum`` configured, determination starts before slow seats finish.
+        """
         seats = list(participants)
         logger.info(
             "moa.run start act=%s seats=%s seats_n=%d q_len=%d",
@@ -451,15 +706,18 @@ class MoAOrchestrator:
             len(seats),
             len(question or ""),
         )
-        opinions = await self.collect_opinions(
-            question, participants, cwd=cwd, permission=permission
-        )
-        determination = await self.determine(question, opinions)
-        act_result: ActResult | None = None
-        if act:
-            act_result = await self.act(
-                determination, action or "apply determination"
+        with tracing.span("moa.run", seats=len(seats), act=act):
+            opinions = await self.collect_opinions(
+                question, participants, cwd=cwd, permission=permission, on_progress=on_progress
             )
+            with tracing.span("moa.determine"):
+                determination = await self.determine(question, opinions)
+            act_result: ActResult | None = None
+            if act:
+                with tracing.span("moa.act"):
+                    act_result = await self.act(
+                        determination, action or "apply determination"
+                    )
         logger.info(
             "moa.run done act=%s act_ok=%s determination=%s ok_opinions=%d",
             act,
@@ -476,5 +734,7 @@ class MoAOrchestrator:
                 "participants": list(participants),
                 "permission": permission or self.participant_permission,
                 "act": act,
+                "quorum": self.quorum or None,
+                "skipped": [o.name for o in opinions if (o.meta or {}).get("quorum_skipped")],
             },
         )
@@ -0,0 +1,164 @@
+"""Latency/error history for MoA seats, used for adaptive scheduling.
+
+:class:`SeatStats` keeps, per ``backend:seat`` key, exponentially weighted
+moving averages of consult latency (mean and variance) and of the error
+rate, and persists them to a small JSON file so the next run starts warm.
+The orchestrator derives from it:
+
+- a **p95 estimate** (``mean + 1.645 * stddev``) after which a failover
+  candidate is launched as a hedge,
+- a **failover order** (lowest error rate, then lowest latency first).
+
+Timeouts stay as configured; the history never shortens them.
+
+Keys with fewer than ``min_samples`` observations give no estimate, so a
+cold seat behaves exactly like the static configuration.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+import os
+import threading
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# One-sided z-score for the 95th percentile of a normal distribution.
+P95_Z = 1.645
+
+
+def _default_path() -> Path:
+    env = os.getenv("SWARM_MOA_STATS_PATH")
+    if env:
+        return Path(env).expanduser()
+    from swarm.core.paths import get_user_cache_dir_for_swarm
+
+    return get_user_cache_dir_for_swarm() / "moa_seat_stats.json"
+
+
+class SeatStats:
+    """Persisted EWMA latency/error-rate per ``backend:seat`` key (thread-safe)."""
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        *,
+        alpha: float = 0.2,
+        min_samples: int = 3,
+        persist: bool = True,
+    ) -> None:
+        self.path = Path(path) if path else _default_path()
+        self.alpha = alpha
+        self.min_samples = min_samples
+        self.persist = persist
+        self._entries: dict[str, dict[str, float]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if persist:
+            self._load()
+
+    @staticmethod
+    def key(backend: Any, seat: str) -> str:
+        return f"{type(backend).__name__}:{seat}"
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable MoA seat stats %s: %s", self.path, e)
+            return
+        if isinstance(data, dict):
+            self._entries = {
+                k: v for k, v in data.items() if isinstance(v, dict) and "latency" in v
+            }
+
+    def record(self, key: str, latency: float, ok: bool | None) -> None:
+        """Fold one consult (wall-clock seconds, success) into ``key``'s averages.
+
+        ``ok=None`` records a censored consult (cancelled before it answered):
+        ``latency`` is a lower bound that still counts towards the latency
+        averages, but the error rate is left alone.
+        """
+        a = self.alpha
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = {"latency": latency, "var": 0.0, "errors": 0.0 if ok is not False else 1.0, "n": 0}
+            else:
+                # Incremental exponentially weighted mean and variance.
+                diff = latency - entry["latency"]
+                entry["latency"] += a * diff
+                entry["var"] = (1 - a) * (entry["var"] + a * diff * diff)
+                if ok is not None:
+                    entry["errors"] += a * ((0.0 if ok else 1.0) - entry["errors"])
+            entry["n"] = entry["n"] + 1
+            entry["updated"] = time.time()
+            self._entries[key] = entry
+            self._dirty = True
+
+    def get(self, key: str) -> dict[str, float] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            return dict(entry) if entry else None
+
+    def p95(self, key: str) -> float | None:
+        """Estimated 95th-percentile latency, or ``None`` without enough history."""
+        entry = self.get(key)
+        if not entry or entry["n"] < self.min_samples:
+            return None
+        return entry["latency"] + P95_Z * math.sqrt(entry["var"])
+
+    def error_rate(self, key: str) -> float:
+        entry = self.get(key)
+        return entry["errors"] if entry else 0.0
+
+    def rank(self, backend: Any, seats: Iterable[str]) -> list[str]:
+        """``seats`` ordered by (error rate, mean latency); unknown seats keep their order last."""
+        seats = list(seats)
+
+        def _score(item: tuple[int, str]) -> tuple[float, float, int]:
+            entry = self.get(self.key(backend, item[1]))
+            if not entry or entry["n"] < self.min_samples:
+                return (math.inf, math.inf, item[0])
+            return (round(entry["errors"], 2), entry["latency"], item[0])
+
+        return [seat for _, seat in sorted(enumerate(seats), key=_score)]
+
+    def save(self) -> None:
+        if not self.persist:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps(self._entries, separators=(",", ":"))
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Could not persist MoA seat stats %s: %s", self.path, e)
+
+
+_shared: SeatStats | None = None
+_shared_lock = threading.Lock()
+
+
+def get_seat_stats() -> SeatStats:
+    """Process-wide :class:`SeatStats` at the default path (shared so runs do not race on the file)."""
+    global _shared
+    if _shared is None:
+        with _shared_lock:
+            if _shared is None:
+                _shared = SeatStats()
+    return _shared
@@ -0,0 +1,203 @@
+"""Staged specialist writes and write-set conflict tracking for the team runner.
+
+:func:`swarm.core.moa.team.run_moa_then_team` runs specialists concurrently
+when their declared file scopes are disjoint. Two pieces make that safe:
+
+* :class:`StagedWorkspace` — a :class:`WorkspaceTools` whose writes land in an
+  in-memory overlay instead of on disk. Reads and listings see the overlay on
+  top of the workspace, so a specialist still reads its own (and, in a
+  serialized chain, its predecessors') output. Nothing reaches the workspace
+  until :func:`commit_staged` runs, so a cancelled or failed team run never
+  leaves half-applied output behind.
+* :func:`plan_specialist_chains` — tasks whose declared scopes overlap (same
+  file, or one path inside the other) are chained and run in task order;
+  everything else runs side by side. :func:`plan_chain_waits` then makes a
+  chain wait for the chains whose earlier writes it reads, and runs it on top
+  of their output, so every task sees what it would in a sequential run. The
+  runner finally compares the chains' actual write sets: identical content for
+  the same path merges, anything else is a conflict and the later chain is
+  re-run serialized on top of the earlier output.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable, Sequence
+from pathlib import Path, PurePosixPath
+
+from swarm.core.persona_swarm import WorkspaceTools
+
+
+def _scope_parts(path: str) -> tuple[str, ...]:
+    norm = str(path).replace("\\", "/")
+    return tuple(p for p in PurePosixPath(norm).parts if p not in ("", "."))
+
+
+def scopes_overlap(a: Iterable[str] | None, b: Iterable[str] | None) -> bool:
+    """True if two declared scopes could touch the same file.
+
+    ``None`` (undeclared) overlaps everything. Paths overlap when equal or
+    when one is a directory prefix of the other (``docs`` vs ``docs/ADR.md``).
+    """
+    if a is None or b is None:
+        return True
+    for x in map(_scope_parts, a):
+        for y in map(_scope_parts, b):
+            n = min(len(x), len(y))
+            if x[:n] == y[:n]:
+                return True
+    return False
+
+
+def plan_specialist_chains(scopes: Sequence[Iterable[str] | None]) -> list[list[int]]:
+    """Group task indices into chains of mutually overlapping scopes.
+
+    Each chain keeps task order and runs sequentially; chains are disjoint
+    from each other and may run concurrently. Chains are ordered by their
+    first task.
+    """
+    scopes = [None if s is None else list(s) for s in scopes]
+    parent = list(range(len(scopes)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(scopes)):
+        for j in range(i + 1, len(scopes)):
+            if scopes_overlap(scopes[i], scopes[j]):
+                parent[find(j)] = find(i)
+
+    chains: dict[int, list[int]] = {}
+    for i in range(len(scopes)):
+        chains.setdefault(find(i), []).append(i)
+    return sorted(chains.values(), key=lambda chain: chain[0])
+
+
+def plan_chain_waits(
+    chains: Sequence[Sequence[int]],
+    scopes: Sequence[Iterable[str] | None],
+    reads: Sequence[Iterable[str] | None],
+) -> tuple[list[list[int]], list[list[int]]]:
+    """Order chains so each task reads what earlier tasks wrote.
+
+    A task that reads a path an earlier task (in another chain) may write
+    makes its chain wait for that one. ``None`` reads (unknown) depend on
+    every earlier task. Waits only point at chains that start earlier; when a
+    dependency would point the other way, the two chains are merged instead,
+    which keeps the result acyclic. Returns the chains (ordered by first task)
+    and, per chain, the indices of the chains it waits for.
+    """
+    scopes = [None if s is None else list(s) for s in scopes]
+    reads = [None if r is None else list(r) for r in reads]
+    planned = sorted((list(c) for c in chains), key=lambda chain: chain[0])
+    while True:
+        owner = {i: c for c, chain in enumerate(planned) for i in chain}
+        waits: list[set[int]] = [set() for _ in planned]
+        merge = None
+        for j, read in enumerate(reads):
+            for i in range(j):
+                c, d = owner[j], owner[i]
+                if c == d or d in waits[c] or not scopes_overlap(read, scopes[i]):
+                    continue
+                if planned[d][0] < planned[c][0]:
+                    waits[c].add(d)
+                else:
+                    merge = (c, d)
+                    break
+            if merge is not None:
+                break
+        if merge is None:
+            return planned, [sorted(w) for w in waits]
+        c, d = merge
+        planned[c] = sorted(planned[c] + planned[d])
+        del planned[d]
+        planned.sort(key=lambda chain: chain[0])
+
+
+class StagedWorkspace(WorkspaceTools):
+    """:class:`WorkspaceTools` that buffers writes in memory until committed.
+
+    ``base`` is a read-only overlay of already-staged files (workspace-relative
+    POSIX keys) that sits between this workspace's own writes and the disk.
+    """
+
+    def __init__(self, root: str | os.PathLike[str] | Path, base: dict[str, str] | None = None) -> None:
+        super().__init__(root)
+        self.base = dict(base or {})
+        self.staged: dict[str, str] = {}
+
+    def _lookup(self, key: str) -> str | None:
+        if key in self.staged:
+            return self.staged[key]
+        return self.base.get(key)
+
+    def exists(self, path: str | os.PathLike[str] | Path) -> bool:
+        p = self._safe(path)
+        return self._lookup(self._relkey(p)) is not None or p.exists()
+
+    def read_file(self, path: str | os.PathLike[str] | Path) -> str:
+        p = self._safe(path)
+        key = self._relkey(p)
+        text = self._lookup(key)
+        if text is None:
+            return super().read_file(path)
+        self.reads.append(key)
+        return text
+
+    def write_file(self, path: str | os.PathLike[str] | Path, content: str) -> str:
+        p = self._safe(path)
+        if p == self.root or p.is_dir():
+            raise IsADirectoryError(f"not a file: {path}")
+        key = self._relkey(p)
+        self.staged[key] = content
+        self.writes.append(key)
+        return f"OK: staged {key} ({len(content)} bytes)"
+
+    def list_files(self, directory: str | os.PathLike[str] | Path = ".") -> str:
+        p = self._safe(directory)
+        prefix = _scope_parts(self._relkey(p)) if p != self.root else ()
+        names = {x.name for x in p.iterdir()} if p.is_dir() else set()
+        for key in (*self.base, *self.staged):
+            parts = _scope_parts(key)
+            if len(parts) > len(prefix) and parts[: len(prefix)] == prefix:
+                names.add(parts[len(prefix)])
+        if not names and not p.is_dir():
+            return f"ERROR: not a directory: {directory}"
+        self.reads.append(self._relkey(p))
+        return "\n".join(sorted(names))
+
+
+def commit_staged(root: str | os.PathLike[str] | Path, files: dict[str, str]) -> list[str]:
+    """Write staged ``files`` under ``root`` (each one atomically); returns the keys.
+
+    Every file is fully written to a temporary sibling before any is renamed
+    into place, so an error while writing leaves the workspace untouched.
+    """
+    tools = WorkspaceTools(root)
+    pending: list[tuple[Path, Path]] = []
+    try:
+        for key, content in files.items():
+            dest = tools._safe(key)
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f".{dest.name}.staged-{os.getpid()}")
+            pending.append((tmp, dest))
+            tmp.write_text(content, encoding="utf-8")
+    except BaseException:
+        for tmp, _ in pending:
+            tmp.unlink(missing_ok=True)
+        raise
+    for tmp, dest in pending:
+        os.replace(tmp, dest)
+    return list(files)
+
+
+__all__ = [
+    "StagedWorkspace",
+    "commit_staged",
+    "plan_chain_waits",
+    "plan_specialist_chains",
+    "scopes_overlap",
+]
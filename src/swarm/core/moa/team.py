@@ -6,6 +6,9 @@ Two first-class scripted paths (CI-safe, no ``agents`` / Runner dependency):
    No specialist writes.
 2. **Consensus then team** — same MoA step, then purpose R/W specialists
    (implementer / tester / docs / researcher) write via :class:`WorkspaceTools`.
+   Specialists with disjoint file scopes run concurrently, after any
+   specialist whose output they read; their writes are staged and committed
+   together (see :mod:`swarm.core.moa.staging`).
 
 The openai-agents orchestrator mode (``run_moa_agents_orchestrator``) reuses the
 team runner for its scripted body; live Runner mode is optional and separate.
@@ -13,8 +16,10 @@ team runner for its scripted body; live Runner mode is optional and separate.
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Literal
@@ -24,12 +29,21 @@ from swarm.core.moa.policy import (
     WriteDeniedError,
     assert_participant_permission,
 )
+from swarm.core.moa.staging import (
+    StagedWorkspace,
+    commit_staged,
+    plan_chain_waits,
+    plan_specialist_chains,
+)
 from swarm.core.moa.tools import consult_moa
 from swarm.core.moa.types import PermissionMode
 from swarm.core.persona_swarm import PersonaResult, WorkspaceTools
 
 logger = logging.getLogger(__name__)
 
+# Specialist chains (groups with overlapping scopes) run at most this many at once.
+TEAM_CONCURRENCY = int(os.getenv("SWARM_TEAM_CONCURRENCY", "4"))
+
 # Built-in specialist purposes the scripted team runner can schedule.
 SPECIALIST_PURPOSES = frozenset(
     {
@@ -48,6 +62,9 @@ class TeamTask:
     purpose: str
     instruction: str
     output_path: str | None = None
+    # Workspace paths (files or directories) this task may write. ``None``
+    # means just ``output_path``; tasks with disjoint scopes run concurrently.
+    scope: list[str] | None = None
 
 
 # Back-compat alias used by openai-agents orchestrator module / blueprints.
@@ -65,6 +82,8 @@ class MoATeamResult:
     writes: list[str] = field(default_factory=list)
     reads: list[str] = field(default_factory=list)
     final: str = ""
+    # Paths concurrent specialists wrote differently (their chain was re-run serialized).
+    conflicts: list[str] = field(default_factory=list)
 
     @property
     def panel_wrote(self) -> bool:
@@ -261,7 +280,11 @@ def _task_from_dict(item: dict[str, Any]) -> TeamTask:
         output_path = default_output_path(purpose)
     else:
         output_path = _portable_relpath(str(raw_path).strip())
-    return TeamTask(purpose=purpose, instruction=instruction, output_path=output_path)
+    raw_scope = item.get("scope")
+    if isinstance(raw_scope, str):
+        raw_scope = [raw_scope]
+    scope = [_portable_relpath(str(p).strip()) for p in raw_scope] if raw_scope else None
+    return TeamTask(purpose=purpose, instruction=instruction, output_path=output_path, scope=scope)
 
 
 def _parse_task_segment(part: str) -> TeamTask | None:
@@ -348,6 +371,7 @@ def parse_team_tasks(
                         purpose=item.purpose,
                         instruction=item.instruction,
                         output_path=_portable_relpath(item.output_path),
+                        scope=item.scope,
                     )
                 tasks.append(item)
             elif isinstance(item, dict):
@@ -672,7 +696,7 @@ def _run_specialist(
             listing = tools.list_files(".")
             trace.append("list_files('.')")
             notes = ""
-            if (tools.root / "notes.txt").exists():
+            if tools.exists("notes.txt"):
                 notes = tools.read_file("notes.txt")
                 trace.append("read_file('notes.txt')")
             body = (
@@ -687,10 +711,10 @@ def _run_specialist(
             out_parts.append(body)
         elif purpose == "implementer":
             notes = ""
-            if (tools.root / "notes.txt").exists():
+            if tools.exists("notes.txt"):
                 notes = tools.read_file("notes.txt")
                 trace.append("read_file('notes.txt')")
-            if (tools.root / "moa_determination.md").exists():
+            if tools.exists("moa_determination.md"):
                 tools.read_file("moa_determination.md")
                 trace.append("read_file('moa_determination.md')")
             body = (
@@ -755,6 +779,107 @@ def _run_specialist(
 
 
 
+def _task_scope(task: TeamTask) -> list[str] | None:
+    """Paths ``task`` may write (``None`` = unknown, serialize with everything)."""
+    if task.scope is not None:
+        return list(task.scope)
+    purpose = task.purpose.lower().strip()
+    if purpose not in SPECIALIST_PURPOSES:
+        return []  # fails before writing anything
+    path = task.output_path or default_output_path(purpose)
+    return [path] if path else None
+
+
+# Paths the scripted specialists read before writing ("." = root listing).
+_PURPOSE_READS: dict[str, tuple[str, ...]] = {
+    "researcher": (".", "notes.txt"),
+    "implementer": ("notes.txt", "moa_determination.md"),
+}
+
+
+def _task_reads(task: TeamTask) -> list[str]:
+    """Paths ``task`` reads; its chain waits for earlier tasks writing them."""
+    return list(_PURPOSE_READS.get(task.purpose.lower().strip(), ()))
+
+
+async def _run_specialists(
+    root: Path,
+    *,
+    question: str,
+    determination: str,
+    tasks: list[TeamTask],
+    max_concurrency: int,
+) -> tuple[list[PersonaResult], list[str], list[str], list[str]]:
+    """Run ``tasks`` in scope-disjoint chains, then commit every staged write.
+
+    Chains run concurrently (``max_concurrency`` at a time, each in a worker
+    thread); tasks inside a chain run in order. A chain that reads an earlier
+    chain's output waits for it and runs on top of its staged writes. Returns
+    the results in task order plus the writes, reads and conflicting paths.
+    The workspace is only touched by the final commit, so cancelling this
+    coroutine applies nothing.
+    """
+    scopes = [_task_scope(t) for t in tasks]
+    chains, waits = plan_chain_waits(plan_specialist_chains(scopes), scopes, [_task_reads(t) for t in tasks])
+    results: list[PersonaResult | None] = [None] * len(tasks)
+    traces: list[tuple[list[str], list[str]]] = [([], []) for _ in tasks]
+
+    def _run_chain(chain: list[int], base: dict[str, str] | None) -> StagedWorkspace:
+        ws = StagedWorkspace(root, base)
+        for i in chain:
+            n_writes, n_reads = len(ws.writes), len(ws.reads)
+            results[i] = _run_specialist(ws, question=question, determination=determination, task=tasks[i])
+            traces[i] = (ws.writes[n_writes:], ws.reads[n_reads:])
+        return ws
+
+    limit = asyncio.Semaphore(max(1, max_concurrency))
+
+    runs: list[asyncio.Future[StagedWorkspace]] = []
+    ancestors: list[set[int]] = []
+
+    async def _chain(c: int) -> StagedWorkspace:
+        base: dict[str, str] = {}
+        for d in sorted(ancestors[c]):
+            base.update((await runs[d]).staged)
+        async with limit:
+            return await asyncio.to_thread(_run_chain, chains[c], base)
+
+    logger.info(
+        "moa.team specialist chains=%s waits=%s max_concurrency=%d", chains, waits, max_concurrency
+    )
+    for c in range(len(chains)):
+        ancestors.append(set(waits[c]).union(*(ancestors[d] for d in waits[c])))
+        runs.append(asyncio.ensure_future(_chain(c)))
+    try:
+        staged = await asyncio.gather(*runs)
+    except BaseException:
+        for run in runs:
+            run.cancel()
+        raise
+
+    # Write-set check: a path staged by more than one chain merges when the
+    # content is identical; otherwise the later chain is re-run on top of the
+    # earlier output, as if the two had been serialized from the start.
+    merged: dict[str, str] = {}
+    conflicts: list[str] = []
+    for chain, ws in zip(chains, staged, strict=True):
+        clash = sorted(k for k, v in ws.staged.items() if k in merged and merged[k] != v)
+        if clash:
+            logger.warning(
+                "moa.team write conflict paths=%s tasks=%s; re-running serialized",
+                clash,
+                [tasks[i].purpose for i in chain],
+            )
+            conflicts.extend(clash)
+            ws = await asyncio.to_thread(_run_chain, chain, merged)
+        merged.update(ws.staged)
+
+    commit_staged(root, merged)
+    writes = [key for w, _ in traces for key in w]
+    reads = [key for _, r in traces for key in r]
+    return [r for r in results if r is not None], writes, reads, conflicts
+
+
 def _moa_panel_usable(moa_payload: dict[str, Any]) -> bool:
     """Return True if the consult_moa payload has at least one usable opinion.
 
@@ -803,12 +928,15 @@ async def run_moa_then_team(
     permission: PermissionMode | str = PermissionMode.APPROVE_READS,
     cwd: str | Path | None = None,
     timeout: float = 300.0,
+    max_concurrency: int = TEAM_CONCURRENCY,
 ) -> MoATeamResult:
     """Consensus then a scripted R/W team — no openai-agents dependency.
 
     1. ``consult_moa`` — read-only multi-seat panel + determination (never act)
     2. Optional ``moa_determination.md`` (orchestrator-owned text artifact)
-    3. Purpose specialists write files via :class:`WorkspaceTools`
+    3. Purpose specialists write files via :class:`WorkspaceTools`; tasks with
+       disjoint scopes run concurrently (``max_concurrency`` chains at a time)
+       and all specialist writes are committed together at the end
 
     Participant ``permission`` must be a read-only mode (``approve-reads`` /
     ``deny-all``). Specialists still write; only panelists are permission-locked.
@@ -906,16 +1034,15 @@ async def run_moa_then_team(
             ),
         ]
 
-    specialist_results: list[PersonaResult] = []
-    for task in specialist_tasks:
-        specialist_results.append(
-            _run_specialist(
-                tools,
-                question=question,
-                determination=det,
-                task=task,
-            )
-        )
+    specialist_results, team_writes, team_reads, conflicts = await _run_specialists(
+        tools.root,
+        question=question,
+        determination=det,
+        tasks=specialist_tasks,
+        max_concurrency=max_concurrency,
+    )
+    writes = [*tools.writes, *team_writes]
+    reads = [*tools.reads, *team_reads]
 
     # Prefer last successful specialist; do not let a trailing unknown/failed
     # purpose replace determination with an error string.
@@ -928,19 +1055,20 @@ async def run_moa_then_team(
         "writes_n=%d writes=%s reads_n=%d reads=%s",
         specialists_ok,
         specialists_failed,
-        len(tools.writes),
-        list(tools.writes),
-        len(tools.reads),
-        list(tools.reads),
+        len(writes),
+        writes,
+        len(reads),
+        reads,
     )
     return MoATeamResult(
         determination=det,
         moa_payload=moa_payload,
         mode="consensus_then_team",
         specialist_results=specialist_results,
-        writes=list(tools.writes),
-        reads=list(tools.reads),
+        writes=writes,
+        reads=reads,
         final=final,
+        conflicts=conflicts,
     )
 
 
@@ -27,6 +27,24 @@ class ParticipantOpinion:
     meta: dict[str, Any] = field(default_factory=dict)
 
 
+@dataclass
+class OpinionDelta:
+    """Incremental output from one participant seat while it is answering.
+
+    ``text`` is the newly produced fragment. The last delta of a seat carries
+    the complete :class:`ParticipantOpinion` in ``opinion`` (and usually no
+    text); see :meth:`StreamingParticipantBackend.stream`.
+    """
+
+    name: str
+    text: str = ""
+    opinion: ParticipantOpinion | None = None
+
+    @property
+    def done(self) -> bool:
+        return self.opinion is not None
+
+
 @dataclass
 class Determination:
     """Orchestrator-owned consensus determination."""
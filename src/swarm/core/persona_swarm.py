@@ -116,6 +116,9 @@ class WorkspaceTools:
         self.writes.append(key)
         return f"OK: wrote {key} ({len(content)} bytes)"
 
+    def exists(self, path: str | os.PathLike[str] | Path) -> bool:
+        return self._safe(path).exists()
+
     def list_files(self, directory: str | os.PathLike[str] | Path = ".") -> str:
         p = self._safe(directory)
         if not p.is_dir():
@@ -203,8 +206,7 @@ def build_persona_agents(tools: WorkspaceTools) -> dict[str, Any]:
 
     def _consult_moa_sync(question: str) -> str:
         """Sync wrapper: run MoA collect→determine (never act) for the coordinator."""
-        import asyncio
-
+        from swarm.core.loop_bridge import run_sync
         from swarm.core.moa.tools import consult_moa
 
         async def _run() -> dict[str, Any]:
@@ -224,18 +226,7 @@ def build_persona_agents(tools: WorkspaceTools) -> dict[str, Any]:
                 },
             )
 
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_running():
-                # Nested loop: run in a fresh loop via thread if needed.
-                import concurrent.futures
-
-                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-                    payload = pool.submit(lambda: asyncio.run(_run())).result()
-            else:
-                payload = loop.run_until_complete(_run())
-        except RuntimeError:
-            payload = asyncio.run(_run())
+        payload = run_sync(_run())
 
         moa_calls.append({"question": question, "payload": payload})
         det = (payload or {}).get("determination") or {}
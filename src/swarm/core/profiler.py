@@ -0,0 +1,239 @@
+"""On-demand sampling profiler (pure Python, no extra dependencies).
+
+:func:`sample` runs in its own thread and snapshots the stack of every other
+thread through :func:`sys._current_frames` every ``interval`` seconds. Each
+snapshot adds one count to a stack key:
+
+    <thread name>;<outermost frame>;...;<innermost frame>
+
+Many identical keys make up a :class:`Profile`. Its :meth:`Profile.collapsed`
+output is the "folded" format read by ``flamegraph.pl``, speedscope and
+inferno.
+
+All threads are sampled, so event loops show up with the coroutine each one
+is running: the ASGI loop, the ``swarm-async-bridge`` loop and
+``/v1/responses`` worker loops. Threads parked in a known wait (selector,
+lock, queue) are left out unless ``include_idle`` is set, so the profile shows
+CPU work rather than wall time.
+
+Only one profile runs at a time (:class:`ProfilerBusy` otherwise). Durations
+are capped by ``SWARM_PROFILE_MAX_SECONDS`` (default 60). Intervals are
+floored at 1 ms. The default interval comes from ``SWARM_PROFILE_INTERVAL_MS``
+(default 5). The sampler's own CPU time is reported as
+:attr:`Profile.overhead`; the ``profiler.overhead`` benchmark tracks what it
+costs the profiled code.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from types import CodeType, FrameType
+
+DEFAULT_INTERVAL_MS = 5.0
+MIN_INTERVAL_MS = 1.0
+DEFAULT_MAX_SECONDS = 60.0
+MAX_DEPTH = 128
+
+# (file name, function) of leaf frames that mean "this thread is waiting".
+IDLE_FRAMES = frozenset({
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+    ("thread.py", "_worker"),  # concurrent.futures worker blocked on its queue
+    ("socket.py", "accept"),
+    ("socketserver.py", "serve_forever"),
+    ("subprocess.py", "_try_wait"),
+})
+
+_LOCK = threading.Lock()
+_labels: dict[CodeType, str] = {}
+
+
+class ProfilerBusy(RuntimeError):
+    """Another profile is already running in this process."""
+
+
+def default_interval() -> float:
+    """Sampling interval in seconds (``SWARM_PROFILE_INTERVAL_MS``)."""
+    try:
+        ms = float(os.getenv("SWARM_PROFILE_INTERVAL_MS", DEFAULT_INTERVAL_MS))
+    except ValueError:
+        ms = DEFAULT_INTERVAL_MS
+    return max(MIN_INTERVAL_MS, ms) / 1000
+
+
+def max_seconds() -> float:
+    try:
+        return float(os.getenv("SWARM_PROFILE_MAX_SECONDS", DEFAULT_MAX_SECONDS))
+    except ValueError:
+        return DEFAULT_MAX_SECONDS
+
+
+@dataclass
+class Profile:
+    """Sampled stacks plus what it took to collect them."""
+
+    stacks: Counter[str] = field(default_factory=Counter)
+    samples: int = 0
+    duration: float = 0.0
+    interval: float = 0.0
+    sampler_cpu: float = 0.0
+    threads: set[str] = field(default_factory=set)
+
+    @property
+    def overhead(self) -> float:
+        """Sampler CPU time as a fraction of the wall-clock duration."""
+        return self.sampler_cpu / self.duration if self.duration else 0.0
+
+    def collapsed(self) -> str:
+        """Folded stacks (``stack count`` per line, busiest first)."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+    def summary(self, top: int = 20) -> dict:
+        return {
+            "samples": self.samples,
+            "duration_s": round(self.duration, 3),
+            "interval_ms": round(self.interval * 1000, 3),
+            "sampler_cpu_s": round(self.sampler_cpu, 4),
+            "overhead": round(self.overhead, 4),
+            "threads": sorted(self.threads),
+            "top": [
+                {"frame": frame, "self": own, "total": total}
+                for frame, own, total in top_frames(self.stacks, top)
+            ],
+        }
+
+
+def _label(code: CodeType) -> str:
+    label = _labels.get(code)
+    if label is None:
+        name = getattr(code, "co_qualname", code.co_name)
+        path = code.co_filename
+        parent, base = os.path.split(path)
+        label = f"{name} ({os.path.basename(parent)}/{base}:{code.co_firstlineno})".replace(";", ":")
+        _labels[code] = label
+    return label
+
+
+def _is_idle(frame: FrameType) -> bool:
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES
+
+
+def _stack(frame: FrameType | None) -> list[str]:
+    labels = []
+    while frame is not None and len(labels) < MAX_DEPTH:
+        labels.append(_label(frame.f_code))
+        frame = frame.f_back
+    labels.reverse()
+    return labels
+
+
+def sample(seconds: float, *, interval: float | None = None, include_idle: bool = False) -> Profile:
+    """Sample every other thread's stack for ``seconds``; blocks the caller.
+
+    Raises :class:`ProfilerBusy` when a profile is already running and
+    ``ValueError`` for a non-positive duration.
+    """
+    if seconds <= 0:
+        raise ValueError("seconds must be positive")
+    seconds = min(seconds, max_seconds())
+    interval = max(MIN_INTERVAL_MS / 1000, interval if interval is not None else default_interval())
+    if not _LOCK.acquire(blocking=False):
+        raise ProfilerBusy("a profile is already running")
+    try:
+        return _run(seconds, interval, include_idle)
+    finally:
+        _LOCK.release()
+
+
+def _run(seconds: float, interval: float, include_idle: bool) -> Profile:
+    me = threading.get_ident()
+    names: dict[int, str] = {}
+    profile = Profile(interval=interval)
+    cpu_started = time.thread_time()
+    started = time.perf_counter()
+    deadline = started + seconds
+    next_tick = started
+    while True:
+        frames = sys._current_frames()
+        if any(ident not in names for ident in frames):
+            names = {t.ident: t.name for t in threading.enumerate()}
+        for ident, frame in frames.items():
+            if ident == me or (not include_idle and _is_idle(frame)):
+                continue
+            thread = names.get(ident, f"thread-{ident}").replace(";", ":").replace(" ", "_")
+            profile.stacks[";".join([thread, *_stack(frame)])] += 1
+            profile.threads.add(thread)
+        del frames
+        profile.samples += 1
+        next_tick += interval
+        now = time.perf_counter()
+        if now >= deadline:
+            break
+        if next_tick > now:
+            time.sleep(min(next_tick, deadline) - now)
+        else:
+            next_tick = now  # fell behind: skip missed ticks rather than burst
+    profile.duration = time.perf_counter() - started
+    profile.sampler_cpu = time.thread_time() - cpu_started
+    return profile
+
+
+def parse_collapsed(text: str) -> Counter[str]:
+    """Inverse of :meth:`Profile.collapsed` (malformed lines are skipped)."""
+    stacks: Counter[str] = Counter()
+    for line in text.splitlines():
+        stack, _, count = line.rstrip().rpartition(" ")
+        if stack and count.isdigit():
+            stacks[stack] += int(count)
+    return stacks
+
+
+def top_frames(stacks: Counter[str], limit: int = 20) -> list[tuple[str, int, int]]:
+    """``(frame, self samples, total samples)``, busiest (self) first.
+
+    The thread name prefix is not a frame and is skipped; recursive frames
+    count once per stack towards ``total``.
+    """
+    own: Counter[str] = Counter()
+    total: Counter[str] = Counter()
+    for stack, count in stacks.items():
+        frames = stack.split(";")[1:]
+        if not frames:
+            continue
+        own[frames[-1]] += count
+        for frame in set(frames):
+            total[frame] += count
+    ranked = sorted(total, key=lambda f: (own[f], total[f]), reverse=True)
+    return [(frame, own[frame], total[frame]) for frame in ranked[:limit]]
+
+
+def format_top(stacks: Counter[str], limit: int = 20) -> str:
+    """Text table of :func:`top_frames` with percentages of all samples."""
+    samples = sum(stacks.values())
+    if not samples:
+        return "No samples."
+    lines = [f"{'self%':>6} {'total%':>7}  frame"]
+    for frame, own, total in top_frames(stacks, limit):
+        lines.append(f"{100 * own / samples:6.1f} {100 * total / samples:7.1f}  {frame}")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "IDLE_FRAMES",
+    "Profile",
+    "ProfilerBusy",
+    "default_interval",
+    "format_top",
+    "max_seconds",
+    "parse_collapsed",
+    "sample",
+    "top_frames",
+]
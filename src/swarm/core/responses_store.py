@@ -21,6 +21,8 @@ import time
 from pathlib import Path
 from typing import Any
 
+from swarm.core import metrics, server_timing, tracing
+
 # resp ids we mint look like ``resp_<uuid>``; restrict to a safe charset so a
 # caller-supplied id can never traverse out of the store dir.
 _ID_RE = re.compile(r"^resp_[A-Za-z0-9_-]{1,128}$")
@@ -57,19 +59,25 @@ def save(record: dict[str, Any], *, base_dir: Path | None = None) -> None:
     path = _path_for(rid, base_dir)
     if path is None:
         return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    # write to a temp file in the same dir, then atomic rename.
-    fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
-    try:
-        with os.fdopen(fd, "w") as f:
-            json.dump(record, f, default=str)
-        os.replace(tmp, path)
-    except Exception:
-        with contextlib.suppress(OSError):
-            os.unlink(tmp)
-        raise
+    with (
+        tracing.span("store.save", response_id=rid),
+        metrics.timed(metrics.STORE_SECONDS, op="save"),
+        server_timing.phase("persist"),
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temp file in the same dir, then atomic rename.
+        fd, tmp = tempfile.mkstemp(dir=str(path.parent), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(record, f, default=str)
+            os.replace(tmp, path)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp)
+            raise
 
 
+@metrics.timed(metrics.STORE_SECONDS, op="load")
 def load(response_id: str, *, base_dir: Path | None = None) -> dict[str, Any] | None:
     """Return the stored record for ``response_id``, or None if absent/invalid."""
     path = _path_for(response_id, base_dir)
@@ -104,6 +112,7 @@ def owner_allows(record: dict[str, Any] | None, principal: str | None) -> bool:
     return str(owner) == str(principal)
 
 
+@metrics.timed(metrics.STORE_SECONDS, op="list")
 def list_summaries(*, base_dir: Path | None = None, limit: int | None = 200) -> list[dict[str, Any]]:
     """Lightweight summaries of stored sessions, newest first.
 
@@ -138,6 +147,7 @@ def list_summaries(*, base_dir: Path | None = None, limit: int | None = 200) ->
     return summaries[:limit] if limit else summaries
 
 
+@metrics.timed(metrics.STORE_SECONDS, op="delete")
 def delete(response_id: str, *, base_dir: Path | None = None) -> bool:
     """Delete the stored record; True if one was removed."""
     path = _path_for(response_id, base_dir)
@@ -0,0 +1,121 @@
+"""Per-request phase timings, reported as a ``Server-Timing`` header.
+
+The API views start a :class:`ServerTiming` for each request and the code on
+the request path adds phases to it through :func:`phase` and :func:`mark`.
+The timing lives in a :class:`contextvars.ContextVar`, so helpers deep in
+the call stack (blueprint instantiation, memory retrieval, the responses
+store) need no extra arguments. Outside a request these calls do nothing.
+
+Phases, in milliseconds:
+
+- ``auth``, ``validate``, ``model_access``: request checks;
+- ``blueprint``: blueprint instantiation;
+- ``memory``: waiting for memory retrieval (the part not hidden behind setup);
+- ``first_chunk``: time from the start of the request to the first answer chunk;
+- ``generation``: the whole blueprint run;
+- ``persist``: ``responses_store`` writes;
+- ``total``: the whole request.
+
+Non-streaming responses carry the ``Server-Timing`` header. Streams cannot
+add headers once the body has started, so they end with an SSE comment
+(``: server-timing ...``) just before ``data: [DONE]``. SSE clients ignore
+comments. Set ``SWARM_SERVER_TIMING=0`` to turn both off.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+HEADER = "Server-Timing"
+
+_current: contextvars.ContextVar[ServerTiming | None] = contextvars.ContextVar("swarm_server_timing", default=None)
+
+
+def enabled() -> bool:
+    return os.getenv("SWARM_SERVER_TIMING", "1").lower() not in ("0", "false", "no", "off")
+
+
+class ServerTiming:
+    """Accumulated phase durations for one request (thread-safe)."""
+
+    __slots__ = ("started", "_phases", "_lock")
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._phases: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def add(self, name: str, ms: float) -> None:
+        with self._lock:
+            self._phases[name] = self._phases.get(name, 0.0) + ms
+
+    def mark(self, name: str) -> None:
+        """Record the time since the request started, once per name."""
+        elapsed = self.elapsed_ms()
+        with self._lock:
+            self._phases.setdefault(name, elapsed)
+
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, (time.perf_counter() - start) * 1000)
+
+    def phases(self) -> dict[str, float]:
+        with self._lock:
+            return dict(self._phases)
+
+    def header(self) -> str:
+        """``Server-Timing`` value: each phase, then ``total``."""
+        entries = [f"{name};dur={ms:.1f}" for name, ms in self.phases().items()]
+        entries.append(f"total;dur={self.elapsed_ms():.1f}")
+        return ", ".join(entries)
+
+    def sse_comment(self) -> str:
+        return f": server-timing {self.header()}\n\n"
+
+
+def begin() -> ServerTiming | None:
+    """Start timing the current request (``None`` when disabled)."""
+    timing = ServerTiming() if enabled() else None
+    _current.set(timing)
+    return timing
+
+
+def activate(timing: ServerTiming | None) -> None:
+    """Make ``timing`` current again, e.g. inside a streamed response body."""
+    _current.set(timing)
+
+
+def current() -> ServerTiming | None:
+    return _current.get()
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Add the block's duration to phase ``name`` of the current request."""
+    timing = _current.get()
+    if timing is None:
+        yield
+        return
+    with timing.measure(name):
+        yield
+
+
+def mark(name: str) -> None:
+    timing = _current.get()
+    if timing is not None:
+        timing.mark(name)
+
+
+__all__ = ["HEADER", "ServerTiming", "activate", "begin", "current", "enabled", "mark", "phase"]
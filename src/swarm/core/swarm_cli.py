@@ -846,6 +846,208 @@ def cli_agents(
 app.command(name="agents", help="Alias for cli-agents.")(cli_agents)
 
 
+def _load_asgi_app():
+    """The swarm ASGI application, for in-process ``bench`` runs."""
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "swarm.settings")
+    from swarm.asgi import application
+
+    return application
+
+
+@app.command(name="bench")
+def bench_cmd(
+    model: str = typer.Option("chatbot", "--model", "-m", help="Blueprint/model name to send requests to."),
+    url: str = typer.Option(None, "--url", "-u", help="Base URL of a running server (e.g. http://127.0.0.1:8000). Default: drive the ASGI app in-process."),
+    mix: str = typer.Option("chat", "--mix", help="Weighted request mix, e.g. chat=2,stream=1,responses=1 (kinds: chat, stream, responses)."),
+    concurrency: int = typer.Option(4, "--concurrency", "-c", help="Closed loop: number of workers, each sending back-to-back requests."),
+    rate: float = typer.Option(None, "--rate", "-r", help="Open loop: arrivals per second (Poisson), regardless of completions. Overrides --concurrency."),
+    requests: int = typer.Option(50, "--requests", "-n", help="Stop after this many requests (0 = use --duration only)."),
+    duration: float = typer.Option(None, "--duration", "-d", help="Stop issuing new requests after this many seconds."),
+    prompt: str = typer.Option(None, "--prompt", help="User message sent with every request."),
+    max_wait: float = typer.Option(None, "--max-wait", help="max_wait_seconds for /v1/responses requests (0 = immediate 202 + poll)."),
+    api_key: str = typer.Option(None, "--api-key", envvar="SWARM_API_KEY", help="Bearer token (defaults to $SWARM_API_KEY)."),
+    seed: int = typer.Option(0, "--seed", help="Seed for the request mix and open-loop arrivals."),
+    output_json: bool = typer.Option(False, "--json", "-j", help="Emit the report as JSON."),
+):
+    """Load-test the API: RPS, p50/p95/p99 latency, TTFT and error/429 rates."""
+    import asyncio
+    import contextlib
+    import json
+    import sys
+
+    from swarm.core.loadgen import (
+        DEFAULT_PROMPT,
+        AsgiTarget,
+        HttpTarget,
+        LoadConfig,
+        format_report,
+        parse_mix,
+        run_load,
+    )
+
+    try:
+        weights = parse_mix(mix)
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=2) from None
+    if not requests and not duration:
+        typer.echo("Error: set --requests and/or --duration.", err=True)
+        raise typer.Exit(code=2)
+
+    cfg = LoadConfig(
+        model=model,
+        mix=weights,
+        concurrency=concurrency,
+        rate=rate or None,
+        requests=requests or None,
+        duration=duration,
+        prompt=prompt or DEFAULT_PROMPT,
+        max_wait_seconds=max_wait,
+        seed=seed,
+    )
+    headers = {"authorization": f"Bearer {api_key}"} if api_key else {}
+    limit = None
+    if url:
+        target = HttpTarget(url, headers=headers)
+    else:
+        target = AsgiTarget(_load_asgi_app(), headers=headers)
+        from swarm.core.concurrency import max_inflight
+
+        limit = max_inflight()
+
+    async def _run() -> dict:
+        try:
+            return await run_load(target, cfg, max_inflight=limit)
+        finally:
+            await target.aclose()
+
+    arrival = f"open loop {cfg.rate}/s" if cfg.rate else f"closed loop x{cfg.concurrency}"
+    if not output_json:
+        where = url or "in-process ASGI app"
+        typer.echo(f"Benchmarking model '{model}' on {where} ({arrival}, mix {mix})…", err=True)
+    # In-process blueprints print their run boxes to stdout; keep the report clean.
+    with contextlib.redirect_stdout(sys.stderr if not url else sys.stdout):
+        report = asyncio.run(_run())
+    report["target"] = url or "asgi"
+    report["arrival"] = arrival
+    if output_json:
+        typer.echo(json.dumps(report, indent=2))
+    else:
+        typer.echo(format_report(report))
+    raise typer.Exit(code=0 if report["ok"] else 1)
+
+
+@app.command(name="trace")
+def trace_cmd(
+    path: str = typer.Argument(None, help="Spans JSON-lines file (default: $SWARM_TRACE_FILE or the user data dir's traces/spans.jsonl)."),
+    chrome: str = typer.Option(None, "--chrome", help="Write a Chrome trace-event JSON file (open in chrome://tracing or ui.perfetto.dev)."),
+    trace_id: str = typer.Option(None, "--trace-id", help="Only spans from this trace."),
+    last: int = typer.Option(10, "--last", "-n", help="Print only the newest N traces (0 = all)."),
+):
+    """Show recorded request spans as trees, or export them for a flame view."""
+    import json
+
+    from swarm.core import tracing
+
+    spans_file = Path(path or os.getenv("SWARM_TRACE_FILE") or paths.get_user_data_dir_for_swarm() / "traces" / "spans.jsonl")
+    if not spans_file.is_file():
+        typer.echo(f"Error: no spans file at {spans_file} (enable tracing with SWARM_TRACE=1).", err=True)
+        raise typer.Exit(code=1)
+    spans = tracing.load_spans(spans_file)
+    if trace_id:
+        spans = [s for s in spans if s.get("trace_id") == trace_id]
+    if chrome:
+        chrome_file = Path(chrome)
+        chrome_file.parent.mkdir(parents=True, exist_ok=True)
+        chrome_file.write_text(json.dumps(tracing.to_chrome_trace(spans)), encoding="utf-8")
+        typer.echo(f"Wrote {len(spans)} spans to {chrome_file}")
+        return
+    typer.echo(tracing.format_tree(spans, limit=last or None) or "No spans recorded.")
+
+
+@app.command(name="profile")
+def profile_cmd(
+    url: str = typer.Option("http://127.0.0.1:8000", "--url", "-u", help="Base URL of the running server."),
+    seconds: float = typer.Option(10.0, "--seconds", "-s", help="How long to sample."),
+    interval_ms: float = typer.Option(None, "--interval-ms", help="Sampling interval (server default: $SWARM_PROFILE_INTERVAL_MS or 5 ms)."),
+    idle: bool = typer.Option(False, "--idle", help="Keep samples of threads parked in a wait (wall-clock instead of CPU view)."),
+    output: str = typer.Option(None, "--output", "-o", help="Write folded stacks here (for flamegraph.pl, speedscope or inferno)."),
+    top: int = typer.Option(20, "--top", help="Print the N hottest frames."),
+    api_key: str = typer.Option(None, "--api-key", envvar="SWARM_API_KEY", help="Admin Bearer token (defaults to $SWARM_API_KEY)."),
+):
+    """Sample a running server's CPU hot spots and print/save folded stacks."""
+    import httpx
+
+    from swarm.core import profiler
+
+    params = {"seconds": seconds}
+    if interval_ms:
+        params["interval_ms"] = interval_ms
+    if idle:
+        params["idle"] = 1
+    headers = {"authorization": f"Bearer {api_key}"} if api_key else {}
+    typer.echo(f"Profiling {url} for {seconds:g}s…", err=True)
+    try:
+        resp = httpx.get(f"{url.rstrip('/')}/v1/profile", params=params, headers=headers, timeout=seconds + 30)
+    except httpx.HTTPError as e:
+        typer.echo(f"Error: could not reach {url}: {e}", err=True)
+        raise typer.Exit(code=1) from None
+    if resp.status_code != 200:
+        typer.echo(f"Error: HTTP {resp.status_code}: {resp.text[:300]}", err=True)
+        raise typer.Exit(code=1)
+    if output:
+        output_file = Path(output)
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        output_file.write_text(resp.text, encoding="utf-8")
+        typer.echo(f"Wrote folded stacks to {output_file}", err=True)
+    overhead = float(resp.headers.get("x-profile-overhead") or 0)
+    typer.echo(f"{resp.headers.get('x-profile-samples', '?')} samples, sampler overhead {100 * overhead:.2f}% of one core")
+    typer.echo(profiler.format_top(profiler.parse_collapsed(resp.text), top))
+
+
+@app.command(name="usage")
+def usage_cmd(
+    since: str = typer.Option("7d", "--since", help="Start: ISO date/datetime, epoch seconds, or 24h/7d/4w ago."),
+    until: str = typer.Option(None, "--until", help="End (exclusive), same formats."),
+    granularity: str = typer.Option("day", "--granularity", "-g", help="Rollup to read: day or hour."),
+    by: str = typer.Option("owner,model", "--by", help="Group by any of bucket, owner, model (comma-separated; '' = total)."),
+    owner: str = typer.Option(None, "--owner", help="Only this owner principal (e.g. user:alice, token:…)."),
+    model: str = typer.Option(None, "--model", "-m", help="Only this model/blueprint."),
+    db: str = typer.Option(None, "--db", help="Ledger database (default: $SWARM_USAGE_DB or the user data dir's usage.sqlite3)."),
+    output_json: bool = typer.Option(False, "--json", "-j", help="Emit rows as JSON."),
+):
+    """Token usage per owner/model/period from the local usage ledger."""
+    import json
+
+    from swarm.core import usage_ledger
+
+    ledger = usage_ledger.UsageLedger(db) if db else usage_ledger.USAGE_LEDGER
+    try:
+        rows = ledger.query(
+            granularity=granularity,
+            since=usage_ledger.parse_time(since),
+            until=usage_ledger.parse_time(until),
+            owner=owner,
+            model=model,
+            group_by=[g.strip() for g in by.split(",") if g.strip()],
+        )
+    except ValueError as e:
+        typer.echo(f"Error: {e}", err=True)
+        raise typer.Exit(code=2) from None
+    if output_json:
+        typer.echo(json.dumps(rows, indent=2))
+        return
+    if not rows:
+        typer.echo(f"No usage recorded in {ledger.path} for that range.")
+        return
+    keys = [k for k in ("bucket", "owner", "model") if k in rows[0]]
+    numbers = ("requests", "prompt_tokens", "completion_tokens", "total_tokens")
+    widths = {k: max(len(k), *(len(str(r[k])) for r in rows)) for k in (*keys, *numbers)}
+    typer.echo("  ".join([*(k.ljust(widths[k]) for k in keys), *(k.rjust(widths[k]) for k in numbers)]))
+    for r in rows:
+        typer.echo("  ".join([*(str(r[k]).ljust(widths[k]) for k in keys), *(str(r[k]).rjust(widths[k]) for k in numbers)]))
+
+
 @app.command(name="skills")
 def skills_command(
     show: str = typer.Option(None, "--show", "-s", help="Print the full SKILL.md instructions for one skill."),
@@ -0,0 +1,388 @@
+"""Lightweight request tracing: nested spans to a local JSON-lines file.
+
+Off by default. Set ``SWARM_TRACE_FILE`` (a path) — or ``SWARM_TRACE=1`` for
+``<user data dir>/traces/spans.jsonl`` — and every instrumented step records a
+span: the HTTP views, blueprint instantiation, CLI subprocess runs (with a
+``first_byte`` event), consensus rounds, MoA collection/seat consults and MCP
+calls. When tracing is off, :func:`span` returns a shared no-op object, so the
+instrumentation costs one attribute check.
+
+Span records follow the OpenTelemetry data model (``trace_id`` / ``span_id`` /
+``parent_span_id`` as lower-case hex, ``start_time_unix_nano`` /
+``end_time_unix_nano``, ``attributes``, ``events``, ``status``) so they can
+be fed to OTLP tooling later; no collector or SDK is needed to produce them.
+Parents are tracked in a :class:`contextvars.ContextVar`, so spans nest across
+``await`` and ``asyncio.to_thread`` but not across bare threads.
+
+:func:`to_chrome_trace` converts spans to the Chrome trace-event format for
+flame-style viewing in ``chrome://tracing`` or https://ui.perfetto.dev;
+``swarm-cli trace`` prints span trees or writes that file::
+
+    swarm-cli trace spans.jsonl --chrome trace.json
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "open-swarm"
+STATUS_OK = "OK"
+STATUS_ERROR = "ERROR"
+
+_current: contextvars.ContextVar[Span | None] = contextvars.ContextVar("swarm_trace_span", default=None)
+
+
+class Span:
+    """One timed operation. Use via :func:`span`; call :meth:`end` once."""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_span_id", "kind", "start_ns", "end_ns",
+        "attributes", "events", "status", "status_message", "_token", "_exporter",
+    )
+
+    def __init__(self, name: str, parent: Span | None, kind: str, attributes: dict[str, Any], exporter: JsonlExporter) -> None:
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else None
+        self.kind = kind
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.attributes = {
+            "process.pid": os.getpid(),
+            "thread.id": threading.get_ident(),
+            **{k: v for k, v in attributes.items() if v is not None},
+        }
+        self.events: list[dict[str, Any]] = []
+        self.status = STATUS_OK
+        self.status_message: str | None = None
+        self._token: contextvars.Token | None = None
+        self._exporter = exporter
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        if value is not None:
+            self.attributes[key] = value
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        self.events.append({"name": name, "time_unix_nano": time.time_ns(), "attributes": attributes})
+
+    def set_error(self, message: str) -> None:
+        self.status = STATUS_ERROR
+        self.status_message = message
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.set_error(f"{type(exc).__name__}: {exc}")
+        self.add_event("exception", **{"exception.type": type(exc).__name__, "exception.message": str(exc)})
+
+    def end(self) -> None:
+        if self.end_ns is not None:
+            return
+        self.end_ns = time.time_ns()
+        self._exporter.export(self)
+
+    def to_dict(self) -> dict[str, Any]:
+        status: dict[str, Any] = {"code": self.status}
+        if self.status_message:
+            status["message"] = self.status_message
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_span_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "attributes": self.attributes,
+            "events": self.events,
+            "status": status,
+            "resource": {"service.name": SERVICE_NAME},
+        }
+
+    # -- context manager: activate as the current span, end on exit ---------
+    def __enter__(self) -> Span:
+        self._token = _current.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if isinstance(exc, (GeneratorExit, asyncio.CancelledError)):
+            self.set_attribute("cancelled", True)
+        elif exc is not None:
+            self.record_exception(exc)
+        if self._token is not None:
+            # ValueError: exited from another context (e.g. generator finalizer).
+            with contextlib.suppress(ValueError):
+                _current.reset(self._token)
+            self._token = None
+        self.end()
+
+
+class _NoopSpan:
+    """Returned when tracing is off; every method is a no-op."""
+
+    __slots__ = ()
+    trace_id = span_id = parent_span_id = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def add_event(self, name: str, **attributes: Any) -> None:
+        pass
+
+    def set_error(self, message: str) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+class JsonlExporter:
+    """Append finished spans to ``path``, one JSON object per line.
+
+    Each span is a single ``write`` on an ``O_APPEND`` file, so several
+    worker processes can share one file.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._fd: int | None = None
+
+    def export(self, span: Span) -> None:
+        line = (json.dumps(span.to_dict(), default=str, separators=(",", ":")) + "\n").encode("utf-8")
+        try:
+            with self._lock:
+                if self._fd is None:
+                    self.path.parent.mkdir(parents=True, exist_ok=True)
+                    self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+                os.write(self._fd, line)
+        except OSError as e:
+            logger.warning("Could not write trace span to %s: %s", self.path, e)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+_exporter: JsonlExporter | None = None
+_configured = False
+_config_lock = threading.Lock()
+
+
+def _default_path() -> Path | None:
+    explicit = os.getenv("SWARM_TRACE_FILE")
+    if explicit:
+        return Path(explicit).expanduser()
+    if os.getenv("SWARM_TRACE", "").lower() in ("1", "true", "yes", "on"):
+        from swarm.core import paths
+
+        return paths.get_user_data_dir_for_swarm() / "traces" / "spans.jsonl"
+    return None
+
+
+def configure(path: str | os.PathLike[str] | None = None, *, enabled: bool | None = None) -> JsonlExporter | None:
+    """(Re)configure tracing. ``enabled=False`` turns it off; otherwise spans
+    go to ``path`` (or the env-derived default). Returns the active exporter."""
+    global _exporter, _configured
+    with _config_lock:
+        if _exporter is not None:
+            _exporter.close()
+        target = None if enabled is False else (Path(path) if path else _default_path())
+        _exporter = JsonlExporter(target) if target else None
+        _configured = True
+        return _exporter
+
+
+def _active_exporter() -> JsonlExporter | None:
+    if not _configured:
+        configure()
+    return _exporter
+
+
+def is_enabled() -> bool:
+    return _active_exporter() is not None
+
+
+def current_span() -> Span | None:
+    return _current.get()
+
+
+def span(
+    name: str,
+    *,
+    kind: str = "INTERNAL",
+    parent: Span | _NoopSpan | None = None,
+    **attributes: Any,
+) -> Span | _NoopSpan:
+    """Start a span as a child of ``parent`` (default: the current span).
+
+    Use as a context manager (``with span("x") as s:``) to make it the current
+    span for the block. Long-lived spans that straddle ``yield`` in an async
+    generator should instead call :meth:`Span.end` explicitly without entering
+    the span, so the caller's context is not altered between iterations.
+    Pass ``parent`` when work continues after the request's span has exited
+    (for example a streamed response body).
+    """
+    exporter = _active_exporter()
+    if exporter is None:
+        return NOOP_SPAN
+    if parent is None or not isinstance(parent, Span):
+        parent = _current.get()
+    return Span(name, parent, kind, attributes, exporter)
+
+
+def set_attributes(**attributes: Any) -> None:
+    """Set attributes on the current span, if there is one."""
+    current = _current.get()
+    if current is not None:
+        for key, value in attributes.items():
+            current.set_attribute(key, value)
+
+
+def traced(name: str | None = None, **attributes: Any) -> Callable:
+    """Decorator: run a sync or ``async`` function inside :func:`span`."""
+
+    def decorator(fn: Callable) -> Callable:
+        span_name = name or f"{fn.__module__}.{fn.__qualname__}"
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with span(span_name, **attributes):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with span(span_name, **attributes):
+                return fn(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def load_spans(path: str | os.PathLike[str]) -> list[dict[str, Any]]:
+    """Read a spans JSON-lines file, skipping torn or malformed lines."""
+    spans: list[dict[str, Any]] = []
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict) and record.get("span_id"):
+                spans.append(record)
+    return spans
+
+
+def to_chrome_trace(spans: Iterable[dict[str, Any]]) -> dict[str, Any]:
+    """Chrome trace-event JSON: one complete (``X``) event per span, plus an
+    instant (``i``) event per span event, laid out by process and thread."""
+    events: list[dict[str, Any]] = []
+    for record in spans:
+        attrs = record.get("attributes") or {}
+        start, end = record.get("start_time_unix_nano"), record.get("end_time_unix_nano")
+        if start is None or end is None:
+            continue
+        pid, tid = attrs.get("process.pid", 0), attrs.get("thread.id", 0)
+        args = {k: v for k, v in attrs.items() if k not in ("process.pid", "thread.id")}
+        args.update(trace_id=record.get("trace_id"), span_id=record.get("span_id"))
+        if (record.get("status") or {}).get("code") == STATUS_ERROR:
+            args["error"] = record["status"].get("message", "")
+        events.append({
+            "name": record.get("name", "?"),
+            "cat": record.get("kind", "INTERNAL").lower(),
+            "ph": "X",
+            "ts": start / 1000,
+            "dur": max(0, end - start) / 1000,
+            "pid": pid,
+            "tid": tid,
+            "args": args,
+        })
+        for event in record.get("events") or []:
+            events.append({
+                "name": f"{record.get('name', '?')}:{event.get('name')}",
+                "cat": "event",
+                "ph": "i",
+                "s": "t",
+                "ts": event.get("time_unix_nano", start) / 1000,
+                "pid": pid,
+                "tid": tid,
+                "args": event.get("attributes") or {},
+            })
+    events.sort(key=lambda e: e["ts"])
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def format_tree(spans: Iterable[dict[str, Any]], *, limit: int | None = None) -> str:
+    """Indented per-trace span tree with durations, newest ``limit`` traces."""
+    records = [r for r in spans if r.get("end_time_unix_nano") is not None]
+    by_trace: dict[str, list[dict[str, Any]]] = {}
+    for record in sorted(records, key=lambda r: r["start_time_unix_nano"]):
+        by_trace.setdefault(record.get("trace_id", "?"), []).append(record)
+    traces = list(by_trace.items())
+    if limit:
+        traces = traces[-limit:]
+    lines: list[str] = []
+    for trace_id, members in traces:
+        ids = {r["span_id"] for r in members}
+        children: dict[str | None, list[dict[str, Any]]] = {}
+        for record in members:
+            parent = record.get("parent_span_id")
+            children.setdefault(parent if parent in ids else None, []).append(record)
+        lines.append(f"trace {trace_id}")
+        stack = [(r, 1) for r in reversed(children.get(None, []))]
+        while stack:
+            record, depth = stack.pop()
+            ms = (record["end_time_unix_nano"] - record["start_time_unix_nano"]) / 1e6
+            status = record.get("status") or {}
+            flag = f"  ERROR {status.get('message', '')}".rstrip() if status.get("code") == STATUS_ERROR else ""
+            lines.append(f"{'  ' * depth}{record.get('name', '?')}  {ms:.1f} ms{flag}")
+            stack.extend((c, depth + 1) for c in reversed(children.get(record["span_id"], [])))
+    return "\n".join(lines)
+
+
+__all__ = [
+    "NOOP_SPAN",
+    "JsonlExporter",
+    "Span",
+    "configure",
+    "current_span",
+    "format_tree",
+    "is_enabled",
+    "load_spans",
+    "set_attributes",
+    "span",
+    "to_chrome_trace",
+    "traced",
+]
@@ -0,0 +1,356 @@
+"""Persistent token usage ledger (SQLite) with hourly and daily rollups.
+
+The chat and responses views call :func:`record` once per completed answer.
+The call only queues the event. A single daemon thread, the same
+write-behind shape as :mod:`swarm.memory.write_behind`, drains the queue in
+batches. Each batch is one transaction that:
+
+- appends the events to ``usage_events``, which is never updated or pruned;
+- upserts the per-(bucket, owner, model) sums in ``usage_hourly`` and
+  ``usage_daily``.
+
+Queries (:meth:`UsageLedger.query`, ``GET /v1/usage``, ``swarm-cli usage``)
+only read the rollup tables. Their cost depends on the number of buckets in
+the range and the distinct owners and models in it, not on how many events
+the ledger holds.
+
+The database is ``$SWARM_USAGE_DB`` or ``<user data dir>/usage.sqlite3``.
+Set ``SWARM_USAGE_LEDGER=0`` to stop recording. The queue is bounded
+(``SWARM_USAGE_QUEUE_SIZE``); when it is full, events are dropped with a
+warning rather than stalling a request. Token counts are the estimates from
+``usage_counts``. Buckets are UTC.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import re
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+USAGE_QUEUE_SIZE = int(os.getenv("SWARM_USAGE_QUEUE_SIZE", "10000"))
+USAGE_BATCH_SIZE = 256
+ANONYMOUS = "anonymous"
+
+# Rollup table per granularity and its bucket width in seconds.
+GRANULARITIES = {"hour": ("usage_hourly", 3600), "day": ("usage_daily", 86400)}
+GROUP_FIELDS = ("bucket", "owner", "model")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage_events (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    owner TEXT NOT NULL,
+    model TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    request_id TEXT,
+    prompt_tokens INTEGER NOT NULL,
+    completion_tokens INTEGER NOT NULL
+);
+""" + "".join(
+    f"""
+CREATE TABLE IF NOT EXISTS {table} (
+    bucket INTEGER NOT NULL,
+    owner TEXT NOT NULL,
+    model TEXT NOT NULL,
+    requests INTEGER NOT NULL,
+    prompt_tokens INTEGER NOT NULL,
+    completion_tokens INTEGER NOT NULL,
+    PRIMARY KEY (bucket, owner, model)
+) WITHOUT ROWID;
+"""
+    for table, _width in GRANULARITIES.values()
+)
+
+
+def enabled() -> bool:
+    return os.getenv("SWARM_USAGE_LEDGER", "1").lower() not in ("0", "false", "no", "off")
+
+
+def default_path() -> Path:
+    override = os.getenv("SWARM_USAGE_DB")
+    if override:
+        return Path(override)
+    from swarm.core import paths
+
+    return paths.get_user_data_dir_for_swarm() / "usage.sqlite3"
+
+
+@dataclass(frozen=True)
+class UsageEvent:
+    ts: float
+    owner: str
+    model: str
+    endpoint: str
+    prompt_tokens: int
+    completion_tokens: int
+    request_id: str | None = None
+
+
+class UsageLedger:
+    """SQLite ledger plus one worker thread that batches appends."""
+
+    def __init__(self, path: str | Path | None = None, *, max_queue: int = USAGE_QUEUE_SIZE,
+                 max_batch: int = USAGE_BATCH_SIZE):
+        self._path = Path(path) if path is not None else None
+        self.max_batch = max(1, max_batch)
+        self._queue: queue.Queue[UsageEvent] = queue.Queue(maxsize=max(1, max_queue))
+        self._lock = threading.Lock()  # guards the connection and the worker start
+        self._conn: sqlite3.Connection | None = None
+        self._thread: threading.Thread | None = None
+        self._stats_lock = threading.Lock()  # guards the counters below
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    @property
+    def path(self) -> Path:
+        return self._path if self._path is not None else default_path()
+
+    # -- writing -------------------------------------------------------------
+
+    def submit(self, event: UsageEvent) -> bool:
+        """Queue an event; returns ``False`` (and logs) if the queue is full."""
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            with self._stats_lock:
+                self.dropped += 1
+            logger.warning("usage ledger queue full (%d); dropping an event for %r",
+                           self._queue.maxsize, event.model)
+            return False
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued event is committed (``False`` on timeout)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    @property
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="swarm-usage-ledger", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self.write(batch)
+                with self._stats_lock:
+                    self.written += len(batch)
+            except Exception as exc:
+                with self._stats_lock:
+                    self.failed += len(batch)
+                logger.warning("Usage ledger write failed (%d event(s)): %s", len(batch), exc)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def write(self, events: Iterable[UsageEvent]) -> None:
+        """Append ``events`` and update the rollups in one transaction."""
+        events = list(events)
+        if not events:
+            return
+        rollups: dict[tuple[str, int, str, str], list[int]] = {}
+        for e in events:
+            for table, width in GRANULARITIES.values():
+                key = (table, int(e.ts // width * width), e.owner, e.model)
+                sums = rollups.setdefault(key, [0, 0, 0])
+                sums[0] += 1
+                sums[1] += e.prompt_tokens
+                sums[2] += e.completion_tokens
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    "INSERT INTO usage_events (ts, owner, model, endpoint, request_id, prompt_tokens, completion_tokens)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    [(e.ts, e.owner, e.model, e.endpoint, e.request_id, e.prompt_tokens, e.completion_tokens)
+                     for e in events],
+                )
+                for (table, bucket, owner, model), (requests, prompt, completion) in rollups.items():
+                    conn.execute(
+                        f"INSERT INTO {table} (bucket, owner, model, requests, prompt_tokens, completion_tokens)"
+                        " VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (bucket, owner, model) DO UPDATE SET"
+                        " requests = requests + excluded.requests,"
+                        " prompt_tokens = prompt_tokens + excluded.prompt_tokens,"
+                        " completion_tokens = completion_tokens + excluded.completion_tokens",
+                        (bucket, owner, model, requests, prompt, completion),
+                    )
+
+    # -- reading -------------------------------------------------------------
+
+    def query(
+        self,
+        *,
+        granularity: str = "day",
+        since: float | None = None,
+        until: float | None = None,
+        owner: str | None = None,
+        model: str | None = None,
+        group_by: Iterable[str] = ("owner", "model"),
+    ) -> list[dict]:
+        """Summed usage per group from the ``granularity`` rollup.
+
+        ``since``/``until`` are epoch seconds, widened to whole buckets
+        (``until`` is exclusive). ``group_by`` is any of ``bucket``, ``owner``
+        and ``model``; an empty tuple gives one grand-total row. Rows are
+        ordered by bucket, then by total tokens, largest first.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"granularity must be one of {', '.join(GRANULARITIES)}")
+        group_by = tuple(dict.fromkeys(group_by))
+        unknown = [g for g in group_by if g not in GROUP_FIELDS]
+        if unknown:
+            raise ValueError(f"cannot group by {', '.join(unknown)} (choose from {', '.join(GROUP_FIELDS)})")
+        table, width = GRANULARITIES[granularity]
+        where: list[str] = []
+        args: list[str | int] = []
+        if since is not None:
+            where.append("bucket >= ?")
+            args.append(int(since // width * width))
+        if until is not None:
+            where.append("bucket < ?")
+            args.append(int(until))
+        for column, value in (("owner", owner), ("model", model)):
+            if value is not None:
+                where.append(f"{column} = ?")
+                args.append(value)
+        sql = (
+            f"SELECT {''.join(g + ', ' for g in group_by)}"
+            "SUM(requests), SUM(prompt_tokens), SUM(completion_tokens) FROM " + table
+            + (" WHERE " + " AND ".join(where) if where else "")
+            + (" GROUP BY " + ", ".join(group_by) if group_by else "")
+        )
+        if not self.path.exists() and self._conn is None:
+            return []
+        with self._lock:
+            rows = self._connection().execute(sql, args).fetchall()
+        out = []
+        for row in rows:
+            requests, prompt, completion = row[len(group_by):]
+            if requests is None:  # grand total over no rows
+                continue
+            item = dict(zip(group_by, row[:len(group_by)], strict=True))
+            if "bucket" in item:
+                item["bucket"] = datetime.fromtimestamp(item["bucket"], timezone.utc).isoformat()
+            item.update(requests=requests, prompt_tokens=prompt, completion_tokens=completion,
+                        total_tokens=prompt + completion)
+            out.append(item)
+        out.sort(key=lambda r: (r.get("bucket", ""), -r["total_tokens"]))
+        return out
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            path = self.path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+USAGE_LEDGER = UsageLedger()
+
+
+def record(
+    *,
+    owner: str | None,
+    model: str,
+    endpoint: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+    request_id: str | None = None,
+) -> bool:
+    """Queue one completed answer's usage (no-op when the ledger is disabled)."""
+    if not enabled():
+        return False
+    return USAGE_LEDGER.submit(UsageEvent(
+        ts=time.time(), owner=owner or ANONYMOUS, model=model, endpoint=endpoint,
+        prompt_tokens=int(prompt_tokens), completion_tokens=int(completion_tokens), request_id=request_id,
+    ))
+
+
+def flush_usage(timeout: float | None = None) -> bool:
+    """Block until queued usage events are committed (``False`` on timeout)."""
+    return USAGE_LEDGER.flush(timeout)
+
+
+_RELATIVE = re.compile(r"^(\d+(?:\.\d+)?)([hdw])$")
+_UNIT_SECONDS = {"h": 3600, "d": 86400, "w": 7 * 86400}
+
+
+def parse_time(value: str | float | None, *, now: float | None = None) -> float | None:
+    """Epoch seconds from epoch numbers, ISO dates/datetimes or ``7d``/``24h``/``2w`` ago.
+
+    Naive ISO values are taken as UTC. Raises ``ValueError`` on anything else.
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value).strip()
+    match = _RELATIVE.match(text)
+    if match:
+        return (time.time() if now is None else now) - float(match.group(1)) * _UNIT_SECONDS[match.group(2)]
+    try:
+        return float(text)
+    except ValueError:
+        pass
+    parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+atexit.register(flush_usage, 5.0)
+
+__all__ = [
+    "ANONYMOUS",
+    "GRANULARITIES",
+    "USAGE_LEDGER",
+    "UsageEvent",
+    "UsageLedger",
+    "default_path",
+    "enabled",
+    "flush_usage",
+    "parse_time",
+    "record",
+]
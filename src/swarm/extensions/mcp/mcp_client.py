@@ -6,12 +6,15 @@ Redirects MCP server stderr to log files unless debug mode is enabled.
 """
 
 import asyncio
+import functools
 import logging
+import time
 from typing import Any, Dict, List, Callable
 from contextlib import contextmanager
 
 from mcp import ClientSession, StdioServerParameters  # type: ignore
 from mcp.client.stdio import stdio_client  # type: ignore
+from swarm.core import metrics, tracing
 from swarm.types import Tool
 from swarm.utils.env_utils import build_mcp_stdio_env
 from .cache_utils import get_cache
@@ -19,6 +22,25 @@ from .cache_utils import get_cache
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+
+def _instrumented(op: str, **attributes: Any) -> Callable:
+    """Trace an async MCP call as ``mcp.<op>`` and time it in ``swarm_mcp_call_seconds``."""
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                with tracing.span(f"mcp.{op}", kind="CLIENT", **attributes):
+                    result = await fn(*args, **kwargs)
+                outcome = "ok"
+                return result
+            finally:
+                metrics.MCP_SECONDS.observe(time.perf_counter() - start, op=op, status=outcome)
+        return wrapper
+    return decorator
+
+
 class MCPClient:
     """
     Manages connections and interactions with MCP servers using the MCP Python SDK.
@@ -61,6 +83,7 @@ class MCPClient:
         else:
             yield
 
+    @_instrumented("list_tools")
     async def list_tools(self) -> List[Tool]:
         """
         Discover tools from the MCP server and cache their schemas.
@@ -75,6 +98,8 @@ class MCPClient:
         cache_key = f"mcp_tools_{self.command}_{args_string}"
         cached_tools = self.cache.get(cache_key)
 
+        tracing.set_attributes(server=self.command, cache_hit=bool(cached_tools))
+        metrics.CACHE_LOOKUPS.inc(cache="mcp_tools", result="hit" if cached_tools else "miss")
         if cached_tools:
             logger.debug("Retrieved tools from cache")
             tools = []
@@ -159,7 +184,7 @@ class MCPClient:
         """
         Dynamically create a callable function for the specified tool.
         """
-        async def dynamic_tool_func(**kwargs) -> Any:
+        async def call_tool(**kwargs) -> Any:
             logger.debug(f"Creating tool callable for '{tool_name}'")
             server_params = StdioServerParameters(command=self.command, args=self.args, env=self.env)
             async with stdio_client(server_params) as (read, write):
@@ -181,7 +206,7 @@ class MCPClient:
                         logger.error(f"Failed to execute tool '{tool_name}': {e}")
                         raise RuntimeError(f"Tool execution failed: {e}") from e
 
-        return dynamic_tool_func
+        return _instrumented("call_tool", tool=tool_name, server=self.command)(call_tool)
 
     def _validate_input_schema(self, schema: Dict[str, Any], kwargs: Dict[str, Any]):
         """
@@ -198,12 +223,14 @@ class MCPClient:
 
         logger.debug(f"Validated input against schema: {schema} with arguments: {kwargs}")
 
+    @_instrumented("list_resources")
     async def list_resources(self) -> Any:
         """
         Discover resources from the MCP server using the internal method with enforced timeout.
         """
         return await asyncio.wait_for(self._do_list_resources(), timeout=self.timeout)
 
+    @_instrumented("get_resource")
     async def get_resource(self, resource_uri: str) -> Any:
         """
         Retrieve a specific resource from the MCP server.
@@ -22,6 +22,7 @@ from swarm.core.blueprint_discovery import (
     discover_blueprints,
     merge_community_blueprints,
 )
+from swarm.core.loop_bridge import run_sync
 from swarm.core.mcp_server_config import MCPServerConfig
 from swarm.core.requirements import load_active_config
 from swarm.settings import BLUEPRINT_DIRECTORY, BLUEPRINT_EXTRA_DIRS
@@ -278,15 +279,7 @@ class BlueprintMCPProvider:
                 run_method = blueprint_instance.run
                 result = run_method(messages, mcp_servers_override=mcp_servers)
                 # Always check if result is a coroutine and await if necessary
-                if asyncio.iscoroutine(result):
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    try:
-                        results = loop.run_until_complete(result)
-                    finally:
-                        loop.close()
-                else:
-                    results = result
+                results = run_sync(result) if asyncio.iscoroutine(result) else result
             except Exception as e:
                 return {"content": f"[Blueprint:{blueprint_name}] Execution error: {e}"}
 
@@ -314,8 +307,6 @@ class BlueprintMCPProvider:
                     yield chunk
 
             # Run the async generator to completion and collect results
-            import asyncio
-
             async def collect_results():
                 results = []
                 try:
@@ -326,12 +317,9 @@ class BlueprintMCPProvider:
                     return e
                 return results
 
-            # Run the async collection in a new event loop
+            # Run the async collection on the shared background loop
             try:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                collected_results = loop.run_until_complete(collect_results())
-                loop.close()
+                collected_results = run_sync(collect_results())
 
                 # Handle case where collected_results is an exception (e.g. when blueprint.run raises an exception)
                 if isinstance(collected_results, Exception):
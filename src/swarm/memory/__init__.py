@@ -1,9 +1,40 @@
+import asyncio as _asyncio
+import logging as _mem_logger
+from typing import Any, Protocol, runtime_checkable
+
 from .base import BaseMemory
-from .mem0_memory import Mem0Memory
 from .langmem_memory import LangmemMemory
+from .local_memory import HashingEmbedder, LocalVectorMemory
+from .mem0_memory import Mem0Memory
 from .papr_memory import PaprMemory
-import logging as _mem_logger
-from typing import Any, runtime_checkable, Protocol
+from .query_cache import (
+    MEMORY_QUERY_CACHE,
+    MemoryQueryCache,
+    normalize_query,
+    search_cached,
+)
+from .write_behind import MEMORY_WRITER, MemoryWriteBehind, flush_memory_writes
+
+__all__ = [
+    "MEMORY_QUERY_CACHE",
+    "MEMORY_WRITER",
+    "AsyncMemoryBackend",
+    "BaseMemory",
+    "HashingEmbedder",
+    "LangmemMemory",
+    "LocalVectorMemory",
+    "Mem0Memory",
+    "MemoryBackend",
+    "MemoryQueryCache",
+    "MemoryWriteBehind",
+    "PaprMemory",
+    "asearch_cached",
+    "asearch_memory",
+    "flush_memory_writes",
+    "get_memory_backend",
+    "normalize_query",
+    "search_cached",
+]
 
 _mem_log = _mem_logger.getLogger(__name__)
 
@@ -15,6 +46,46 @@ class MemoryBackend(Protocol):
     def search(self, query: str, user_id: str = "default", limit: int | None = None) -> list[str]: ...
 
 
+@runtime_checkable
+class AsyncMemoryBackend(Protocol):
+    """Backends that can be awaited directly (every :class:`BaseMemory` qualifies)."""
+    async def aadd(self, messages: Any, user_id: str = "default", metadata: dict | None = None) -> None: ...
+    async def asearch(self, query: str, user_id: str = "default", limit: int | None = None) -> list[str]: ...
+
+
+async def asearch_memory(backend: Any, query: str, user_id: str = "default") -> list[str]:
+    """Search any backend without blocking the event loop.
+
+    Uses the backend's own ``asearch`` when it has one, otherwise runs the
+    sync ``search`` on a worker thread.
+    """
+    if isinstance(backend, AsyncMemoryBackend):
+        return await backend.asearch(query, user_id=user_id)
+    return await _asyncio.to_thread(backend.search, query, user_id=user_id)
+
+
+def _has_native_asearch(backend: Any) -> bool:
+    asearch = getattr(type(backend), "asearch", None)
+    return asearch is not None and asearch is not BaseMemory.asearch
+
+
+async def asearch_cached(backend: Any, namespace: str, user_id: str, query: str) -> list[str]:
+    """Search ``backend`` for a run and store the result in :data:`MEMORY_QUERY_CACHE`.
+
+    A backend with its own ``asearch`` (a native async client) is awaited
+    through :func:`asearch_memory`. Sync backends, including those that only
+    inherit the :class:`BaseMemory` thread default, go through
+    :func:`search_cached`, whose worker thread fills the cache even when the
+    run has stopped waiting.
+    """
+    if not _has_native_asearch(backend):
+        return await _asyncio.wrap_future(search_cached(backend, namespace, user_id, query))
+    generation = MEMORY_QUERY_CACHE.generation(namespace, user_id)
+    memories = list(await asearch_memory(backend, query, user_id=user_id) or [])
+    MEMORY_QUERY_CACHE.put(namespace, user_id, query, memories, generation)
+    return memories
+
+
 def get_memory_backend(config: dict | str | None = None, options: dict | None = None) -> BaseMemory | None:
     """Factory: instantiate a memory backend from a config dict or backend name string."""
     if not config:
@@ -33,6 +104,8 @@ def get_memory_backend(config: dict | str | None = None, options: dict | None =
             return LangmemMemory(config if isinstance(config, dict) else {})
         elif name == 'papr':
             return PaprMemory(config if isinstance(config, dict) else {})
+        elif name == 'local':
+            return LocalVectorMemory(config if isinstance(config, dict) else {})
     except ImportError as e:
         _mem_log.warning("Memory backend '%s' is not available (missing dependency): %s", name, e)
         return None
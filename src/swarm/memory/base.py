@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -6,7 +7,10 @@ class BaseMemory(ABC):
     """Abstract base class for agent memory backends.
 
     Concrete backends must implement :meth:`add` and :meth:`search` and
-    thereby satisfy the :class:`swarm.memory.MemoryBackend` protocol.
+    thereby satisfy the :class:`swarm.memory.MemoryBackend` protocol. The
+    async variants (:meth:`asearch` / :meth:`aadd`) and :meth:`add_many`
+    have working defaults; backends with a native async client or a cheaper
+    bulk write override them.
     """
 
     @abstractmethod
@@ -18,3 +22,16 @@ class BaseMemory(ABC):
     def search(self, query: str, user_id: str = "default", limit: int | None = None) -> list[str]:
         """Return memory snippets relevant to ``query`` for ``user_id``."""
         raise NotImplementedError
+
+    def add_many(self, conversations: list[Any], user_id: str = "default") -> None:
+        """Persist several conversations for one user (used by the write-behind queue)."""
+        for messages in conversations:
+            self.add(messages, user_id=user_id)
+
+    async def asearch(self, query: str, user_id: str = "default", limit: int | None = None) -> list[str]:
+        """Async :meth:`search`; the default runs the sync call on a worker thread."""
+        return await asyncio.to_thread(self.search, query, user_id, limit)
+
+    async def aadd(self, messages: Any, user_id: str = "default", metadata: dict[str, Any] | None = None) -> None:
+        """Async :meth:`add`; the default runs the sync call on a worker thread."""
+        await asyncio.to_thread(self.add, messages, user_id, metadata)
@@ -0,0 +1,429 @@
+"""Offline memory backend: SQLite storage plus an in-process ANN index.
+
+Unlike the other backends this one needs no service, SDK or extra: entries
+are embedded by a deterministic :class:`HashingEmbedder` (or any object
+satisfying :class:`Embedder`), stored in a SQLite file and searched through
+:class:`swarm.memory.vector_index.TernaryIVFIndex`, whose candidates are
+re-ranked by exact cosine similarity against the stored vectors.
+
+Config keys (all optional besides ``backend: local``):
+  - ``path``: SQLite file (default ``<user data dir>/memory/local_memory.sqlite3``)
+  - ``limit``: max results returned by :meth:`search` (default 5)
+  - ``min_score``: drop hits whose cosine similarity is below this (default 0.15)
+  - ``embedder``: ``"module:factory"`` returning an :class:`Embedder`
+    (default: ``HashingEmbedder(dim)``)
+  - ``dim``: dimensions of the default embedder (default 256)
+  - ``rerank``: candidates re-ranked exactly per search (default 256)
+  - ``train_min``: entries before the coarse quantiser is trained (default 4096);
+    training and retraining run on a background thread
+  - ``branching`` / ``probe_top`` / ``scan``: index shape and search effort, see
+    :class:`~swarm.memory.vector_index.TernaryIVFIndex`
+
+Every non-empty user/assistant message (or plain string) becomes one entry;
+duplicates per user are ignored. Changing the embedder re-embeds the store
+on the next open.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import math
+import operator
+import random
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from array import array
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+from swarm.memory.base import BaseMemory
+from swarm.memory.vector_index import (
+    ENTRY_PLANES,
+    UNASSIGNED,
+    TernaryIVFIndex,
+    ternary_code,
+)
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\w+")
+_STOPWORDS = frozenset(
+    [
+        "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "has", "have", "i", "in", "is", "it",
+        "its", "me", "my", "of", "on", "or", "our", "so", "that", "the", "their", "them", "they", "this", "to",
+        "was", "we", "were", "what", "when", "which", "who", "will", "with", "you", "your",
+    ]
+)
+# Retrain the coarse quantiser once the store has grown this many times over.
+_RETRAIN_GROWTH = 8
+_TRAIN_SAMPLE = 4096
+
+
+@runtime_checkable
+class Embedder(Protocol):
+    """Anything that maps texts to fixed-size float vectors."""
+
+    name: str
+    dim: int
+
+    def embed(self, texts: Sequence[str]) -> list[Sequence[float]]: ...
+
+
+class HashingEmbedder:
+    """Deterministic feature-hashing embedder (no model, no network).
+
+    Word unigrams, word bigrams and character trigrams are hashed with CRC32
+    into ``dim`` signed buckets and the result is L2-normalised, so cosine
+    similarity tracks shared vocabulary and, through the trigrams, spelling
+    variants and inflections.
+    """
+
+    def __init__(self, dim: int = 256):
+        self.dim = int(dim)
+        self.name = f"hashing-v1-{self.dim}"
+
+    def _features(self, text: str) -> Iterable[tuple[str, float]]:
+        words = [w for w in _TOKEN_RE.findall(text.lower()) if w not in _STOPWORDS]
+        for i, word in enumerate(words):
+            yield word, 1.0
+            if i:
+                yield f"{words[i - 1]} {word}", 0.5
+            padded = f"#{word}#"
+            for j in range(len(padded) - 2):
+                yield padded[j:j + 3], 0.25
+
+    def embed_one(self, text: str) -> tuple[float, ...]:
+        vec = [0.0] * self.dim
+        for feature, weight in self._features(text):
+            h = zlib.crc32(feature.encode("utf-8"))
+            vec[h % self.dim] += weight if h & 0x80000000 else -weight
+        norm = math.sqrt(sum(map(operator.mul, vec, vec)))
+        return tuple(x / norm for x in vec) if norm else tuple(vec)
+
+    def embed(self, texts: Sequence[str]) -> list[Sequence[float]]:
+        return [self.embed_one(t) for t in texts]
+
+
+def _load_embedder(spec: str, dim: int) -> Embedder:
+    module_name, _, attr = spec.partition(":")
+    factory = getattr(importlib.import_module(module_name), attr or "Embedder")
+    embedder = factory(dim=dim)
+    if not isinstance(embedder, Embedder):
+        raise TypeError(f"{spec} did not return an Embedder (needs name, dim and embed())")
+    return embedder
+
+
+def _message_texts(messages: Any) -> list[str]:
+    """Texts worth remembering from a conversation, a message dict or a string."""
+    if isinstance(messages, str):
+        return [messages.strip()] if messages.strip() else []
+    if isinstance(messages, dict):
+        messages = [messages]
+    texts: list[str] = []
+    for msg in messages or []:
+        if isinstance(msg, str):
+            content = msg
+        elif isinstance(msg, dict) and msg.get("role", "user") in ("user", "assistant"):
+            content = msg.get("content")
+            if isinstance(content, list):  # multi-part content
+                content = " ".join(p.get("text", "") for p in content if isinstance(p, dict))
+        else:
+            continue
+        if isinstance(content, str) and content.strip():
+            texts.append(content.strip())
+    return texts
+
+
+def _default_path() -> Path:
+    from swarm.core.paths import get_user_data_dir_for_swarm
+
+    return get_user_data_dir_for_swarm() / "memory" / "local_memory.sqlite3"
+
+
+class LocalVectorMemory(BaseMemory):
+    """Memory backend stored in SQLite and searched with an in-memory ANN index.
+
+    Thread-safe: the write-behind worker and request threads share one
+    connection behind a lock. See the module docstring for config keys.
+    """
+
+    def __init__(self, config: dict[str, Any] | None = None, *, embedder: Embedder | None = None):
+        self.config = dict(config or {})
+        dim = int(self.config.get("dim", 256))
+        if embedder is None:
+            spec = self.config.get("embedder")
+            embedder = _load_embedder(spec, dim) if spec else HashingEmbedder(dim)
+        self.embedder = embedder
+        self.limit = int(self.config.get("limit", 5))
+        self.min_score = float(self.config.get("min_score", 0.15))
+        self.rerank = max(1, int(self.config.get("rerank", 256)))
+        self.train_min = max(1, int(self.config.get("train_min", 4096)))
+        self.index = TernaryIVFIndex(
+            branching=int(self.config.get("branching", 32)),
+            probe_top=int(self.config.get("probe_top", 8)),
+            scan=int(self.config.get("scan", 4096)),
+        )
+        self._code_bytes = (self.embedder.dim * len(ENTRY_PLANES) + 7) // 8
+        self._trained_size = 0
+        self._trainer: threading.Thread | None = None
+        self._lock = threading.RLock()
+
+        path = self.config.get("path")
+        self.path = Path(path).expanduser() if path else _default_path()
+        if str(self.path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                id INTEGER PRIMARY KEY,
+                user_id TEXT NOT NULL,
+                text TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                metadata TEXT,
+                created REAL NOT NULL,
+                vector BLOB NOT NULL,
+                code BLOB NOT NULL,
+                leaf INTEGER NOT NULL DEFAULT -1,
+                UNIQUE (user_id, digest)
+            );
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS centroids (
+                level INTEGER NOT NULL, parent INTEGER NOT NULL, idx INTEGER NOT NULL, vector BLOB NOT NULL,
+                PRIMARY KEY (level, parent, idx)
+            );
+            """
+        )
+        self._load()
+
+    # ---- persistence -----------------------------------------------------------
+    def _meta(self, key: str, default: str = "") -> str:
+        row = self._conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def _set_meta(self, key: str, value: Any) -> None:
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, str(value)))
+
+    def _encode(self, vector: Sequence[float]) -> tuple[bytes, bytes, tuple[int, int]]:
+        code = ternary_code(vector)
+        blob = code[0].to_bytes(self._code_bytes, "little") + code[1].to_bytes(self._code_bytes, "little")
+        return array("f", vector).tobytes(), blob, code
+
+    def _decode_code(self, blob: bytes) -> tuple[int, int]:
+        n = self._code_bytes
+        return int.from_bytes(blob[:n], "little"), int.from_bytes(blob[n:], "little")
+
+    @staticmethod
+    def _vector(blob: bytes) -> array:
+        vec = array("f")
+        vec.frombytes(blob)
+        return vec
+
+    def _load(self) -> None:
+        with self._lock:
+            if self._meta("embedder") != self.embedder.name:
+                self._reembed()
+                return
+            top, leaves = [], {}
+            for level, parent, _, blob in self._conn.execute(
+                "SELECT level, parent, idx, vector FROM centroids ORDER BY level, parent, idx"
+            ):
+                centroid = tuple(self._vector(blob))
+                if level == 0:
+                    top.append(centroid)
+                else:
+                    leaves.setdefault(parent, []).append(centroid)
+            if top:
+                self.index.load_centroids(top, [leaves.get(i, [top[i]]) for i in range(len(top))])
+            self._trained_size = int(self._meta("trained_size", "0"))
+            for entry_id, user_id, code, leaf in self._conn.execute("SELECT id, user_id, code, leaf FROM entries"):
+                self.index.add(entry_id, user_id, leaf, self._decode_code(code))
+
+    def _reembed(self) -> None:
+        """Recompute vectors/codes for every entry after an embedder change."""
+        rows = self._conn.execute("SELECT id, text FROM entries").fetchall()
+        if rows:
+            logger.info("Re-embedding %d local memory entries with %s", len(rows), self.embedder.name)
+        with self._conn:
+            for start in range(0, len(rows), 1024):
+                chunk = rows[start:start + 1024]
+                updates = []
+                for (entry_id, _), vector in zip(chunk, self.embedder.embed([t for _, t in chunk]), strict=True):
+                    vec_blob, code_blob, _ = self._encode(vector)
+                    updates.append((vec_blob, code_blob, entry_id))
+                self._conn.executemany(
+                    "UPDATE entries SET vector = ?, code = ?, leaf = -1 WHERE id = ?", updates
+                )
+            self._conn.execute("DELETE FROM centroids")
+            self._set_meta("embedder", self.embedder.name)
+            self._set_meta("trained_size", 0)
+        self.index = TernaryIVFIndex(
+            branching=self.index.branching, probe_top=self.index.probe_top, scan=self.index.scan
+        )
+        self._trained_size = 0
+        for entry_id, user_id, code in self._conn.execute("SELECT id, user_id, code FROM entries"):
+            self.index.add(entry_id, user_id, UNASSIGNED, self._decode_code(code))
+        self._maybe_train()
+
+    def _maybe_train(self) -> None:
+        """Start a background retrain once the store outgrows the index (caller holds the lock)."""
+        size = self.index.size
+        if size < self.train_min or (self._trained_size and size < self._trained_size * _RETRAIN_GROWTH):
+            return
+        if self._trainer is not None and self._trainer.is_alive():
+            return
+        self._trainer = threading.Thread(target=self._train, name="swarm-memory-train", daemon=True)
+        self._trainer.start()
+
+    def _train(self) -> None:
+        try:
+            self._retrain()
+        except Exception:
+            logger.exception("Training the local memory index failed")
+
+    def _retrain(self) -> None:
+        """Fit a new index off the lock and swap it in.
+
+        The lock is only held to read a sample, to read entries in chunks for
+        reassignment and for the final swap, so adds and searches keep going
+        against the old index meanwhile. Entries added during training are
+        assigned at the swap.
+        """
+        started = time.perf_counter()
+        with self._lock:
+            ids = [row[0] for row in self._conn.execute("SELECT id FROM entries")]
+            picked = random.Random(len(ids)).sample(ids, min(len(ids), _TRAIN_SAMPLE))
+            sample = []
+            for start in range(0, len(picked), 500):
+                chunk = picked[start:start + 500]
+                sample += [
+                    self._vector(blob)
+                    for (blob,) in self._conn.execute(
+                        f"SELECT vector FROM entries WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                    )
+                ]
+            index = TernaryIVFIndex(
+                branching=self.index.branching, probe_top=self.index.probe_top, scan=self.index.scan
+            )
+        index.train(sample)
+        assignments: list[tuple[int, int]] = []
+        last_id = -1
+
+        def assign(rows: Iterable[tuple[int, str, bytes, bytes]]) -> None:
+            nonlocal last_id
+            for entry_id, user_id, blob, code in rows:
+                leaf = index.assign(self._vector(blob))
+                index.add(entry_id, user_id, leaf, self._decode_code(code))
+                assignments.append((leaf, entry_id))
+                last_id = entry_id
+
+        query = "SELECT id, user_id, vector, code FROM entries WHERE id > ? ORDER BY id"
+        while True:
+            with self._lock:
+                rows = self._conn.execute(f"{query} LIMIT 1024", (last_id,)).fetchall()
+            if not rows:
+                break
+            assign(rows)
+        with self._lock:
+            assign(self._conn.execute(query, (last_id,)).fetchall())
+            with self._conn:
+                self._conn.executemany("UPDATE entries SET leaf = ? WHERE id = ?", assignments)
+                self._conn.execute("DELETE FROM centroids")
+                rows = [(0, -1, i, array("f", c).tobytes()) for i, c in enumerate(index.top)]
+                rows += [
+                    (1, t, j, array("f", c).tobytes())
+                    for t, leaves in enumerate(index.leaves)
+                    for j, c in enumerate(leaves)
+                ]
+                self._conn.executemany("INSERT INTO centroids (level, parent, idx, vector) VALUES (?, ?, ?, ?)", rows)
+                self._set_meta("trained_size", index.size)
+            # Search effort may have been tuned on the live index meanwhile.
+            index.probe_top, index.scan = self.index.probe_top, self.index.scan
+            self.index = index
+            self._trained_size = index.size
+        logger.info("Trained local memory index on %d entries in %.1fs", index.size, time.perf_counter() - started)
+
+    def wait_for_training(self, timeout: float | None = None) -> bool:
+        """Block until a background retrain has finished (``False`` on timeout)."""
+        trainer = self._trainer
+        if trainer is None:
+            return True
+        trainer.join(timeout)
+        return not trainer.is_alive()
+
+    # ---- BaseMemory ----------------------------------------------------------------
+    def add(self, messages: Any, user_id: str = "default", metadata: dict[str, Any] | None = None) -> None:
+        """Persist a conversation (list of role/content dicts) or a plain string."""
+        if metadata and metadata.get("user_id") and user_id == "default":
+            user_id = metadata["user_id"]
+        self._insert(_message_texts(messages), user_id, metadata)
+
+    def add_many(self, conversations: list[Any], user_id: str = "default") -> None:
+        """Persist several conversations in one transaction."""
+        texts = [t for messages in conversations for t in _message_texts(messages)]
+        self._insert(texts, user_id, None)
+
+    def _insert(self, texts: list[str], user_id: str, metadata: dict[str, Any] | None) -> None:
+        if not texts:
+            return
+        texts = list(dict.fromkeys(texts))
+        vectors = self.embedder.embed(texts)
+        meta_json = json.dumps(metadata, default=str) if metadata else None
+        now = time.time()
+        with self._lock:
+            added = []
+            with self._conn:
+                for text, vector in zip(texts, vectors, strict=True):
+                    vec_blob, code_blob, code = self._encode(vector)
+                    leaf = self.index.assign(vector)
+                    cur = self._conn.execute(
+                        "INSERT OR IGNORE INTO entries (user_id, text, digest, metadata, created, vector, code, leaf)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                        (user_id, text, hashlib.sha1(text.encode("utf-8")).hexdigest(), meta_json, now,
+                         vec_blob, code_blob, leaf),
+                    )
+                    if cur.rowcount:
+                        added.append((cur.lastrowid, leaf, code))
+            for entry_id, leaf, code in added:
+                self.index.add(entry_id, user_id, leaf, code)
+            self._maybe_train()
+
+    def search(self, query: str, user_id: str = "default", limit: int | None = None) -> list[str]:
+        """Return memory snippets relevant to ``query`` for ``user_id``, best first."""
+        return [text for text, _ in self.search_scored(query, user_id=user_id, limit=limit)]
+
+    def search_scored(self, query: str, user_id: str = "default", limit: int | None = None) -> list[tuple[str, float]]:
+        """Like :meth:`search` but returns ``(text, cosine)`` pairs."""
+        limit = limit or self.limit
+        if not query or not query.strip():
+            return []
+        qvec = self.embedder.embed([query])[0]
+        with self._lock:
+            candidates = self.index.search(qvec, user_id, max(self.rerank, limit))
+            if not candidates:
+                return []
+            ids = [entry_id for entry_id, _ in candidates]
+            rows = self._conn.execute(
+                f"SELECT text, vector FROM entries WHERE id IN ({','.join('?' * len(ids))})", ids
+            ).fetchall()
+        scored = [(text, sum(map(operator.mul, qvec, self._vector(blob)))) for text, blob in rows]
+        scored = [hit for hit in scored if hit[1] >= self.min_score]
+        scored.sort(key=lambda hit: hit[1], reverse=True)
+        return scored[:limit]
+
+    def __len__(self) -> int:
+        return self.index.size
+
+    def close(self) -> None:
+        self.wait_for_training()
+        with self._lock:
+            self._conn.close()
@@ -16,6 +16,11 @@ class Mem0Memory(BaseMemory):
       - ``config``: dict passed to ``mem0.Memory.from_config`` (vector store, llm, ...)
       - ``limit``: max results returned by :meth:`search` (default 5)
       - ``user_id``: default user id used by blueprints when none is supplied
+
+    ``mem0.Memory`` is synchronous; the inherited :meth:`asearch` /
+    :meth:`aadd` run it on a worker thread. Blueprint searches run on the memory search pool and
+    writes go through :data:`swarm.memory.MEMORY_WRITER`, so neither blocks a
+    run.
     """
 
     def __init__(self, config: dict[str, Any] | None = None):
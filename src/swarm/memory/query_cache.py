@@ -0,0 +1,130 @@
+"""Process-wide cache of memory search results.
+
+Blueprint instances are created per request, so the cache lives at module
+level (:data:`MEMORY_QUERY_CACHE`) and is keyed by a *namespace* (the
+blueprint's memory config, serialised), the user id and the normalised
+query: repeated or re-phrased-only-in-case/whitespace questions skip the
+backend round trip. Entries expire after ``ttl`` seconds, and a user's
+entries are dropped once the write-behind queue has stored a new conversation
+for that user. Each drop also bumps a per-(namespace, user) generation, and
+results computed against an older generation are not stored, so a search that
+was already running when the write landed cannot put its stale answer back.
+
+:func:`search_cached` runs ``backend.search`` on a small dedicated pool and
+stores the result from the worker thread, so a search that outlives the run
+waiting for it (deadline missed, or ``asyncio.run`` already returned) still
+warms the cache for the next one.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from swarm.core import metrics
+
+MEMORY_CACHE_SIZE = int(os.getenv("SWARM_MEMORY_CACHE_SIZE", "256"))
+MEMORY_CACHE_TTL = float(os.getenv("SWARM_MEMORY_CACHE_TTL", "300"))
+MEMORY_SEARCH_THREADS = int(os.getenv("SWARM_MEMORY_SEARCH_THREADS", "4"))
+
+_search_pool: ThreadPoolExecutor | None = None
+_search_pool_lock = threading.Lock()
+
+
+def _get_search_pool() -> ThreadPoolExecutor:
+    """Lazily create the bounded pool that runs memory searches."""
+    global _search_pool
+    if _search_pool is None:
+        with _search_pool_lock:
+            if _search_pool is None:
+                _search_pool = ThreadPoolExecutor(
+                    max_workers=MEMORY_SEARCH_THREADS, thread_name_prefix="swarm-memory-search"
+                )
+    return _search_pool
+
+
+def normalize_query(query: str) -> str:
+    """Case-folded query with runs of whitespace collapsed."""
+    return " ".join(str(query).casefold().split())
+
+
+class MemoryQueryCache:
+    """Thread-safe LRU of ``search`` results with a per-lookup TTL."""
+
+    def __init__(self, max_entries: int = MEMORY_CACHE_SIZE):
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[tuple[str, str, str], tuple[float, list[str]]] = OrderedDict()
+        self._generations: dict[tuple[str, str | None], int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, namespace: str, user_id: str, query: str, ttl: float = MEMORY_CACHE_TTL) -> list[str] | None:
+        """Cached memories for ``query`` or ``None`` (miss, expired or ``ttl <= 0``)."""
+        if ttl <= 0:
+            return None
+        key = (namespace, user_id, normalize_query(query))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] > ttl:
+                self.misses += 1
+                metrics.CACHE_LOOKUPS.inc(cache="memory_query", result="miss")
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            metrics.CACHE_LOOKUPS.inc(cache="memory_query", result="hit")
+            return list(entry[1])
+
+    def generation(self, namespace: str, user_id: str) -> tuple[int, int]:
+        """Token to pass to :meth:`put` for a search starting now."""
+        with self._lock:
+            return self._generations.get((namespace, None), 0), self._generations.get((namespace, user_id), 0)
+
+    def put(
+        self, namespace: str, user_id: str, query: str, memories: list[str],
+        generation: tuple[int, int] | None = None,
+    ) -> None:
+        """Cache ``memories``; skipped when ``generation`` predates an :meth:`invalidate`."""
+        key = (namespace, user_id, normalize_query(query))
+        with self._lock:
+            if generation is not None and generation != (
+                self._generations.get((namespace, None), 0), self._generations.get((namespace, user_id), 0)
+            ):
+                return
+            self._entries[key] = (time.monotonic(), list(memories))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, namespace: str, user_id: str | None = None) -> None:
+        """Drop ``namespace``'s entries (only ``user_id``'s when given)."""
+        with self._lock:
+            self._generations[(namespace, user_id)] = self._generations.get((namespace, user_id), 0) + 1
+            for key in [k for k in self._entries if k[0] == namespace and (user_id is None or k[1] == user_id)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+MEMORY_QUERY_CACHE = MemoryQueryCache()
+
+
+def search_cached(backend: Any, namespace: str, user_id: str, query: str) -> Future:
+    """Run ``backend.search`` on the memory search pool and cache its result there."""
+    generation = MEMORY_QUERY_CACHE.generation(namespace, user_id)
+
+    def _search() -> list[str]:
+        memories = list(backend.search(query, user_id=user_id) or [])
+        MEMORY_QUERY_CACHE.put(namespace, user_id, query, memories, generation)
+        return memories
+
+    return _get_search_pool().submit(_search)
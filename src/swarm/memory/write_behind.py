@@ -0,0 +1,149 @@
+"""Background write-behind queue for memory backends.
+
+Blueprint runs hand finished conversations to :data:`MEMORY_WRITER` instead
+of calling ``backend.add`` before their stream completes. A single daemon
+thread drains the queue, groups consecutive writes for the same backend and
+user into one :meth:`~swarm.memory.base.BaseMemory.add_many` call (or plain
+``add`` calls for protocol-only backends) and logs — never raises — backend
+errors. Once a group has been handed to its backend the writer drops that
+user's entries from :data:`swarm.memory.query_cache.MEMORY_QUERY_CACHE` for
+every cache namespace the writes were queued under.
+
+A thread rather than an asyncio task because runs happen on many short-lived
+event loops (``asyncio.run`` per CLI invocation, Django's per-request loops)
+and the backends' SDKs are synchronous anyway. The queue is bounded
+(``SWARM_MEMORY_QUEUE_SIZE``); when it is full the write is dropped with a
+warning rather than stalling the caller. :func:`flush_memory_writes` waits
+for queued writes (tests, shutdown).
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from swarm.memory.query_cache import MEMORY_QUERY_CACHE
+
+logger = logging.getLogger(__name__)
+
+MEMORY_QUEUE_SIZE = int(os.getenv("SWARM_MEMORY_QUEUE_SIZE", "1000"))
+MEMORY_BATCH_SIZE = int(os.getenv("SWARM_MEMORY_BATCH", "32"))
+
+
+@dataclass
+class MemoryWrite:
+    backend: Any
+    messages: Any
+    user_id: str = "default"
+    cache_namespace: str | None = None
+
+
+class MemoryWriteBehind:
+    """Bounded queue plus one worker thread that batches memory writes."""
+
+    def __init__(self, max_queue: int = MEMORY_QUEUE_SIZE, max_batch: int = MEMORY_BATCH_SIZE):
+        self.max_batch = max(1, max_batch)
+        self._queue: queue.Queue[MemoryWrite] = queue.Queue(maxsize=max(1, max_queue))
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def submit(
+        self, backend: Any, messages: Any, user_id: str = "default", cache_namespace: str | None = None,
+    ) -> bool:
+        """Queue a write; returns ``False`` (and logs) if the queue is full.
+
+        With ``cache_namespace``, the user's cached searches in that namespace
+        are invalidated once the backend has stored the write.
+        """
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(MemoryWrite(backend, messages, user_id, cache_namespace))
+        except queue.Full:
+            self.dropped += 1
+            logger.warning("memory write-behind queue full (%d); dropping a write for user %r",
+                           self._queue.maxsize, user_id)
+            return False
+        return True
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until every queued write has been handed to its backend."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    @property
+    def pending(self) -> int:
+        return self._queue.unfinished_tasks
+
+    def _ensure_worker(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="swarm-memory-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write(self, batch: list[MemoryWrite]) -> None:
+        # Group consecutive writes per (backend, user) so order is preserved.
+        groups: list[tuple[Any, str, list[Any], set[str]]] = []
+        for item in batch:
+            if not (groups and groups[-1][0] is item.backend and groups[-1][1] == item.user_id):
+                groups.append((item.backend, item.user_id, [], set()))
+            groups[-1][2].append(item.messages)
+            if item.cache_namespace is not None:
+                groups[-1][3].add(item.cache_namespace)
+        for backend, user_id, conversations, namespaces in groups:
+            try:
+                add_many = getattr(backend, "add_many", None)
+                if add_many is not None:
+                    add_many(conversations, user_id=user_id)
+                else:
+                    for messages in conversations:
+                        backend.add(messages, user_id=user_id)
+                self.written += len(conversations)
+            except Exception as exc:
+                self.failed += len(conversations)
+                logger.warning("Memory add failed for user %r (%d conversation(s)): %s",
+                               user_id, len(conversations), exc)
+            finally:
+                # Even a failed batch may have stored part of its conversations.
+                for namespace in namespaces:
+                    MEMORY_QUERY_CACHE.invalidate(namespace, user_id)
+
+MEMORY_WRITER = MemoryWriteBehind()
+
+
+def flush_memory_writes(timeout: float | None = None) -> bool:
+    """Block until queued memory writes are stored (``False`` on timeout)."""
+    return MEMORY_WRITER.flush(timeout)
+
+
+atexit.register(flush_memory_writes, 5.0)
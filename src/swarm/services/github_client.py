@@ -9,39 +9,52 @@ MCP configuration templates.
 from __future__ import annotations
 
 import ast
+import asyncio
 import base64
+import copy
 import json as _json
+import logging
 import os
+import posixpath
+import threading
 import time
 from collections.abc import Iterable
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any
 
 import httpx
 from django.db import models
 
+from swarm.core.paths import get_user_cache_dir_for_swarm
 from swarm.models.core_models import Blueprint, MCPConfig
 from swarm.settings import (
     GITHUB_MARKETPLACE_ORG_ALLOWLIST,
     GITHUB_MARKETPLACE_TOPICS,
 )
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class GitHubConfig:
     """Configuration for the GitHub client."""
-    token: Optional[str] = field(default_factory=lambda: os.environ.get("GITHUB_TOKEN"))
+    token: str | None = field(default_factory=lambda: os.environ.get("GITHUB_TOKEN"))
     base_url: str = "https://api.github.com"
     timeout: int = 30
     max_retries: int = 3
     user_agent: str = "Swarm-GitHub-Client"
     verify_ssl: bool = True
+    # Async client: upper bound on in-flight requests (and pooled connections).
+    max_concurrency: int = 8
+    # Persisted ETag cache for conditional requests; None -> user cache dir.
+    etag_cache_path: str | None = None
 
 
 class GitHubClient:
     """A client for interacting with the GitHub API."""
 
-    def __init__(self, config: Optional[GitHubConfig] = None, **kwargs: Any):
+    def __init__(self, config: GitHubConfig | None = None, **kwargs: Any):
         if config:
             self.config = config
         elif kwargs:
@@ -114,206 +127,458 @@ class GitHubClient:
         except Exception:
             return []
 
-    def fetch_manifests(
-        self,
-        repo: dict[str, Any],
-    ) -> list[dict[str, Any]]:
-        """Return list of manifest items found in a repository."""
-        headers = {
-            "Accept": "application/vnd.github+json",
-            "User-Agent": self.config.user_agent,
-        }
-        if self.config.token:
-            headers["Authorization"] = f"Bearer {self.config.token}"
-        results: list[dict[str, Any]] = []
-        try:
-            full = (repo.get("full_name") or "").split("/")
-            if len(full) != 2:
-                return results
-            owner, name = full
-            with httpx.Client(
-                timeout=self.config.timeout,
-                headers=headers,
-                verify=self.config.verify_ssl
-            ) as client:
-                # Try top-level open-swarm.json
-                top = client.get(f"{self.base_url}/repos/{owner}/{name}/contents/open-swarm.json")
-                if top.status_code == 200:
-                    data = top.json()
-                    if isinstance(data, dict) and data.get("type") == "file":
-                        content = data.get("content")
-                        if content:
-                            try:
-                                decoded = base64.b64decode(content).decode("utf-8")
-                                parsed = _json.loads(decoded)
-                                if isinstance(parsed, list):
-                                    results.extend(parsed)
-                                elif isinstance(parsed, dict):
-                                    results.append(parsed)
-                            except Exception:
-                                pass
-                # List per-item manifests under conventional paths
-                for base in ("swarm/blueprints", "swarm/mcp"):
-                    resp = client.get(f"{self.base_url}/repos/{owner}/{name}/contents/{base}")
-                    if resp.status_code != 200:
-                        continue
-                    entries = resp.json() or []
-                    for ent in entries:
-                        if not isinstance(ent, dict) or ent.get("type") != "dir":
-                            continue
-                        path = ent.get("path")
-                        if not path:
-                            continue
-                        man = client.get(f"{self.base_url}/repos/{owner}/{name}/contents/{path}/manifest.json")
-                        if man.status_code == 200:
-                            mdata = man.json()
-                            if isinstance(mdata, dict) and mdata.get("type") == "file":
-                                content = mdata.get("content")
-                                if content:
-                                    try:
-                                        decoded = base64.b64decode(content).decode("utf-8")
-                                        parsed = _json.loads(decoded)
-                                        if isinstance(parsed, dict):
-                                            # Enrich with metrics and owner
-                                            self.enrich_item_with_metrics(client, owner, name, path, parsed)
-                                            parsed.setdefault('owner', owner)
-                                            results.append(parsed)
-                                    except Exception:
-                                        pass
-        except Exception:
-            return results
-        return results
+    def fetch_manifests(self, repo: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return manifest items found in ``repo``.
 
-    def enrich_item_with_metrics(
-        self,
-        client: httpx.Client,
-        owner: str,
-        repo: str,
-        item_dir: str,
-        item: dict[str, Any]
-    ) -> None:
-        """Compute file and line counts; extract metadata from python file if possible."""
-        try:
-            listing = client.get(f"{self.base_url}/repos/{owner}/{repo}/contents/{item_dir}")
-            if listing.status_code != 200:
-                return
-            entries = listing.json() or []
-            file_count = 0
-            line_total = 0
-            first_py_content = None
-            for f in entries:
-                if not isinstance(f, dict) or f.get('type') != 'file':
-                    continue
-                file_count += 1
-                # Count lines for small files (< 200KB) to avoid heavy downloads
-                size = f.get('size') or 0
-                if size and size < 200_000:
-                    # Fetch file content and count lines
-                    fc = client.get(f"{self.base_url}/repos/{owner}/{repo}/contents/{f.get('path')}")
-                    if fc.status_code == 200:
-                        fj = fc.json()
-                        try:
-                            raw = base64.b64decode(fj.get('content') or b'').decode('utf-8', errors='ignore')
-                            line_total += raw.count('\n') + 1
-                            if (f.get('name') or '').endswith('.py') and first_py_content is None:
-                                first_py_content = raw
-                        except Exception:
-                            pass
-            item.setdefault('file_count', file_count)
-            item.setdefault('line_count', line_total)
-            # Try AST parse for metadata name/description if missing
-            if first_py_content and (not item.get('name') or not item.get('description')):
-                meta = safe_extract_metadata_from_py(first_py_content)
-                if meta:
-                    item.setdefault('name', meta.get('name'))
-                    item.setdefault('description', meta.get('description'))
-        except Exception:
-            return
+        Synchronous wrapper over :meth:`AsyncGitHubClient.fetch_manifests`, so
+        it shares the ETag cache and the single tree request per repository.
+        Must not be called from a thread that is already running an event loop.
+        """
+
+        async def _fetch() -> list[dict[str, Any]]:
+            async with AsyncGitHubClient(self.config) as client:
+                return await client.fetch_manifests(repo)
+
+        return asyncio.run(_fetch())
 
     def sync_marketplace_items(self) -> tuple[int, int]:
-        """Synchronize GitHub marketplace items with local database."""
+        """Synchronize GitHub marketplace items with local database.
+
+        Repositories and manifests are collected concurrently through
+        :class:`AsyncGitHubClient` (conditional requests, one tree request per
+        repo); the database writes then run here, synchronously. Must not be
+        called from a thread that is already running an event loop.
+        """
         # Get all configured topics and orgs
         topics = list(GITHUB_MARKETPLACE_TOPICS)
         orgs = list(GITHUB_MARKETPLACE_ORG_ALLOWLIST)
 
-        # Search for repositories
-        repos = self.search_repositories(topics, orgs)
+        async def _collect() -> tuple[list[dict[str, Any]], list[list[dict[str, Any]]]]:
+            async with AsyncGitHubClient(self.config) as client:
+                found = await client.search_repositories(topics, orgs)
+                return found, await client.fetch_all_manifests(found)
+
+        repos, manifests_per_repo = asyncio.run(_collect())
+
+        created_count = 0
+        updated_count = 0
+        for repo, manifests in zip(repos, manifests_per_repo, strict=True):
+            created, updated = self._upsert_repo_manifests(repo, manifests)
+            created_count += created
+            updated_count += updated
+        return created_count, updated_count
 
+    def _upsert_repo_manifests(self, repo: dict[str, Any], manifests: list[dict[str, Any]]) -> tuple[int, int]:
+        """Create or update Blueprint/MCPConfig rows for one repository's manifests."""
         created_count = 0
         updated_count = 0
 
-        for repo in repos:
-            # Fetch manifests from the repository
-            manifests = self.fetch_manifests(repo)
-
-            # Process blueprints
-            blueprint_manifests = [m for m in manifests if m.get('type') == 'blueprint' or m.get('kind') == 'blueprint']
-            for manifest in blueprint_manifests:
-                try:
-                    # Check if blueprint already exists
-                    name = manifest.get('name', '').replace(' ', '_').lower()
-                    if not name:
-                        continue
-
-                    # Update or create the blueprint
-                    blueprint, created = Blueprint.objects.update_or_create(
-                        name=name,
-                        defaults={
-                            'title': manifest.get('name', name),
-                            'description': manifest.get('description', ''),
-                            'version': manifest.get('version', '1.0.0'),
-                            'tags': ','.join(manifest.get('tags', [])),
-                            'repository_url': repo.get('html_url'),
-                            'manifest_data': manifest,
-                            'code_template': manifest.get('code_template', ''),
-                            'required_mcp_servers': manifest.get('required_mcp_servers', []),
-                            'category': manifest.get('category', 'ai_assistants'),
-                        }
-                    )
-
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
-
-                except Exception as e:
-                    print(f"Error processing blueprint manifest: {e}")
-
-            # Process MCP configs
-            mcp_manifests = [m for m in manifests if m.get('type') == 'mcp' or m.get('kind') == 'mcp']
-            for manifest in mcp_manifests:
-                try:
-                    # Check if MCP config already exists
-                    name = manifest.get('name', '').replace(' ', '_').lower()
-                    if not name:
-                        continue
-
-                    # Update or create the MCP config
-                    mcp_config, created = MCPConfig.objects.update_or_create(
-                        name=name,
-                        defaults={
-                            'title': manifest.get('name', name),
-                            'description': manifest.get('description', ''),
-                            'version': manifest.get('version', '1.0.0'),
-                            'tags': ','.join(manifest.get('tags', [])),
-                            'repository_url': repo.get('html_url'),
-                            'manifest_data': manifest,
-                            'config_template': manifest.get('config_template', ''),
-                            'server_name': manifest.get('server_name', ''),
-                        }
-                    )
-
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
-
-                except Exception as e:
-                    print(f"Error processing MCP config manifest: {e}")
+        # Process blueprints
+        blueprint_manifests = [m for m in manifests if m.get('type') == 'blueprint' or m.get('kind') == 'blueprint']
+        for manifest in blueprint_manifests:
+            try:
+                # Check if blueprint already exists
+                name = manifest.get('name', '').replace(' ', '_').lower()
+                if not name:
+                    continue
+
+                # Update or create the blueprint
+                blueprint, created = Blueprint.objects.update_or_create(
+                    name=name,
+                    defaults={
+                        'title': manifest.get('name', name),
+                        'description': manifest.get('description', ''),
+                        'version': manifest.get('version', '1.0.0'),
+                        'tags': ','.join(manifest.get('tags', [])),
+                        'repository_url': repo.get('html_url'),
+                        'manifest_data': manifest,
+                        'code_template': manifest.get('code_template', ''),
+                        'required_mcp_servers': manifest.get('required_mcp_servers', []),
+                        'category': manifest.get('category', 'ai_assistants'),
+                    }
+                )
+
+                if created:
+                    created_count += 1
+                else:
+                    updated_count += 1
+
+            except Exception as e:
+                print(f"Error processing blueprint manifest: {e}")
+
+        # Process MCP configs
+        mcp_manifests = [m for m in manifests if m.get('type') == 'mcp' or m.get('kind') == 'mcp']
+        for manifest in mcp_manifests:
+            try:
+                # Check if MCP config already exists
+                name = manifest.get('name', '').replace(' ', '_').lower()
+                if not name:
+                    continue
+
+                # Update or create the MCP config
+                mcp_config, created = MCPConfig.objects.update_or_create(
+                    name=name,
+                    defaults={
+                        'title': manifest.get('name', name),
+                        'description': manifest.get('description', ''),
+                        'version': manifest.get('version', '1.0.0'),
+                        'tags': ','.join(manifest.get('tags', [])),
+                        'repository_url': repo.get('html_url'),
+                        'manifest_data': manifest,
+                        'config_template': manifest.get('config_template', ''),
+                        'server_name': manifest.get('server_name', ''),
+                    }
+                )
+
+                if created:
+                    created_count += 1
+                else:
+                    updated_count += 1
+
+            except Exception as e:
+                print(f"Error processing MCP config manifest: {e}")
 
         return created_count, updated_count
 
 
+class _FetchFailed(RuntimeError):
+    """A file listed in the repository tree could not be fetched (403, rate limit, 5xx)."""
+
+
+def _default_etag_cache_path() -> Path:
+    return get_user_cache_dir_for_swarm() / "github_etag_cache.json"
+
+
+class ETagCache:
+    """Persisted ``url -> (ETag, JSON body)`` cache for GitHub conditional requests.
+
+    A 304 response to ``If-None-Match`` does not count against the GitHub rate
+    limit, so an unchanged repository costs one cheap round trip. Entries are
+    kept in LRU order and bounded by ``max_entries``; the file is rewritten
+    atomically by :meth:`save` (only when something changed). An entry's body
+    may be something derived from the response instead of the response
+    itself (repository trees keep only their manifests), or ``None`` while
+    that is still being computed; such an entry never answers a 304.
+    Use :func:`get_etag_cache` to share one instance per file.
+    """
+
+    def __init__(self, path: Path | str | None = None, max_entries: int = 2048):
+        self.path = Path(path) if path else _default_etag_cache_path()
+        self.max_entries = max_entries
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with self.path.open("r", encoding="utf-8") as f:
+                data = _json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable GitHub ETag cache %s: %s", self.path, e)
+            return
+        if isinstance(data, dict):
+            self._entries = {k: v for k, v in data.items() if isinstance(v, dict) and "etag" in v}
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry  # mark as most recently used
+            return entry
+
+    def put(self, key: str, etag: str, data: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = {"etag": etag, "data": data}
+            while len(self._entries) > self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._dirty = True
+
+    def set_data(self, key: str, data: Any) -> None:
+        """Replace the body stored for ``key``, keeping its ETag (no-op if evicted)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry["data"] = data
+                self._dirty = True
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._dirty = True
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = _json.dumps(self._entries, separators=(",", ":"))
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + ".tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning("Could not persist GitHub ETag cache %s: %s", self.path, e)
+
+
+_etag_caches: dict[Path, ETagCache] = {}
+_etag_caches_lock = threading.Lock()
+
+
+def get_etag_cache(path: Path | str | None = None) -> ETagCache:
+    """The process-wide :class:`ETagCache` for ``path`` (default: the user cache dir).
+
+    Clients are created per request, so sharing the instance keeps the file
+    from being re-read for each one.
+    """
+    resolved = Path(path) if path else _default_etag_cache_path()
+    with _etag_caches_lock:
+        cache = _etag_caches.get(resolved)
+        if cache is None:
+            cache = _etag_caches[resolved] = ETagCache(resolved)
+        return cache
+
+
+class AsyncGitHubClient:
+    """Async GitHub client for marketplace discovery.
+
+    One ``httpx.AsyncClient`` (connection pool) is shared by every request made
+    through the instance, and a semaphore caps in-flight requests at
+    ``config.max_concurrency``. Every GET is conditional on a persisted ETag,
+    and each repository is inspected with a single recursive tree request:
+    manifests are located from the tree, and file counts/sizes come from the
+    tree's blob sizes instead of downloading each file. Use as an async
+    context manager so the pool is closed and the ETag cache saved.
+    """
+
+    def __init__(self, config: GitHubConfig | None = None, *, etag_cache: ETagCache | None = None):
+        self.config = config or GitHubConfig()
+        self.base_url = self.config.base_url.rstrip("/")
+        self.etag_cache = etag_cache if etag_cache is not None else get_etag_cache(self.config.etag_cache_path)
+        self._semaphore = asyncio.Semaphore(max(1, self.config.max_concurrency))
+        self._client: httpx.AsyncClient | None = None
+        # Request accounting, mostly for tests and diagnostics.
+        self.requests_made = 0
+        self.not_modified = 0
+
+    async def __aenter__(self) -> AsyncGitHubClient:
+        self._ensure_client()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            headers = {
+                "Accept": "application/vnd.github+json",
+                "User-Agent": self.config.user_agent,
+            }
+            if self.config.token:
+                headers["Authorization"] = f"Bearer {self.config.token}"
+            limit = max(1, self.config.max_concurrency)
+            self._client = httpx.AsyncClient(
+                headers=headers,
+                timeout=self.config.timeout,
+                verify=self.config.verify_ssl,
+                limits=httpx.Limits(max_connections=limit, max_keepalive_connections=limit),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self.etag_cache.save()
+
+    def _cache_key(self, path: str, params: dict[str, Any] | None = None) -> str:
+        url = f"{self.base_url}{path}"
+        return str(httpx.URL(url, params=params)) if params else url
+
+    async def _get_json(
+        self, path: str, params: dict[str, Any] | None = None, *, cache_body: bool = True
+    ) -> tuple[int, Any, bool]:
+        """GET ``path`` conditionally; returns ``(status, json, not_modified)``.
+
+        On 304 the cached body is returned with status 200 and
+        ``not_modified=True``. Non-200 responses return ``(status, None, False)``.
+        With ``cache_body=False`` only the ETag is stored; the caller fills in
+        the body with :meth:`ETagCache.set_data`.
+        """
+        client = self._ensure_client()
+        url = f"{self.base_url}{path}"
+        key = self._cache_key(path, params)
+        cached = self.etag_cache.get(key)
+        headers = {"If-None-Match": cached["etag"]} if cached and cached.get("data") is not None else None
+        async with self._semaphore:
+            resp = await client.get(url, params=params, headers=headers)
+        self.requests_made += 1
+        if resp.status_code == 304 and headers is not None:
+            self.not_modified += 1
+            return 200, cached["data"], True
+        if resp.status_code != 200:
+            return resp.status_code, None, False
+        data = resp.json()
+        etag = resp.headers.get("ETag")
+        if etag:
+            self.etag_cache.put(key, etag, data if cache_body else None)
+        return 200, data, False
+
+    async def search_repositories(
+        self,
+        topics: list[str],
+        orgs: list[str] | None = None,
+        *,
+        sort: str = 'stars',
+        order: str = 'desc',
+        query: str = '',
+    ) -> list[dict[str, Any]]:
+        """Async counterpart of :meth:`GitHubClient.search_repositories`."""
+        q = _build_search_query(topics, orgs, query)
+        params = {"q": q, "sort": sort or "stars", "order": order or "desc", "per_page": 20}
+        try:
+            status, data, _ = await self._get_json("/search/repositories", params)
+        except httpx.HTTPError as e:
+            logger.warning("GitHub repository search failed: %s", e)
+            return []
+        if status != 200:
+            return []
+        return [_repo_summary(it) for it in (data or {}).get("items") or []]
+
+    async def fetch_manifests(self, repo: dict[str, Any]) -> list[dict[str, Any]]:
+        """Return manifest items found in ``repo``; best-effort, partial on errors.
+
+        If the repository tree is unchanged since the last call (304), the
+        previously derived manifests are returned without any further requests.
+        The cache keeps only those manifests and the tree sha, not the tree
+        itself, and only for a complete result: after a failed fetch the next
+        call fetches the tree and manifests again.
+        """
+        full = (repo.get("full_name") or "").split("/")
+        if len(full) != 2:
+            return []
+        owner, name = full
+        ref = repo.get("default_branch") or "HEAD"
+        tree_path = f"/repos/{owner}/{name}/git/trees/{ref}"
+        tree_params = {"recursive": "1"}
+        tree_key = self._cache_key(tree_path, tree_params)
+        try:
+            status, tree, not_modified = await self._get_json(tree_path, tree_params, cache_body=False)
+        except httpx.HTTPError as e:
+            logger.warning("GitHub tree request for %s/%s failed: %s", owner, name, e)
+            return []
+        if status != 200 or not isinstance(tree, dict):
+            return []
+        if not_modified:
+            # The entry holds the manifests derived from this very tree.
+            return copy.deepcopy(tree.get("manifests") or [])
+        tree_sha = tree.get("sha") or ""
+        if tree.get("truncated"):
+            logger.warning("GitHub tree for %s/%s is truncated; manifests may be incomplete", owner, name)
+
+        blobs = {
+            ent["path"]: ent.get("size") or 0
+            for ent in tree.get("tree") or []
+            if isinstance(ent, dict) and ent.get("type") == "blob" and ent.get("path")
+        }
+        item_dirs = sorted(
+            posixpath.dirname(p)
+            for p in blobs
+            if posixpath.basename(p) == "manifest.json"
+            and posixpath.dirname(posixpath.dirname(p)) in ("swarm/blueprints", "swarm/mcp")
+        )
+        tasks = [self._fetch_item_manifest(owner, name, d, blobs) for d in item_dirs]
+        if "open-swarm.json" in blobs:
+            tasks.insert(0, self._fetch_top_level_manifest(owner, name))
+        results: list[dict[str, Any]] = []
+        complete = True
+        for found in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(found, BaseException):
+                logger.debug("Skipping manifest for %s/%s: %s", owner, name, found)
+                complete = False
+                continue
+            results.extend(found)
+        if complete:
+            self.etag_cache.set_data(tree_key, {"sha": tree_sha, "manifests": copy.deepcopy(results)})
+        else:
+            self.etag_cache.discard(tree_key)
+        return results
+
+    async def fetch_all_manifests(self, repos: Iterable[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+        """Fetch manifests for every repository concurrently, preserving input order."""
+        return list(await asyncio.gather(*(self.fetch_manifests(r) for r in repos)))
+
+    async def _fetch_file_text(self, owner: str, repo: str, path: str) -> str | None:
+        status, data, _ = await self._get_json(f"/repos/{owner}/{repo}/contents/{path}")
+        if status != 200:
+            raise _FetchFailed(f"{owner}/{repo}/{path}: HTTP {status}")
+        if not isinstance(data, dict) or data.get("type") != "file":
+            return None
+        content = data.get("content")
+        if not content:
+            return None
+        return base64.b64decode(content).decode("utf-8", errors="ignore")
+
+    async def _fetch_top_level_manifest(self, owner: str, repo: str) -> list[dict[str, Any]]:
+        text = await self._fetch_file_text(owner, repo, "open-swarm.json")
+        if not text:
+            return []
+        parsed = _json.loads(text)
+        if isinstance(parsed, list):
+            return parsed
+        if isinstance(parsed, dict):
+            return [parsed]
+        return []
+
+    async def _fetch_item_manifest(
+        self, owner: str, repo: str, item_dir: str, blobs: dict[str, int]
+    ) -> list[dict[str, Any]]:
+        text = await self._fetch_file_text(owner, repo, f"{item_dir}/manifest.json")
+        if not text:
+            return []
+        parsed = _json.loads(text)
+        if not isinstance(parsed, dict):
+            return []
+        # Metrics from the tree: direct children of the item directory.
+        files = sorted(p for p in blobs if posixpath.dirname(p) == item_dir)
+        parsed.setdefault('file_count', len(files))
+        parsed.setdefault('size_bytes', sum(blobs[p] for p in files))
+        if not parsed.get('name') or not parsed.get('description'):
+            first_py = next((p for p in files if p.endswith('.py')), None)
+            if first_py:
+                source = await self._fetch_file_text(owner, repo, first_py)
+                meta = safe_extract_metadata_from_py(source) if source else None
+                if meta:
+                    parsed.setdefault('name', meta.get('name'))
+                    parsed.setdefault('description', meta.get('description'))
+        parsed.setdefault('owner', owner)
+        return [parsed]
+
+
+def _build_search_query(topics: list[str], orgs: list[str] | None, query: str) -> str:
+    q_parts = [f"topic:{t}" for t in topics or [] if t]
+    q_parts.extend(f"org:{o}" for o in orgs or [] if o)
+    if query:
+        q_parts.append(f"{query} in:name")
+    return " ".join(q_parts) or "open-swarm-blueprint open-swarm-mcp-template"
+
+
+def _repo_summary(it: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "full_name": it.get("full_name"),
+        "html_url": it.get("html_url"),
+        "description": it.get("description"),
+        "stargazers_count": it.get("stargazers_count"),
+        "updated_at": it.get("updated_at"),
+        "topics": it.get("topics", []),
+        "default_branch": it.get("default_branch"),
+    }
+
+
 # Very simple in-process cache (best-effort) to reduce GitHub calls in a
 # long-lived process. Keys are based on query parameters. TTL is short.
 _CACHE: dict[tuple[str, str, str, str], tuple[float, list[dict[str, Any]]]] = {}
@@ -370,13 +635,6 @@ def sync_marketplace_items():
     return _DEFAULT_CLIENT.sync_marketplace_items()
 
 
-def enrich_item_with_metrics(client: httpx.Client, owner: str, repo: str, item_dir: str, item: dict[str, Any]) -> None:
-    """Legacy wrapper for enriching item with metrics."""
-    _DEFAULT_CLIENT.enrich_item_with_metrics(client, owner, repo, item_dir, item)
-
-
-
-
 def safe_extract_metadata_from_py(src: str) -> dict[str, Any] | None:
     """Safely extract Blueprint.metadata dict from Python source using AST only.
 
@@ -437,7 +695,7 @@ def to_marketplace_items(
                 'version': it.get('version', ''),
                 'tags': it.get('tags', []),
                 'file_count': it.get('file_count'),
-                'line_count': it.get('line_count'),
+                'size_bytes': it.get('size_bytes'),
                 'manifest_data': it,
                 'repository_url': repo.get('html_url'),
                 'source': 'github',
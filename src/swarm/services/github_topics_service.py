@@ -7,8 +7,7 @@ tests monkeypatch these functions to return controlled data.
 from __future__ import annotations
 
 import ast
-import base64
-import json as _json
+import asyncio
 import time
 from collections.abc import Iterable
 from typing import Any
@@ -107,117 +106,26 @@ def search_repos_by_topics(
         ) from exc
 
 
-def fetch_repo_manifests(
-    repo: dict[str, Any],
+def fetch_repos_manifests(
+    repos: list[dict[str, Any]],
     token: str | None = None,
-) -> list[dict[str, Any]]:
-    """Return list of manifest items found in a repository.
+) -> list[list[dict[str, Any]]]:
+    """Return manifest items for every repo, in ``repos`` order.
 
-    Tries the top-level `open-swarm.json` first. Then lists conventional
-    directories for per-item manifests. On any error, returns partial results.
+    Uses :class:`swarm.services.github_client.AsyncGitHubClient`: one shared
+    connection pool with bounded concurrency, ETag-conditional requests (an
+    unchanged repo costs a single 304) and one tree request per repo for
+    file metrics. Must be called from synchronous code (no running loop).
     """
-    headers = {"Accept": "application/vnd.github+json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    results: list[dict[str, Any]] = []
-    try:
-        full = (repo.get("full_name") or "").split("/")
-        if len(full) != 2:
-            return results
-        owner, name = full
-        with httpx.Client(timeout=10.0, headers=headers) as client:
-            # Try top-level open-swarm.json
-            top = client.get(f"{GITHUB_API}/repos/{owner}/{name}/contents/open-swarm.json")
-            if top.status_code == 200:
-                data = top.json()
-                if isinstance(data, dict) and data.get("type") == "file":
-                    content = data.get("content")
-                    if content:
-                        try:
-                            decoded = base64.b64decode(content).decode("utf-8")
-                            # Expecting either a single item or a list of items
-                            import json
-                            parsed = json.loads(decoded)
-                            if isinstance(parsed, list):
-                                results.extend(parsed)
-                            elif isinstance(parsed, dict):
-                                results.append(parsed)
-                        except Exception:
-                            pass
-            # List per-item manifests under conventional paths
-            for base in ("swarm/blueprints", "swarm/mcp"):
-                resp = client.get(f"{GITHUB_API}/repos/{owner}/{name}/contents/{base}")
-                if resp.status_code != 200:
-                    continue
-                entries = resp.json() or []
-                for ent in entries:
-                    if not isinstance(ent, dict) or ent.get("type") != "dir":
-                        continue
-                    path = ent.get("path")
-                    if not path:
-                        continue
-                    man = client.get(f"{GITHUB_API}/repos/{owner}/{name}/contents/{path}/manifest.json")
-                    if man.status_code == 200:
-                        mdata = man.json()
-                        if isinstance(mdata, dict) and mdata.get("type") == "file":
-                            content = mdata.get("content")
-                            if content:
-                                try:
-                                    decoded = base64.b64decode(content).decode("utf-8")
-                                    parsed = _json.loads(decoded)
-                                    if isinstance(parsed, dict):
-                                        # Enrich with metrics and owner
-                                        enrich_item_with_metrics(client, owner, name, path, parsed)
-                                        parsed.setdefault('owner', owner)
-                                        results.append(parsed)
-                                except Exception:
-                                    pass
-    except Exception:
-        return results
-    return results
+    if not repos:
+        return []
+    from swarm.services.github_client import AsyncGitHubClient, GitHubConfig
 
+    async def _fetch() -> list[list[dict[str, Any]]]:
+        async with AsyncGitHubClient(GitHubConfig(token=token)) as client:
+            return await client.fetch_all_manifests(repos)
 
-def enrich_item_with_metrics(client: httpx.Client, owner: str, repo: str, item_dir: str, item: dict[str, Any]) -> None:
-    """Compute file and line counts; extract metadata from python file if possible.
-
-    This function is best-effort; failures are silently ignored.
-    """
-    try:
-        listing = client.get(f"{GITHUB_API}/repos/{owner}/{repo}/contents/{item_dir}")
-        if listing.status_code != 200:
-            return
-        entries = listing.json() or []
-        file_count = 0
-        line_total = 0
-        first_py_content = None
-        for f in entries:
-            if not isinstance(f, dict) or f.get('type') != 'file':
-                continue
-            file_count += 1
-            # Count lines for small files (< 200KB) to avoid heavy downloads
-            size = f.get('size') or 0
-            if size and size < 200_000:
-                # Fetch file content and count lines
-                fc = client.get(f"{GITHUB_API}/repos/{owner}/{repo}/contents/{f.get('path')}")
-                if fc.status_code == 200:
-                    fj = fc.json()
-                    try:
-                        raw = base64.b64decode(fj.get('content') or b'').decode('utf-8', errors='ignore')
-                        line_total += raw.count('\n') + 1
-                        if (f.get('name') or '').endswith('.py') and first_py_content is None:
-                            first_py_content = raw
-                    except Exception:
-                        pass
-        item.setdefault('file_count', file_count)
-        item.setdefault('line_count', line_total)
-        # Try AST parse for metadata name/description if missing
-        if first_py_content and (not item.get('name') or not item.get('description')):
-            meta = safe_extract_metadata_from_py(first_py_content)
-            if meta:
-                item.setdefault('name', meta.get('name'))
-                item.setdefault('description', meta.get('description'))
-    except Exception:
-        return
+    return asyncio.run(_fetch())
 
 
 def safe_extract_metadata_from_py(src: str) -> dict[str, Any] | None:
@@ -279,7 +187,7 @@ def to_marketplace_items(
                 'version': it.get('version', ''),
                 'tags': it.get('tags', []),
                 'file_count': it.get('file_count'),
-                'line_count': it.get('line_count'),
+                'size_bytes': it.get('size_bytes'),
                 'manifest': it,
             }
         )
@@ -1,11 +1,15 @@
+import asyncio
+import codecs
 import json
 import logging
 import os
 import re
 import shlex
+import signal
 import subprocess
 import threading
 import time
+from collections.abc import AsyncIterator, Iterator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -17,9 +21,7 @@ logger = logging.getLogger(__name__)
 RE_NON_ALPHANUMERIC = re.compile(r'[^a-zA-Z0-9]')
 
 # Import secure subprocess utilities
-from swarm.services.secure_subprocess import (
-    validate_command_safety
-)
+from swarm.services.secure_subprocess import validate_command_safety
 
 # Define a path for storing job metadata and outputs
 # Consider making this configurable
@@ -31,6 +33,92 @@ JOB_OUTPUTS_DIR = SWARM_JOB_DATA_DIR / "outputs"
 SWARM_JOB_DATA_DIR.mkdir(parents=True, exist_ok=True)
 JOB_OUTPUTS_DIR.mkdir(parents=True, exist_ok=True)
 
+# The metadata snapshot is only rewritten on compaction; individual status
+# changes are appended to a JSON-lines journal next to it and replayed on load.
+JOBS_JOURNAL_NAME = "jobs_journal.jsonl"
+# Number of journal records after which the snapshot is rewritten and the
+# journal truncated.
+JOURNAL_COMPACT_THRESHOLD = 256
+# Poll interval (seconds) for jobs re-adopted after a restart; they are not our
+# children any more, so ``wait()`` is unavailable.
+REATTACH_POLL_INTERVAL = 1.0
+
+# Block size used when reading job logs backwards (tail) and forwards (follow).
+LOG_READ_BLOCK_SIZE = 64 * 1024
+# Default poll interval (seconds) for ``follow_log``/``afollow_log``.
+LOG_FOLLOW_POLL_INTERVAL = 0.25
+
+TERMINAL_STATUSES = ("COMPLETED", "FAILED", "TERMINATED", "FAILED_TERMINATION", "UNKNOWN_STALE", "EXITED")
+
+
+def _journal_file() -> Path:
+    """Journal path, derived from the (patchable) metadata file location."""
+    return JOBS_METADATA_FILE.with_name(JOBS_JOURNAL_NAME)
+
+
+def _pid_file(job_id: str) -> Path:
+    """Pidfile path for ``job_id``, kept alongside its log under ``JOB_OUTPUTS_DIR``."""
+    return JOB_OUTPUTS_DIR / f"{job_id}.pid"
+
+
+def _process_start_time(pid: int) -> int | None:
+    """Return the kernel start time (clock ticks since boot) of ``pid``.
+
+    Reads ``/proc/<pid>/stat``; returns ``None`` when the process does not exist
+    or ``/proc`` is unavailable (non-Linux), in which case identity cannot be
+    verified and callers must not trust the PID.
+    """
+    try:
+        with open(f"/proc/{pid}/stat", "rb") as f:
+            stat = f.read().decode("ascii", errors="replace")
+    except OSError:
+        return None
+    # ``comm`` (field 2) may contain spaces and parentheses; everything after the
+    # last ')' is space separated starting at field 3. starttime is field 22.
+    fields = stat[stat.rfind(")") + 2:].split()
+    try:
+        return int(fields[19])
+    except (IndexError, ValueError):
+        return None
+
+
+def _pid_matches(pid: int, start_time: int) -> bool:
+    """True if ``pid`` is alive and is the same process that was started at ``start_time``."""
+    return _process_start_time(pid) == start_time
+
+
+def _read_tail_lines(path: Path, n_lines: int, block_size: int = LOG_READ_BLOCK_SIZE) -> list[str]:
+    """Return the last ``n_lines`` lines of ``path`` by reading backwards in blocks.
+
+    Cost is proportional to the size of the tail, not the file, so tailing a
+    multi-hundred-MB log reads only a few blocks.
+    """
+    if n_lines <= 0:
+        return []
+    with path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        blocks: list[bytes] = []
+        newlines = 0
+        # One extra newline is needed to know the earliest wanted line is complete;
+        # a trailing newline at EOF does not start a new line.
+        while pos > 0 and newlines <= n_lines:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            block = f.read(step)
+            blocks.append(block)
+            newlines += block.count(b"\n")
+    data = b"".join(reversed(blocks))
+    return data.decode("utf-8", errors="replace").splitlines()[-n_lines:]
+
+
+def _read_log_chunk(path: Path, offset: int, max_bytes: int = LOG_READ_BLOCK_SIZE) -> bytes:
+    """Read up to ``max_bytes`` of ``path`` starting at byte ``offset``."""
+    with path.open("rb") as f:
+        f.seek(offset)
+        return f.read(max_bytes)
+
 
 def _is_under_job_outputs(path: Path | str) -> bool:
     """True if resolved ``path`` is under ``JOB_OUTPUTS_DIR`` (no escapes)."""
@@ -74,7 +162,7 @@ class Job:
     id: str
     command_list: list[str] # The command and its arguments as a list
     command_str: str = "" # User-friendly string representation of the command
-    status: str = "PENDING"  # PENDING, RUNNING, COMPLETED, FAILED, TERMINATED
+    status: str = "PENDING"  # PENDING, RUNNING, COMPLETED, FAILED, TERMINATED, EXITED
     pid: int | None = None
     exit_code: int | None = None
     output_file_path: Path | None = None # Path to the file storing stdout/stderr
@@ -143,6 +231,7 @@ class DefaultJobService:
         self._jobs: dict[str, Job] = {}
         self._threads: dict[str, threading.Thread] = {}
         self._lock = threading.Lock() # For thread-safe access to _jobs
+        self._journal_records = 0 # Journal records appended since the last compaction
         self._load_jobs_from_disk()
         logger.info(f"DefaultJobService initialized. Loaded {len(self._jobs)} jobs from disk.")
 
@@ -155,83 +244,206 @@ class DefaultJobService:
         return f"{safe_base}_{timestamp_ms}"
 
     def _save_jobs_to_disk(self):
-        """Persists the metadata of all current jobs to a JSON file."""
+        """Compacts persisted state: rewrites the metadata snapshot and truncates the journal.
+
+        The snapshot is written to a temporary file and atomically renamed into
+        place, so a crash mid-write leaves the previous snapshot (plus journal)
+        intact. Replaying a journal over a newer snapshot is idempotent.
+        """
         with self._lock:
             try:
                 serializable_jobs = {job_id: job.to_dict() for job_id, job in self._jobs.items()}
-                with JOBS_METADATA_FILE.open("w") as f:
-                    json.dump(serializable_jobs, f, indent=2)
+                tmp_path = JOBS_METADATA_FILE.with_name(JOBS_METADATA_FILE.name + ".tmp")
+                with tmp_path.open("w") as f:
+                    json.dump(serializable_jobs, f, separators=(",", ":"))
+                os.replace(tmp_path, JOBS_METADATA_FILE)
+                with _journal_file().open("w"):
+                    pass
+                self._journal_records = 0
                 logger.debug(f"Saved {len(serializable_jobs)} jobs to disk at {JOBS_METADATA_FILE}")
             except Exception as e:
                 logger.error(f"Error saving jobs to disk: {e}", exc_info=True)
 
+    def _append_journal(self, record: dict[str, Any]) -> None:
+        """Appends a single record to the job journal, compacting when it grows too long."""
+        try:
+            line = json.dumps(record, separators=(",", ":")) + "\n"
+        except (TypeError, ValueError) as e:
+            logger.error(f"Error serializing job journal record: {e}", exc_info=True)
+            return
+        with self._lock:
+            try:
+                with _journal_file().open("a", encoding="utf-8") as f:
+                    f.write(line)
+                self._journal_records += 1
+            except OSError as e:
+                logger.error(f"Error appending to job journal: {e}", exc_info=True)
+                return
+            needs_compaction = self._journal_records >= JOURNAL_COMPACT_THRESHOLD
+        if needs_compaction:
+            self._save_jobs_to_disk()
+
+    def _record_job(self, job: Job) -> None:
+        """Journals the current state of ``job``."""
+        self._append_journal({"op": "put", "job": job.to_dict()})
+
+    def _replay_journal(self, jobs_data: dict[str, dict[str, Any]]) -> int:
+        """Applies journal records on top of ``jobs_data`` in place; returns the record count.
+
+        A torn final line (crash mid-append) is ignored.
+        """
+        journal = _journal_file()
+        if not journal.exists():
+            return 0
+        count = 0
+        with journal.open("r", encoding="utf-8", errors="replace") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    if record["op"] == "put":
+                        jobs_data[record["job"]["id"]] = record["job"]
+                    elif record["op"] == "del":
+                        jobs_data.pop(record["id"], None)
+                    else:
+                        continue
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    logger.warning(f"Skipping unreadable job journal record in {journal}")
+                    continue
+                count += 1
+        return count
+
     def _load_jobs_from_disk(self):
-        """Loads job metadata from disk on initialization."""
+        """Loads job metadata (snapshot plus journal) from disk on initialization.
+
+        Jobs recorded as RUNNING are re-adopted when their pidfile still matches
+        a live process (same PID and kernel start time); otherwise they are
+        marked ``UNKNOWN_STALE``.
+        """
+        loaded_data: dict[str, dict[str, Any]] = {}
         if JOBS_METADATA_FILE.exists():
-            with self._lock:
+            try:
+                with JOBS_METADATA_FILE.open("r") as f:
+                    loaded_data = json.load(f)
+            except json.JSONDecodeError:
+                logger.error(f"Error decoding JSON from {JOBS_METADATA_FILE}. Starting with empty job list.", exc_info=True)
+                loaded_data = {}
+            except Exception as e:
+                logger.error(f"Error loading jobs from disk: {e}", exc_info=True)
+                loaded_data = {}
+        try:
+            replayed = self._replay_journal(loaded_data)
+        except OSError as e:
+            logger.error(f"Error reading job journal: {e}", exc_info=True)
+            replayed = 0
+
+        reattached: list[tuple[Job, int]] = []
+        marked_stale = False
+        with self._lock:
+            for job_id, job_data in loaded_data.items():
                 try:
-                    with JOBS_METADATA_FILE.open("r") as f:
-                        loaded_data = json.load(f)
-                        for job_id, job_data in loaded_data.items():
-                            try:
-                                job = Job.from_dict(job_data)
-                            except ValueError as e:
-                                logger.error(
-                                    "Skipping job %s with invalid output_file_path: %s",
-                                    job_id,
-                                    e,
-                                )
-                                continue
-                            # Jobs loaded from disk are not actively running unless re-monitored.
-                            # If status was RUNNING, it's likely stale. Mark as UNKNOWN or check.
-                            if job.status == "RUNNING":
-                                logger.warning(f"Job {job_id} was RUNNING on disk; actual status unknown without re-check.")
-                                # For simplicity, we might mark as UNKNOWN or COMPLETED if PID is old.
-                                # A more robust system would try to re-attach or verify.
-                                job.status = "UNKNOWN_STALE"
-                            self._jobs[job_id] = job
-                    logger.info(f"Loaded {len(self._jobs)} job metadata entries from {JOBS_METADATA_FILE}")
-                except json.JSONDecodeError:
-                    logger.error(f"Error decoding JSON from {JOBS_METADATA_FILE}. Starting with empty job list.", exc_info=True)
-                except Exception as e:
-                    logger.error(f"Error loading jobs from disk: {e}", exc_info=True)
+                    job = Job.from_dict(job_data)
+                except ValueError as e:
+                    logger.error(
+                        "Skipping job %s with invalid output_file_path: %s",
+                        job_id,
+                        e,
+                    )
+                    continue
+                if job.status == "RUNNING":
+                    start_time = self._read_pid_file(job)
+                    if start_time is not None:
+                        logger.info(f"Re-adopting running job {job_id} (PID: {job.pid}).")
+                        reattached.append((job, start_time))
+                    else:
+                        logger.warning(f"Job {job_id} was RUNNING on disk but its process is gone; marking UNKNOWN_STALE.")
+                        job.status = "UNKNOWN_STALE"
+                        job.pid = None
+                        marked_stale = True
+                self._jobs[job_id] = job
+        if loaded_data:
+            logger.info(f"Loaded {len(self._jobs)} job metadata entries from {JOBS_METADATA_FILE}")
+
+        for job, start_time in reattached:
+            watcher = threading.Thread(target=self._watch_reattached_job, args=(job, start_time))
+            watcher.daemon = True
+            self._threads[job.id] = watcher
+            watcher.start()
+        if replayed or marked_stale:
+            # Fold the replayed journal and any stale transitions into the snapshot.
+            self._save_jobs_to_disk()
+
+    def _write_pid_file(self, job: Job) -> None:
+        """Records the job's PID and kernel start time so a restarted service can re-adopt it."""
+        if job.pid is None:
+            return
+        start_time = _process_start_time(job.pid)
+        if start_time is None:
+            return
+        try:
+            _pid_file(job.id).write_text(json.dumps({"pid": job.pid, "start_time": start_time}))
+        except OSError as e:
+            logger.warning(f"Could not write pidfile for job {job.id}: {e}")
+
+    def _read_pid_file(self, job: Job) -> int | None:
+        """Returns the recorded start time if the job's pidfile matches a live process."""
+        if job.pid is None:
+            return None
+        try:
+            data = json.loads(_pid_file(job.id).read_text())
+            pid, start_time = int(data["pid"]), int(data["start_time"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if pid != job.pid or not _pid_matches(pid, start_time):
+            return None
+        return start_time
+
+    def _remove_pid_file(self, job_id: str) -> None:
+        pid_path = _pid_file(job_id)
+        if not pid_path.exists():
+            return
+        try:
+            pid_path.unlink()
+        except OSError as e:
+            logger.warning(f"Could not remove pidfile for job {job_id}: {e}")
+
+    def _watch_reattached_job(self, job: Job, start_time: int):
+        """
+        Internal method to run in a thread for a job re-adopted after a restart.
+        The process writes straight to its log file, so only liveness is tracked;
+        its exit code cannot be collected because it is no longer our child.
+        """
+        while job.pid is not None and _pid_matches(job.pid, start_time):
+            time.sleep(REATTACH_POLL_INTERVAL)
+        with self._lock:
+            self._threads.pop(job.id, None)
+            if job.status != "RUNNING":
+                return  # Terminated through the service in the meantime.
+            job.status = "EXITED"
+            job.pid = None
+            job.updated_at = time.time()
+        logger.info(f"Re-adopted job {job.id} exited; exit code unavailable.")
+        self._remove_pid_file(job.id)
+        self._record_job(job)
 
     def _monitor_job_process(self, job: Job):
         """
         Internal method to run in a thread, monitoring a subprocess.
-        Streams stdout/stderr to the job's output file and updates job status.
+        The process writes stdout/stderr straight to the job's output file, so
+        this only waits for it to exit and updates job status.
         """
         if not job._process_handle or job.output_file_path is None:
             logger.error(f"Job {job.id} cannot be monitored: process handle or output file path is missing.")
             job.status = "FAILED"
             job.exit_code = -1 # Indicate internal error
             job.updated_at = time.time()
-            self._save_jobs_to_disk()
-            return
-
-        if not _is_under_job_outputs(job.output_file_path):
-            logger.error(
-                "Job %s output_file_path escapes JOB_OUTPUTS_DIR: %s",
-                job.id,
-                job.output_file_path,
-            )
-            job.status = "FAILED"
-            job.exit_code = -1
-            job.updated_at = time.time()
-            self._save_jobs_to_disk()
+            self._record_job(job)
             return
 
         logger.info(f"Monitoring job {job.id} (PID: {job.pid}) output to {job.output_file_path}")
         try:
-            with job.output_file_path.open("w", encoding="utf-8", errors="replace") as f_out:
-                # Stream stdout (which includes stderr due to Popen config)
-                if job._process_handle.stdout:
-                    for line in iter(job._process_handle.stdout.readline, ''):
-                        f_out.write(line)
-                        f_out.flush() # Ensure output is written promptly
-                        # Optionally, could store recent lines in memory in Job object if needed
-                    job._process_handle.stdout.close()
-
             job._process_handle.wait() # Wait for the process to complete
             job.exit_code = job._process_handle.returncode
             job.status = "COMPLETED" if job.exit_code == 0 else "FAILED"
@@ -247,14 +459,18 @@ class DefaultJobService:
             job.updated_at = time.time()
             with self._lock:
                 self._jobs[job.id] = job # Ensure the main dict has the updated job
-            self._save_jobs_to_disk()
-            if job.id in self._threads:
-                del self._threads[job.id]
+                self._threads.pop(job.id, None)
+            self._remove_pid_file(job.id)
+            self._record_job(job)
 
 
     def launch(self, command: list[str], tracking_label: str | None = None) -> str:
         """
         Launches a command as a background job.
+
+        The process runs in its own session with stdout/stderr redirected to the
+        job's log file, so it keeps running (and logging) across service restarts
+        and can be re-adopted on the next load.
         Args:
             command: The command and its arguments as a list.
             tracking_label: An optional label for the job.
@@ -276,32 +492,35 @@ class DefaultJobService:
             # Validate command safety first
             if not validate_command_safety(job.command_list):
                 raise ValueError(f"Unsafe command detected in job {job.id}: {job.command_list}")
+            if job.output_file_path is None or not _is_under_job_outputs(job.output_file_path):
+                raise ValueError(f"Job {job.id} output_file_path escapes JOB_OUTPUTS_DIR: {job.output_file_path}")
 
             # Use secure subprocess execution
-            process = subprocess.Popen(
-                job.command_list,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT, # Redirect stderr to stdout
-                text=True, # Decode output as text
-                bufsize=1, # Line-buffered
-                universal_newlines=True, # Ensure consistent newline handling
-                encoding='utf-8', errors='replace' # Handle potential encoding issues
-            )
+            with job.output_file_path.open("wb") as log_file:
+                process = subprocess.Popen(
+                    job.command_list,
+                    stdin=subprocess.DEVNULL,
+                    stdout=log_file,
+                    stderr=subprocess.STDOUT, # Redirect stderr to stdout
+                    start_new_session=True, # Detach from our process group so restarts do not kill it
+                )
             job.pid = process.pid
             job._process_handle = process
             job.status = "RUNNING"
             job.updated_at = time.time()
+            self._write_pid_file(job)
 
             with self._lock:
                 self._jobs[job_id] = job
+            # Journal RUNNING before the monitor can append the exit record.
+            self._record_job(job)
 
-            # Start a thread to monitor the process and stream its output
+            # Start a thread to monitor the process and record its exit
             monitor_thread = threading.Thread(target=self._monitor_job_process, args=(job,))
             monitor_thread.daemon = True # Allow main program to exit even if threads are running
             self._threads[job_id] = monitor_thread
             monitor_thread.start()
 
-            self._save_jobs_to_disk()
             logger.info(f"Job {job.id} (PID: {job.pid}) launched successfully and is being monitored.")
             return job_id
         except FileNotFoundError:
@@ -310,7 +529,7 @@ class DefaultJobService:
             job.exit_code = -1 # Indicate command not found
             with self._lock:
                  self._jobs[job_id] = job # Still record the failed attempt
-            self._save_jobs_to_disk()
+            self._record_job(job)
             raise
         except Exception as e:
             logger.error(f"Failed to launch job {job.id} with command '{job.command_str}': {e}", exc_info=True)
@@ -318,7 +537,7 @@ class DefaultJobService:
             job.exit_code = -1 # Indicate launch error
             with self._lock:
                  self._jobs[job_id] = job
-            self._save_jobs_to_disk()
+            self._record_job(job)
             raise
 
     def get_status(self, job_id: str) -> Job | None:
@@ -327,10 +546,10 @@ class DefaultJobService:
             job = self._jobs.get(job_id)
         if job:
             logger.debug(f"Status for job {job_id}: {job.status}, PID: {job.pid}, Exit: {job.exit_code}")
-            # If job was RUNNING but process handle is gone (e.g. after restart), update status
-            if job.status == "RUNNING" and job._process_handle is None and job.pid is not None:
+            # Re-adopted jobs are RUNNING without a handle but have a watcher thread.
+            if job.status == "RUNNING" and job._process_handle is None and job.pid is not None and job_id not in self._threads:
                  # This indicates a stale "RUNNING" status, process might have finished externally
-                 # or service restarted. A more robust check would involve OS-level PID check.
+                 # or service restarted without a verifiable pidfile.
                  logger.warning(f"Job {job_id} (PID: {job.pid}) has status RUNNING but no active process handle. Consider it UNKNOWN_STALE.")
                  # job.status = "UNKNOWN_STALE" # Or try to determine actual status
                  # For now, we rely on the monitor thread to update status.
@@ -375,17 +594,110 @@ class DefaultJobService:
     def get_log_tail(self, job_id: str, n_lines: int = 20) -> list[str]:
         """
         Retrieves the last N lines of captured output for a job.
+        The log is read backwards from the end, so cost does not grow with log size.
         Args:
             job_id: The ID of the job.
             n_lines: The number of lines to retrieve from the tail of the log.
         Returns:
             A list of strings, each representing a line from the log tail.
         """
-        full_log = self.get_full_log(job_id)
-        if full_log.startswith("[Job not found]") or full_log.startswith("[Error reading output file"):
-            return [full_log] # Return the error message as the only line
-        lines = full_log.splitlines()
-        return lines[-n_lines:]
+        job = self.get_status(job_id)
+        if not job:
+            logger.warning(f"Log tail requested for non-existent job ID {job_id}")
+            return ["[Job not found]"]
+        if not job.output_file_path:
+            return ["[No output file found or job not started/completed]"]
+        if not _is_under_job_outputs(job.output_file_path):
+            logger.error(
+                "Refusing to read job %s log outside JOB_OUTPUTS_DIR: %s",
+                job_id,
+                job.output_file_path,
+            )
+            return ["[Error reading output file: path escapes job outputs directory]"]
+        if not job.output_file_path.exists():
+            return ["[No output file found or job not started/completed]"]
+        try:
+            return _read_tail_lines(job.output_file_path, n_lines)
+        except Exception as e:
+            logger.error(f"Error reading output file for job {job_id}: {e}", exc_info=True)
+            return [f"[Error reading output file: {e}]"]
+
+    def _followable_log_path(self, job_id: str) -> Path:
+        """Resolves the log path for ``follow_log``; raises ``KeyError``/``ValueError`` when unusable."""
+        job = self.get_status(job_id)
+        if not job:
+            raise KeyError(job_id)
+        if not job.output_file_path or not _is_under_job_outputs(job.output_file_path):
+            raise ValueError(f"Job {job_id} has no readable output file under JOB_OUTPUTS_DIR")
+        return job.output_file_path
+
+    def _is_job_active(self, job_id: str) -> bool:
+        with self._lock:
+            job = self._jobs.get(job_id)
+        return job is not None and job.status in ("PENDING", "RUNNING")
+
+    def follow_log(
+        self,
+        job_id: str,
+        offset: int = 0,
+        poll_interval: float = LOG_FOLLOW_POLL_INTERVAL,
+    ) -> Iterator[tuple[int, str]]:
+        """
+        Yields new log output for a job as ``(next_offset, text)`` pairs.
+
+        Starts at byte ``offset`` (pass the last ``next_offset`` to resume a
+        previous follow) and polls for growth while the job is PENDING/RUNNING;
+        returns once the job has stopped and the log is drained. Multi-byte
+        characters split across reads are decoded correctly.
+        Raises:
+            KeyError: If the job does not exist.
+            ValueError: If the job's log path is missing or escapes JOB_OUTPUTS_DIR.
+        """
+        path = self._followable_log_path(job_id)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            # Sample liveness before reading so output written just before exit is not lost.
+            active = self._is_job_active(job_id)
+            chunk = _read_log_chunk(path, offset) if path.exists() else b""
+            if chunk:
+                offset += len(chunk)
+                text = decoder.decode(chunk)
+                if text:
+                    # Bytes the decoder still holds (a split character) are not consumed yet.
+                    yield offset - len(decoder.getstate()[0]), text
+                continue
+            if not active:
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield offset, tail
+                return
+            time.sleep(poll_interval)
+
+    async def afollow_log(
+        self,
+        job_id: str,
+        offset: int = 0,
+        poll_interval: float = LOG_FOLLOW_POLL_INTERVAL,
+    ) -> AsyncIterator[tuple[int, str]]:
+        """Async variant of :meth:`follow_log`; file reads run in a worker thread."""
+        path = self._followable_log_path(job_id)
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            active = self._is_job_active(job_id)
+            chunk = await asyncio.to_thread(_read_log_chunk, path, offset) if path.exists() else b""
+            if chunk:
+                offset += len(chunk)
+                text = decoder.decode(chunk)
+                if text:
+                    # Bytes the decoder still holds (a split character) are not consumed yet.
+                    yield offset - len(decoder.getstate()[0]), text
+                continue
+            if not active:
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield offset, tail
+                return
+            await asyncio.sleep(poll_interval)
 
     def list_all(self) -> list[Job]:
         """Lists all jobs currently managed by the service."""
@@ -410,6 +722,8 @@ class DefaultJobService:
             logger.info(f"Job {job_id} is already stopped (status: {job.status}).")
             return "ALREADY_STOPPED"
 
+        # Jobs re-adopted after a restart have no Popen handle, only a verified pidfile.
+        start_time = None if job._process_handle else self._read_pid_file(job)
         if job._process_handle and job.pid:
             try:
                 logger.info(f"Attempting to terminate job {job.id} (PID: {job.pid}).")
@@ -426,22 +740,52 @@ class DefaultJobService:
                 job.updated_at = time.time()
                 job._process_handle = None # Clear handle
                 job.pid = None
-                self._save_jobs_to_disk()
+                self._remove_pid_file(job.id)
+                self._record_job(job)
                 logger.info(f"Job {job.id} terminated with exit code {job.exit_code}.")
                 return "TERMINATED"
             except Exception as e:
                 logger.error(f"Error terminating job {job.id} (PID: {job.pid}): {e}", exc_info=True)
                 job.status = "FAILED_TERMINATION" # A special status
                 job.updated_at = time.time()
-                self._save_jobs_to_disk()
+                self._record_job(job)
                 return "ERROR"
+        elif job.status == "RUNNING" and start_time is not None:
+            # Signal by PID; the pidfile check has just verified it still refers
+            # to the original process rather than a recycled PID.
+            pid = job.pid
+            try:
+                logger.info(f"Attempting to terminate re-adopted job {job.id} (PID: {pid}).")
+                with self._lock:
+                    job.status = "TERMINATED"
+                os.kill(pid, signal.SIGTERM)
+                deadline = time.monotonic() + 2
+                while time.monotonic() < deadline and _pid_matches(pid, start_time):
+                    time.sleep(0.05)
+                if _pid_matches(pid, start_time):
+                    logger.warning(f"Job {job.id} (PID: {pid}) did not terminate gracefully, sending SIGKILL.")
+                    os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass # Exited between the check and the signal
+            except Exception as e:
+                logger.error(f"Error terminating job {job.id} (PID: {pid}): {e}", exc_info=True)
+                job.status = "FAILED_TERMINATION"
+                job.updated_at = time.time()
+                self._record_job(job)
+                return "ERROR"
+            job.exit_code = None # Not our child; the exit status cannot be collected
+            job.pid = None
+            job.updated_at = time.time()
+            self._remove_pid_file(job.id)
+            self._record_job(job)
+            return "TERMINATED"
         else:
             logger.warning(f"Job {job.id} is {job.status} but has no process handle to terminate.")
             # If it was PENDING and never started, or RUNNING but handle lost (e.g. restart)
             job.status = "TERMINATED" # Assume it should be stopped
             job.exit_code = -1 # Indicate abnormal stop
             job.updated_at = time.time()
-            self._save_jobs_to_disk()
+            self._record_job(job)
             return "TERMINATED" # Or "UNKNOWN_STATE_STOPPED"
 
     def prune_completed(self) -> list[str]:
@@ -450,7 +794,7 @@ class DefaultJobService:
         with self._lock:
             job_ids_to_prune = [
                 job_id for job_id, job in self._jobs.items()
-                if job.status in ["COMPLETED", "FAILED", "TERMINATED", "FAILED_TERMINATION", "UNKNOWN_STALE"]
+                if job.status in TERMINAL_STATUSES
             ]
             for job_id in job_ids_to_prune:
                 job = self._jobs.pop(job_id, None)
@@ -468,11 +812,12 @@ class DefaultJobService:
                         except OSError as e:
                             logger.error(f"Error deleting output file for pruned job {job_id}: {e}", exc_info=True)
                 if job:
+                    self._remove_pid_file(job_id)
                     pruned_ids.append(job_id)
                     logger.info(f"Pruned job {job_id} with status {job.status}.")
 
         if pruned_ids:
-            self._save_jobs_to_disk() # Save changes after pruning
+            self._save_jobs_to_disk() # Compact: pruning shrinks the snapshot
         logger.info(f"Pruned {len(pruned_ids)} jobs: {pruned_ids}")
         return pruned_ids
 
@@ -50,6 +50,10 @@ if ENABLE_API_AUTH:
     assert SWARM_API_KEY is not None, "SWARM_API_KEY cannot be None when ENABLE_API_AUTH is True"
     assert SWARM_API_KEYS, "SWARM_API_KEYS cannot be empty when ENABLE_API_AUTH is True"
 
+# Tokens allowed on operator endpoints such as /v1/profile (CSV). Each must also
+# be an accepted API token; staff/superuser sessions are admins as well.
+SWARM_ADMIN_API_KEYS = [t.strip() for t in os.getenv("SWARM_ADMIN_API_KEYS", "").split(",") if t.strip()]
+
 SWARM_CONFIG_PATH = get_swarm_config_path()
 BLUEPRINT_DIRECTORY = get_blueprint_directory()
 
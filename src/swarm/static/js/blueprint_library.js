@@ -257,6 +257,12 @@ function safeHttpUrl(raw) {
     return '';
 }
 
+function formatBytes(n) {
+    if (n < 1024) return `${n} B`;
+    if (n < 1024 * 1024) return `${(n / 1024).toFixed(1)} KB`;
+    return `${(n / (1024 * 1024)).toFixed(1)} MB`;
+}
+
 function renderGithubCard(item) {
     const repo = escapeHtml(item.repo_full_name || 'unknown/repo');
     const repoHref = safeHttpUrl(item.repo_url);
@@ -267,8 +273,8 @@ function renderGithubCard(item) {
     const kind = item.kind || 'blueprint';
     const kindBadge = kind === 'mcp' ? '<span class="badge bg-info text-dark ms-2">MCP</span>' : '';
     const files = item.file_count != null ? `${item.file_count} file${item.file_count === 1 ? '' : 's'}` : '';
-    const lines = item.line_count != null ? `${item.line_count} lines` : '';
-    const metrics = (files || lines) ? `<small class="text-muted">${[files, lines].filter(Boolean).join(' • ')}</small>` : '';
+    const size = item.size_bytes != null ? formatBytes(item.size_bytes) : '';
+    const metrics = (files || size) ? `<small class="text-muted">${[files, size].filter(Boolean).join(' • ')}</small>` : '';
     const repoLink = repoHref
         ? `<a class="btn btn-outline-secondary btn-sm" href="${repoUrlAttr}" target="_blank" rel="noopener noreferrer">View Repo</a>`
         : `<span class="btn btn-outline-secondary btn-sm disabled" aria-disabled="true" title="No safe http(s) repo URL">View Repo</span>`;
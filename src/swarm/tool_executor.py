@@ -3,17 +3,27 @@ Tool execution utilities for the Swarm framework.
 Handles invoking agent functions/tools based on LLM requests.
 """
 
+import asyncio
+import contextlib
+import contextvars
+import functools
 import inspect  # To check for awaitables
 import json
 import logging
+import os
 import re
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Any
 
+from openai.types.chat import ChatCompletionMessageToolCall
+
 # Import necessary types from the Swarm framework
 from .types import (
     Agent,
     AgentFunction,  # Type hint for functions/tools
-    ChatCompletionMessageToolCall,
     Response,  # Structure for returning results of multiple tool calls
     Result,  # Structure for returning result of a single tool call
 )
@@ -42,17 +52,11 @@ def redact_sensitive_data(data: Any) -> Any:
     Top-level strings also get pattern / URI scrubbing (log lines may be plain
     text rather than structured dicts).
     """
-    from swarm.utils.redact import (
-        _COMPILED_SENSITIVE_PATTERNS,
-        redact_sensitive_data as _shared_redact,
-        redact_uri_credentials,
-    )
+    from swarm.utils.redact import redact_sensitive_data as _shared_redact
+    from swarm.utils.redact import redact_text
 
     if isinstance(data, str):
-        redacted = data
-        for pattern in _COMPILED_SENSITIVE_PATTERNS:
-            redacted = pattern.sub("[REDACTED]", redacted)
-        redacted = redact_uri_credentials(redacted)
+        redacted = redact_text(data)
         # Extra log-oriented heuristics (Basic auth / JWT-ish prefixes).
         if redacted == data and re.search(r"(?:sk-|Bearer |Basic |eyJ)", data):
             return "***REDACTED***"
@@ -74,6 +78,68 @@ if not logger.handlers:
 # Standard name used for injecting context variables into tool calls
 __CTX_VARS_NAME__ = "context_variables"
 
+# Default cap on concurrently running tool calls for one agent turn; an agent
+# can lower or raise it via Agent.max_tool_concurrency.
+DEFAULT_TOOL_CONCURRENCY = int(os.environ.get("SWARM_TOOL_CONCURRENCY", "8"))
+# Worker threads shared by all synchronous tools (kept off the event loop).
+TOOL_THREAD_POOL_SIZE = int(os.environ.get("SWARM_TOOL_THREADS", str(min(32, (os.cpu_count() or 1) + 4))))
+
+_tool_thread_pool: ThreadPoolExecutor | None = None
+_tool_thread_pool_lock = threading.Lock()
+
+
+def _get_tool_thread_pool() -> ThreadPoolExecutor:
+    """Lazily create the bounded pool that runs synchronous tools."""
+    global _tool_thread_pool
+    if _tool_thread_pool is None:
+        with _tool_thread_pool_lock:
+            if _tool_thread_pool is None:
+                _tool_thread_pool = ThreadPoolExecutor(
+                    max_workers=TOOL_THREAD_POOL_SIZE, thread_name_prefix="swarm-tool"
+                )
+    return _tool_thread_pool
+
+
+@dataclass(frozen=True)
+class _ToolCallMetadata:
+    """Per-function facts that used to be recomputed on every call."""
+
+    accepts_context: bool
+    is_async: bool
+
+
+# Keyed weakly on the function (or a bound method's __func__) so tools defined
+# per-agent are not kept alive by the cache.
+_TOOL_METADATA_CACHE: "weakref.WeakKeyDictionary[Any, _ToolCallMetadata]" = weakref.WeakKeyDictionary()
+
+
+def _inspect_tool(func: AgentFunction, tool_name: str) -> _ToolCallMetadata:
+    try:
+        accepts_context = __CTX_VARS_NAME__ in inspect.signature(func).parameters
+    except (ValueError, TypeError) as e:
+        # Handle cases where signature cannot be inspected (e.g., built-ins)
+        logger.warning(f"Could not inspect signature for tool '{tool_name}': {e}. Cannot inject context automatically.")
+        accepts_context = False
+    return _ToolCallMetadata(
+        accepts_context=accepts_context,
+        is_async=inspect.iscoroutinefunction(func),
+    )
+
+
+def get_tool_call_metadata(func: AgentFunction, tool_name: str) -> _ToolCallMetadata:
+    """Return cached call metadata for ``func``, inspecting it on first use."""
+    key = getattr(func, "__func__", func)
+    try:
+        return _TOOL_METADATA_CACHE[key]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable or not weak-referenceable: inspect every time
+        return _inspect_tool(func, tool_name)
+    metadata = _inspect_tool(func, tool_name)
+    with contextlib.suppress(TypeError):
+        _TOOL_METADATA_CACHE[key] = metadata
+    return metadata
+
 
 def handle_function_result(result: Any, debug: bool) -> Result:
     """
@@ -129,20 +195,64 @@ def handle_function_result(result: Any, debug: bool) -> Result:
             raise TypeError(f"Tool function returned a result of type {type(result)} that could not be serialized to string/JSON: {result}") from e
 
 
+async def _invoke_tool(
+    func_to_call: AgentFunction,
+    metadata: _ToolCallMetadata,
+    args: dict[str, Any],
+    tool_name: str,
+    tool_call_id: str,
+    debug: bool,
+) -> Any:
+    """Run one tool: await coroutine functions, offload sync ones to the tool pool."""
+    logger.info(f"Executing tool '{tool_name}' (ID: '{tool_call_id}') with args: {redact_sensitive_data(args)}")
+    if metadata.is_async:
+        raw_result = func_to_call(**args)
+    else:
+        # Sync tools would block every other stream on the loop; run them in
+        # the bounded pool with the caller's contextvars.
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func_to_call, **args)
+        raw_result = await loop.run_in_executor(_get_tool_thread_pool(), call)
+    # Sync wrappers (e.g. Tool objects) may still hand back an awaitable.
+    if inspect.isawaitable(raw_result):
+        if debug: logger.debug(f"Awaiting async result for tool '{tool_name}' (ID: '{tool_call_id}')")
+        raw_result = await raw_result
+    return raw_result
+
+
+def _merge_context_changes(target: dict, before: dict, after: dict) -> None:
+    """Apply the keys one tool call set or removed in its context copy to ``target``."""
+    for key in before.keys() - after.keys():
+        target.pop(key, None)
+    for key, value in after.items():
+        if key not in before or before[key] is not value:
+            target[key] = value
+
+
 async def handle_tool_calls(
     tool_calls: list[ChatCompletionMessageToolCall], # Expect list of Pydantic models
     functions: list[AgentFunction], # Available functions/tools for the agent
     context_variables: dict, # Current context
-    debug: bool # Debug logging flag
+    debug: bool, # Debug logging flag
+    agent: Agent | None = None, # Agent making the calls (for its concurrency cap)
 ) -> Response:
     """
     Execute a list of tool calls requested by the LLM and aggregate their results.
 
+    Calls in one turn are independent, so they run concurrently, at most
+    ``agent.max_tool_concurrency`` (default ``DEFAULT_TOOL_CONCURRENCY``) at a
+    time. Synchronous tools run in a bounded thread pool instead of on the
+    event loop. Tools that take ``context_variables`` each get their own
+    copy, so concurrent calls never mutate a shared dict; their changes,
+    returned context updates and handoffs are applied in ``tool_calls`` order
+    once every call has finished (the last handoff wins).
+
     Args:
         tool_calls: A list of ChatCompletionMessageToolCall objects requested by the LLM.
         functions: A list of available functions/tools (callables or dicts) for the current agent.
         context_variables: A dictionary containing the current context variables.
         debug: If True, enable detailed debugging logs.
+        agent: The agent that requested the calls; only its concurrency cap is used.
 
     Returns:
         Response: An object containing a list of messages (tool results) to be added
@@ -172,7 +282,19 @@ async def handle_tool_calls(
     # Initialize Response object to aggregate results
     aggregated_response = Response(messages=[], agent=None, context_variables={})
 
-    # Process each requested tool call
+    # One slot per valid tool call, in request order: either a ready message
+    # (validation error) or a pending execution filled in below.
+    slots: list[dict[str, Any] | tuple[str, str, int, dict | None]] = []
+    executions: list[Any] = []
+    context_before = dict(context_variables)
+
+    max_concurrency = getattr(agent, "max_tool_concurrency", None) or DEFAULT_TOOL_CONCURRENCY
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def _run_limited(*invoke_args: Any) -> Any:
+        async with semaphore:
+            return await _invoke_tool(*invoke_args)
+
     for tool_call in tool_calls:
         # Ensure it's the expected Pydantic model type
         if not isinstance(tool_call, _TOOL_CALL_TYPES):
@@ -188,7 +310,7 @@ async def handle_tool_calls(
         if not tool_name or not tool_call_id:
             logger.error(f"Invalid tool call data: Missing name ('{tool_name}') or id ('{tool_call_id}'). Skipping.")
             # Optionally add an error message to the response
-            aggregated_response.messages.append({
+            slots.append({
                 "role": "tool", "tool_call_id": tool_call_id or "missing_id", "name": tool_name or "missing_name",
                 "content": json.dumps({"error": "Invalid tool call data received from LLM."})
             })
@@ -199,7 +321,7 @@ async def handle_tool_calls(
         if not func_to_call:
             logger.error(f"Tool '{tool_name}' requested by LLM (ID: '{tool_call_id}') not found in agent's available functions.")
             # Add error message to history
-            aggregated_response.messages.append({
+            slots.append({
                 "role": "tool", "tool_call_id": tool_call_id, "name": tool_name,
                 "content": json.dumps({"error": f"Tool '{tool_name}' is not available."}) # Use JSON for content
             })
@@ -216,27 +338,32 @@ async def handle_tool_calls(
             args = {}
 
         # Inject context variables if the function expects them
+        metadata = get_tool_call_metadata(func_to_call, tool_name)
+        call_context = None
+        if metadata.accepts_context:
+            call_context = dict(context_variables)
+            args[__CTX_VARS_NAME__] = call_context
+            if debug: logger.debug(f"Injecting context variables into tool '{tool_name}'.")
+
+        slots.append((tool_call_id, tool_name, len(executions), call_context))
+        executions.append(_run_limited(func_to_call, metadata, args, tool_name, tool_call_id, debug))
+
+    # --- Execute the functions/tools concurrently ---
+    outcomes = await asyncio.gather(*executions, return_exceptions=True)
+
+    for slot in slots:
+        if isinstance(slot, dict):
+            aggregated_response.messages.append(slot)
+            continue
+        tool_call_id, tool_name, index, call_context = slot
+        raw_result = outcomes[index]
+        if call_context is not None:
+            _merge_context_changes(context_variables, context_before, call_context)
         try:
-             sig = inspect.signature(func_to_call)
-             if __CTX_VARS_NAME__ in sig.parameters:
-                 args[__CTX_VARS_NAME__] = context_variables
-                 if debug: logger.debug(f"Injecting context variables into tool '{tool_name}'.")
-        except (ValueError, TypeError) as e:
-             # Handle cases where signature cannot be inspected (e.g., built-ins)
-             logger.warning(f"Could not inspect signature for tool '{tool_name}': {e}. Cannot inject context automatically.")
-
-
-        # --- Execute the function/tool ---
-        try:
-            logger.info(f"Executing tool '{tool_name}' (ID: '{tool_call_id}') with args: {redact_sensitive_data(args)}")
-            # Execute the function with parsed arguments
-            raw_result = func_to_call(**args)
-
-            # Handle asynchronous functions/tools if necessary
-            if inspect.isawaitable(raw_result):
-                if debug: logger.debug(f"Awaiting async result for tool '{tool_name}' (ID: '{tool_call_id}')")
-                raw_result = await raw_result
-            # else: (sync function executed directly)
+            if isinstance(raw_result, BaseException):
+                # Tool errors land in the handler below; CancelledError and
+                # other BaseExceptions propagate as before.
+                raise raw_result
 
             # Process the raw result (handles handoffs, serialization)
             processed_result: Result = handle_function_result(raw_result, debug)
@@ -262,7 +389,7 @@ async def handle_tool_calls(
                  if aggregated_response.agent and aggregated_response.agent != processed_result.agent:
                       logger.warning(f"Multiple agent handoffs detected in one turn. Last handoff to '{getattr(processed_result.agent, 'name', 'UnnamedAgent')}' takes precedence.")
                  aggregated_response.agent = processed_result.agent
-                 # Update context immediately for subsequent steps within this turn if needed
+                 # Update context for the caller's next step
                  context_variables["active_agent_name"] = getattr(processed_result.agent, 'name', None)
                  logger.debug(f"Agent handoff triggered by tool '{tool_name}' to agent '{context_variables['active_agent_name']}'.")
 
@@ -280,3 +407,91 @@ async def handle_tool_calls(
     # Return the aggregated response containing all tool result messages and potential updates
     logger.debug(f"Finished handling tool calls. {len(aggregated_response.messages)} result messages generated.")
     return aggregated_response
+
+
+# Upper bound on model round trips in run_tool_loop before giving up on a final answer.
+DEFAULT_MAX_TOOL_TURNS = int(os.environ.get("SWARM_MAX_TOOL_TURNS", "10"))
+
+
+def _tool_spec(func: AgentFunction) -> dict[str, Any]:
+    """OpenAI ``tools`` entry for ``func``, hiding the injected context parameter."""
+    from .util import function_to_json
+
+    spec = function_to_json(func)
+    parameters = spec["function"]["parameters"]
+    parameters["properties"].pop(__CTX_VARS_NAME__, None)
+    if __CTX_VARS_NAME__ in parameters["required"]:
+        parameters["required"].remove(__CTX_VARS_NAME__)
+    return spec
+
+
+async def run_tool_loop(
+    client: Any,
+    model: str,
+    agent: Agent,
+    messages: list[dict[str, Any]],
+    context_variables: dict | None = None,
+    *,
+    max_turns: int | None = None,
+    debug: bool = False,
+) -> Response:
+    """
+    Drive a chat-completions function-calling loop for ``agent``.
+
+    Each turn sends the history plus the active agent's ``functions`` as tools.
+    The tool calls in the reply are executed by :func:`handle_tool_calls`
+    (concurrently, capped by the agent) and their results appended, until the
+    model answers without tool calls or ``max_turns`` round trips are spent.
+    A tool that returns an Agent hands the following turns over to it.
+
+    Args:
+        client: An ``openai.AsyncOpenAI``-compatible client.
+        model: Model name passed to ``chat.completions.create``.
+        agent: The starting agent (``swarm.types.Agent``).
+        messages: Conversation history; not modified.
+        context_variables: Shared context injected into tools that accept it.
+        max_turns: Round-trip cap (default ``DEFAULT_MAX_TOOL_TURNS``).
+        debug: If True, enable detailed debugging logs.
+
+    Returns:
+        Response: The messages produced by the loop (assistant and tool
+                  messages, in order), the final active agent and the
+                  resulting context variables.
+    """
+    context_variables = dict(context_variables or {})
+    history = list(messages)
+    produced: list[dict[str, Any]] = []
+    active_agent = agent
+    turns = max_turns or DEFAULT_MAX_TOOL_TURNS
+
+    for _turn in range(turns):
+        instructions = active_agent.instructions() if callable(active_agent.instructions) else active_agent.instructions
+        request: dict[str, Any] = {
+            "model": model,
+            "messages": ([{"role": "system", "content": instructions}] if instructions else []) + history,
+        }
+        if active_agent.functions:
+            request["tools"] = [_tool_spec(f) for f in active_agent.functions]
+            request["parallel_tool_calls"] = active_agent.parallel_tool_calls
+            if active_agent.tool_choice:
+                request["tool_choice"] = active_agent.tool_choice
+        completion = await client.chat.completions.create(**request)
+        reply = completion.choices[0].message
+        assistant_message = reply.model_dump(exclude_none=True)
+        history.append(assistant_message)
+        produced.append(assistant_message)
+        if not reply.tool_calls:
+            break
+
+        tool_response = await handle_tool_calls(
+            list(reply.tool_calls), active_agent.functions, context_variables, debug, agent=active_agent
+        )
+        history.extend(tool_response.messages)
+        produced.extend(tool_response.messages)
+        context_variables.update(tool_response.context_variables)
+        if tool_response.agent is not None:
+            active_agent = tool_response.agent
+    else:
+        logger.warning(f"Tool loop for agent '{agent.name}' stopped after {turns} turns without a final answer.")
+
+    return Response(messages=produced, agent=active_agent, context_variables=context_variables)
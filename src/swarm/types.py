@@ -16,6 +16,7 @@ class Agent(BaseModel):
     tool_choice: str = None
     # parallel_tool_calls: bool = True  # Commented out as in your version
     parallel_tool_calls: bool = False
+    max_tool_concurrency: Optional[int] = None  # Cap on concurrently executing tool calls (None = executor default)
     mcp_servers: Optional[List[str]] = None  # List of MCP server names
     env_vars: Optional[Dict[str, str]] = None  # Environment variables required
     response_format: Optional[Dict[str, Any]] = None  # Structured Output
@@ -30,6 +30,9 @@ from swarm.views.api_views import (
     CustomBlueprintsView,
     MarketplaceGitHubBlueprintsView,
     MarketplaceGitHubMCPConfigsView,
+    MetricsView,
+    ProfileView,
+    UsageView,
 )
 from swarm.views.api_views import ModelsListView as OpenAIModelsView
 from swarm.views.blueprint_library_views import (
@@ -69,6 +72,13 @@ urlpatterns = [
     # Lightweight liveness probe (no auth) — used by the Fly health check.
     path("health", HealthCheckView.as_view(), name="health"),
     path("health/", HealthCheckView.as_view()),
+    # Prometheus scrape target (authenticated when ENABLE_API_AUTH is on).
+    path("metrics", MetricsView.as_view(), name="metrics"),
+    path("metrics/", MetricsView.as_view()),
+    path("v1/profile", ProfileView.as_view(), name="profile"),
+    path("v1/profile/", ProfileView.as_view()),
+    path("v1/usage", UsageView.as_view(), name="usage"),
+    path("v1/usage/", UsageView.as_view()),
     # Session Explorer web UI (browse stateful /v1/responses sessions + delegation timelines)
     path("sessions/", session_explorer, name="session-explorer"),
     path("sessions/<str:response_id>/", session_detail, name="session-detail"),
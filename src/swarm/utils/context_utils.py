@@ -23,7 +23,7 @@ def _is_valid_message(msg: Any) -> bool:
         return False
     role = msg.get("role")
     if not role or not isinstance(role, str):
-        logger.warning(f"Skipping msg missing role: {str(msg)[:150]}")
+        logger.warning("Skipping msg missing role: %s", str(msg)[:150])
         return False
     content = msg.get("content")
     tool_calls = msg.get("tool_calls")
@@ -39,7 +39,7 @@ def _is_valid_message(msg: Any) -> bool:
     else:
         is_valid = False
     if not is_valid:
-        logger.warning(f"Skipping msg failing validity check for role '{role}': {str(msg)[:150]}")
+        logger.warning("Skipping msg failing validity check for role '%s': %s", role, str(msg)[:150])
     return is_valid
 # --- End Helper ---
 
@@ -58,7 +58,7 @@ def get_token_count(text: Any, model: str) -> int:
         else:
             processed_text = str(text) if text is not None else ""
     except Exception as e:
-        logger.error(f"Error preprocessing token count: {e}.")
+        logger.error("Error preprocessing token count: %s.", e)
         processed_text = str(text) if text else ""
     if not processed_text:
         return 0
@@ -69,10 +69,10 @@ def get_token_count(text: Any, model: str) -> int:
             try:
                 return len(tiktoken.get_encoding("cl100k_base").encode(processed_text))
             except Exception as e:
-                logger.error(f"tiktoken failed: {e}. Word count.")
+                logger.error("tiktoken failed: %s. Word count.", e)
                 return len(processed_text.split()) + 5
         except Exception as e:
-            logger.error(f"tiktoken error: {e}. Word count.")
+            logger.error("tiktoken error: %s. Word count.", e)
             return len(processed_text.split()) + 5
     return len(processed_text.split()) + 5
 
@@ -83,7 +83,7 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
     system_found = False
     valid_messages = [msg for msg in messages if _is_valid_message(msg)]
     if len(valid_messages) != len(messages):
-        logger.info(f"Filtered {len(messages) - len(valid_messages)} invalid msgs.")
+        logger.info("Filtered %s invalid msgs.", len(messages) - len(valid_messages))
     for msg in valid_messages:
          if msg.get("role") == "system" and not system_found:
              system_msgs.append(msg)
@@ -93,7 +93,7 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
     try:
         system_tokens = sum(get_token_count(msg, model) for msg in system_msgs)
     except Exception as e:
-        logger.error(f"Error calc system tokens: {e}.")
+        logger.error("Error calc system tokens: %s.", e)
         system_tokens = 0
     target_msg_count = max(0, max_messages - len(system_msgs))
     target_token_count = max(0, max_tokens - system_tokens)
@@ -106,13 +106,13 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
     try:
         msg_tokens = [(msg, get_token_count(msg, model)) for msg in non_system_msgs]
     except Exception as e:
-        logger.critical(f"Error preparing msg_tokens: {e}", exc_info=True)
+        logger.critical("Error preparing msg_tokens: %s", e, exc_info=True)
         return system_msgs
     current_total_tokens = sum(t for _, t in msg_tokens)
     if len(non_system_msgs) <= target_msg_count and current_total_tokens <= target_token_count:
         logger.info("History fits.")
         return system_msgs + non_system_msgs
-    logger.info(f"Sophisticated truncation. Target: {target_msg_count} msgs, {target_token_count} tokens.")
+    logger.info("Sophisticated truncation. Target: %s msgs, %s tokens.", target_msg_count, target_token_count)
     truncated = []
     total_tokens = 0
     kept_indices = set()
@@ -120,7 +120,7 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
 
     while i >= 0:
         if i in kept_indices:
-            logger.debug(f"  [Loop Skip] Idx {i} already kept.")
+            logger.debug("  [Loop Skip] Idx %s already kept.", i)
             i -= 1
             continue
         if len(truncated) >= target_msg_count:
@@ -128,14 +128,14 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
             break
 
         try: msg, tokens = msg_tokens[i]; assert isinstance(tokens, int | float) and tokens >= 0
-        except (IndexError, AssertionError): tokens = 9999; logger.warning(f"Bad tokens at {i}")
-        except Exception as e: logger.error(f"  [Loop Error] {i}: {e}."); break
+        except (IndexError, AssertionError): tokens = 9999; logger.warning("Bad tokens at %s", i)
+        except Exception as e: logger.error("  [Loop Error] %s: %s.", i, e); break
 
         current_role = msg.get("role")
-        logger.debug(f"  [Loop Eval] Idx={i}, Role={current_role}, Tokens={tokens}. Kept: Msgs={len(truncated)}, Tokens={total_tokens}")
+        logger.debug("  [Loop Eval] Idx=%s, Role=%s, Tokens=%s. Kept: Msgs=%s, Tokens=%s", i, current_role, tokens, len(truncated), total_tokens)
 
         if tokens > target_token_count - total_tokens and len(truncated) + 1 > target_msg_count:
-             logger.warning(f"  [Pre-Check Skip] Msg {i} ({tokens}) exceeds remaining budget ({target_token_count - total_tokens}) and msg count. Skipping.")
+             logger.warning("  [Pre-Check Skip] Msg %s (%s) exceeds remaining budget (%s) and msg count. Skipping.", i, tokens, target_token_count - total_tokens)
              i -= 1
              continue
 
@@ -143,7 +143,7 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
 
         # Case 1: Tool message
         if current_role == "tool" and "tool_call_id" in msg:
-            tool_call_id = msg["tool_call_id"]; logger.debug(f"    -> Case 1: Tool Msg (ID: {tool_call_id})")
+            tool_call_id = msg["tool_call_id"]; logger.debug("    -> Case 1: Tool Msg (ID: %s)", tool_call_id)
             assistant_idx = i - 1; pair_found = False; search_depth = 0; max_search_depth = 10
             while assistant_idx >= 0 and search_depth < max_search_depth:
                  if assistant_idx in kept_indices:
@@ -154,7 +154,7 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
                      prev_msg, prev_tokens = msg_tokens[assistant_idx]
                      assert isinstance(prev_tokens, int | float) and prev_tokens >= 0
                  except Exception as e:
-                     logger.warning(f"Bad tokens at {assistant_idx}: {e}")
+                     logger.warning("Bad tokens at %s: %s", assistant_idx, e)
                      prev_tokens = 9999
                  if prev_msg.get("role") == "assistant" and isinstance(prev_msg.get("tool_calls"), list):
                      assistant_tool_calls = prev_msg.get("tool_calls", [])
@@ -164,18 +164,18 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
                           is_single_call_assistant = len(assistant_tool_calls) == 1
                           pair_found = True
                           if not is_single_call_assistant:
-                              logger.debug(f"      Found assistant pair at {assistant_idx}, but it has multiple tool calls ({len(assistant_tool_calls)}). Deferring to Case 2.")
+                              logger.debug("      Found assistant pair at %s, but it has multiple tool calls (%s). Deferring to Case 2.", assistant_idx, len(assistant_tool_calls))
                               # Do not attempt pair formation here, let Case 2 handle the block later
                           else:
                               # Assistant only has this one call, proceed with pairing check
                               pair_total_tokens = tokens + prev_tokens; pair_msg_count = 2
-                              logger.debug(f"      Found single-call assistant pair at {assistant_idx}. Pair cost={pair_total_tokens}, Pair msgs={pair_msg_count}")
+                              logger.debug("      Found single-call assistant pair at %s. Pair cost=%s, Pair msgs=%s", assistant_idx, pair_total_tokens, pair_msg_count)
                               check_token_fits = (total_tokens + pair_total_tokens <= target_token_count)
                               check_msg_fits = (len(truncated) + pair_msg_count <= target_msg_count)
-                              logger.debug(f"      Budget Check: (CurrentTokens={total_tokens} + PairTokens={pair_total_tokens} <= TargetTokens={target_token_count}) -> {check_token_fits}")
-                              logger.debug(f"      Budget Check: (CurrentMsgs={len(truncated)} + PairMsgs={pair_msg_count} <= TargetMsgs={target_msg_count}) -> {check_msg_fits}")
+                              logger.debug("      Budget Check: (CurrentTokens=%s + PairTokens=%s <= TargetTokens=%s) -> %s", total_tokens, pair_total_tokens, target_token_count, check_token_fits)
+                              logger.debug("      Budget Check: (CurrentMsgs=%s + PairMsgs=%s <= TargetMsgs=%s) -> %s", len(truncated), pair_msg_count, target_msg_count, check_msg_fits)
                               if check_token_fits and check_msg_fits:
-                                   logger.info(f"      Action: KEEPING Pair T(idx {i})+A(idx {assistant_idx})")
+                                   logger.debug("      Action: KEEPING Pair T(idx %s)+A(idx %s)", i, assistant_idx)
                                    truncated.insert(0, prev_msg)
                                    truncated.insert(1, msg)
                                    total_tokens += pair_total_tokens
@@ -196,7 +196,7 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
 
         # Case 2: Assistant message with tool calls
         elif current_role == "assistant" and isinstance(msg.get("tool_calls"), list) and msg["tool_calls"]:
-             logger.debug(f"    -> Case 2: Assistant w/ Tools at index {i}")
+             logger.debug("    -> Case 2: Assistant w/ Tools at index %s", i)
              assistant_tokens = tokens; expected_tool_ids = {tc.get("id") for tc in msg.get("tool_calls") if isinstance(tc, dict)}
              found_tools = []; found_indices = []; found_tokens = 0; j = i + 1
              while j < len(non_system_msgs):
@@ -207,7 +207,7 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
                       tool_msg, tool_tokens_fwd = msg_tokens[j]
                       assert isinstance(tool_tokens_fwd, int | float) and tool_tokens_fwd >= 0
                   except Exception as e:
-                      logger.warning(f"Bad tokens at {j}: {e}")
+                      logger.warning("Bad tokens at %s: %s", j, e)
                       tool_tokens_fwd = 9999
                   tool_msg_call_id = tool_msg.get("tool_call_id")
                   if tool_msg.get("role") == "tool" and tool_msg_call_id in expected_tool_ids:
@@ -219,18 +219,18 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
                   j += 1
              pair_total_tokens = assistant_tokens + found_tokens
              pair_msg_count = 1 + len(found_tools)
-             logger.debug(f"      Found {len(found_tools)} tools for {len(expected_tool_ids)} calls. Pair Cost={pair_total_tokens}, Pair Len={pair_msg_count}.")
+             logger.debug("      Found %s tools for %s calls. Pair Cost=%s, Pair Len=%s.", len(found_tools), len(expected_tool_ids), pair_total_tokens, pair_msg_count)
              all_tools_found = (len(found_indices) == len(expected_tool_ids))
              if not all_tools_found:
                  logger.debug("      Did not find all expected tools for this assistant call.")
 
              check_token_fits = (total_tokens + pair_total_tokens <= target_token_count)
              check_msg_fits = (len(truncated) + pair_msg_count <= target_msg_count)
-             logger.debug(f"      Budget Check: (CurrentTokens={total_tokens} + PairTokens={pair_total_tokens} <= TargetTokens={target_token_count}) -> {check_token_fits}")
-             logger.debug(f"      Budget Check: (CurrentMsgs={len(truncated)} + PairMsgs={pair_msg_count} <= TargetMsgs={target_msg_count}) -> {check_msg_fits}")
+             logger.debug("      Budget Check: (CurrentTokens=%s + PairTokens=%s <= TargetTokens=%s) -> %s", total_tokens, pair_total_tokens, target_token_count, check_token_fits)
+             logger.debug("      Budget Check: (CurrentMsgs=%s + PairMsgs=%s <= TargetMsgs=%s) -> %s", len(truncated), pair_msg_count, target_msg_count, check_msg_fits)
 
              if all_tools_found and check_token_fits and check_msg_fits:
-                  logger.info(f"    -> Action: KEEPING Pair A(idx {i})+Tools({found_indices})")
+                  logger.debug("    -> Action: KEEPING Pair A(idx %s)+Tools(%s)", i, found_indices)
                   truncated.insert(0, msg)
                   kept_indices.add(i)
                   insert_idx = 1
@@ -243,7 +243,7 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
                            insert_idx += 1
                            added_tool_count += 1
                       else:
-                          logger.error(f"      Consistency Error! Tool index {tool_idx} already kept.")
+                          logger.error("      Consistency Error! Tool index %s already kept.", tool_idx)
                   total_tokens += pair_total_tokens
                   i -= 1
                   action_taken_for_i = True
@@ -252,43 +252,43 @@ def _truncate_sophisticated(messages: list[dict[str, Any]], model: str, max_toke
                   single_token_fits = total_tokens + tokens <= target_token_count
                   single_msg_fits = len(truncated) + 1 <= target_msg_count
                   if single_token_fits and single_msg_fits:
-                       logger.info(f"    -> Action: KEEPING SINGLE Assistant {i} (pair failed/incomplete).")
+                       logger.debug("    -> Action: KEEPING SINGLE Assistant %s (pair failed/incomplete).", i)
                        truncated.insert(0, msg)
                        total_tokens += tokens
                        kept_indices.add(i)
                        i -= 1
                        action_taken_for_i = True
                   else:
-                       logger.debug(f"      Cannot keep single assistant {i} either (Tokens fit: {single_token_fits}, Msgs fit: {single_msg_fits}).")
+                       logger.debug("      Cannot keep single assistant %s either (Tokens fit: %s, Msgs fit: %s).", i, single_token_fits, single_msg_fits)
 
         # Case 3: Regular message (User or Assistant w/o tool calls)
         elif not action_taken_for_i:
-             logger.debug(f"    -> Case 3: Regular Message at index {i}")
+             logger.debug("    -> Case 3: Regular Message at index %s", i)
              single_token_fits = total_tokens + tokens <= target_token_count
              single_msg_fits = len(truncated) + 1 <= target_msg_count
              if single_token_fits and single_msg_fits:
-                  logger.info(f"    -> Action: KEEPING SINGLE message {i}")
+                  logger.debug("    -> Action: KEEPING SINGLE message %s", i)
                   truncated.insert(0, msg)
                   total_tokens += tokens
                   kept_indices.add(i)
                   i -= 1
                   action_taken_for_i = True
              else:
-                  logger.info(f"    -> Action: SKIPPING message {i} (Tokens fit: {single_token_fits}, Msgs fit: {single_msg_fits}). Stopping.")
+                  logger.debug("    -> Action: SKIPPING message %s (Tokens fit: %s, Msgs fit: %s). Stopping.", i, single_token_fits, single_msg_fits)
                   break
 
         # Make sure index 'i' decreases if no action modified it and loop didn't break
         if not action_taken_for_i:
-             logger.debug(f"  [Loop Default Decrement] No action/break for index {i}.")
+             logger.debug("  [Loop Default Decrement] No action/break for index %s.", i)
              i -= 1
 
     final_messages = system_msgs + truncated
     try:
         final_token_check = sum(get_token_count(m, model) for m in final_messages)
     except Exception as e:
-        logger.error(f"Error final token check: {e}.")
+        logger.error("Error final token check: %s.", e)
         final_token_check = -1
-    logger.info(f"Sophisticated truncation result: {len(final_messages)} msgs ({len(system_msgs)} sys, {len(truncated)} non-sys), ~{final_token_check} tokens.")
+    logger.info("Sophisticated truncation result: %s msgs (%s sys, %s non-sys), ~%s tokens.", len(final_messages), len(system_msgs), len(truncated), final_token_check)
     return final_messages
 
 
@@ -296,26 +296,26 @@ def _truncate_simple(messages: list[dict[str, Any]], model: str, max_tokens: int
     # --- Simple Truncation (Unchanged) ---
     system_msgs = []; non_system_msgs = []; system_found = False
     valid_messages = [msg for msg in messages if _is_valid_message(msg)]
-    if len(valid_messages) != len(messages): logger.info(f"Simple Mode: Filtered {len(messages) - len(valid_messages)} invalid msgs.")
+    if len(valid_messages) != len(messages): logger.info("Simple Mode: Filtered %s invalid msgs.", len(messages) - len(valid_messages))
     for msg in valid_messages:
          if msg.get("role") == "system" and not system_found: system_msgs.append(msg); system_found = True
          elif msg.get("role") != "system": non_system_msgs.append(msg)
     try: system_tokens = sum(get_token_count(msg, model) for msg in system_msgs)
-    except Exception as e: logger.error(f"Simple Mode: Error calc system tokens: {e}."); system_tokens = 0
+    except Exception as e: logger.error("Simple Mode: Error calc system tokens: %s.", e); system_tokens = 0
     target_msg_count = max(0, max_messages - len(system_msgs)); target_token_count = max(0, max_tokens - system_tokens)
     if len(system_msgs) > max_messages or system_tokens > max_tokens: logger.warning("Simple Mode: System msgs exceed limits."); return []
     if not non_system_msgs: logger.info("Simple Mode: No valid non-system messages."); return system_msgs
     result_non_system = []; current_tokens = 0; current_msg_count = 0
     for msg_index, msg in reversed(list(enumerate(non_system_msgs))):
         try: msg_tokens = get_token_count(msg, model); assert isinstance(msg_tokens, int | float) and msg_tokens >= 0
-        except Exception as e: logger.error(f"Simple Mode: Error token count msg idx {msg_index}: {e}. High cost."); msg_tokens = 9999
+        except Exception as e: logger.error("Simple Mode: Error token count msg idx %s: %s. High cost.", msg_index, e); msg_tokens = 9999
         if (current_msg_count + 1 <= target_msg_count and current_tokens + msg_tokens <= target_token_count):
             result_non_system.append(msg); current_tokens += msg_tokens; current_msg_count += 1
         else: break
     final_result = system_msgs + list(reversed(result_non_system))
     try: final_token_check = sum(get_token_count(m, model) for m in final_result)
-    except Exception as e: logger.error(f"Simple Mode: Error final token check: {e}."); final_token_check = -1
-    logger.info(f"Simple truncation result: {len(final_result)} messages ({len(system_msgs)} sys), ~{final_token_check} tokens.")
+    except Exception as e: logger.error("Simple Mode: Error final token check: %s.", e); final_token_check = -1
+    logger.info("Simple truncation result: %s messages (%s sys), ~%s tokens.", len(final_result), len(system_msgs), final_token_check)
     return final_result
 
 
@@ -326,22 +326,22 @@ def truncate_message_history(messages: list[dict[str, Any]], model: str, max_tok
         return []
     truncation_mode = os.getenv("SWARM_TRUNCATION_MODE", "pairs").lower()
     mode_name = "Sophisticated (Pair-Preserving)" if truncation_mode == "pairs" else "Simple (Recent Only)"
-    logger.info(f"--- Starting Truncation --- Mode: {mode_name}, Max Tokens: {max_tokens}, Max Messages: {max_messages}, Input Msgs: {len(messages)}")
+    logger.info("--- Starting Truncation --- Mode: %s, Max Tokens: %s, Max Messages: %s, Input Msgs: %s", mode_name, max_tokens, max_messages, len(messages))
     result = []
     try:
         if truncation_mode == "pairs":
             result = _truncate_sophisticated(messages, model, max_tokens, max_messages)
         else:
             if truncation_mode != "simple":
-                logger.warning(f"Unknown SWARM_TRUNCATION_MODE '{truncation_mode}'. Defaulting 'simple'.")
+                logger.warning("Unknown SWARM_TRUNCATION_MODE '%s'. Defaulting 'simple'.", truncation_mode)
             result = _truncate_simple(messages, model, max_tokens, max_messages)
     except Exception as e:
-        logger.error(f"!!! Critical error during primary truncation ({mode_name}): {e}", exc_info=True)
+        logger.error("!!! Critical error during primary truncation (%s): %s", mode_name, e, exc_info=True)
         try:
              logger.warning("Attempting fallback to simple truncation.")
              result = _truncate_simple(messages, model, max_tokens, max_messages)
         except Exception as fallback_e:
-             logger.error(f"!!! Fallback simple truncation also failed: {fallback_e}", exc_info=True)
+             logger.error("!!! Fallback simple truncation also failed: %s", fallback_e, exc_info=True)
              logger.warning("Returning raw last N messages as final fallback.")
              try:
                  system_msg_fallback = [m for m in messages if isinstance(m, dict) and m.get("role") == "system"][:1]
@@ -349,7 +349,7 @@ def truncate_message_history(messages: list[dict[str, Any]], model: str, max_tok
                  keep_count = max(0, max_messages - len(system_msg_fallback))
                  result = system_msg_fallback + valid_non_system_fallback[-keep_count:]
              except Exception as final_fallback_e:
-                 logger.critical(f"!!! Final fallback failed: {final_fallback_e}.", exc_info=True)
+                 logger.critical("!!! Final fallback failed: %s.", final_fallback_e, exc_info=True)
                  result = []
     initial_valid_message_count = sum(1 for m in messages if _is_valid_message(m))
     if initial_valid_message_count > 0 and not result:
@@ -364,5 +364,5 @@ def truncate_message_history(messages: list[dict[str, Any]], model: str, max_tok
                  pass
          logger.warning("Truncation resulted empty list unexpectedly.")
          return []
-    logger.info(f"--- Finished Truncation --- Result Msgs: {len(result)}")
+    logger.info("--- Finished Truncation --- Result Msgs: %s", len(result))
     return result
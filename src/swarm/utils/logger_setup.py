@@ -1,6 +1,53 @@
 # src/swarm/utils/logger_setup.py
+"""Logger helpers and the server's non-blocking, rate-limited log pipeline.
 
+Hot paths (per-chunk streaming in the API views, per-message context
+truncation) log from the event-loop thread. With plain handlers, every record
+is formatted and written right there, and a slow terminal, pipe or disk
+stalls the loop. :func:`install_queue_logging` moves that work off the
+caller's thread:
+
+- the handlers of every logger that has any are replaced by one
+  ``QueueHandler``, which only puts the record on a bounded queue;
+- one ``QueueListener`` thread (``swarm-log-writer``) gives each record to
+  the handlers its logger had, and they format and write it there;
+- ``%``-style arguments of immutable types (str, numbers, None) are merged
+  into the message on that thread too. Other arguments are merged at the
+  call, so mutating an object after logging it cannot change the line;
+- when the queue (``SWARM_LOG_QUEUE_SIZE``, 10000) is full, DEBUG and INFO
+  records are dropped and counted, and WARNING and above wait up to a
+  second. A warning reports the number dropped once the queue drains.
+
+:class:`RateLimitFilter` and :class:`SampleFilter` cap high-frequency
+records per call site. :func:`apply_log_limits` attaches them to loggers
+from a spec such as ``swarm.views.chat_views=50/s,swarm.utils.context_utils=1/20``
+(``SWARM_LOG_LIMITS``, default :data:`DEFAULT_LOG_LIMITS`). They only affect
+DEBUG records, so warnings and errors are never dropped.
+
+:func:`configure_hot_path_logging` applies both after Django's ``LOGGING``
+config (see ``SwarmConfig.ready``). ``SWARM_LOG_QUEUE=0`` keeps handlers
+synchronous.
+"""
+
+import abc
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
+import threading
+import time
+
+DEFAULT_QUEUE_SIZE = 10000
+# Per call site: streaming views at most 50 DEBUG lines/s, truncation 1 in 20.
+DEFAULT_LOG_LIMITS = (
+    "swarm.views.chat_views=50/s,swarm.views.responses_views=50/s,swarm.utils.context_utils=1/20"
+)
+
+_IMMEDIATE_TYPES = frozenset({str, int, float, bool, type(None), bytes})
+_EXC_FORMATTER = logging.Formatter()
+_LOCK = threading.Lock()
+_pipeline = None
 
 
 def setup_logger(name: str, level=logging.DEBUG) -> logging.Logger:
@@ -22,5 +69,300 @@ def setup_logger(name: str, level=logging.DEBUG) -> logging.Logger:
         formatter = logging.Formatter("[%(levelname)s] %(asctime)s - %(name)s - %(message)s")
         handler.setFormatter(formatter)
         logger.addHandler(handler)
+        if _pipeline is not None:
+            _pipeline.attach(logger)
 
     return logger
+
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Enqueues ``(targets, record)`` for the listener; never formats."""
+
+    def __init__(self, pipeline: "_Pipeline", targets: tuple[logging.Handler, ...]):
+        super().__init__(pipeline.queue)
+        self.pipeline = pipeline
+        self.targets = targets
+        self.setLevel(min(h.level for h in targets))
+
+    def prepare(self, record: logging.LogRecord):
+        args = record.args
+        if args and not (isinstance(args, tuple) and all(type(a) in _IMMEDIATE_TYPES for a in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            # As QueueHandler.prepare: render the traceback now, while its frames
+            # are still current, and let formatters print the cached exc_text.
+            if not record.exc_text:
+                record.exc_text = _EXC_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return self.targets, record
+
+    def enqueue(self, item) -> None:
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            if item[1].levelno >= logging.WARNING:
+                try:
+                    self.queue.put(item, timeout=1.0)
+                    return
+                except queue.Full:
+                    pass
+            self.pipeline.count_drop()
+            return
+        dropped = self.pipeline.take_drops()
+        if dropped:
+            notice = logging.makeLogRecord({
+                "name": __name__, "levelno": logging.WARNING, "levelname": "WARNING",
+                "msg": "%d log records dropped: logging queue full", "args": (dropped,),
+            })
+            try:
+                self.queue.put_nowait((self.targets, notice))
+            except queue.Full:
+                self.pipeline.count_drop(dropped)
+
+
+class _Listener(logging.handlers.QueueListener):
+    def handle(self, item) -> None:
+        targets, record = item
+        for handler in targets:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._monitor, name="swarm-log-writer", daemon=True)
+        self._thread.start()
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel)  # blocking: a full queue must not lose the stop
+
+
+class _Pipeline:
+    def __init__(self, maxsize: int):
+        self.queue: queue.Queue = queue.Queue(maxsize)
+        self.listener = _Listener(self.queue)
+        self.originals: dict[str, list[logging.Handler]] = {}
+        self.dropped_total = 0
+        self._dropped = 0
+        self._drop_lock = threading.Lock()
+
+    def attach(self, logger: logging.Logger) -> bool:
+        targets = tuple(h for h in logger.handlers if not isinstance(h, _QueueHandler))
+        if not targets:
+            return False
+        self.originals.setdefault(logger.name, list(logger.handlers))
+        for handler in targets:
+            logger.removeHandler(handler)
+        logger.addHandler(_QueueHandler(self, targets))
+        return True
+
+    def count_drop(self, n: int = 1) -> None:
+        with self._drop_lock:
+            self._dropped += n
+            self.dropped_total += n
+
+    def take_drops(self) -> int:
+        if not self._dropped:
+            return 0
+        with self._drop_lock:
+            dropped, self._dropped = self._dropped, 0
+            return dropped
+
+
+def _loggers_with_handlers() -> list[logging.Logger]:
+    found = [logging.getLogger()]
+    found += [
+        lg for lg in list(logging.root.manager.loggerDict.values())
+        if isinstance(lg, logging.Logger) and lg.handlers
+    ]
+    return found
+
+
+def install_queue_logging(loggers=None, maxsize: int | None = None) -> logging.handlers.QueueListener:
+    """Route the handlers of ``loggers`` (default: every logger that has one) through the queue.
+
+    Idempotent: loggers already routed are left alone, and a second call only
+    picks up loggers that gained handlers since. Loggers created later by
+    :func:`setup_logger` are routed automatically.
+    """
+    global _pipeline
+    with _LOCK:
+        if _pipeline is None:
+            if maxsize is None:
+                maxsize = int(os.getenv("SWARM_LOG_QUEUE_SIZE", DEFAULT_QUEUE_SIZE))
+            _pipeline = _Pipeline(maxsize)
+            _pipeline.listener.start()
+            atexit.register(uninstall_queue_logging)
+        targets = _loggers_with_handlers() if loggers is None else [
+            lg if isinstance(lg, logging.Logger) else logging.getLogger(lg) for lg in loggers
+        ]
+        for logger in targets:
+            _pipeline.attach(logger)
+        return _pipeline.listener
+
+
+def uninstall_queue_logging() -> None:
+    """Write out everything queued, stop the listener and restore the original handlers."""
+    global _pipeline
+    with _LOCK:
+        pipeline, _pipeline = _pipeline, None
+    if pipeline is None:
+        return
+    pipeline.listener.stop()
+    for name, handlers in pipeline.originals.items():
+        logger = logging.getLogger(name if name != "root" else None)
+        for handler in list(logger.handlers):
+            if isinstance(handler, _QueueHandler):
+                logger.removeHandler(handler)
+        for handler in handlers:
+            if handler not in logger.handlers:
+                logger.addHandler(handler)
+
+
+def flush_queue_logging(timeout: float = 5.0) -> bool:
+    """Wait until the listener has written every queued record (False on timeout)."""
+    pipeline = _pipeline
+    if pipeline is None:
+        return True
+    deadline = time.monotonic() + timeout
+    while pipeline.queue.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def queue_logging_stats() -> dict:
+    pipeline = _pipeline
+    if pipeline is None:
+        return {"installed": False, "queued": 0, "dropped": 0}
+    return {"installed": True, "queued": pipeline.queue.qsize(), "dropped": pipeline.dropped_total}
+
+
+class _CallSiteFilter(logging.Filter, abc.ABC):
+    """Base for filters that keep per-call-site state for low-level records."""
+
+    def __init__(self, max_level: int = logging.DEBUG):
+        super().__init__()
+        self.max_level = max_level
+        self._sites: dict[tuple[str, int], list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > self.max_level:
+            return True
+        with self._lock:
+            return self._allow(record, (record.pathname, record.lineno))
+
+    @abc.abstractmethod
+    def _allow(self, record: logging.LogRecord, site: tuple[str, int]) -> bool:
+        """Decide for ``record`` from ``site``; called with the lock held."""
+
+
+class RateLimitFilter(_CallSiteFilter):
+    """Token bucket per call site: ``rate`` records a second, bursts up to ``burst``.
+
+    The first record let through after some were suppressed says how many.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None, max_level: int = logging.DEBUG):
+        super().__init__(max_level)
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+
+    def _allow(self, record, site):
+        now = time.monotonic()
+        state = self._sites.get(site)
+        if state is None:
+            state = self._sites[site] = [self.burst, now, 0]
+        tokens = min(self.burst, state[0] + (now - state[1]) * self.rate)
+        state[1] = now
+        if tokens < 1:
+            state[0] = tokens
+            state[2] += 1
+            return False
+        state[0] = tokens - 1
+        if state[2]:
+            record.msg = f"{record.getMessage()} [{state[2]} similar suppressed]"
+            record.args = None
+            state[2] = 0
+        return True
+
+
+class SampleFilter(_CallSiteFilter):
+    """Keeps the first of every ``every`` records per call site."""
+
+    def __init__(self, every: int, max_level: int = logging.DEBUG):
+        super().__init__(max_level)
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.every = every
+
+    def _allow(self, _record, site):
+        seen = self._sites.get(site, 0)
+        self._sites[site] = seen + 1
+        return seen % self.every == 0
+
+
+def parse_log_limits(spec: str) -> dict[str, logging.Filter]:
+    """``name=RATE/s`` (rate limit) or ``name=1/N`` (sample) entries, comma-separated."""
+    limits: dict[str, logging.Filter] = {}
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, value = entry.partition("=")
+        value = value.strip().lower()
+        if not sep or not name.strip():
+            raise ValueError(f"bad log limit {entry!r}: expected name=RATE/s or name=1/N")
+        if value.endswith("/s"):
+            limits[name.strip()] = RateLimitFilter(float(value[:-2]))
+        elif value.startswith("1/"):
+            limits[name.strip()] = SampleFilter(int(value[2:]))
+        else:
+            raise ValueError(f"bad log limit {entry!r}: expected name=RATE/s or name=1/N")
+    return limits
+
+
+def apply_log_limits(spec: str | None = None) -> dict[str, logging.Filter]:
+    """Attach rate-limit / sample filters from ``spec`` (default ``SWARM_LOG_LIMITS``).
+
+    Replaces filters a previous call attached. ``"off"`` (or an empty spec)
+    removes them all.
+    """
+    if spec is None:
+        spec = os.getenv("SWARM_LOG_LIMITS", DEFAULT_LOG_LIMITS)
+    limits = {} if spec.strip().lower() in ("", "0", "off", "none") else parse_log_limits(spec)
+    for lg in list(logging.root.manager.loggerDict.values()):
+        if isinstance(lg, logging.Logger):
+            for old in [f for f in lg.filters if isinstance(f, _CallSiteFilter)]:
+                lg.removeFilter(old)
+    for name, log_filter in limits.items():
+        logging.getLogger(name).addFilter(log_filter)
+    return limits
+
+
+def configure_hot_path_logging() -> None:
+    """Rate limits plus the queue pipeline, unless ``SWARM_LOG_QUEUE`` is off."""
+    try:
+        apply_log_limits()
+    except ValueError as e:
+        logging.getLogger(__name__).warning("Ignoring SWARM_LOG_LIMITS: %s", e)
+    if os.getenv("SWARM_LOG_QUEUE", "true").lower() not in ("0", "false", "no", "off"):
+        install_queue_logging()
+
+
+__all__ = [
+    "DEFAULT_LOG_LIMITS",
+    "RateLimitFilter",
+    "SampleFilter",
+    "apply_log_limits",
+    "configure_hot_path_logging",
+    "flush_queue_logging",
+    "install_queue_logging",
+    "parse_log_limits",
+    "queue_logging_stats",
+    "setup_logger",
+    "uninstall_queue_logging",
+]
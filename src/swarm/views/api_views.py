@@ -2,12 +2,14 @@ import logging
 import time
 
 from asgiref.sync import async_to_sync
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
 from drf_spectacular.utils import extend_schema, inline_serializer
 from rest_framework import serializers, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from swarm.auth import api_permission_classes
+from swarm.auth import admin_permission_classes, api_permission_classes
 from swarm.services import github_topics_service as gh_service
 from swarm.settings import (
     ENABLE_GITHUB_MARKETPLACE,
@@ -395,8 +397,8 @@ class MarketplaceGitHubBlueprintsView(APIView):
         except gh_service.GitHubAPIError as exc:
             return _github_marketplace_error_response(exc)
         items: list[dict] = []
-        for repo in repos:
-            manifests = gh_service.fetch_repo_manifests(repo, token=GITHUB_TOKEN)
+        manifests_per_repo = gh_service.fetch_repos_manifests(repos, token=GITHUB_TOKEN)
+        for repo, manifests in zip(repos, manifests_per_repo, strict=True):
             items.extend(gh_service.to_marketplace_items(repo, manifests, kind='blueprint'))
         if sort == 'last_used':
             usage = get_last_used_map()
@@ -436,8 +438,8 @@ class MarketplaceGitHubMCPConfigsView(APIView):
         except gh_service.GitHubAPIError as exc:
             return _github_marketplace_error_response(exc)
         items: list[dict] = []
-        for repo in repos:
-            manifests = gh_service.fetch_repo_manifests(repo, token=GITHUB_TOKEN)
+        manifests_per_repo = gh_service.fetch_repos_manifests(repos, token=GITHUB_TOKEN)
+        for repo, manifests in zip(repos, manifests_per_repo, strict=True):
             items.extend(gh_service.to_marketplace_items(repo, manifests, kind='mcp'))
         if sort == 'last_used':
             usage = get_last_used_map()
@@ -534,6 +536,128 @@ class CliAgentsView(APIView):
         })
 
 
+@extend_schema(exclude=True)
+class MetricsView(APIView):
+    """Prometheus scrape target.
+
+    GET /metrics -> text exposition format (see :mod:`swarm.core.metrics`).
+    Authenticated like the rest of the API when ``ENABLE_API_AUTH`` is on, and
+    never throttled so scrapes cannot eat into client quotas.
+    """
+    throttle_classes: list = []
+
+    def get_permissions(self):
+        return [perm() for perm in api_permission_classes()]
+
+    def get(self, _request, *_args, **_kwargs):
+        from django.http import HttpResponse
+
+        from swarm.core import metrics
+
+        return HttpResponse(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
+
+@extend_schema(exclude=True)
+class ProfileView(APIView):
+    """On-demand sampling profile of this server process (admin only).
+
+    GET /v1/profile?seconds=10[&interval_ms=5][&idle=1][&format=json] ->
+    folded stacks for flamegraph tools (``text/plain``), or a JSON summary
+    with the hottest frames plus the folded text. 409 while another profile
+    is running. See :mod:`swarm.core.profiler`.
+    """
+
+    metrics_view = "profile"
+
+    def get_permissions(self):
+        return [perm() for perm in admin_permission_classes()]
+
+    @method_decorator(csrf_exempt)
+    async def dispatch(self, request, *args, **kwargs):
+        from swarm.views.responses_views import _async_auth_dispatch
+
+        return await _async_auth_dispatch(self, request, *args, **kwargs)
+
+    async def get(self, request, *_args, **_kwargs):
+        import asyncio
+
+        from django.http import HttpResponse
+        from rest_framework.exceptions import ValidationError
+
+        from swarm.core import profiler
+
+        try:
+            seconds = float(request.query_params.get("seconds", 10))
+            interval_ms = request.query_params.get("interval_ms")
+            interval = float(interval_ms) / 1000 if interval_ms else None
+        except ValueError as e:
+            raise ValidationError({"detail": f"Invalid number: {e}"}) from e
+        if not 0 < seconds <= profiler.max_seconds():
+            raise ValidationError({"detail": f"seconds must be in (0, {profiler.max_seconds():g}]."})
+        include_idle = request.query_params.get("idle", "").lower() in ("1", "true", "yes")
+        try:
+            # Off the event loop, which then shows up in the samples like any other thread.
+            profile = await asyncio.to_thread(profiler.sample, seconds, interval=interval, include_idle=include_idle)
+        except profiler.ProfilerBusy as e:
+            return Response({"error": str(e)}, status=status.HTTP_409_CONFLICT)
+        if request.query_params.get("format") == "json":
+            return Response({**profile.summary(), "collapsed": profile.collapsed()})
+        response = HttpResponse(profile.collapsed(), content_type="text/plain; charset=utf-8")
+        response["X-Profile-Samples"] = str(profile.samples)
+        response["X-Profile-Overhead"] = f"{profile.overhead:.4f}"
+        return response
+
+
+@extend_schema(exclude=True)
+class UsageView(APIView):
+    """Token usage rollups from the usage ledger.
+
+    GET /v1/usage?since=7d[&until=...][&granularity=day|hour]
+                 [&group_by=owner,model|bucket,...][&owner=...][&model=...]
+    -> {"object": "usage", "granularity", "since", "until", "data": [rows]}
+
+    Reads only the rollup tables (see :mod:`swarm.core.usage_ledger`). With
+    ``ENABLE_API_AUTH`` on, callers see their own usage; admins (see
+    :func:`swarm.auth.is_admin_request`) may pass any ``owner`` or none.
+    """
+
+    def get_permissions(self):
+        return [perm() for perm in api_permission_classes()]
+
+    def get(self, request, *_args, **_kwargs):
+        from django.conf import settings
+        from rest_framework.exceptions import ValidationError
+
+        from swarm.auth import is_admin_request, request_principal
+        from swarm.core import usage_ledger
+
+        params = request.query_params
+        try:
+            since = usage_ledger.parse_time(params.get("since", "7d"))
+            until = usage_ledger.parse_time(params.get("until"))
+        except ValueError as e:
+            raise ValidationError({"detail": f"Invalid time: {e}"}) from e
+        owner = params.get("owner") or None
+        if getattr(settings, "ENABLE_API_AUTH", False) and not is_admin_request(request):
+            owner = request_principal(request) or usage_ledger.ANONYMOUS
+        group_by = [g.strip() for g in params.get("group_by", "owner,model").split(",") if g.strip()]
+        granularity = params.get("granularity", "day")
+        try:
+            rows = usage_ledger.USAGE_LEDGER.query(
+                granularity=granularity, since=since, until=until,
+                owner=owner, model=params.get("model") or None, group_by=group_by,
+            )
+        except ValueError as e:
+            raise ValidationError({"detail": str(e)}) from e
+        return Response({
+            "object": "usage",
+            "granularity": granularity,
+            "since": since,
+            "until": until,
+            "data": rows,
+        })
+
+
 class ConfigOptionsView(APIView):
     """Everything the Builder UI needs to configure the new decoupling features.
 
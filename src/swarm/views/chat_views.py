@@ -37,7 +37,9 @@ from rest_framework.views import APIView
 # Import custom permission
 # Assuming serializers are in the same app
 from swarm.auth import request_principal
+from swarm.core import metrics, server_timing, tracing, usage_ledger
 from swarm.serializers import ChatCompletionRequestSerializer
+from swarm.utils.redact import StreamRedactor, output_redaction_enabled, redact_text
 
 from .openai_schema import chat_completions_schema
 
@@ -132,6 +134,8 @@ def usage_counts(messages: list[dict[str, Any]] | None, answer: Any, model: str)
 
     prompt = sum(get_token_count(m, model) for m in (messages or []))
     completion = get_token_count(answer if answer is not None else "", model)
+    metrics.TOKENS.inc(prompt, blueprint=model, kind="prompt")
+    metrics.TOKENS.inc(completion, blueprint=model, kind="completion")
     return prompt, completion, prompt + completion
 
 
@@ -173,6 +177,7 @@ class ChatCompletionsView(APIView):
     """
     # Default serializer class for request validation.
     serializer_class = ChatCompletionRequestSerializer
+    metrics_view = "chat_completions"
     # Default permission classes are likely set in settings.py
     # permission_classes = [IsAuthenticated] # Example default
 
@@ -187,7 +192,7 @@ class ChatCompletionsView(APIView):
         user_id: str | None = None,
     ) -> Response:
         """ Handles non-streaming requests. """
-        logger.info(f"[ReqID: {request_id}] Processing non-streaming request for model '{model_name}'.")
+        logger.info("[ReqID: %s] Processing non-streaming request for model '%s'.", request_id, model_name)
         final_message = None
         backend_meta = None
         start_time = time.time()
@@ -200,32 +205,42 @@ class ChatCompletionsView(APIView):
             # Chunks carrying an explicit final marker (AgentInteraction.final)
             # short-circuit the scan.
             # user_id scopes memory per authenticated principal (not shared "default").
-            async_generator = blueprint_instance.run(messages, stream=False, user_id=user_id)
-            async for chunk in async_generator:
-                if isinstance(chunk, dict) and chunk.get("meta"):
-                    backend_meta = chunk["meta"]  # which CLI(s) answered (system_fingerprint)
-                message = _extract_message_from_chunk(chunk)
-                if message is None:
-                    logger.debug(f"[ReqID: {request_id}] Skipping non-message chunk during non-streaming run: {chunk}")
-                    continue
-                final_message = message
-                if _chunk_is_final(chunk):
-                    logger.debug(f"[ReqID: {request_id}] Received explicitly-final chunk; stopping consumption.")
-                    break
+            with tracing.span("blueprint.run", model=model_name, stream=False) as run_span, server_timing.phase("generation"):
+                async_generator = blueprint_instance.run(messages, stream=False, user_id=user_id)
+                async for chunk in async_generator:
+                    if isinstance(chunk, dict) and chunk.get("meta"):
+                        backend_meta = chunk["meta"]  # which CLI(s) answered (system_fingerprint)
+                    message = _extract_message_from_chunk(chunk)
+                    if message is None:
+                        logger.debug("[ReqID: %s] Skipping non-message chunk during non-streaming run: %s", request_id, chunk)
+                        continue
+                    if final_message is None:
+                        run_span.add_event("first_chunk")
+                        server_timing.mark("first_chunk")
+                    final_message = message
+                    if _chunk_is_final(chunk):
+                        logger.debug("[ReqID: %s] Received explicitly-final chunk; stopping consumption.", request_id)
+                        break
 
             if not isinstance(final_message, dict) or final_message.get('content') is None:
-                 logger.error(f"[ReqID: {request_id}] Blueprint '{model_name}' did not yield any valid message chunk.")
+                 logger.error("[ReqID: %s] Blueprint '%s' did not yield any valid message chunk.", request_id, model_name)
                  raise APIException("Blueprint did not return valid data.", code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            if output_redaction_enabled() and isinstance(final_message["content"], str):
+                final_message = {**final_message, "content": redact_text(final_message["content"])}
 
             p_tok, c_tok, t_tok = usage_counts(messages, final_message.get("content"), model_name)
+            usage_ledger.record(
+                owner=user_id, model=model_name, endpoint="chat.completions",
+                prompt_tokens=p_tok, completion_tokens=c_tok, request_id=f"chatcmpl-{request_id}",
+            )
             response_payload = { "id": f"chatcmpl-{request_id}", "object": "chat.completion", "created": int(time.time()), "model": model_name, "choices": [{"index": 0, "message": final_message, "logprobs": None, "finish_reason": "stop"}], "usage": {"prompt_tokens": p_tok, "completion_tokens": c_tok, "total_tokens": t_tok}, "system_fingerprint": backend_fingerprint(model_name, backend_meta) }
             end_time = time.time()
-            logger.info(f"[ReqID: {request_id}] Non-streaming request completed in {end_time - start_time:.2f}s.")
+            logger.info("[ReqID: %s] Non-streaming request completed in %.2fs.", request_id, end_time - start_time)
             return Response(response_payload, status=status.HTTP_200_OK)
         except APIException:
             raise
         except Exception as e:
-            logger.error(f"[ReqID: {request_id}] Unexpected error during non-streaming blueprint execution: {e}", exc_info=True)
+            logger.error("[ReqID: %s] Unexpected error during non-streaming blueprint execution: %s", request_id, e, exc_info=True)
             from swarm.utils.env_utils import client_safe_error_message
             raise APIException(
                 client_safe_error_message(e),
@@ -248,77 +263,170 @@ class ChatCompletionsView(APIView):
         user_id: str | None = None,
     ) -> StreamingHttpResponse:
         """ Handles streaming requests using SSE. """
-        logger.info(f"[ReqID: {request_id}] Processing streaming request for model '{model_name}'.")
+        logger.info("[ReqID: %s] Processing streaming request for model '%s'.", request_id, model_name)
+        # The body is produced after the request span has exited, so parent explicitly.
+        request_span = tracing.current_span()
+        request_started = getattr(self, "_started", None) or time.monotonic()
+        timing = server_timing.current()
+
         async def event_stream():
+            server_timing.activate(timing)
+            generation_started = time.perf_counter()
+
+            def timing_trailer() -> str:
+                # Headers are gone once the body starts: report phases as an SSE comment.
+                if timing is None:
+                    return ""
+                timing.add("generation", (time.perf_counter() - generation_started) * 1000)
+                return timing.sse_comment()
+
             start_time = time.time()
             chunk_index = 0
+            answer_parts: list[str] = []
             backend_meta = None
             async_generator = None
-            try:
-                logger.debug(f"[ReqID: {request_id}] Getting async generator from blueprint.run()...")
-                # user_id scopes memory per authenticated principal (not shared "default").
-                async_generator = blueprint_instance.run(messages, stream=True, user_id=user_id)
-                logger.debug(f"[ReqID: {request_id}] Got async generator. Starting iteration...")
-                async for chunk in async_generator:
-                    logger.debug(f"[ReqID: {request_id}] Received stream chunk {chunk_index}: {chunk}")
-                    if isinstance(chunk, dict) and chunk.get("meta"):
-                        backend_meta = chunk["meta"]  # which CLI(s) answered
-                    message = _extract_message_from_chunk(chunk)
-                    if message is None:
-                        logger.warning(f"[ReqID: {request_id}] Skipping invalid chunk format: {chunk}")
-                        continue
-                    delta = {"role": "assistant", "content": message["content"]}
-                    response_chunk = { "id": f"chatcmpl-{request_id}", "object": "chat.completion.chunk", "created": int(time.time()), "model": model_name, "choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": None}], "system_fingerprint": backend_fingerprint(model_name, backend_meta) }
-                    logger.debug(f"[ReqID: {request_id}] Sending SSE chunk {chunk_index}")
-                    yield f"data: {json.dumps(response_chunk)}\n\n"
-                    chunk_index += 1
-                    await asyncio.sleep(0.01)
-                logger.debug(f"[ReqID: {request_id}] Finished iterating stream. Sending [DONE].")
-                yield "data: [DONE]\n\n"
-                end_time = time.time()
-                logger.info(f"[ReqID: {request_id}] Streaming request completed in {end_time - start_time:.2f}s.")
-            except APIException as e:
-                logger.error(f"[ReqID: {request_id}] API error during streaming: {e}", exc_info=True)
-                error_msg = f"API error: {e.detail}"
-                error_chunk = {"error": {"message": error_msg, "type": "api_error", "code": e.status_code}}
-                yield f"data: {json.dumps(error_chunk)}\n\n"
-                yield "data: [DONE]\n\n"
-            except Exception as e:
-                logger.error(f"[ReqID: {request_id}] Unexpected error during streaming: {e}", exc_info=True)
-                from swarm.utils.env_utils import client_safe_error_message
-                error_msg = client_safe_error_message(e, public="Internal server error.")
-                error_chunk = {"error": {"message": error_msg, "type": "internal_error"}}
-                yield f"data: {json.dumps(error_chunk)}\n\n"
-                yield "data: [DONE]\n\n"
-            finally:
-                # Client disconnect / aclose — push GeneratorExit into blueprint so
-                # CliAdapter.stream_run can _terminate orphaned CLI subprocesses.
-                if async_generator is not None and hasattr(async_generator, "aclose"):
-                    try:
-                        await async_generator.aclose()
-                    except Exception:
-                        pass
+            # Deltas can split a secret, so redaction must see across them.
+            redactor = StreamRedactor() if output_redaction_enabled() else None
+
+            def sse_chunk(content) -> str:
+                nonlocal chunk_index
+                logger.debug("[ReqID: %s] Sending SSE chunk %s", request_id, chunk_index)
+                if chunk_index == 0:
+                    run_span.add_event("first_chunk")
+                    metrics.record_first_chunk(self.metrics_view, model_name, request_started)
+                    if timing is not None:
+                        timing.mark("first_chunk")
+                chunk_index += 1
+                delta = {"role": "assistant", "content": content}
+                response_chunk = { "id": f"chatcmpl-{request_id}", "object": "chat.completion.chunk", "created": int(time.time()), "model": model_name, "choices": [{"index": 0, "delta": delta, "logprobs": None, "finish_reason": None}], "system_fingerprint": backend_fingerprint(model_name, backend_meta) }
+                return f"data: {json.dumps(response_chunk)}\n\n"
+
+            seat_redactors: dict[str, StreamRedactor] = {}
+
+            def seat_progress(chunk: dict) -> str:
+                # MoA seat progress as an SSE comment: OpenAI-style clients ignore it.
+                event = {k: chunk[k] for k in ("seat", "delta", "done", "ok") if k in chunk}
+                if redactor is not None:
+                    seat = seat_redactors.setdefault(str(chunk["seat"]), StreamRedactor())
+                    text = seat.feed(str(event.get("delta", "")))
+                    if event.get("done"):
+                        text += seat.flush()
+                    if text:
+                        event["delta"] = text
+                    else:
+                        event.pop("delta", None)
+                        if not event.get("done"):
+                            return ""
+                return f": moa-progress {json.dumps(event)}\n\n"
+            with tracing.span("blueprint.run", parent=request_span, model=model_name, stream=True) as run_span:
+                try:
+                    logger.debug("[ReqID: %s] Getting async generator from blueprint.run()...", request_id)
+                    # user_id scopes memory per authenticated principal (not shared "default").
+                    async_generator = blueprint_instance.run(messages, stream=True, user_id=user_id)
+                    logger.debug("[ReqID: %s] Got async generator. Starting iteration...", request_id)
+                    async for chunk in async_generator:
+                        logger.debug("[ReqID: %s] Received stream chunk %s: %s", request_id, chunk_index, chunk)
+                        if isinstance(chunk, dict) and chunk.get("meta"):
+                            backend_meta = chunk["meta"]  # which CLI(s) answered
+                        message = _extract_message_from_chunk(chunk)
+                        if message is None:
+                            if isinstance(chunk, dict) and chunk.get("progress") and chunk.get("seat"):
+                                comment = seat_progress(chunk)
+                                if comment:
+                                    yield comment
+                            elif isinstance(chunk, dict) and chunk.get("progress"):
+                                # Other side-channel progress (spinners): not for SSE clients.
+                                logger.debug("[ReqID: %s] Skipping progress chunk: %s", request_id, chunk)
+                            else:
+                                logger.warning("[ReqID: %s] Skipping invalid chunk format: %s", request_id, chunk)
+                            continue
+                        content = message["content"]
+                        if redactor is not None:
+                            content = redactor.feed(str(content))
+                            if not content:
+                                continue
+                        answer_parts.append(str(content))
+                        yield sse_chunk(content)
+                        await asyncio.sleep(0.01)
+                    tail = redactor.flush() if redactor is not None else ""
+                    if tail:
+                        answer_parts.append(tail)
+                        yield sse_chunk(tail)
+                    logger.debug("[ReqID: %s] Finished iterating stream. Sending [DONE].", request_id)
+                    yield timing_trailer()
+                    yield "data: [DONE]\n\n"
+                    # Counted after [DONE] so tokenising the answer never delays the client.
+                    p_tok, c_tok, _ = usage_counts(messages, "".join(answer_parts), model_name)
+                    usage_ledger.record(
+                        owner=user_id, model=model_name, endpoint="chat.completions",
+                        prompt_tokens=p_tok, completion_tokens=c_tok, request_id=f"chatcmpl-{request_id}",
+                    )
+                    end_time = time.time()
+                    logger.info("[ReqID: %s] Streaming request completed in %.2fs.", request_id, end_time - start_time)
+                except APIException as e:
+                    logger.error("[ReqID: %s] API error during streaming: %s", request_id, e, exc_info=True)
+                    error_msg = f"API error: {e.detail}"
+                    error_chunk = {"error": {"message": error_msg, "type": "api_error", "code": e.status_code}}
+                    run_span.record_exception(e)
+                    yield f"data: {json.dumps(error_chunk)}\n\n"
+                    yield timing_trailer()
+                    yield "data: [DONE]\n\n"
+                except Exception as e:
+                    logger.error("[ReqID: %s] Unexpected error during streaming: %s", request_id, e, exc_info=True)
+                    run_span.record_exception(e)
+                    from swarm.utils.env_utils import client_safe_error_message
+                    error_msg = client_safe_error_message(e, public="Internal server error.")
+                    error_chunk = {"error": {"message": error_msg, "type": "internal_error"}}
+                    yield f"data: {json.dumps(error_chunk)}\n\n"
+                    yield timing_trailer()
+                    yield "data: [DONE]\n\n"
+                finally:
+                    # Client disconnect / aclose — push GeneratorExit into blueprint so
+                    # CliAdapter.stream_run can _terminate orphaned CLI subprocesses.
+                    if async_generator is not None and hasattr(async_generator, "aclose"):
+                        try:
+                            await async_generator.aclose()
+                        except Exception:
+                            pass
+                    run_span.set_attribute("chunks", chunk_index)
+                    metrics.record_stream_end(self.metrics_view, model_name, request_started)
         return StreamingHttpResponse(event_stream(), content_type="text/event-stream")
 
     # --- Restore Custom dispatch method (wrapping perform_authentication) ---
     @method_decorator(csrf_exempt)
     async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
         """
-        Override DRF's dispatch method to specifically wrap the authentication step.
+        Override DRF's dispatch method to specifically wrap the authentication step
+        (and to run the whole request inside a tracing span).
         """
         self.args = args
         self.kwargs = kwargs
         drf_request: Request = self.initialize_request(request, *args, **kwargs)
         self.request = drf_request
         self.headers = self.default_response_headers
-
+        self._started = time.monotonic()
+        timing = server_timing.begin()
+
+        with tracing.span("http.chat_completions", kind="SERVER", method=request.method, route="/v1/chat/completions") as request_span:
+            response = await self._dispatch_request(drf_request, *args, **kwargs)
+            request_span.set_attribute("status_code", getattr(response, "status_code", None))
+            if getattr(response, "status_code", 500) >= 500:
+                request_span.set_error(f"HTTP {response.status_code}")
+        metrics.record_response(self.metrics_view, response, self._started, getattr(self, "_metrics_blueprint", None))
+        if timing is not None and not getattr(response, "streaming", False):
+            response[server_timing.HEADER] = timing.header()
+        return response
+
+    async def _dispatch_request(self, drf_request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        """Authenticate, check permissions/throttles, run the handler, finalize."""
         response = None
         try:
             # --- Wrap ONLY perform_authentication ---
-            print_logger.debug(f"User before perform_authentication: {getattr(drf_request, 'user', 'N/A')}, Auth: {getattr(drf_request, 'auth', 'N/A')}")
+            print_logger.debug("User before perform_authentication: %s, Auth: %s", getattr(drf_request, 'user', 'N/A'), getattr(drf_request, 'auth', 'N/A'))
             # This forces the synchronous DB access within perform_authentication into a thread
-            await sync_to_async(self.perform_authentication)(drf_request)
-            print_logger.debug(f"User after perform_authentication: {getattr(drf_request, 'user', 'N/A')}, Auth: {getattr(drf_request, 'auth', 'N/A')}")
+            with tracing.span("auth"), server_timing.phase("auth"):
+                await sync_to_async(self.perform_authentication)(drf_request)
+            print_logger.debug("User after perform_authentication: %s, Auth: %s", getattr(drf_request, 'user', 'N/A'), getattr(drf_request, 'auth', 'N/A'))
             # --- End wrapping ---
 
             # Enforce auth: if ENABLE_API_AUTH is True, require valid token or authenticated session
@@ -364,8 +472,8 @@ class ChatCompletionsView(APIView):
         Handles POST requests for chat completions. Assumes dispatch has handled auth/perms.
         """
         request_id = str(uuid.uuid4())
-        logger.info(f"[ReqID: {request_id}] Processing POST request.")
-        print_logger.debug(f"[ReqID: {request_id}] User in post: {getattr(request, 'user', 'N/A')}, Auth: {getattr(request, 'auth', 'N/A')}")
+        logger.info("[ReqID: %s] Processing POST request.", request_id)
+        print_logger.debug("[ReqID: %s] User in post: %s, Auth: %s", request_id, getattr(request, 'user', 'N/A'), getattr(request, 'auth', 'N/A'))
         # Stamp owner for async/background store records (IDOR protection on GET poll).
         self._owner_principal = request_principal(request)
 
@@ -373,24 +481,25 @@ class ChatCompletionsView(APIView):
         try:
             request_data = request.data
         except ParseError as e:
-            logger.error(f"[ReqID: {request_id}] Invalid request body format: {e.detail}")
+            logger.error("[ReqID: %s] Invalid request body format: %s", request_id, e.detail)
             raise e
         except json.JSONDecodeError as e:
-            logger.error(f"[ReqID: {request_id}] JSON Decode Error: {e}")
+            logger.error("[ReqID: %s] JSON Decode Error: %s", request_id, e)
             raise ParseError(f"Invalid JSON body: {e}") from e
 
         # --- Serialization and Validation ---
         serializer = self.serializer_class(data=request_data)
         try:
-            print_logger.debug(f"[ReqID: {request_id}] Validating request data: {request_data}")
+            print_logger.debug("[ReqID: %s] Validating request data: %s", request_id, request_data)
             # Wrap sync is_valid call as it *might* do DB lookups
-            await sync_to_async(serializer.is_valid)(raise_exception=True)
-            print_logger.debug(f"[ReqID: {request_id}] Request data validation successful.")
+            with tracing.span("validate"), server_timing.phase("validate"):
+                await sync_to_async(serializer.is_valid)(raise_exception=True)
+            print_logger.debug("[ReqID: %s] Request data validation successful.", request_id)
         except ValidationError as e:
-            print_logger.error(f"[ReqID: {request_id}] Request data validation FAILED: {e.detail}")
+            print_logger.error("[ReqID: %s] Request data validation FAILED: %s", request_id, e.detail)
             raise e
         except Exception as e:
-            print_logger.error(f"[ReqID: {request_id}] Unexpected error during serializer validation: {e}", exc_info=True)
+            print_logger.error("[ReqID: %s] Unexpected error during serializer validation: %s", request_id, e, exc_info=True)
             from swarm.utils.env_utils import client_safe_error_message
             raise APIException(
                 client_safe_error_message(e, public="Internal error during request validation."),
@@ -402,23 +511,25 @@ class ChatCompletionsView(APIView):
         messages = validated_data['messages']
         stream = validated_data.get('stream', False)
         blueprint_params = validated_data.get('params', None)
+        tracing.set_attributes(request_id=request_id, model=model_name, stream=bool(stream))
 
         # --- Model Access Validation ---
         # This function likely performs sync DB lookups, so wrap it.
-        print_logger.debug(f"[ReqID: {request_id}] Checking model access for user '{request.user}' and model '{model_name}'")
+        print_logger.debug("[ReqID: %s] Checking model access for user '%s' and model '%s'", request_id, request.user, model_name)
         try:
-            access_granted = await sync_to_async(validate_model_access)(request.user, model_name)
+            with tracing.span("model_access"), server_timing.phase("model_access"):
+                access_granted = await sync_to_async(validate_model_access)(request.user, model_name)
         except Exception as e:
-            logger.error(f"[ReqID: {request_id}] Error during model access validation for model '{model_name}': {e}", exc_info=True)
+            logger.error("[ReqID: %s] Error during model access validation for model '%s': %s", request_id, model_name, e, exc_info=True)
             raise APIException("Error checking model permissions.", code=status.HTTP_500_INTERNAL_SERVER_ERROR) from e
 
         # --- Get Blueprint Instance (existence determines 404) ---
         # This function should ideally be async or sync-safe.
-        print_logger.debug(f"[ReqID: {request_id}] Getting blueprint instance for '{model_name}' with params: {blueprint_params}")
+        print_logger.debug("[ReqID: %s] Getting blueprint instance for '%s' with params: %s", request_id, model_name, blueprint_params)
         try:
             blueprint_instance = await get_blueprint_instance(model_name, params=blueprint_params)
         except Exception as e:
-             logger.error(f"[ReqID: {request_id}] Error getting blueprint instance for '{model_name}': {e}", exc_info=True)
+             logger.error("[ReqID: %s] Error getting blueprint instance for '%s': %s", request_id, model_name, e, exc_info=True)
              from swarm.utils.env_utils import client_safe_error_message
              raise APIException(
                  client_safe_error_message(
@@ -428,13 +539,14 @@ class ChatCompletionsView(APIView):
              ) from e
 
         if blueprint_instance is None:
-            logger.error(f"[ReqID: {request_id}] Blueprint '{model_name}' not found or failed to initialize (get_blueprint_instance returned None).")
+            logger.error("[ReqID: %s] Blueprint '%s' not found or failed to initialize (get_blueprint_instance returned None).", request_id, model_name)
             raise NotFound(f"The requested model (blueprint) '{model_name}' was not found or could not be initialized.")
 
         # Only after confirming existence, enforce permission check result
         if not access_granted:
-            logger.warning(f"[ReqID: {request_id}] User '{request.user}' denied access to model '{model_name}'.")
+            logger.warning("[ReqID: %s] User '%s' denied access to model '%s'.", request_id, request.user, model_name)
             raise PermissionDenied(f"You do not have permission to access the model '{model_name}'.")
+        self._metrics_blueprint = model_name  # a real model from here on: safe as a metric label
 
         # --- Async fire-and-forget: return a queued handle immediately, run in a
         #     background worker, poll via GET /v1/responses/{id}. Reuses the
@@ -473,7 +585,7 @@ class ChatCompletionsView(APIView):
             "_task": _task_spec(request_id, model_name, list(messages), params, None, owner=owner),
         })
         _spawn_worker(response_id, request_id, model_name, list(messages), params, None, user_id=owner)
-        logger.info(f"[ReqID: {request_id}] /v1/chat/completions queued async task {response_id} (model '{model_name}').")
+        logger.info("[ReqID: %s] /v1/chat/completions queued async task %s (model '%s').", request_id, response_id, model_name)
         ack = {
             "id": response_id,
             "object": "chat.completion",
@@ -11,6 +11,7 @@ flattened ``output_text``). Streaming is supported via the existing SSE machiner
 and emits ``response.output_text.delta`` events.
 """
 import asyncio
+import contextvars
 import json
 import logging
 import os
@@ -43,7 +44,20 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from swarm.auth import request_principal
-from swarm.core import cancel_registry, responses_store
+from swarm.core import (
+    cancel_registry,
+    metrics,
+    responses_store,
+    server_timing,
+    tracing,
+    usage_ledger,
+)
+from swarm.utils.redact import (
+    StreamRedactor,
+    output_redaction_enabled,
+    redact_sensitive_data,
+    redact_text,
+)
 
 from .chat_views import _chunk_is_final, _extract_message_from_chunk
 from .openai_schema import responses_schema
@@ -193,10 +207,26 @@ async def _async_auth_dispatch(view: APIView, request: HttpRequest, *args: Any,
     drf_request: Request = view.initialize_request(request, *args, **kwargs)
     view.request = drf_request
     view.headers = view.default_response_headers
-
+    view._started = time.monotonic()
+    timing = server_timing.begin()
+
+    span_name = getattr(view, "trace_name", f"http.{type(view).__name__}")
+    with tracing.span(span_name, kind="SERVER", method=request.method, route=request.path) as request_span:
+        response = await _dispatch_request(view, drf_request, *args, **kwargs)
+        request_span.set_attribute("status_code", getattr(response, "status_code", None))
+        if getattr(response, "status_code", 500) >= 500:
+            request_span.set_error(f"HTTP {response.status_code}")
+    metrics.record_response(getattr(view, "metrics_view", type(view).__name__), response, view._started, getattr(view, "_metrics_blueprint", None))
+    if timing is not None and not getattr(response, "streaming", False):
+        response[server_timing.HEADER] = timing.header()
+    return response
+
+
+async def _dispatch_request(view: APIView, drf_request: Request, *args: Any, **kwargs: Any) -> HttpResponseBase:
     response = None
     try:
-        await sync_to_async(view.perform_authentication)(drf_request)
+        with tracing.span("auth"), server_timing.phase("auth"):
+            await sync_to_async(view.perform_authentication)(drf_request)
 
         if bool(getattr(settings, 'ENABLE_API_AUTH', False)):
             has_token = getattr(drf_request, 'auth', None) is not None
@@ -241,6 +271,9 @@ class ResponsesView(APIView):
     conversation.
     """
 
+    trace_name = "http.responses"
+    metrics_view = "responses"
+
     @method_decorator(csrf_exempt)
     async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
         return await _async_auth_dispatch(self, request, *args, **kwargs)
@@ -248,7 +281,7 @@ class ResponsesView(APIView):
     @responses_schema
     async def post(self, request: Request, *_args: Any, **_kwargs: Any) -> HttpResponseBase:
         request_id = str(uuid.uuid4())
-        logger.info(f"[ReqID: {request_id}] Processing /v1/responses POST request.")
+        logger.info("[ReqID: %s] Processing /v1/responses POST request.", request_id)
         # Stamp owner for store records (IDOR protection on GET/cancel/delete).
         self._owner_principal = request_principal(request)
 
@@ -256,10 +289,10 @@ class ResponsesView(APIView):
         try:
             request_data = request.data
         except ParseError as e:
-            logger.error(f"[ReqID: {request_id}] Invalid request body format: {e.detail}")
+            logger.error("[ReqID: %s] Invalid request body format: %s", request_id, e.detail)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"[ReqID: {request_id}] JSON Decode Error: {e}")
+            logger.error("[ReqID: %s] JSON Decode Error: %s", request_id, e)
             raise ParseError(f"Invalid JSON body: {e}") from e
 
         if not isinstance(request_data, dict):
@@ -284,6 +317,7 @@ class ResponsesView(APIView):
         messages = _normalize_input_to_messages(request_data.get('input'), instructions)
         if not messages:
             raise ParseError("'input' did not yield any messages.")
+        tracing.set_attributes(request_id=request_id, model=model_name, stream=stream, background=background)
 
         # --- Statefulness: continue a prior conversation by id ---
         if previous_response_id:
@@ -295,16 +329,17 @@ class ResponsesView(APIView):
 
         # --- Model access validation (same helper as ChatCompletionsView) ---
         try:
-            access_granted = await sync_to_async(validate_model_access)(request.user, model_name)
+            with tracing.span("model_access"), server_timing.phase("model_access"):
+                access_granted = await sync_to_async(validate_model_access)(request.user, model_name)
         except Exception as e:
-            logger.error(f"[ReqID: {request_id}] Error during model access validation for '{model_name}': {e}", exc_info=True)
+            logger.error("[ReqID: %s] Error during model access validation for '%s': %s", request_id, model_name, e, exc_info=True)
             raise APIException("Error checking model permissions.", code=status.HTTP_500_INTERNAL_SERVER_ERROR) from e
 
         # --- Get blueprint instance (existence determines 404) ---
         try:
             blueprint_instance = await get_blueprint_instance(model_name, params=params)
         except Exception as e:
-            logger.error(f"[ReqID: {request_id}] Error getting blueprint instance for '{model_name}': {e}", exc_info=True)
+            logger.error("[ReqID: %s] Error getting blueprint instance for '%s': %s", request_id, model_name, e, exc_info=True)
             from swarm.utils.env_utils import client_safe_error_message
             raise APIException(
                 client_safe_error_message(
@@ -314,12 +349,13 @@ class ResponsesView(APIView):
             ) from e
 
         if blueprint_instance is None:
-            logger.error(f"[ReqID: {request_id}] Blueprint '{model_name}' not found or failed to initialize.")
+            logger.error("[ReqID: %s] Blueprint '%s' not found or failed to initialize.", request_id, model_name)
             raise NotFound(f"The requested model (blueprint) '{model_name}' was not found or could not be initialized.")
 
         if not access_granted:
-            logger.warning(f"[ReqID: {request_id}] User '{request.user}' denied access to model '{model_name}'.")
+            logger.warning("[ReqID: %s] User '%s' denied access to model '%s'.", request_id, request.user, model_name)
             raise PermissionDenied(f"You do not have permission to access the model '{model_name}'.")
+        self._metrics_blueprint = model_name  # a real model from here on: safe as a metric label
 
         # Async-by-default: the task runs on a background worker (persisted to disk
         # under its response_id) and we wait up to `wait_seconds` for it to finish —
@@ -377,7 +413,7 @@ class ResponsesView(APIView):
             response_id, request_id, model_name, list(messages), params, previous_response_id,
             user_id=owner,
         )
-        logger.info(f"[ReqID: {request_id}] /v1/responses task {response_id} started (wait={wait_seconds}s, model '{model_name}').")
+        logger.info("[ReqID: %s] /v1/responses task %s started (wait=%ss, model '%s').", request_id, response_id, wait_seconds, model_name)
 
         if wait_seconds <= 0:
             return Response(payload, status=status.HTTP_202_ACCEPTED)
@@ -407,26 +443,31 @@ class ResponsesView(APIView):
         backend_meta = None
         try:
             # user_id scopes memory per authenticated principal (not shared "default").
-            async_generator = blueprint_instance.run(messages, stream=False, user_id=user_id)
-            async for chunk in async_generator:
-                if isinstance(chunk, dict) and chunk.get("meta"):
-                    backend_meta = chunk["meta"]  # which CLI(s) answered (system_fingerprint)
-                message = _extract_message_from_chunk(chunk)
-                if message is None:
-                    continue
-                final_message = message
-                if _chunk_is_final(chunk):
-                    break
+            with server_timing.phase("generation"):
+                async_generator = blueprint_instance.run(messages, stream=False, user_id=user_id)
+                async for chunk in async_generator:
+                    if isinstance(chunk, dict) and chunk.get("meta"):
+                        backend_meta = chunk["meta"]  # which CLI(s) answered (system_fingerprint)
+                    message = _extract_message_from_chunk(chunk)
+                    if message is None:
+                        continue
+                    if final_message is None:
+                        server_timing.mark("first_chunk")
+                    final_message = message
+                    if _chunk_is_final(chunk):
+                        break
 
             if not isinstance(final_message, dict) or final_message.get('content') is None:
-                logger.error(f"[ReqID: {request_id}] Blueprint '{model_name}' did not yield any valid message chunk.")
+                logger.error("[ReqID: %s] Blueprint '%s' did not yield any valid message chunk.", request_id, model_name)
                 raise APIException("Blueprint did not return valid data.", code=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
             answer = final_message['content']
+            if output_redaction_enabled() and isinstance(answer, str):
+                answer = redact_text(answer)
         except APIException:
             raise
         except Exception as e:
-            logger.error(f"[ReqID: {request_id}] Unexpected error during /v1/responses generation: {e}", exc_info=True)
+            logger.error("[ReqID: %s] Unexpected error during /v1/responses generation: %s", request_id, e, exc_info=True)
             from swarm.utils.env_utils import client_safe_error_message
             raise APIException(
                 client_safe_error_message(e),
@@ -438,6 +479,7 @@ class ResponsesView(APIView):
             await sync_to_async(_persist)(
                 payload, messages, answer, owner=getattr(self, "_owner_principal", None)
             )
+        _record_usage(payload, user_id, "responses")  # after the retried part: counted once
         return Response(payload, status=status.HTTP_200_OK)
 
     async def _handle_streaming(
@@ -446,11 +488,38 @@ class ResponsesView(APIView):
     ) -> StreamingHttpResponse:
         """Stream ``response.output_text.delta`` SSE events, then a final completed response."""
         response_id = f"resp_{request_id}"
+        request_started = getattr(self, "_started", None) or time.monotonic()
+        timing = server_timing.current()
 
         async def event_stream():
+            server_timing.activate(timing)
+            generation_started = time.perf_counter()
+
+            def timing_trailer() -> str:
+                # Headers are gone once the body starts: report phases as an SSE comment.
+                if timing is None:
+                    return ""
+                timing.add("generation", (time.perf_counter() - generation_started) * 1000)
+                return timing.sse_comment()
+
             full_text_parts: list[str] = []
             backend_meta = None
             async_generator = None
+            # Deltas can split a secret, so redaction must see across them.
+            redactor = StreamRedactor() if output_redaction_enabled() else None
+
+            def delta_event(delta: str) -> str:
+                if not full_text_parts:
+                    metrics.record_first_chunk(self.metrics_view, model_name, request_started)
+                    server_timing.mark("first_chunk")
+                full_text_parts.append(delta)
+                event = {
+                    "type": "response.output_text.delta",
+                    "response_id": response_id,
+                    "delta": delta,
+                }
+                return f"data: {json.dumps(event)}\n\n"
+
             try:
                 # user_id scopes memory per authenticated principal (not shared "default").
                 async_generator = blueprint_instance.run(messages, stream=True, user_id=user_id)
@@ -461,16 +530,15 @@ class ResponsesView(APIView):
                     if message is None:
                         continue
                     delta = message.get("content")
+                    if delta and redactor is not None:
+                        delta = redactor.feed(str(delta))
                     if not delta:
                         continue
-                    full_text_parts.append(delta)
-                    event = {
-                        "type": "response.output_text.delta",
-                        "response_id": response_id,
-                        "delta": delta,
-                    }
-                    yield f"data: {json.dumps(event)}\n\n"
+                    yield delta_event(delta)
                     await asyncio.sleep(0.01)
+                tail = redactor.flush() if redactor is not None else ""
+                if tail:
+                    yield delta_event(tail)
 
                 final_text = "".join(full_text_parts)
                 payload = _build_response_payload(request_id, model_name, final_text, previous_response_id, messages, backend_meta)
@@ -478,17 +546,20 @@ class ResponsesView(APIView):
                     await sync_to_async(_persist)(
                         payload, messages, final_text, owner=getattr(self, "_owner_principal", None)
                     )
+                _record_usage(payload, user_id, "responses")
                 completed = {"type": "response.completed", "response": payload}
                 yield f"data: {json.dumps(completed)}\n\n"
+                yield timing_trailer()
                 yield "data: [DONE]\n\n"
             except Exception as e:
-                logger.error(f"[ReqID: {request_id}] Error during /v1/responses streaming: {e}", exc_info=True)
+                logger.error("[ReqID: %s] Error during /v1/responses streaming: %s", request_id, e, exc_info=True)
                 from swarm.utils.env_utils import client_safe_error_message
                 error_event = {
                     "type": "error",
                     "error": {"message": client_safe_error_message(e)},
                 }
                 yield f"data: {json.dumps(error_event)}\n\n"
+                yield timing_trailer()
                 yield "data: [DONE]\n\n"
             finally:
                 # Client disconnect / aclose — push GeneratorExit into blueprint so
@@ -498,6 +569,7 @@ class ResponsesView(APIView):
                         await async_generator.aclose()
                     except Exception:
                         pass
+                metrics.record_stream_end(self.metrics_view, model_name, request_started)
 
         return StreamingHttpResponse(event_stream(), content_type="text/event-stream")
 
@@ -544,6 +616,16 @@ def _build_response_payload(
     }
 
 
+def _record_usage(payload: dict[str, Any], owner: str | None, endpoint: str) -> None:
+    """Append a completed response's token usage to the usage ledger."""
+    usage = payload.get("usage") or {}
+    usage_ledger.record(
+        owner=owner, model=payload["model"], endpoint=endpoint,
+        prompt_tokens=usage.get("input_tokens", 0), completion_tokens=usage.get("output_tokens", 0),
+        request_id=payload["id"],
+    )
+
+
 def _persist(
     payload: dict[str, Any],
     messages: list[dict[str, Any]],
@@ -629,12 +711,17 @@ async def _consume_blueprint(
         message = _extract_message_from_chunk(chunk)
         if message is None:
             continue
+        if final_message is None:
+            server_timing.mark("first_chunk")
         final_message = message
         if _chunk_is_final(chunk):
             break
     if not isinstance(final_message, dict) or final_message.get("content") is None:
         raise RuntimeError("Blueprint did not return valid data.")
-    return final_message["content"], backend_meta
+    answer = final_message["content"]
+    if output_redaction_enabled() and isinstance(answer, str):
+        answer = redact_text(answer)
+    return answer, backend_meta
 
 
 def _task_spec(
@@ -674,10 +761,12 @@ def _spawn_worker(
                 "Retry later or raise SWARM_MAX_INFLIGHT."
             )
         )
+    metrics.BACKGROUND_RESPONSES.inc(state="queued")
+    # Run in a copy of the current context so the worker's spans join the request's trace.
     threading.Thread(
-        target=_run_background_response,
+        target=contextvars.copy_context().run,
         args=(
-            response_id, request_id, model_name, list(messages), params,
+            _run_background_response, response_id, request_id, model_name, list(messages), params,
             previous_response_id, user_id,
         ),
         daemon=True,
@@ -701,6 +790,8 @@ def _run_background_response(
     """
     from swarm.core.concurrency import release
 
+    metrics.BACKGROUND_RESPONSES.dec(state="queued")
+    metrics.BACKGROUND_RESPONSES.inc(state="running")
     started = time.time()
     # Prefer explicit user_id; fall back to persisted record owner for resume.
     existing = responses_store.load(response_id) or {}
@@ -709,11 +800,13 @@ def _run_background_response(
         request_id, model_name, messages, params, previous_response_id, owner=owner,
     )
     try:
-        _run_background_response_body(
-            response_id, request_id, model_name, messages, params, previous_response_id,
-            started, spec, user_id=owner,
-        )
+        with tracing.span("responses.worker", response_id=response_id, model=model_name):
+            _run_background_response_body(
+                response_id, request_id, model_name, messages, params, previous_response_id,
+                started, spec, user_id=owner,
+            )
     finally:
+        metrics.BACKGROUND_RESPONSES.dec(state="running")
         release()
 
 
@@ -770,6 +863,9 @@ def _run_background_response_body(
             backend_meta, status=status_str,
         )
         payload["started_at"] = int(started)
+        if status_str == "completed":
+            _record_usage(payload, user_id if user_id is not None else spec.get("owner"), "responses.background")
+        metrics.BACKGROUND_RUN_SECONDS.observe(time.time() - started, blueprint=model_name, status=status_str)
         if error is not None:
             from swarm.utils.env_utils import client_safe_error_message
             payload["error"] = {"message": client_safe_error_message(error if isinstance(error, Exception) else Exception(str(error)))}
@@ -778,8 +874,12 @@ def _run_background_response_body(
     def _on_progress(entry: dict) -> None:
         # Append a {role, status, result/error, model_used} entry and re-persist
         # the in_progress record so pollers see delegations as they finish.
+        # redact_sensitive_data may hand back the blueprint's own dict, so
+        # store a copy the blueprint cannot change afterwards.
+        if output_redaction_enabled():
+            entry = redact_sensitive_data(entry)
         with progress_lock:
-            progress.append(entry)
+            progress.append(dict(entry))
         in_prog = _build_response_payload(request_id, model_name, "", previous_response_id, None, None, status="in_progress")
         in_prog["started_at"] = int(started)
         _save(in_prog, None, keep_task=True)
@@ -816,25 +916,26 @@ def _run_background_response_body(
                 timeout=exec_timeout,
             )
 
-        answer, backend_meta = asyncio.run(_go())
+        with server_timing.phase("generation"):
+            answer, backend_meta = asyncio.run(_go())
         # A cancel may have landed between the last chunk and here.
         if _is_cancel_requested(response_id):
             _terminal("cancelled")
-            logger.info(f"[ReqID: {request_id}] async task {response_id} cancelled.")
+            logger.info("[ReqID: %s] async task %s cancelled.", request_id, response_id)
         else:
             _terminal(
                 "completed", answer=answer, backend_meta=backend_meta,
                 transcript=list(messages) + [{"role": "assistant", "content": answer}],
             )
-            logger.info(f"[ReqID: {request_id}] async task {response_id} completed.")
+            logger.info("[ReqID: %s] async task %s completed.", request_id, response_id)
     except (TimeoutError, asyncio.TimeoutError):
-        logger.error(f"[ReqID: {request_id}] async task {response_id} timed out.")
+        logger.error("[ReqID: %s] async task %s timed out.", request_id, response_id)
         _terminal("failed", error="execution timed out")
     except _Cancelled:
         _terminal("cancelled")
-        logger.info(f"[ReqID: {request_id}] async task {response_id} cancelled mid-run.")
+        logger.info("[ReqID: %s] async task %s cancelled mid-run.", request_id, response_id)
     except Exception as e:
-        logger.error(f"[ReqID: {request_id}] async task {response_id} failed: {e}", exc_info=True)
+        logger.error("[ReqID: %s] async task %s failed: %s", request_id, response_id, e, exc_info=True)
         _terminal("failed", error=e)
     finally:
         _clear_cancel(response_id)
@@ -885,6 +986,8 @@ def resume_pending_responses() -> int:
 class ResponsesDetailView(APIView):
     """Retrieve or delete a stored response (``/v1/responses/<id>``)."""
 
+    metrics_view = "responses_detail"
+
     @method_decorator(csrf_exempt)
     async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
         return await _async_auth_dispatch(self, request, *args, **kwargs)
@@ -910,6 +1013,8 @@ class ResponsesDetailView(APIView):
 class ResponsesCancelView(APIView):
     """Cancel an in-flight async response (``POST /v1/responses/<id>/cancel``)."""
 
+    metrics_view = "responses_cancel"
+
     @method_decorator(csrf_exempt)
     async def dispatch(self, request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
         return await _async_auth_dispatch(self, request, *args, **kwargs)
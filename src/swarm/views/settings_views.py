@@ -82,7 +82,12 @@ def _redact_setting_value(value, *, sensitive: bool):
 
 
 def redact_settings_groups(all_settings: dict) -> dict:
-    """Deep-copy settings groups with secrets redacted (dashboard + API + json_script)."""
+    """Copy settings groups with secrets redacted (dashboard + API + json_script).
+
+    Groups and settings are new dicts, but a dict/list value with nothing to
+    redact is shared with ``all_settings`` (see ``redact_sensitive_data``), so
+    treat the result as read-only.
+    """
     safe_settings: dict = {}
     for group_name, group_data in all_settings.items():
         safe_settings[group_name] = {
@@ -5,6 +5,7 @@ from asgiref.sync import async_to_sync, sync_to_async
 from django.conf import settings
 
 from swarm.blueprints.dynamic_team.blueprint_dynamic_team import DynamicTeamBlueprint
+from swarm.core import metrics, server_timing, tracing
 
 # Assuming the discovery functions are correctly located now
 from swarm.core.blueprint_discovery import (
@@ -142,7 +143,7 @@ def _load_all_blueprint_metadata_sync():
                 "tags": ["team", "dynamic"],
             },
         }
-    logger.info(f"Found blueprint classes: {list(blueprint_classes.keys())}")
+    logger.info("Found blueprint classes: %s", list(blueprint_classes.keys()))
     _blueprint_meta_cache = blueprint_classes
     return blueprint_classes
 
@@ -150,6 +151,7 @@ def _load_all_blueprint_metadata_sync():
 def get_available_blueprints():
      """Asynchronously retrieves available blueprint classes."""
      global _blueprint_meta_cache
+     metrics.CACHE_LOOKUPS.inc(cache="blueprint_registry", result="miss" if _blueprint_meta_cache is None else "hit")
      if _blueprint_meta_cache is None:
           _load_all_blueprint_metadata_sync()
      return _blueprint_meta_cache
@@ -163,17 +165,25 @@ async def get_blueprint_instance(blueprint_id: str, params: dict = None):
     Always instantiates per call so concurrent requests never share mutable
     blueprint state.
     """
-    logger.debug(f"Getting instance for blueprint: {blueprint_id} with params: {params}")
+    logger.debug("Getting instance for blueprint: %s with params: %s", blueprint_id, params)
 
     available_blueprint_classes = await get_available_blueprints()
 
     if not isinstance(available_blueprint_classes, dict) or blueprint_id not in available_blueprint_classes:
-        logger.error(f"Blueprint ID '{blueprint_id}' not found in available blueprint classes.")
+        logger.error("Blueprint ID '%s' not found in available blueprint classes.", blueprint_id)
         return None
 
     blueprint_info = available_blueprint_classes[blueprint_id]
     blueprint_class = blueprint_info['class_type']
 
+    with tracing.span("blueprint.instantiate", blueprint=blueprint_id) as span, server_timing.phase("blueprint"):
+        instance = _instantiate_blueprint(blueprint_class, blueprint_id, params)
+        if instance is None:
+            span.set_error("instantiation failed")
+        return instance
+
+
+def _instantiate_blueprint(blueprint_class, blueprint_id: str, params: dict | None):
     try:
         # Instantiate without params; blueprints that need them use set_params.
         instance = blueprint_class(blueprint_id=blueprint_id)
@@ -185,25 +195,25 @@ async def get_blueprint_instance(blueprint_id: str, params: dict = None):
                 instance.llm_profile_name = team_info["llm_profile"]
         except Exception:
             pass
-        logger.info(f"Successfully instantiated blueprint: {blueprint_id}")
+        logger.info("Successfully instantiated blueprint: %s", blueprint_id)
         if hasattr(instance, 'set_params') and callable(instance.set_params):
              instance.set_params(params)
 
         return instance
     except Exception as e:
         # Catch potential TypeError during instantiation too
-        logger.error(f"Failed to instantiate blueprint class '{blueprint_id}': {e}", exc_info=True)
+        logger.error("Failed to instantiate blueprint class '%s': %s", blueprint_id, e, exc_info=True)
         return None
 
 # --- Model Access Validation ---
 def validate_model_access(user, model_name):
      """Synchronous permission check."""
-     logger.debug(f"Validating access for user '{user}' to model '{model_name}'...")
+     logger.debug("Validating access for user '%s' to model '%s'...", user, model_name)
      try:
          available = async_to_sync(get_available_blueprints)()
          is_available = model_name in available
-         logger.debug(f"Model '{model_name}' availability: {is_available}")
+         logger.debug("Model '%s' availability: %s", model_name, is_available)
          return is_available
      except Exception as e:
-         logger.error(f"Error checking model availability during validation: {e}", exc_info=True)
+         logger.error("Error checking model availability during validation: %s", e, exc_info=True)
          return False
@@ -0,0 +1,85 @@
+"""``GET /metrics``: Prometheus exposition of the API hot paths, behind API auth."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+import pytest
+from django.apps import apps
+
+PY = sys.executable
+TOKEN = "metrics-test-token"
+
+
+@pytest.fixture
+def cli_config(monkeypatch):
+    cfg = {"cli_agents": {"b": {"cmd": [PY, "-c", "import sys; print('B:' + sys.argv[1])", "{prompt}"]}}}
+    monkeypatch.setattr(apps.get_app_config("swarm"), "config", cfg, raising=False)
+    monkeypatch.setenv("SWARM_TEST_MODE", "1")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-dummy-test-mode")
+    monkeypatch.delenv("SWARM_METRICS_DIR", raising=False)
+    return cfg
+
+
+def _chat(client, stream: bool):
+    body = {"model": "cli_agent", "stream": stream, "params": {"cli": "b"}, "messages": [{"role": "user", "content": "hi"}]}
+    resp = client.post("/v1/chat/completions", data=json.dumps(body), content_type="application/json")
+    assert resp.status_code == 200
+    if stream:
+
+        async def _drain():
+            return b"".join([c async for c in resp.streaming_content])
+
+        assert b"[DONE]" in asyncio.run(_drain())
+
+
+def _value(text: str, prefix: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(prefix):
+            return float(line.rsplit(" ", 1)[1])
+    return 0.0
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("cli_config")
+def test_metrics_cover_requests_ttft_cli_and_tokens(client):
+    before = client.get("/metrics").content.decode()
+    _chat(client, stream=False)
+    _chat(client, stream=True)
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp["Content-Type"].startswith("text/plain; version=0.0.4")
+    text = resp.content.decode()
+
+    def delta(prefix: str) -> float:
+        return _value(text, prefix) - _value(before, prefix)
+
+    assert delta('swarm_http_requests_total{view="chat_completions",status="200"}') == 2
+    assert delta('swarm_request_duration_seconds_count{view="chat_completions",blueprint="cli_agent",stream="false"}') == 1
+    assert delta('swarm_request_duration_seconds_count{view="chat_completions",blueprint="cli_agent",stream="true"}') == 1
+    assert delta('swarm_time_to_first_token_seconds_count{view="chat_completions",blueprint="cli_agent"}') == 1
+    assert delta('swarm_cli_exits_total{adapter="b",code="0"}') == 2
+    assert delta('swarm_cli_spawn_seconds_count{adapter="b"}') == 2
+    assert delta('swarm_tokens_total{blueprint="cli_agent",kind="completion"}') > 0
+    assert "swarm_inflight_requests 0" in text and "# TYPE swarm_inflight_limit gauge" in text
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("cli_config")
+def test_unknown_models_never_become_labels(client):
+    body = {"model": "no-such-model", "messages": [{"role": "user", "content": "hi"}]}
+    resp = client.post("/v1/chat/completions", data=json.dumps(body), content_type="application/json")
+    assert resp.status_code == 404
+    assert "no-such-model" not in client.get("/metrics").content.decode()
+
+
+@pytest.mark.django_db
+def test_metrics_require_auth_when_enabled(client, settings):
+    settings.ENABLE_API_AUTH = True
+    settings.SWARM_API_KEY = TOKEN
+    settings.SWARM_API_KEYS = [TOKEN]
+    assert client.get("/metrics").status_code in (401, 403)
+    resp = client.get("/metrics", HTTP_AUTHORIZATION=f"Bearer {TOKEN}")
+    assert resp.status_code == 200 and b"# TYPE swarm_http_requests_total counter" in resp.content
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -111,3 +113,57 @@ def test_http_e2e_legacy_alias_cli_fusion(api_client):
     assert response.status_code == status.HTTP_200_OK
     assert response.json()["choices"][0]["message"]["content"]
     assert "cli_fusion" in (response.json().get("system_fingerprint") or "cli_fusion")
+
+
+def _stream_moa(api_client, params):
+    async def fake_get_instance(model_name, params=None):
+        bp = MoABlueprint(blueprint_id=model_name)
+        bp._config = {}
+        bp.set_params(params)
+        return bp
+
+    async def collect(response):
+        return b"".join([c async for c in response.streaming_content]).decode()
+
+    with patch(
+        "swarm.views.chat_views.get_blueprint_instance",
+        new=AsyncMock(side_effect=fake_get_instance),
+    ), patch(
+        "swarm.views.chat_views.validate_model_access",
+        return_value=True,
+    ):
+        response = api_client.post(
+            "/v1/chat/completions",
+            {
+                "model": "moa",
+                "messages": [{"role": "user", "content": "How should we rate-limit?"}],
+                "stream": True,
+                "params": params,
+            },
+            format="json",
+        )
+        assert response.status_code == status.HTTP_200_OK
+        return asyncio.run(collect(response)).split("\n\n")
+
+
+@pytest.mark.django_db
+def test_http_e2e_moa_stream_forwards_seat_progress(api_client, monkeypatch):
+    monkeypatch.setenv("SWARM_REDACT_OUTPUT", "1")
+    events = _stream_moa(api_client, {
+        "participants": ["claude", "codex"],
+        "fake_responses": {
+            "claude": '{"claim":"token bucket","confidence":0.9}',
+            "codex": '{"claim":"use sk-abc123def456ghi789","confidence":0.85}',
+        },
+    })
+
+    progress = [json.loads(e[len(": moa-progress "):]) for e in events if e.startswith(": moa-progress ")]
+    first_data = next(i for i, e in enumerate(events) if e.startswith("data: {"))
+    assert all(i < first_data for i, e in enumerate(events) if e.startswith(": moa-progress "))
+    by_seat = {seat: [p for p in progress if p["seat"] == seat] for seat in ("claude", "codex")}
+    for seat, seat_events in by_seat.items():
+        assert seat_events[-1]["done"] and seat_events[-1]["ok"], seat
+        assert "".join(p.get("delta", "") for p in seat_events)
+    assert "token bucket" in "".join(p.get("delta", "") for p in by_seat["claude"])
+    assert "sk-abc123" not in "".join(events)
+    assert events[-2] == "data: [DONE]"
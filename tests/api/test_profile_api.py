@@ -0,0 +1,52 @@
+"""``GET /v1/profile``: on-demand sampling profile, admin only."""
+
+from __future__ import annotations
+
+import pytest
+from django.contrib.auth import get_user_model
+
+TOKEN = "profile-user-token"
+ADMIN_TOKEN = "profile-admin-token"
+
+
+@pytest.mark.django_db
+def test_profile_returns_folded_stacks_and_json(client):
+    resp = client.get("/v1/profile", {"seconds": "0.2", "interval_ms": "2", "idle": "1"})
+    assert resp.status_code == 200 and resp["Content-Type"].startswith("text/plain")
+    assert int(resp["X-Profile-Samples"]) > 0
+    lines = resp.content.decode().splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+    data = client.get("/v1/profile", {"seconds": "0.1", "format": "json", "idle": "1"}).json()
+    assert data["samples"] > 0 and data["top"] and "collapsed" in data
+    assert client.get("/v1/profile", {"seconds": "0"}).status_code == 400
+    assert client.get("/v1/profile", {"seconds": "abc"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_profile_is_admin_only(client, settings):
+    settings.ENABLE_API_AUTH = True
+    settings.SWARM_API_KEY = TOKEN
+    settings.SWARM_API_KEYS = [TOKEN, ADMIN_TOKEN]
+    settings.SWARM_ADMIN_API_KEYS = [ADMIN_TOKEN]
+    params = {"seconds": "0.05"}
+    assert client.get("/v1/profile", params).status_code in (401, 403)
+    assert client.get("/v1/profile", params, HTTP_AUTHORIZATION=f"Bearer {TOKEN}").status_code == 403
+    assert client.get("/v1/profile", params, HTTP_AUTHORIZATION=f"Bearer {ADMIN_TOKEN}").status_code == 200
+
+    staff = get_user_model().objects.create_user("ops", password="pw", is_staff=True)
+    client.force_login(staff)
+    assert client.get("/v1/profile", params).status_code == 200
+
+
+@pytest.mark.django_db
+def test_profile_without_api_auth_is_loopback_only(client, settings):
+    settings.ENABLE_API_AUTH = False
+    settings.SWARM_ADMIN_API_KEYS = []
+    params = {"seconds": "0.05"}
+    assert client.get("/v1/profile", params, REMOTE_ADDR="::1").status_code == 200
+    assert client.get("/v1/profile", params, REMOTE_ADDR="203.0.113.7").status_code in (401, 403)
+
+    staff = get_user_model().objects.create_user("ops", password="pw", is_staff=True)
+    client.force_login(staff)
+    assert client.get("/v1/profile", params, REMOTE_ADDR="203.0.113.7").status_code == 200
@@ -0,0 +1,64 @@
+"""``SWARM_REDACT_OUTPUT``: secrets are masked in SSE deltas, answers and stored responses."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+import pytest
+from django.apps import apps
+
+PY = sys.executable
+# Writes the secret in two pieces so it only shows up across deltas.
+LEAKY = (
+    "import sys, time\n"
+    "for part in ('use sk-', 'abc123', ' please'):\n"
+    "    sys.stdout.write(part); sys.stdout.flush(); time.sleep(0.05)\n"
+)
+
+
+@pytest.fixture
+def cli_config(monkeypatch, tmp_path):
+    # redact: false on the adapter, so the views do the masking.
+    cfg = {"cli_agents": {"leaky": {"cmd": [PY, "-c", LEAKY, "{prompt}"], "redact": False}}}
+    monkeypatch.setattr(apps.get_app_config("swarm"), "config", cfg, raising=False)
+    monkeypatch.setenv("SWARM_TEST_MODE", "1")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-dummy-test-mode")
+    monkeypatch.setenv("SWARM_RESPONSES_DIR", str(tmp_path))
+    monkeypatch.setenv("SWARM_REDACT_OUTPUT", "1")
+    return cfg
+
+
+def _events(resp) -> list[dict]:
+    async def _collect():
+        return b"".join([c async for c in resp.streaming_content])
+
+    body = asyncio.run(_collect()).decode()
+    return [json.loads(e[len("data: "):]) for e in body.split("\n\n") if e.startswith("data: {")]
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("cli_config")
+def test_chat_stream_and_answer_are_redacted(client):
+    body = {"model": "cli_agent", "stream": True, "params": {"cli": "leaky"}, "messages": [{"role": "user", "content": "hi"}]}
+    resp = client.post("/v1/chat/completions", data=json.dumps(body), content_type="application/json")
+    deltas = [e["choices"][0]["delta"]["content"] for e in _events(resp)]
+    assert "".join(deltas) == "use [REDACTED] please"
+
+    body["stream"] = False
+    resp = client.post("/v1/chat/completions", data=json.dumps(body), content_type="application/json")
+    assert resp.json()["choices"][0]["message"]["content"] == "use [REDACTED] please"
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("cli_config")
+def test_responses_stream_and_stored_record_are_redacted(client):
+    body = {"model": "cli_agent", "stream": True, "params": {"cli": "leaky"}, "input": "hi"}
+    resp = client.post("/v1/responses", data=json.dumps(body), content_type="application/json")
+    events = _events(resp)
+    deltas = [e["delta"] for e in events if e["type"] == "response.output_text.delta"]
+    assert "".join(deltas) == "use [REDACTED] please"
+    completed = next(e for e in events if e["type"] == "response.completed")["response"]
+    stored = client.get(f"/v1/responses/{completed['id']}").content.decode()
+    assert "[REDACTED]" in stored and "abc123" not in stored
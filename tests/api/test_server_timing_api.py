@@ -0,0 +1,70 @@
+"""``Server-Timing`` on API responses: a header, or a final SSE comment on streams."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+import pytest
+from django.apps import apps
+
+PY = sys.executable
+
+
+@pytest.fixture
+def cli_config(monkeypatch, tmp_path):
+    cfg = {"cli_agents": {"b": {"cmd": [PY, "-c", "import sys; print('B:' + sys.argv[1])", "{prompt}"]}}}
+    monkeypatch.setattr(apps.get_app_config("swarm"), "config", cfg, raising=False)
+    monkeypatch.setenv("SWARM_TEST_MODE", "1")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-dummy-test-mode")
+    monkeypatch.setenv("SWARM_RESPONSES_DIR", str(tmp_path))
+    return cfg
+
+
+def _phases(value: str) -> list[str]:
+    return [entry.split(";")[0] for entry in value.split(", ")]
+
+
+def _drain(resp) -> str:
+    async def _collect():
+        return b"".join([c async for c in resp.streaming_content])
+
+    return asyncio.run(_collect()).decode()
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("cli_config")
+def test_chat_completion_header(client):
+    body = {"model": "cli_agent", "params": {"cli": "b"}, "messages": [{"role": "user", "content": "hi"}]}
+    resp = client.post("/v1/chat/completions", data=json.dumps(body), content_type="application/json")
+    assert resp.status_code == 200
+    phases = _phases(resp["Server-Timing"])
+    assert {"auth", "validate", "model_access", "blueprint", "first_chunk", "generation"} <= set(phases)
+    assert phases[-1] == "total"
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("cli_config")
+def test_streams_end_with_a_timing_comment(client):
+    body = {"model": "cli_agent", "stream": True, "params": {"cli": "b"}, "messages": [{"role": "user", "content": "hi"}]}
+    resp = client.post("/v1/chat/completions", data=json.dumps(body), content_type="application/json")
+    assert "Server-Timing" not in resp
+    events = _drain(resp).split("\n\n")
+    assert events[-3].startswith(": server-timing ") and events[-2] == "data: [DONE]"
+    assert {"first_chunk", "generation", "total"} <= set(_phases(events[-3][len(": server-timing "):]))
+
+    body = {"model": "cli_agent", "stream": True, "params": {"cli": "b"}, "input": "hi"}
+    resp = client.post("/v1/responses", data=json.dumps(body), content_type="application/json")
+    events = _drain(resp).split("\n\n")
+    assert events[-3].startswith(": server-timing ") and events[-2] == "data: [DONE]"
+    assert {"auth", "model_access", "blueprint", "generation", "persist"} <= set(_phases(events[-3][len(": server-timing "):]))
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("cli_config")
+def test_disabled(client, monkeypatch):
+    monkeypatch.setenv("SWARM_SERVER_TIMING", "0")
+    body = {"model": "cli_agent", "params": {"cli": "b"}, "messages": [{"role": "user", "content": "hi"}]}
+    resp = client.post("/v1/chat/completions", data=json.dumps(body), content_type="application/json")
+    assert resp.status_code == 200 and "Server-Timing" not in resp
@@ -0,0 +1,83 @@
+"""Request tracing over ``/v1/chat/completions``: one trace per request, from
+the view down to the agent CLI subprocess."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+import pytest
+from django.apps import apps
+
+from swarm.core import tracing
+
+PY = sys.executable
+
+
+@pytest.fixture
+def spans_file(tmp_path, monkeypatch):
+    cfg = {"cli_agents": {"b": {"cmd": [PY, "-c", "import sys; print('B:' + sys.argv[1])", "{prompt}"]}}}
+    monkeypatch.setattr(apps.get_app_config("swarm"), "config", cfg, raising=False)
+    monkeypatch.setenv("SWARM_TEST_MODE", "1")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-dummy-test-mode")
+    path = tmp_path / "spans.jsonl"
+    tracing.configure(path)
+    try:
+        yield path
+    finally:
+        tracing.configure(enabled=False)
+
+
+def _post(client, stream: bool):
+    body = {"model": "cli_agent", "stream": stream, "params": {"cli": "b"}, "messages": [{"role": "user", "content": "hi"}]}
+    return client.post("/v1/chat/completions", data=json.dumps(body), content_type="application/json")
+
+
+def _drain(response) -> str:
+    stream = response.streaming_content
+    if hasattr(stream, "__aiter__"):
+
+        async def _collect():
+            return b"".join([c async for c in stream])
+
+        return asyncio.run(_collect()).decode()
+    return b"".join(stream).decode()
+
+
+def _chain(spans: list[dict], name: str) -> list[str]:
+    by_id = {s["span_id"]: s for s in spans}
+    span = next(s for s in spans if s["name"] == name)
+    chain = [span["name"]]
+    while span.get("parent_span_id"):
+        span = by_id[span["parent_span_id"]]
+        chain.append(span["name"])
+    return chain
+
+
+@pytest.mark.django_db
+def test_chat_completion_trace(client, spans_file):
+    resp = _post(client, stream=False)
+    assert resp.status_code == 200, resp.content[:300]
+
+    spans = tracing.load_spans(spans_file)
+    assert len({s["trace_id"] for s in spans}) == 1
+    assert _chain(spans, "cli.run") == ["cli.run", "blueprint.run", "http.chat_completions"]
+    assert _chain(spans, "blueprint.instantiate") == ["blueprint.instantiate", "http.chat_completions"]
+    request = next(s for s in spans if s["name"] == "http.chat_completions")
+    assert request["kind"] == "SERVER"
+    assert request["attributes"]["model"] == "cli_agent" and request["attributes"]["status_code"] == 200
+    assert {"auth", "validate", "model_access"} <= {s["name"] for s in spans}
+
+
+@pytest.mark.django_db
+def test_streamed_chat_completion_trace(client, spans_file):
+    resp = _post(client, stream=True)
+    assert resp.status_code == 200
+    assert "[DONE]" in _drain(resp)
+
+    spans = tracing.load_spans(spans_file)
+    assert _chain(spans, "cli.run") == ["cli.run", "blueprint.run", "http.chat_completions"]
+    run = next(s for s in spans if s["name"] == "blueprint.run")
+    assert run["attributes"]["stream"] is True and run["attributes"]["chunks"] >= 1
+    assert [e["name"] for e in run["events"]] == ["first_chunk"]
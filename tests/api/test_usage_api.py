@@ -0,0 +1,84 @@
+"""Usage ledger over the API: chat/responses record usage, ``GET /v1/usage`` reads rollups."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+
+import pytest
+from django.apps import apps
+
+from swarm.auth import token_principal
+from swarm.core import usage_ledger
+
+PY = sys.executable
+TOKEN = "usage-user-token"
+OTHER = "usage-other-token"
+ADMIN = "usage-admin-token"
+
+
+@pytest.fixture
+def ledger(tmp_path, monkeypatch):
+    cfg = {"cli_agents": {"b": {"cmd": [PY, "-c", "import sys; print('B:' + sys.argv[1])", "{prompt}"]}}}
+    monkeypatch.setattr(apps.get_app_config("swarm"), "config", cfg, raising=False)
+    monkeypatch.setenv("SWARM_TEST_MODE", "1")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-dummy-test-mode")
+    monkeypatch.setenv("SWARM_RESPONSES_DIR", str(tmp_path / "responses"))
+    monkeypatch.setenv("SWARM_USAGE_LEDGER", "1")
+    led = usage_ledger.UsageLedger(tmp_path / "usage.sqlite3")
+    monkeypatch.setattr(usage_ledger, "USAGE_LEDGER", led)
+    yield led
+    led.close()
+
+
+def _post(client, path, body, **headers):
+    resp = client.post(path, data=json.dumps(body), content_type="application/json", **headers)
+    assert resp.status_code == 200, resp.content[:300]
+    if body.get("stream"):
+
+        async def _drain():
+            return b"".join([c async for c in resp.streaming_content])
+
+        asyncio.run(_drain())
+    return resp
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("ledger")
+def test_chat_and_responses_usage_is_rolled_up(client):
+    chat = {"model": "cli_agent", "params": {"cli": "b"}, "messages": [{"role": "user", "content": "hello there"}]}
+    _post(client, "/v1/chat/completions", chat)
+    _post(client, "/v1/chat/completions", {**chat, "stream": True})
+    _post(client, "/v1/responses", {"model": "cli_agent", "params": {"cli": "b"}, "input": "hi", "store": False})
+    assert usage_ledger.flush_usage(5)
+
+    data = client.get("/v1/usage", {"group_by": "model"}).json()
+    assert data["object"] == "usage" and data["granularity"] == "day"
+    [row] = data["data"]
+    assert row["model"] == "cli_agent" and row["requests"] == 3
+    assert row["prompt_tokens"] > 0 and row["completion_tokens"] > 0
+
+    hourly = client.get("/v1/usage", {"granularity": "hour", "group_by": "bucket,owner"}).json()["data"]
+    assert sum(r["requests"] for r in hourly) == 3 and hourly[0]["owner"] == usage_ledger.ANONYMOUS
+    assert client.get("/v1/usage", {"since": "yesterday"}).status_code == 400
+    assert client.get("/v1/usage", {"granularity": "week"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_usage_is_scoped_to_the_caller_unless_admin(client, settings, ledger):
+    settings.ENABLE_API_AUTH = True
+    settings.SWARM_API_KEY = TOKEN
+    settings.SWARM_API_KEYS = [TOKEN, OTHER, ADMIN]
+    settings.SWARM_ADMIN_API_KEYS = [ADMIN]
+    now = __import__("time").time()
+    ledger.write([
+        usage_ledger.UsageEvent(now, token_principal(TOKEN), "cli_agent", "chat.completions", 10, 5),
+        usage_ledger.UsageEvent(now, token_principal(OTHER), "cli_agent", "chat.completions", 100, 50),
+    ])
+
+    assert client.get("/v1/usage").status_code in (401, 403)
+    mine = client.get("/v1/usage", {"owner": token_principal(OTHER)}, HTTP_AUTHORIZATION=f"Bearer {TOKEN}").json()["data"]
+    assert [r["owner"] for r in mine] == [token_principal(TOKEN)]
+    everyone = client.get("/v1/usage", HTTP_AUTHORIZATION=f"Bearer {ADMIN}").json()["data"]
+    assert {r["owner"] for r in everyone} == {token_principal(TOKEN), token_principal(OTHER)}
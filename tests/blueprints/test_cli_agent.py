@@ -504,3 +504,37 @@ async def test_param_consensus_overrides_config_to_single():
     chunks = await _collect(bp.run([{"role": "user", "content": "ping"}]))
     assert _final_content(chunks) == "SOLO:ping"
     assert "consensus agent" not in _progress_text(chunks)
+
+
+# --------------------------------------------------------------------------- #
+# Hedged failover (params.hedge / cli_fusion.hedge)
+# --------------------------------------------------------------------------- #
+
+def _hung() -> dict:
+    return {"cmd": [PY, "-c", "import time; time.sleep(30)", "{prompt}"]}
+
+
+async def test_hedge_param_races_backup_against_hung_primary():
+    cfg = {
+        "cli_agents": {"slow": _hung(), "backup": _ok("BACKUP")},
+        "cli_fusion": {"default_cli": "slow"},
+    }
+    bp = CliAgentBlueprint(blueprint_id="cli_agent", config=cfg)
+    bp.set_params({"hedge": {"after": 0.3}})
+    chunks = await _collect(bp.run([{"role": "user", "content": "ping"}]))
+    assert _final_content(chunks) == "BACKUP: ping"
+    assert chunks[-1]["meta"]["hedge"] == {
+        "winner": "backup", "launched": ["slow", "backup"], "terminated": ["slow"],
+    }
+    progress = _progress_text(chunks)
+    assert "Hedging with CLI agent `backup`" in progress and "stopping `slow`" in progress
+
+
+async def test_hedge_config_applies_to_streaming_requests_as_one_message():
+    cfg = {
+        "cli_agents": {"slow": _hung(), "backup": _ok("BACKUP")},
+        "cli_fusion": {"default_cli": "slow", "hedge": 0.3},
+    }
+    bp = CliAgentBlueprint(blueprint_id="cli_agent", config=cfg)
+    chunks = await _collect(bp.run([{"role": "user", "content": "ping"}], stream=True))
+    assert _message_contents(chunks) == ["BACKUP: ping"]
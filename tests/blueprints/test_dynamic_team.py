@@ -0,0 +1,110 @@
+"""dynamic_team: teams with MCP servers answer through the concurrent tool loop."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import swarm.blueprints.dynamic_team.blueprint_dynamic_team as dynamic_team_module
+import swarm.extensions.mcp.mcp_utils as mcp_utils
+from swarm.blueprints.dynamic_team.blueprint_dynamic_team import DynamicTeamBlueprint
+
+_LLM = {"default": {"provider": "openai", "model": "m", "base_url": "http://x/v1", "api_key": "k"}}
+
+
+def _completion(content=None, tool_calls=None):
+    from openai.types.chat import ChatCompletionMessage
+
+    message = ChatCompletionMessage.model_validate(
+        {"role": "assistant", "content": content, "tool_calls": tool_calls}
+    )
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class FakeAsyncOpenAI:
+    replies: list = []
+    requests: list = []
+
+    def __init__(self, **_kwargs):
+        self.chat = SimpleNamespace(completions=self)
+
+    async def create(self, **kwargs):
+        FakeAsyncOpenAI.requests.append(kwargs)
+        return FakeAsyncOpenAI.replies.pop(0)
+
+
+async def test_team_with_mcp_servers_runs_tool_calls_concurrently(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def fetch(url: str):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return f"body of {url}"
+
+    async def fake_discover(agent, _config):
+        assert agent.mcp_servers == ["fetcher"]
+        assert agent.max_tool_concurrency == 3
+        return [fetch]
+
+    calls = [
+        {"id": f"c{i}", "type": "function", "function": {"name": "fetch", "arguments": json.dumps({"url": f"u{i}"})}}
+        for i in range(4)
+    ]
+    FakeAsyncOpenAI.replies = [_completion(tool_calls=calls), _completion(content=" fetched four ")]
+    FakeAsyncOpenAI.requests = []
+    monkeypatch.setattr(dynamic_team_module, "AsyncOpenAI", FakeAsyncOpenAI)
+    monkeypatch.setattr(mcp_utils, "discover_and_merge_agent_tools", fake_discover)
+
+    config = {
+        "llm": _LLM,
+        "blueprints": {"ops-team": {"mcp_servers": ["fetcher"], "max_tool_concurrency": 3}},
+    }
+    bp = DynamicTeamBlueprint(blueprint_id="ops-team", config=config)
+    chunks = [c async for c in bp.run([{"role": "user", "content": "fetch"}], stream=False)]
+
+    assert chunks[-1]["messages"][0]["content"] == "fetched four"
+    assert peak == 3
+    tool_messages = [m for m in FakeAsyncOpenAI.requests[1]["messages"] if m["role"] == "tool"]
+    assert [m["content"] for m in tool_messages] == [f"body of u{i}" for i in range(4)]
+
+
+async def test_team_without_mcp_servers_is_single_shot(monkeypatch):
+    FakeAsyncOpenAI.replies = [_completion(content="hello")]
+    FakeAsyncOpenAI.requests = []
+    monkeypatch.setattr(dynamic_team_module, "AsyncOpenAI", FakeAsyncOpenAI)
+
+    bp = DynamicTeamBlueprint(blueprint_id="plain-team", config={"llm": _LLM})
+    chunks = [c async for c in bp.run([{"role": "user", "content": "hi"}], stream=False)]
+
+    assert chunks[-1]["messages"][0]["content"] == "hello"
+    assert "tools" not in FakeAsyncOpenAI.requests[0]
+
+
+async def test_prepare_run_discovers_mcp_tools_once(monkeypatch):
+    discovered = []
+
+    async def fake_discover(agent, _config):
+        discovered.append(agent)
+        return []
+
+    FakeAsyncOpenAI.replies = [_completion(content="done")]
+    FakeAsyncOpenAI.requests = []
+    monkeypatch.setattr(dynamic_team_module, "AsyncOpenAI", FakeAsyncOpenAI)
+    monkeypatch.setattr(mcp_utils, "discover_and_merge_agent_tools", fake_discover)
+
+    config = {"llm": _LLM, "blueprints": {"ops-team": {"mcp_servers": ["fetcher"]}}}
+    bp = DynamicTeamBlueprint(blueprint_id="ops-team", config=config)
+    messages = [{"role": "user", "content": "go"}]
+    await bp.prepare_run(messages, stream=True)
+    assert discovered == []  # streaming runs never use tools
+    await bp.prepare_run(messages)
+    chunks = [c async for c in bp.run(messages, stream=False)]
+
+    assert chunks[-1]["messages"][0]["content"] == "done"
+    assert len(discovered) == 1  # run() reused the agent prepare_run built
+    assert bp._prepared_tool_agent is None
@@ -0,0 +1,47 @@
+"""Tests for the `swarm-cli bench` load generator command."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+from typer.testing import CliRunner
+
+from swarm.core import swarm_cli
+from swarm.core.swarm_cli import app
+
+runner = CliRunner(mix_stderr=False)
+
+
+@pytest.fixture(autouse=True)
+def _quiet_logging():
+    logging.disable(logging.CRITICAL)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+
+async def _echo_app(_scope, receive, send):
+    await receive()
+    print("blueprint chatter that must not reach the report")
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"data: hi\n\n"})
+
+
+def test_bench_json_report_in_process(monkeypatch):
+    monkeypatch.setattr(swarm_cli, "_load_asgi_app", lambda: _echo_app)
+    result = runner.invoke(app, ["bench", "--mix", "chat=1,stream=1", "-n", "8", "-c", "2", "--json"])
+    assert result.exit_code == 0, result.stderr
+    report = json.loads(result.stdout)
+    assert report["requests"] == 8 and report["ok"] == 8
+    assert report["target"] == "asgi" and report["arrival"] == "closed loop x2"
+    assert report["max_inflight"] >= 1
+    assert "blueprint chatter" not in result.stdout
+
+
+def test_bench_rejects_bad_mix():
+    result = runner.invoke(app, ["bench", "--mix", "tweets"])
+    assert result.exit_code == 2
+    assert "unknown request kind" in result.stderr
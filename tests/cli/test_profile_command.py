@@ -0,0 +1,39 @@
+"""Tests for `swarm-cli profile` (client of ``GET /v1/profile``)."""
+
+from __future__ import annotations
+
+import httpx
+from typer.testing import CliRunner
+
+from swarm.core.swarm_cli import app
+
+runner = CliRunner(mix_stderr=False)
+
+FOLDED = "MainThread;run (core/loop.py:1);encode (core/json.py:9) 30\nMainThread;run (core/loop.py:1) 10\n"
+
+
+def test_profile_saves_folded_stacks_and_prints_top(tmp_path, monkeypatch):
+    calls = []
+
+    def fake_get(url, **kwargs):
+        calls.append((url, kwargs))
+        headers = {"x-profile-samples": "40", "x-profile-overhead": "0.0125"}
+        return httpx.Response(200, text=FOLDED, headers=headers)
+
+    monkeypatch.setattr(httpx, "get", fake_get)
+    out = tmp_path / "cpu.folded"
+    result = runner.invoke(app, ["profile", "--url", "http://srv:8000/", "-s", "3", "-o", str(out), "--api-key", "k"])
+    assert result.exit_code == 0, result.stderr
+    assert out.read_text() == FOLDED
+    url, kwargs = calls[0]
+    assert url == "http://srv:8000/v1/profile" and kwargs["params"] == {"seconds": 3.0}
+    assert kwargs["headers"] == {"authorization": "Bearer k"}
+    lines = result.stdout.splitlines()
+    assert "40 samples, sampler overhead 1.25%" in lines[0]
+    assert "75.0" in lines[2] and "encode (core/json.py:9)" in lines[2]
+
+
+def test_profile_reports_http_errors(monkeypatch):
+    monkeypatch.setattr(httpx, "get", lambda *_args, **_kwargs: httpx.Response(403, text="Admin access required"))
+    result = runner.invoke(app, ["profile", "-s", "1"])
+    assert result.exit_code == 1 and "HTTP 403" in result.stderr
@@ -0,0 +1,45 @@
+"""Tests for the `swarm-cli trace` span viewer / Chrome exporter."""
+
+from __future__ import annotations
+
+import json
+
+from typer.testing import CliRunner
+
+from swarm.core import tracing
+from swarm.core.swarm_cli import app
+
+runner = CliRunner(mix_stderr=False)
+
+
+def _record(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracing.configure(path)
+    try:
+        with tracing.span("http.chat_completions"), tracing.span("cli.run") as run:
+            run.set_error("exit 1")
+    finally:
+        tracing.configure(enabled=False)
+    return path
+
+
+def test_trace_prints_span_tree(tmp_path):
+    result = runner.invoke(app, ["trace", str(_record(tmp_path))])
+    assert result.exit_code == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert lines[1].strip().startswith("http.chat_completions")
+    assert lines[2].strip().startswith("cli.run") and "ERROR exit 1" in lines[2]
+
+
+def test_trace_chrome_export(tmp_path):
+    out = tmp_path / "trace.json"
+    result = runner.invoke(app, ["trace", str(_record(tmp_path)), "--chrome", str(out)])
+    assert result.exit_code == 0, result.stderr
+    events = json.loads(out.read_text())["traceEvents"]
+    assert {e["name"] for e in events} == {"http.chat_completions", "cli.run"}
+    assert next(e for e in events if e["name"] == "cli.run")["args"]["error"] == "exit 1"
+
+
+def test_trace_missing_file(tmp_path):
+    result = runner.invoke(app, ["trace", str(tmp_path / "nope.jsonl")])
+    assert result.exit_code == 1 and "no spans file" in result.stderr
@@ -0,0 +1,36 @@
+"""Tests for `swarm-cli usage` (reads the local usage ledger's rollups)."""
+
+from __future__ import annotations
+
+import json
+import time
+
+from typer.testing import CliRunner
+
+from swarm.core.swarm_cli import app
+from swarm.core.usage_ledger import UsageEvent, UsageLedger
+
+runner = CliRunner(mix_stderr=False)
+
+
+def test_usage_table_and_json(tmp_path):
+    db = tmp_path / "usage.sqlite3"
+    ledger = UsageLedger(db)
+    now = time.time()
+    ledger.write([
+        UsageEvent(now, "user:alice", "cli_agent", "chat.completions", 100, 20),
+        UsageEvent(now, "user:bob", "moa", "responses", 7, 3),
+    ])
+    ledger.close()
+
+    result = runner.invoke(app, ["usage", "--db", str(db)])
+    assert result.exit_code == 0, result.stderr
+    lines = result.stdout.splitlines()
+    assert lines[0].split() == ["owner", "model", "requests", "prompt_tokens", "completion_tokens", "total_tokens"]
+    assert lines[1].split() == ["user:alice", "cli_agent", "1", "100", "20", "120"]
+
+    result = runner.invoke(app, ["usage", "--db", str(db), "--by", "", "--json"])
+    assert json.loads(result.stdout) == [{"requests": 2, "prompt_tokens": 107, "completion_tokens": 23, "total_tokens": 130}]
+
+    result = runner.invoke(app, ["usage", "--db", str(db), "--by", "endpoint"])
+    assert result.exit_code == 2 and "cannot group by endpoint" in result.stderr
@@ -10,6 +10,19 @@ from asgiref.sync import sync_to_async
 # swarm.settings is imported by pytest-django) unless the caller has
 # explicitly set DJANGO_DEBUG.
 os.environ.setdefault("DJANGO_DEBUG", "true")
+# Keep test requests out of the developer's real usage ledger; ledger tests
+# enable it against a temporary database.
+os.environ.setdefault("SWARM_USAGE_LEDGER", "0")
+# Log synchronously and unsampled so caplog sees every record at the call.
+# pytest-django runs SwarmConfig.ready() before this file is imported, so undo
+# what it set up rather than relying on the environment alone.
+os.environ.setdefault("SWARM_LOG_QUEUE", "0")
+os.environ.setdefault("SWARM_LOG_LIMITS", "off")
+from swarm.utils.logger_setup import apply_log_limits, uninstall_queue_logging  # noqa: E402
+
+apply_log_limits()
+if os.environ["SWARM_LOG_QUEUE"].lower() in ("0", "false", "no", "off"):
+    uninstall_queue_logging()
 
 # --- Fixtures ---
 
@@ -431,6 +431,25 @@ async def test_stream_run_json_parse_streams_raw_but_parses_final():
     assert "deep" in "".join(deltas)  # deltas are the raw JSON document
 
 
+async def test_stream_run_redacts_secrets_split_across_deltas(monkeypatch):
+    code = (
+        "import sys, time\n"
+        "for part in ('key: sk-', 'abc123', ' ok\\n'):\n"
+        "    sys.stdout.write(part); sys.stdout.flush(); time.sleep(0.05)\n"
+        "sys.stderr.write('Bearer tok123')\n"
+    )
+    monkeypatch.delenv("SWARM_REDACT_OUTPUT", raising=False)
+    adapter = CliAdapter.from_config("r", {"cmd": [PY, "-c", code, "{prompt}"], "redact": True})
+    deltas, result = await _collect_stream(adapter)
+    assert "".join(deltas) == "key: [REDACTED] ok\n" and len(deltas) > 1
+    assert result.text == "key: [REDACTED] ok" and result.stderr == "[REDACTED]"
+
+    plain = CliAdapter.from_config("p", {"cmd": [PY, "-c", code, "{prompt}"]})
+    assert "sk-abc123" in "".join((await _collect_stream(plain))[0])
+    monkeypatch.setenv("SWARM_REDACT_OUTPUT", "1")
+    assert (await plain.run("x")).text == "key: [REDACTED] ok"
+
+
 async def test_stream_run_early_aclose_terminates_child(tmp_path):
     """Breaking out of async for (aclose) must kill the CLI process group."""
     pidfile = tmp_path / "child.pid"
@@ -0,0 +1,130 @@
+"""Hedged failover across CLI adapters (real subprocesses)."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import time
+
+import pytest
+
+from swarm.core.cli_adapter import CliAdapterRegistry
+from swarm.core.cli_hedge import (
+    EVENT_CANCELLED,
+    EVENT_FAILED,
+    EVENT_HEDGED,
+    EVENT_LAUNCHED,
+    EVENT_SKIPPED,
+    EVENT_WON,
+    HedgePolicy,
+    run_hedged,
+)
+
+PY = sys.executable
+
+
+def _script(body: str) -> dict:
+    return {"cmd": [PY, "-c", f"import os, sys, time\n{body}", "{prompt}"], "parse": "text"}
+
+
+def _hung(pid_file, first: str = "") -> dict:
+    pre = f"print({first!r}, flush=True)\n" if first else ""
+    return _script(f"open({str(pid_file)!r}, 'w').write(str(os.getpid()))\n{pre}time.sleep(30)")
+
+
+def _adapters(agents: dict) -> list:
+    registry = CliAdapterRegistry.from_config({"cli_agents": agents})
+    return [registry.get(name) for name in agents]
+
+
+async def _events(adapters, policy):
+    return [e async for e in run_hedged(adapters, "ping", policy=policy)]
+
+
+def _assert_killed(pid_file) -> None:
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
+
+
+def test_policy_parse_forms(caplog, monkeypatch):
+    monkeypatch.setattr(logging.getLogger("swarm"), "propagate", True)
+    assert HedgePolicy.parse(None) is None and HedgePolicy.parse(False) is None
+    assert HedgePolicy.parse(True) == HedgePolicy()
+    assert HedgePolicy.parse(5) == HedgePolicy(after=5.0)
+    assert HedgePolicy.parse({"first_byte": 2, "max_parallel": 3}) == HedgePolicy(
+        after=None, first_byte=2.0, max_parallel=3
+    )
+    assert HedgePolicy.parse({"after": 0}) is None  # nothing would ever trigger
+    assert HedgePolicy.parse("soon") is None
+    assert "Ignoring invalid hedge policy" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_hung_primary_is_hedged_and_killed(tmp_path):
+    pid_file = tmp_path / "pid"
+    adapters = _adapters({"slow": _hung(pid_file), "fast": _script("print('FAST: ' + sys.argv[1])")})
+    start = time.monotonic()
+    events = await _events(adapters, HedgePolicy(after=0.3))
+    assert time.monotonic() - start < 10
+    assert [(e.kind, e.name) for e in events] == [
+        (EVENT_LAUNCHED, "slow"),
+        (EVENT_HEDGED, "fast"),
+        (EVENT_WON, "fast"),
+        (EVENT_CANCELLED, "slow"),
+    ]
+    assert events[1].reason == "`slow` no answer after 0.3s"
+    assert events[2].result.text == "FAST: ping" and events[2].others == ("slow",)
+    _assert_killed(pid_file)
+
+
+@pytest.mark.asyncio
+async def test_first_byte_deadline_only_hedges_silent_candidates(tmp_path):
+    silent = tmp_path / "silent"
+    adapters = _adapters({"silent": _hung(silent), "backup": _script("print('BACKUP')")})
+    events = await _events(adapters, HedgePolicy(after=None, first_byte=0.3))
+    assert events[1].kind == EVENT_HEDGED and "no output after 0.3s" in events[1].reason
+    assert events[2].kind == EVENT_WON and events[2].name == "backup"
+
+    # A primary that is producing output is left alone under first_byte alone.
+    adapters = _adapters(
+        {
+            "chatty": _script("print('thinking', flush=True)\ntime.sleep(1.0)\nprint('done')"),
+            "backup": _script("print('BACKUP')"),
+        }
+    )
+    events = await _events(adapters, HedgePolicy(after=None, first_byte=0.5))
+    assert [(e.kind, e.name) for e in events] == [(EVENT_LAUNCHED, "chatty"), (EVENT_WON, "chatty")]
+
+
+@pytest.mark.asyncio
+async def test_without_policy_failover_is_sequential():
+    adapters = _adapters(
+        {
+            "ghost": {"cmd": ["definitely-not-a-real-cli-zzz", "{prompt}"]},
+            "boom": _script("sys.exit(2)"),
+            "good": _script("print('GOOD')"),
+        }
+    )
+    events = await _events(adapters, None)
+    assert [(e.kind, e.name) for e in events] == [
+        (EVENT_SKIPPED, "ghost"),
+        (EVENT_LAUNCHED, "boom"),
+        (EVENT_FAILED, "boom"),
+        (EVENT_LAUNCHED, "good"),
+        (EVENT_WON, "good"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_early_close_terminates_running_attempts(tmp_path):
+    pid_file = tmp_path / "pid"
+    events = run_hedged(_adapters({"slow": _hung(pid_file, first="hi")}), "ping", policy=HedgePolicy())
+    assert (await events.__anext__()).kind == EVENT_LAUNCHED
+    for _ in range(100):
+        if pid_file.exists():
+            break
+        await asyncio.sleep(0.05)
+    await events.aclose()
+    _assert_killed(pid_file)
@@ -0,0 +1,162 @@
+"""Tests for the trigram index behind FilesystemToolset grep/find."""
+from __future__ import annotations
+
+import os
+import sqlite3
+
+import pytest
+
+from swarm.core.filesystem_toolset import FilesystemToolset
+from swarm.core.fs_index import (
+    _query_mask,
+    build_signature,
+    file_trigrams,
+    get_index,
+    required_trigrams,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "ws"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "src" / "pkg" / "alpha.py").write_text("import os\ndef needle_fn():\n    return 1\n")
+    (root / "src" / "pkg" / "beta.py").write_text("x = 'Needle in caps'\n")
+    (root / "src" / "pkg-extra.txt").write_text("haystack only\n")
+    (root / "docs").mkdir()
+    (root / "docs" / "readme.md").write_text("nothing here\n")
+    (root / "blob.bin").write_bytes(b"\x00\x01needle\x00")
+    (root / ".env").write_text("SECRET_NEEDLE=1\n")
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "dep.js").write_text("needle\n")
+    return root
+
+
+def _toolsets(tree, tmp_path):
+    plain = FilesystemToolset(allowed_paths=[str(tree)], audit=False)
+    indexed = FilesystemToolset(
+        allowed_paths=[str(tree)], audit=False, index=True, index_dir=str(tmp_path / "idx")
+    )
+    return plain, indexed
+
+
+def _index_paths(tmp_path):
+    (db,) = (tmp_path / "idx").glob("*.sqlite3")
+    with sqlite3.connect(db) as conn:
+        return {row[0] for row in conn.execute("SELECT path FROM entries")}
+
+
+def test_required_trigrams():
+    assert required_trigrams("hello") == {b"hel", b"ell", b"llo"}
+    assert required_trigrams("foo.*bar") == {b"foo", b"bar"}
+    assert required_trigrams("(abc|def)") is None
+    assert required_trigrams("[a-z]+") is None
+    # Optional pieces end a run; mandatory repeats still contribute.
+    assert required_trigrams("ab?cde") == {b"cde"}
+    assert required_trigrams("x(?:abcd)+y") == {b"abc", b"bcd"}
+    # i/k/s case-fold to non-ASCII code points, so they break runs when ignoring case.
+    assert required_trigrams("Kafka") is None
+    assert required_trigrams("Kafka", ignore_case=False) == {b"kaf", b"afk", b"fka"}
+    assert required_trigrams("(?i)HELLO", ignore_case=False) == {b"hel", b"ell", b"llo"}
+
+
+def test_signature_has_no_false_negatives():
+    signature = build_signature(file_trigrams(b"The quick brown fox jumps over the lazy dog"))
+    mask = _query_mask(required_trigrams("brown fox"), len(signature) * 8)
+    assert int.from_bytes(signature, "little") & mask == mask
+
+
+@pytest.mark.parametrize(
+    ("pattern", "ignore_case"),
+    [("needle", True), ("needle", False), ("Needle", False), ("def \\w+_fn", True), ("(x|y)", True)],
+)
+def test_indexed_grep_matches_full_scan(tree, tmp_path, pattern, ignore_case):
+    plain, indexed = _toolsets(tree, tmp_path)
+    expected = plain.grep(pattern, str(tree), ignore_case=ignore_case)
+    assert indexed.grep(pattern, str(tree), ignore_case=ignore_case) == expected
+    # Sub-directory searches use the same root index.
+    sub = tree / "src"
+    assert indexed.grep(pattern, str(sub), ignore_case=ignore_case) == plain.grep(
+        pattern, str(sub), ignore_case=ignore_case
+    )
+
+
+def test_index_narrows_candidates(tree, tmp_path):
+    _, indexed = _toolsets(tree, tmp_path)
+    indexed.grep("needle", str(tree))
+    idx = get_index(tree.resolve(), index_dir=str(tmp_path / "idx"))
+
+    names = {p.name for p in idx.candidates("", required_trigrams("needle_fn"))}
+    assert names == {"alpha.py"}
+    assert {p.name for p in idx.candidates("src/pkg", None)} == {"alpha.py", "beta.py"}
+
+
+def test_index_respects_ignore_and_confinement_rules(tree, tmp_path):
+    outside = tmp_path / "outside.txt"
+    outside.write_text("needle outside\n")
+    os.symlink(outside, tree / "link.txt")
+    _, indexed = _toolsets(tree, tmp_path)
+    indexed.grep("needle", str(tree))
+
+    paths = _index_paths(tmp_path)
+    assert ".env" not in paths
+    assert not any(p.startswith("node_modules") for p in paths)
+    assert "link.txt" not in paths
+    assert "src/pkg/alpha.py" in paths
+
+
+def test_refresh_is_incremental(tree, tmp_path):
+    _, indexed = _toolsets(tree, tmp_path)
+    indexed.grep("needle", str(tree))
+    idx = get_index(tree.resolve(), index_dir=str(tmp_path / "idx"))
+    assert idx.refresh().indexed == 0
+
+    target = tree / "docs" / "readme.md"
+    target.write_text("now with a needle\n")
+    st = target.stat()
+    os.utime(target, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    (tree / "src" / "pkg" / "beta.py").unlink()
+
+    stats = idx.refresh()
+    assert (stats.indexed, stats.removed) == (1, 1)
+    out = indexed.grep("needle", str(tree))
+    assert "docs/readme.md:1:" in out
+    assert "beta.py" not in out
+
+
+def test_refresh_interval_skips_stat_walk(tree, tmp_path):
+    idx = get_index(tree.resolve(), index_dir=str(tmp_path / "idx"), refresh_interval=60)
+    assert idx.refresh().files > 0
+    assert idx.refresh().files == 0
+    assert idx.refresh("src").files == 0  # covered by the full refresh
+    assert idx.refresh(force=True).files > 0
+
+
+def test_subtree_refresh_leaves_rest_of_index(tree, tmp_path):
+    idx = get_index(tree.resolve(), index_dir=str(tmp_path / "idx"))
+    idx.refresh()
+    (tree / "docs" / "readme.md").unlink()
+
+    stats = idx.refresh("src")
+    assert stats.removed == 0 and stats.files == 4  # pkg/, alpha.py, beta.py, pkg-extra.txt
+    assert "docs/readme.md" in _index_paths(tmp_path)
+    assert idx.refresh("docs").removed == 1
+
+
+def test_indexed_find_matches_rglob(tree, tmp_path):
+    plain, indexed = _toolsets(tree, tmp_path)
+    indexed.index_refresh_seconds = 60
+    for glob in ("*.py", "pkg*", "pkg/*.py", "*"):
+        assert indexed.find(glob, str(tree)) == plain.find(glob, str(tree))
+    assert indexed.find("*.py", str(tree / "src")) == plain.find("*.py", str(tree / "src"))
+    assert _index_paths(tmp_path)
+
+
+def test_from_config_index_cannot_be_enabled_by_override(tmp_path):
+    cfg = {"filesystem": {"allowed_paths": [str(tmp_path)], "index": True, "index_refresh_seconds": 5}}
+    fs = FilesystemToolset.from_config(cfg)
+    assert fs.index is True and fs.index_refresh_seconds == 5.0
+    assert FilesystemToolset.from_config(cfg, overrides={"index": False}).index is False
+
+    off = {"filesystem": {"allowed_paths": [str(tmp_path)]}}
+    assert FilesystemToolset.from_config(off, overrides={"index": True}).index is False
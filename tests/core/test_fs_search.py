@@ -0,0 +1,158 @@
+"""Tests for the streaming grep engine behind FilesystemToolset.grep."""
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from swarm.core import fs_search
+from swarm.core.filesystem_toolset import FilesystemToolset
+from swarm.core.fs_index import required_literals
+from swarm.core.fs_search import grep_paths, is_context_free, iter_files, search_file
+
+TEXTS = [
+    "alpha\nbeta needle\n\ngamma needle needle\nlast needle",
+    "needle at start\r\nwindows needle\r\n",
+    "form\x0cfeed needle sep needle\n",
+    "trailing newline needle\n",
+    "",
+    "\n\n\n",
+    "bad utf8 \udcff needle\n",
+    "no match here\nor here\n",
+    "\u212aafka and \u017fome NEEDLE\u2028next needle\n",
+]
+PATTERNS = [
+    "needle",
+    "^needle",
+    "needle$",
+    "(?<!windows )needle",
+    "e\\s+n",
+    "x*",
+    "^$",
+    "\\bneedle\\b",
+    "(?m)^beta",
+    "kafka",
+    "some needle",
+    "(?-i:NEEDLE)",
+]
+
+
+def _reference(text: str, rx: re.Pattern) -> list[tuple[int, str]]:
+    """The original per-line loop the engine must reproduce."""
+    return [(n, line) for n, line in enumerate(text.splitlines(), 1) if rx.search(line)]
+
+
+def _write(path, text: str) -> None:
+    path.write_bytes(text.encode("utf-8", "surrogateescape"))
+
+
+def test_is_context_free():
+    assert is_context_free("needle")
+    assert is_context_free("\\bfoo\\B(a|b)+")
+    assert not is_context_free("^foo")
+    assert not is_context_free("foo$")
+    assert not is_context_free("(?:a|\\Afoo)")
+    assert not is_context_free("(?<=x)foo")
+    assert not is_context_free("(unclosed")
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+@pytest.mark.parametrize("windowed", [False, True])
+def test_search_file_matches_per_line_loop(tmp_path, monkeypatch, pattern, windowed):
+    if windowed:
+        # Force the mmap path with windows much smaller than the files.
+        monkeypatch.setattr(fs_search, "MMAP_THRESHOLD", 0)
+        monkeypatch.setattr(fs_search, "WINDOW_BYTES", 7)
+    rx = re.compile(pattern, re.IGNORECASE)
+    for i, text in enumerate(TEXTS):
+        fp = tmp_path / f"f{i}.txt"
+        _write(fp, text)
+        raw = fp.read_bytes().decode("utf-8", "replace")
+        got = search_file(
+            fp, rx, limit=1000, jump=is_context_free(pattern), literals=required_literals(pattern)
+        )
+        assert got.hits == _reference(raw, rx), (pattern, text)
+
+
+def test_iter_files_matches_sorted_rglob(tmp_path):
+    root = tmp_path / "ws"
+    for rel in ("b/c.txt", "b.txt", "a-b/x", ".hidden/y", "B/z", "b/d/e.txt", "node_modules/m.js"):
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text("x")
+    (root / "linked").symlink_to(root / "b", target_is_directory=True)
+    (root / "file_link").symlink_to(root / "b.txt")
+
+    expected = [p for p in sorted(root.rglob("*")) if p.is_file()]
+    assert list(iter_files(root)) == expected
+    pruned = list(iter_files(root, lambda name, is_dir: is_dir and name == "node_modules"))
+    assert pruned == [p for p in expected if "node_modules" not in p.parts]
+
+
+def test_binary_sniff_and_size_cap(tmp_path):
+    rx = re.compile("needle")
+    (tmp_path / "bin").write_bytes(b"\x00\x01needle\n")
+    (tmp_path / "late_nul").write_bytes(b"needle\n" + b"x" * 2048 + b"\x00")
+    (tmp_path / "big").write_text("needle\n" * 100)
+
+    assert not search_file(tmp_path / "bin", rx, limit=10).scanned
+    assert search_file(tmp_path / "late_nul", rx, limit=10).hits == [(1, "needle")]
+    assert not search_file(tmp_path / "big", rx, limit=10, max_bytes=100).scanned
+
+
+def test_limit_stops_reading_windows(tmp_path, monkeypatch):
+    monkeypatch.setattr(fs_search, "MMAP_THRESHOLD", 0)
+    monkeypatch.setattr(fs_search, "WINDOW_BYTES", 64)
+    decoded = []
+    real_search_text = fs_search._search_text
+
+    def spy(text, *args):
+        decoded.append(len(text))
+        return real_search_text(text, *args)
+
+    monkeypatch.setattr(fs_search, "_search_text", spy)
+    fp = tmp_path / "long.txt"
+    fp.write_text("needle line\n" * 10_000)
+
+    hits = search_file(fp, re.compile("needle"), limit=3).hits
+    assert [n for n, _ in hits] == [1, 2, 3]
+    assert sum(decoded) < 200  # one window, not the whole 120 KB file
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_grep_paths_is_ordered_and_stops_early(tmp_path, workers):
+    paths = []
+    for i in range(40):
+        fp = tmp_path / f"{i:02d}.txt"
+        fp.write_text("needle\n" * (i % 3))
+        paths.append(fp)
+    accepted = []
+
+    hits, scanned = grep_paths(
+        paths, re.compile("needle"), max_matches=5, workers=workers, accept=lambda p: accepted.append(p) or True
+    )
+    assert [(p.name, n) for p, n, _ in hits] == [
+        ("01.txt", 1), ("02.txt", 1), ("02.txt", 2), ("04.txt", 1), ("05.txt", 1),
+    ]
+    # Only a bounded window past the limit is ever looked at.
+    assert len(accepted) <= 6 + workers
+    assert scanned <= len(accepted)
+
+
+def test_toolset_grep_same_output_with_workers(tmp_path):
+    root = tmp_path / "ws"
+    for i in range(30):
+        sub = root / f"d{i % 4}"
+        sub.mkdir(parents=True, exist_ok=True)
+        (sub / f"f{i}.py").write_text(f"# file {i}\nvalue = {i}\nneedle_{i} = True\n")
+    (root / ".env").write_text("needle_secret=1\n")
+    (tmp_path / "outside.txt").write_text("needle_outside\n")
+    (root / "d0" / "link.txt").symlink_to(tmp_path / "outside.txt")
+    serial = FilesystemToolset(allowed_paths=[str(root)], audit=False, grep_workers=1)
+    parallel = FilesystemToolset(allowed_paths=[str(root)], audit=False, grep_workers=8)
+
+    for pattern, cap in (("needle_\\d+", 200), ("needle", 7), ("^value", 200)):
+        expected = serial.grep(pattern, str(root), max_matches=cap)
+        assert parallel.grep(pattern, str(root), max_matches=cap) == expected
+    out = parallel.grep("needle", str(root))
+    assert "needle_secret" not in out and "needle_outside" not in out
+    assert parallel.grep("needle", str(root), max_matches=7).endswith("…[truncated]")
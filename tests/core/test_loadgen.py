@@ -0,0 +1,112 @@
+"""Load generator: ASGI driving, arrival models, TTFT and 429 accounting."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from swarm.core.loadgen import (
+    AsgiTarget,
+    LoadConfig,
+    format_report,
+    parse_mix,
+    run_load,
+)
+
+
+class FakeApi:
+    """Tiny ASGI app: chat/stream/responses endpoints with an in-flight limit."""
+
+    def __init__(self, *, limit: int = 100, delay: float = 0.02) -> None:
+        self.limit = limit
+        self.delay = delay
+        self.inflight = 0
+        self.peak = 0
+        self.polls = 0
+
+    async def __call__(self, scope, receive, send):
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        payload = json.loads(body or b"{}")
+
+        async def reply(status: int, data: dict) -> None:
+            await send({"type": "http.response.start", "status": status, "headers": [(b"content-type", b"application/json")]})
+            await send({"type": "http.response.body", "body": json.dumps(data).encode()})
+
+        if scope["method"] == "GET":
+            self.polls += 1
+            await reply(200, {"id": scope["path"].rsplit("/", 1)[-1], "status": "completed"})
+            return
+        if self.inflight >= self.limit:
+            await reply(429, {"detail": "Too many in-flight requests"})
+            return
+        self.inflight += 1
+        self.peak = max(self.peak, self.inflight)
+        try:
+            if scope["path"] == "/v1/responses":
+                await reply(202, {"id": "resp_x", "status": "queued"})
+            elif payload.get("stream"):
+                await send({"type": "http.response.start", "status": 200, "headers": []})
+                await send({"type": "http.response.body", "body": b"data: first\n\n", "more_body": True})
+                await asyncio.sleep(self.delay)
+                await send({"type": "http.response.body", "body": b"data: [DONE]\n\n"})
+            else:
+                await asyncio.sleep(self.delay)
+                await reply(200, {"choices": []})
+        finally:
+            self.inflight -= 1
+
+
+def test_parse_mix_normalises_and_rejects_unknown_kinds():
+    assert parse_mix("chat=3, stream=1") == {"chat": 0.75, "stream": 0.25}
+    assert parse_mix("chat,responses") == {"chat": 0.5, "responses": 0.5}
+    for bad in ("chat=x", "tweet", "chat=0", "chat=-1"):
+        with pytest.raises(ValueError):
+            parse_mix(bad)
+
+
+@pytest.mark.asyncio
+async def test_closed_loop_mix_reports_latency_and_ttft():
+    api = FakeApi(delay=0.05)
+    cfg = LoadConfig(model="m", mix=parse_mix("chat,stream,responses"), concurrency=3, requests=30, poll_interval=0.01)
+    report = await run_load(AsgiTarget(api), cfg, max_inflight=100)
+
+    assert (report["requests"], report["ok"], report["errors"], report["rate_limited"]) == (30, 30, 0, 0)
+    assert report["peak_outstanding"] == 3 and api.peak <= 3
+    assert set(report["by_kind"]) == {"chat", "stream", "responses"}
+    stream = report["by_kind"]["stream"]
+    # The first chunk arrives before the response finishes.
+    assert stream["ttft"]["p50"] < stream["latency"]["p50"]
+    assert report["by_kind"]["chat"]["ttft"] is None
+    assert api.polls == report["by_kind"]["responses"]["requests"]
+    assert "SWARM_MAX_INFLIGHT 100" in format_report(report)
+
+
+@pytest.mark.asyncio
+async def test_open_loop_overload_counts_429s():
+    api = FakeApi(limit=2, delay=0.2)
+    cfg = LoadConfig(model="m", rate=200.0, requests=20, seed=1)
+    report = await run_load(AsgiTarget(api), cfg, max_inflight=2)
+
+    assert report["requests"] == 20
+    assert report["rate_limited"] > 0 and report["errors"] == 0
+    assert report["rate_limited"] + report["ok"] == 20
+    assert report["status_codes"]["429"] == report["rate_limited"]
+    # Open loop does not wait for completions before the next arrival.
+    assert report["peak_outstanding"] > 2
+
+
+@pytest.mark.asyncio
+async def test_transport_errors_are_counted_not_raised():
+    async def broken(_scope, _receive, _send):
+        raise ConnectionResetError("boom")
+
+    report = await run_load(AsgiTarget(broken), LoadConfig(model="m", requests=3, concurrency=1))
+    assert report["errors"] == 3 and report["status_codes"] == {"transport_error": 3}
+    assert report["sample_errors"] == ["ConnectionResetError: boom"]
@@ -0,0 +1,135 @@
+"""Shared background event loop bridge (sync → async)."""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from swarm.core.loop_bridge import LoopBridge, get_loop_bridge, run_sync
+
+
+@pytest.fixture
+def bridge():
+    b = LoopBridge(name="test-bridge")
+    yield b
+    b.shutdown()
+
+
+def test_reuses_one_loop_across_calls(bridge):
+    async def current():
+        await asyncio.sleep(0)
+        return asyncio.get_running_loop(), threading.current_thread().name
+
+    first = bridge.run(current())
+    second = bridge.run(current())
+    assert first == second and first[1] == "test-bridge"
+    assert first[0] is bridge.loop
+
+
+def test_exceptions_propagate(bridge):
+    async def boom():
+        raise ValueError("nope")
+
+    with pytest.raises(ValueError, match="nope"):
+        bridge.run(boom())
+
+    async def inner_timeout():
+        raise TimeoutError("from the coroutine")
+
+    with pytest.raises(TimeoutError, match="from the coroutine"):
+        bridge.run(inner_timeout(), timeout=5)
+
+
+def test_timeout_cancels_coroutine(bridge):
+    cancelled = threading.Event()
+
+    async def hang():
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError, match="within 0.2s"):
+        bridge.run(hang(), timeout=0.2)
+    assert time.monotonic() - start < 5
+    assert cancelled.wait(5)
+
+
+def test_calls_from_running_loop_and_many_threads(bridge):
+    async def double(x):
+        await asyncio.sleep(0.01)
+        return 2 * x
+
+    async def caller():
+        # A sync tool invoked from inside an event loop (agents SDK style).
+        return bridge.run(double(21))
+
+    assert asyncio.run(caller()) == 42
+
+    results = []
+    threads = [threading.Thread(target=lambda i=i: results.append(bridge.run(double(i)))) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert sorted(results) == [2 * i for i in range(8)]
+
+
+def test_reentry_from_loop_thread_is_refused(bridge):
+    async def nested():
+        return bridge.run(asyncio.sleep(0))
+
+    with pytest.raises(RuntimeError, match="would deadlock"):
+        bridge.run(nested())
+
+
+def test_shutdown_cancels_pending_and_restarts(bridge):
+    started, cancelled = threading.Event(), threading.Event()
+
+    async def hang():
+        started.set()
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    old_loop = bridge.loop
+    future = bridge.submit(hang())
+    assert started.wait(5)
+    bridge.shutdown()
+    assert cancelled.is_set() and future.cancelled()
+    assert old_loop.is_closed()
+    assert bridge.run(asyncio.sleep(0, result="again")) == "again"
+    assert bridge.loop is not old_loop
+
+
+def test_submit_racing_shutdown_never_hangs(bridge):
+    stop = threading.Event()
+
+    def stopper():
+        while not stop.is_set():
+            bridge.shutdown()
+
+    thread = threading.Thread(target=stopper)
+    thread.start()
+    try:
+        for _ in range(200):
+            future = bridge.submit(asyncio.sleep(0, result="ok"))
+            # Either it ran or shutdown cancelled it; it is never left pending.
+            concurrent.futures.wait([future], timeout=5)
+            assert future.cancelled() or future.result(0) == "ok"
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_shared_bridge_singleton():
+    assert get_loop_bridge() is get_loop_bridge()
+    assert run_sync(asyncio.sleep(0, result=1)) == 1
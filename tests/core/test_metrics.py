@@ -0,0 +1,119 @@
+"""Prometheus metrics: registry, exposition format, multi-process merge, CLI metrics."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+
+import pytest
+
+from swarm.core import metrics
+from swarm.core.cli_adapter import CliAdapter
+from swarm.core.metrics import Registry, merge, render_snapshot
+
+PY = sys.executable
+
+
+def test_counter_gauge_histogram_exposition():
+    reg = Registry()
+    reqs = reg.counter("t_requests_total", "Requests.", ("view", "status"))
+    reqs.inc(view="chat", status=200)
+    reqs.inc(2, view="chat", status=200)
+    reg.gauge("t_inflight", "In flight.", fn=lambda: 3)
+    lat = reg.histogram("t_seconds", "Latency.", ("bp",), buckets=(0.1, 1.0))
+    for v in (0.05, 0.5, 5.0):
+        lat.observe(v, bp='a"b')
+    assert reg.counter("t_requests_total", "Requests.", ("view", "status")) is reqs
+    with pytest.raises(ValueError):
+        reqs.inc(view="chat")
+    with pytest.raises(ValueError):
+        reqs.inc(-1, view="chat", status=200)
+
+    text = render_snapshot(merge([reg.snapshot()]))
+    assert "# TYPE t_requests_total counter" in text
+    assert 't_requests_total{view="chat",status="200"} 3' in text
+    assert "t_inflight 3" in text
+    assert 't_seconds_bucket{bp="a\\"b",le="0.1"} 1' in text
+    assert 't_seconds_bucket{bp="a\\"b",le="1"} 2' in text
+    assert 't_seconds_bucket{bp="a\\"b",le="+Inf"} 3' in text
+    assert 't_seconds_count{bp="a\\"b"} 3' in text
+    assert 't_seconds_sum{bp="a\\"b"} 5.55' in text
+
+
+def test_merge_sums_counters_and_drops_dead_gauges():
+    def snap(pid, hits, gauge, bucket_counts):
+        reg = Registry()
+        reg.counter("c_total", "C.", ("k",)).inc(hits, k="x")
+        reg.gauge("g", "G.").set(gauge)
+        h = reg.histogram("h", "H.", buckets=(1.0,))
+        for v in bucket_counts:
+            h.observe(v)
+        return {**reg.snapshot(), "pid": pid}
+
+    merged = merge([snap(1, 2, 5, [0.5]), snap(2, 3, 7, [2.0, 0.1])], live_pids={2})
+    text = render_snapshot(merged)
+    assert 'c_total{k="x"} 5' in text
+    assert "\ng 7\n" in text  # pid 1 exited: its gauge is gone, its counts stay
+    assert 'h_bucket{le="1"} 2' in text and 'h_bucket{le="+Inf"} 3' in text and "h_count 3" in text
+
+
+def test_collect_merges_worker_snapshots(tmp_path, monkeypatch):
+    monkeypatch.setenv("SWARM_METRICS_DIR", str(tmp_path))
+    other = Registry()
+    other.counter("swarm_http_requests_total", "x", ("view", "status")).inc(4, view="peer", status=200)
+    other.gauge("swarm_background_responses", "x", ("state",)).set(9, state="running")
+    dead_pid = 2 ** 22 + 12345  # beyond pid_max on typical systems
+    (tmp_path / f"metrics-{dead_pid}.json").write_text(json.dumps({**other.snapshot(), "pid": dead_pid}))
+    (tmp_path / "metrics-torn.json").write_text("{")
+
+    metrics.HTTP_REQUESTS.inc(view="local_test", status=200)
+    text = metrics.render()
+    assert (tmp_path / f"metrics-{os.getpid()}.json").is_file()
+    assert 'swarm_http_requests_total{view="peer",status="200"} 4' in text
+    assert 'swarm_http_requests_total{view="local_test",status="200"}' in text
+    assert 'state="running"} 9' not in text
+
+
+def test_cache_hit_ratio_is_derived():
+    reg = Registry()
+    lookups = reg.counter(metrics.CACHE_LOOKUPS.name, "x", ("cache", "result"))
+    lookups.inc(3, cache="memory_query", result="hit")
+    lookups.inc(1, cache="memory_query", result="miss")
+    text = render_snapshot(merge([reg.snapshot()]))
+    assert 'swarm_cache_hit_ratio{cache="memory_query"} 0.75' in text
+
+
+def test_timed_context_and_decorator():
+    reg = Registry()
+    h = reg.histogram("op_seconds", "x", ("op",))
+
+    @metrics.timed(h, op="fn")
+    def work():
+        return 1
+
+    assert work() == 1 and work() == 1
+    with metrics.timed(h, op="block"):
+        pass
+    counts = {labels: v["count"] for labels, v in h.samples()}
+    assert counts == {("fn",): 2, ("block",): 1}
+
+
+@pytest.mark.asyncio
+async def test_cli_runs_record_spawn_duration_and_exit_codes():
+    def count(code: str) -> float:
+        return metrics.CLI_EXITS.value(adapter="metrics_probe", code=code)
+
+    before = {c: count(c) for c in ("0", "3", "timeout")}
+    ok = CliAdapter.from_config("metrics_probe", {"cmd": [PY, "-c", "print(1)", "{prompt}"]})
+    bad = CliAdapter.from_config("metrics_probe", {"cmd": [PY, "-c", "import sys; sys.exit(3)", "{prompt}"]})
+    slow = CliAdapter.from_config(
+        "metrics_probe", {"cmd": [PY, "-c", "import time; time.sleep(5)", "{prompt}"], "timeout": 0.3}
+    )
+    assert (await ok.run("x")).ok
+    assert not (await bad.run("x")).ok
+    assert (await slow.run("x")).timed_out
+    assert {c: count(c) - before[c] for c in before} == {"0": 1, "3": 1, "timeout": 1}
+    spawn = dict(metrics.CLI_SPAWN_SECONDS.samples())[("metrics_probe",)]
+    run = dict(metrics.CLI_RUN_SECONDS.samples())[("metrics_probe",)]
+    assert spawn["count"] >= 3 and run["count"] >= 3 and run["sum"] >= spawn["sum"]
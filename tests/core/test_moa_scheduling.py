@@ -0,0 +1,125 @@
+"""Adaptive MoA scheduling: persisted seat stats, hedging, failover order."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from swarm.core.moa import MoAOrchestrator
+from swarm.core.moa.backends import FakeParticipantBackend
+from swarm.core.moa.scheduling import SeatStats
+
+
+def _stats(tmp_path, **kwargs) -> SeatStats:
+    return SeatStats(tmp_path / "stats.json", **kwargs)
+
+
+def _seed(stats: SeatStats, backend, seat: str, latency: float, ok: bool = True, n: int = 5) -> None:
+    for _ in range(n):
+        stats.record(stats.key(backend, seat), latency, ok)
+
+
+def test_seat_stats_ewma_p95_and_persistence(tmp_path):
+    stats = _stats(tmp_path)
+    key = "GrokParticipantBackend:analyst"
+    stats.record(key, 1.0, True)
+    stats.record(key, 3.0, False)
+    assert stats.p95(key) is None  # below min_samples
+    stats.record(key, 1.0, True)
+    entry = stats.get(key)
+    assert 1.0 < entry["latency"] < 3.0 and entry["var"] > 0
+    assert stats.p95(key) > entry["latency"]
+    assert 0 < stats.error_rate(key) < 1
+
+    stats.save()
+    reloaded = _stats(tmp_path)
+    assert reloaded.p95(key) == pytest.approx(stats.p95(key))
+
+    (tmp_path / "stats.json").write_text("{not json", encoding="utf-8")
+    assert _stats(tmp_path).get(key) is None
+
+
+def test_censored_samples_raise_latency_but_not_errors(tmp_path):
+    stats = _stats(tmp_path, persist=False)
+    key = "FakeParticipantBackend:seat"
+    for _ in range(3):
+        stats.record(key, 1.0, True)
+    before = stats.p95(key)
+    stats.record(key, 5.0, None)
+    assert stats.p95(key) > before
+    assert stats.error_rate(key) == 0
+    stats.record("FakeParticipantBackend:new", 2.0, None)
+    assert stats.error_rate("FakeParticipantBackend:new") == 0
+
+
+def test_rank(tmp_path):
+    stats = _stats(tmp_path, persist=False)
+    backend = FakeParticipantBackend({})
+    _seed(stats, backend, "fast", 2.0)
+
+    _seed(stats, backend, "flaky", 0.5, ok=False)
+    _seed(stats, backend, "slow", 9.0)
+    assert stats.rank(backend, ["unknown", "flaky", "slow", "fast"]) == [
+        "fast", "slow", "flaky", "unknown",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_slow_seat_is_hedged_past_its_p95(tmp_path):
+    backend = FakeParticipantBackend(
+        {"primary": "slow answer", "backup": "fast answer"},
+        delays={"primary": 3.0, "backup": 0.05},
+    )
+    stats = _stats(tmp_path)
+    _seed(stats, backend, "primary", 0.1)
+    orch = MoAOrchestrator(backend=backend, failover=["backup"], stats=stats)
+
+    start = time.monotonic()
+    (opinion,) = await orch.collect_opinions("q", ["primary"])
+    assert time.monotonic() - start < 1.5
+    assert opinion.ok and opinion.name == "primary" and opinion.text == "fast answer"
+    assert opinion.meta["answered_by"] == "backup" and opinion.meta["hedged_from"] == "primary"
+    # The cancelled loser counts as a latency lower bound (not an error); the
+    # winner is recorded too, and stats hit the disk.
+    primary = stats.get(stats.key(backend, "primary"))
+    assert primary["n"] == 6 and primary["latency"] > 0.1
+    assert stats.error_rate(stats.key(backend, "primary")) == 0
+    assert _stats(tmp_path).get(stats.key(backend, "backup"))["n"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cold_seat_is_not_hedged(tmp_path):
+    backend = FakeParticipantBackend(
+        {"primary": "answer", "backup": "unused"}, delays={"primary": 0.3}
+    )
+    orch = MoAOrchestrator(backend=backend, failover=["backup"], stats=_stats(tmp_path))
+    (opinion,) = await orch.collect_opinions("q", ["primary"])
+    assert opinion.text == "answer" and "hedged" not in opinion.meta
+    assert [c["agent"] for c in backend.calls] == ["primary"]
+
+
+@pytest.mark.asyncio
+async def test_history_never_shortens_the_configured_timeout(tmp_path):
+    backend = FakeParticipantBackend({"seat": "late but fine"}, delays={"seat": 0.5})
+    stats = _stats(tmp_path)
+    _seed(stats, backend, "seat", 0.01)  # learned p95 far below the real latency
+    orch = MoAOrchestrator(backend=backend, stats=stats, per_participant_timeout=60, hedge=False)
+
+    (opinion,) = await orch.collect_opinions("q", ["seat"])
+    assert opinion.ok and opinion.text == "late but fine"
+    assert stats.error_rate(stats.key(backend, "seat")) == 0
+
+
+@pytest.mark.asyncio
+async def test_failover_tries_healthiest_backup_first(tmp_path):
+    backend = FakeParticipantBackend(
+        {"flaky": "flaky answer", "steady": "steady answer"}, errors={"primary": "boom"}
+    )
+    stats = _stats(tmp_path)
+    _seed(stats, backend, "flaky", 0.1, ok=False)
+    _seed(stats, backend, "steady", 0.2)
+    orch = MoAOrchestrator(backend=backend, failover=["flaky", "steady"], stats=stats, hedge=False)
+    (opinion,) = await orch.collect_opinions("q", ["primary"])
+    assert opinion.meta["answered_by"] == "steady"
+    assert [c["agent"] for c in backend.calls] == ["primary", "steady"]
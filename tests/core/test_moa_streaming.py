@@ -0,0 +1,155 @@
+"""Streaming MoA participants: per-seat deltas, quorum and CLI cleanup."""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from swarm.blueprints.moa.blueprint_moa import MoABlueprint
+from swarm.core.moa import MoAOrchestrator, OpinionDelta
+from swarm.core.moa.backends import (
+    AcpxParticipantBackend,
+    FakeParticipantBackend,
+    GrokParticipantBackend,
+    StreamingParticipantBackend,
+)
+from swarm.views.chat_views import _extract_message_from_chunk
+
+
+def _fake_cli(tmp_path: Path, body: str) -> str:
+    """Executable stand-in for grok/acpx that ignores its argv."""
+    script = tmp_path / "fake_cli"
+    script.write_text(f"#!{sys.executable}\nimport sys, time\n{body}\n", encoding="utf-8")
+    script.chmod(0o755)
+    return str(script)
+
+
+def test_backends_implement_streaming_protocol():
+    for backend in (
+        FakeParticipantBackend({"a": "x"}),
+        GrokParticipantBackend(grok_bin="grok"),
+        AcpxParticipantBackend(acpx_bin="acpx"),
+    ):
+        assert isinstance(backend, StreamingParticipantBackend)
+
+
+@pytest.mark.asyncio
+async def test_fake_stream_chunks_then_same_opinion_as_consult():
+    backend = FakeParticipantBackend({"analyst": "abcdefgh"}, chunk_size=3)
+    deltas = [d async for d in backend.stream("analyst", "q")]
+    assert [d.text for d in deltas if not d.done] == ["abc", "def", "gh"]
+    assert deltas[-1].done and deltas[-1].opinion.text == "abcdefgh"
+    assert await backend.consult("analyst", "q") == deltas[-1].opinion
+
+
+@pytest.mark.asyncio
+async def test_stream_opinions_reports_fast_seats_first():
+    backend = FakeParticipantBackend(
+        {"fast": "quick answer", "slow": "considered answer"},
+        delays={"slow": 0.3},
+        chunk_size=4,
+    )
+    orch = MoAOrchestrator(backend=backend)
+    deltas = [d async for d in orch.stream_opinions("q", ["slow", "fast"])]
+    done = [d.name for d in deltas if d.done]
+    assert done == ["fast", "slow"]
+    assert "".join(d.text for d in deltas if d.name == "slow" and not d.done) == "considered answer"
+
+
+@pytest.mark.asyncio
+async def test_quorum_starts_determination_without_stragglers():
+    backend = FakeParticipantBackend(
+        {"a": "use a token bucket", "b": "token bucket with jitter", "slow": "never needed"},
+        delays={"slow": 5.0},
+    )
+    orch = MoAOrchestrator(backend=backend, quorum=2)
+    progress: list[OpinionDelta] = []
+    start = time.monotonic()
+    result = await orch.run("rate limit?", ["a", "b", "slow"], on_progress=progress.append)
+    assert time.monotonic() - start < 2.0
+    slow = result.opinions[2]
+    assert slow.name == "slow" and not slow.ok and slow.meta.get("quorum_skipped")
+    assert result.meta["quorum"] == 2 and result.meta["skipped"] == ["slow"]
+    assert set(result.determination.participant_names) == {"a", "b"}
+    assert [d.name for d in progress if d.done] == ["a", "b", "slow"]
+
+
+@pytest.mark.asyncio
+async def test_quorum_grace_lets_close_seats_finish():
+    backend = FakeParticipantBackend({"a": "x", "b": "y"}, delays={"b": 0.1})
+    orch = MoAOrchestrator(backend=backend, quorum=1, quorum_grace=1.0)
+    opinions = await orch.collect_opinions("q", ["a", "b"])
+    assert all(o.ok for o in opinions)
+
+
+@pytest.mark.asyncio
+async def test_grok_stream_yields_before_process_exits(tmp_path):
+    grok = _fake_cli(
+        tmp_path,
+        "print('first line', flush=True)\ntime.sleep(0.5)\nprint('second line', flush=True)",
+    )
+    backend = GrokParticipantBackend(grok_bin=grok, default_timeout=10)
+    start = time.monotonic()
+    first_at = None
+    deltas = []
+    async for delta in backend.stream("analyst", "q"):
+        if first_at is None:
+            first_at = time.monotonic() - start
+        deltas.append(delta)
+    total = time.monotonic() - start
+    assert first_at is not None and first_at < total - 0.3
+    opinion = deltas[-1].opinion
+    assert opinion.ok and opinion.text == "first line\nsecond line"
+    assert opinion.meta == {"returncode": 0, "backend": "grok"}
+    assert "[MoA seat: analyst]" in backend.calls[0]["prompt"]
+
+
+@pytest.mark.asyncio
+async def test_grok_stream_timeout_and_early_close_kill_child(tmp_path):
+    pid_file = tmp_path / "pid"
+    grok = _fake_cli(
+        tmp_path,
+        f"import os\nopen({str(pid_file)!r}, 'w').write(str(os.getpid()))\n"
+        "print('partial', flush=True)\ntime.sleep(30)",
+    )
+    backend = GrokParticipantBackend(grok_bin=grok, default_timeout=0.5)
+    deltas = [d async for d in backend.stream("seat", "q")]
+    assert deltas[0].text.strip() == "partial"
+    assert not deltas[-1].opinion.ok and "timed out" in deltas[-1].opinion.error
+
+    backend.default_timeout = 30
+    stream = backend.stream("seat", "q")
+    assert (await stream.__anext__()).text.strip() == "partial"
+    await stream.aclose()
+    with pytest.raises(ProcessLookupError):
+        os.kill(int(pid_file.read_text()), 0)
+
+
+@pytest.mark.asyncio
+async def test_acpx_stream_reports_failure_with_stderr(tmp_path):
+    acpx = _fake_cli(tmp_path, "print('no auth', file=sys.stderr)\nsys.exit(3)")
+    backend = AcpxParticipantBackend(acpx_bin=acpx, default_timeout=10)
+    deltas = [d async for d in backend.stream("claude", "q")]
+    assert len(deltas) == 1
+    opinion = deltas[0].opinion
+    assert not opinion.ok and opinion.error == "no auth"
+    assert opinion.meta == {"returncode": 3, "stderr": "no auth"}
+
+
+@pytest.mark.asyncio
+async def test_blueprint_yields_seat_progress_before_final():
+    bp = MoABlueprint(blueprint_id="moa")
+    bp._config = {"moa": {"quorum": 1}}
+    bp.set_params({"participants": ["analyst", "critic"]})
+    bp._backend = lambda: FakeParticipantBackend(
+        {"analyst": "ship it", "critic": "wait"}, delays={"critic": 5.0}
+    )
+    chunks = [c async for c in bp.run([{"role": "user", "content": "Ship?"}])]
+    progress, final = chunks[:-1], chunks[-1]
+    assert progress and all(_extract_message_from_chunk(c) is None for c in progress)
+    assert {"seat": "analyst", "delta": "ship it"}.items() <= progress[0].items()
+    assert final["final"] and final["meta"]["skipped_participants"] == ["critic"]
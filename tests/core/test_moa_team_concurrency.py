@@ -0,0 +1,179 @@
+"""Concurrent team specialists: scope planning, staged writes, write conflicts."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+
+import pytest
+
+from swarm.core.moa import team
+from swarm.core.moa.staging import (
+    StagedWorkspace,
+    plan_chain_waits,
+    plan_specialist_chains,
+    scopes_overlap,
+)
+from swarm.core.moa.team import TeamTask, parse_team_tasks, run_moa_then_team
+
+FAKES = {
+    "analyst": '{"claim":"yes token bucket","confidence":0.9}',
+    "critic": '{"claim":"yes token bucket with metrics","confidence":0.85}',
+}
+
+
+def _slow_specialists(monkeypatch, delay: float) -> list[tuple[str, float, float]]:
+    spans: list[tuple[str, float, float]] = []
+    real = team._run_specialist
+
+    def slow(tools, *, question, determination, task):
+        start = time.monotonic()
+        time.sleep(delay)
+        result = real(tools, question=question, determination=determination, task=task)
+        spans.append((task.purpose, start, time.monotonic()))
+        return result
+
+    monkeypatch.setattr(team, "_run_specialist", slow)
+    return spans
+
+
+def test_scope_overlap_and_chain_planning():
+    assert scopes_overlap(["docs"], ["docs/ADR.md"])
+    assert scopes_overlap(["a.md"], None)
+    assert not scopes_overlap(["docs/ADR.md"], ["docs/API.md"])
+    assert not scopes_overlap([], ["a.md"])
+    assert plan_specialist_chains([["a.md"], ["docs/x.md"], ["docs"], ["b.md"]]) == [
+        [0],
+        [1, 2],
+        [3],
+    ]
+    assert plan_specialist_chains([["a.md"], None, ["b.md"]]) == [[0, 1, 2]]
+
+
+def test_readers_wait_for_earlier_writers():
+    scopes = [["notes.txt"], ["decision.md"], ["docs/ADR.md"], ["research_notes.md"]]
+    reads = [[], ["notes.txt"], [], ["."]]
+    chains = plan_specialist_chains(scopes)
+    assert plan_chain_waits(chains, scopes, reads) == ([[0], [1], [2], [3]], [[], [0], [], [0, 1, 2]])
+    # Reading a later-starting chain's earlier write merges the two chains.
+    scopes = [["a.md"], ["b.md"], ["c.md"]]
+    chains = [[0, 2], [1]]
+    assert plan_chain_waits(chains, scopes, [[], [], ["b.md"]]) == ([[0, 1, 2]], [[]])
+
+
+def test_parse_team_tasks_accepts_scope():
+    (task,) = parse_team_tasks([{"purpose": "docs", "scope": "docs\\adr"}])
+    assert task.scope == ["docs/adr"]
+    assert parse_team_tasks("docs")[0].scope is None
+
+
+def test_staged_workspace_overlays_reads_and_listing(tmp_path: Path):
+    (tmp_path / "notes.txt").write_text("on disk", encoding="utf-8")
+    ws = StagedWorkspace(tmp_path, base={"docs/base.md": "from base"})
+    ws.write_file("docs/ADR.md", "staged")
+    assert ws.read_file("docs/ADR.md") == "staged"
+    assert ws.read_file("docs/base.md") == "from base"
+    assert ws.read_file("notes.txt") == "on disk"
+    assert ws.exists("docs/ADR.md") and not (tmp_path / "docs").exists()
+    assert ws.list_files(".").split("\n") == ["docs", "notes.txt"]
+    assert ws.list_files("docs").split("\n") == ["ADR.md", "base.md"]
+    assert ws.writes == ["docs/ADR.md"]
+    with pytest.raises(ValueError):
+        ws.write_file("../escape.md", "x")
+
+
+@pytest.mark.asyncio
+async def test_disjoint_specialists_run_concurrently(tmp_path: Path, monkeypatch):
+    spans = _slow_specialists(monkeypatch, 0.3)
+    result = await run_moa_then_team(
+        tmp_path,
+        "q",
+        specialist_tasks=parse_team_tasks("implementer|tester|docs|researcher"),
+        moa_backend="fake",
+        moa_fake_responses=FAKES,
+    )
+    assert all(s.ok for s in result.specialist_results)
+    assert [s.persona for s in result.specialist_results] == ["implementer", "tester", "docs", "researcher"]
+    assert max(end for *_, end in spans) - min(start for _, start, _ in spans) < 1.0
+    assert result.writes == [
+        "moa_determination.md", "decision.md", "test_notes.md", "docs/ADR.md", "research_notes.md",
+    ]
+    assert (tmp_path / "docs" / "ADR.md").is_file() and result.conflicts == []
+
+    # Overlapping scopes keep task order inside their chain.
+    spans.clear()
+    await run_moa_then_team(
+        tmp_path / "chained",
+        "q",
+        specialist_tasks=[
+            TeamTask("implementer", "a", "docs/decision.md", scope=["docs"]),
+            TeamTask("docs", "b", "docs/ADR.md"),
+        ],
+        moa_backend="fake",
+        moa_fake_responses=FAKES,
+    )
+    (first, _, first_end), (second, second_start, _) = spans
+    assert (first, second) == ("implementer", "docs") and second_start >= first_end
+
+
+@pytest.mark.asyncio
+async def test_undeclared_overlap_is_detected_and_serialized(tmp_path: Path):
+    result = await run_moa_then_team(
+        tmp_path,
+        "q",
+        specialist_tasks=[
+            TeamTask("implementer", "first", "shared.md", scope=["a.md"]),
+            TeamTask("tester", "second", "shared.md", scope=["b.md"]),
+        ],
+        moa_backend="fake",
+        moa_fake_responses=FAKES,
+    )
+    assert result.conflicts == ["shared.md"]
+    # Same outcome as running them one after another: the later task wins.
+    assert (tmp_path / "shared.md").read_text(encoding="utf-8").startswith("# Test notes")
+    assert all(s.ok for s in result.specialist_results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_team_run_leaves_no_specialist_output(tmp_path: Path, monkeypatch):
+    _slow_specialists(monkeypatch, 0.5)
+    run = asyncio.ensure_future(
+        run_moa_then_team(
+            tmp_path,
+            "q",
+            specialist_tasks=parse_team_tasks("implementer|tester"),
+            moa_backend="fake",
+            moa_fake_responses=FAKES,
+        )
+    )
+    await asyncio.sleep(0.2)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    await asyncio.sleep(0.6)  # let the worker threads finish their (staged) writes
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["moa_determination.md"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_team_matches_sequential_run(tmp_path: Path, monkeypatch):
+    tasks = [
+        TeamTask("docs", "write the notes", "notes.txt"),
+        *parse_team_tasks("implementer|tester|docs|researcher"),
+    ]
+
+    async def run(root: Path):
+        result = await run_moa_then_team(
+            root, "q", specialist_tasks=tasks, moa_backend="fake", moa_fake_responses=FAKES
+        )
+        files = {str(p.relative_to(root)): p.read_text(encoding="utf-8") for p in root.rglob("*") if p.is_file()}
+        return [s.output for s in result.specialist_results], files
+
+    concurrent = await run(tmp_path / "concurrent")
+    monkeypatch.setattr(team, "plan_specialist_chains", lambda scopes: [list(range(len(scopes)))])
+    sequential = await run(tmp_path / "sequential")
+
+    assert concurrent == sequential
+    outputs, files = concurrent
+    assert "## Context\n# ADR" in files["decision.md"]  # the implementer read notes.txt
+    assert "decision.md" in files["research_notes.md"].split("## Workspace\n")[1]
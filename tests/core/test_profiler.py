@@ -0,0 +1,69 @@
+"""Sampling profiler: folded stacks across threads, idle filtering, single-flight."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import Counter
+
+import pytest
+
+from swarm.core import profiler
+
+
+def _spin(stop: threading.Event) -> None:
+    while not stop.is_set():
+        sum(i * i for i in range(500))
+
+
+def _park(stop: threading.Event) -> None:
+    stop.wait()
+
+
+@pytest.fixture
+def workers():
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=_spin, args=(stop,), name="busy worker", daemon=True),
+        threading.Thread(target=_park, args=(stop,), name="parked", daemon=True),
+    ]
+    for t in threads:
+        t.start()
+    yield
+    stop.set()
+    for t in threads:
+        t.join()
+
+
+@pytest.mark.usefixtures("workers")
+def test_samples_other_threads_as_folded_stacks():
+    profile = profiler.sample(0.3, interval=0.002)
+    assert profile.samples >= 20 and 0 <= profile.overhead < 1
+    busy = [stack for stack in profile.stacks if stack.startswith("busy_worker;")]
+    assert busy and all("_spin (core/test_profiler.py:" in stack for stack in busy)
+    assert not any(stack.startswith("parked;") for stack in profile.stacks)  # idle by default
+
+    parsed = profiler.parse_collapsed(profile.collapsed())
+    assert parsed == profile.stacks
+    frame, own, total = profiler.top_frames(Counter({s: parsed[s] for s in busy}), 5)[0]
+    assert "test_profiler.py" in frame and own <= total
+    assert "self%" in profiler.format_top(parsed) and profiler.format_top({}) == "No samples."
+
+    with_idle = profiler.sample(0.1, interval=0.002, include_idle=True)
+    assert any(stack.startswith("parked;") for stack in with_idle.stacks)
+
+
+def test_one_profile_at_a_time_and_bounds(monkeypatch):
+    monkeypatch.setenv("SWARM_PROFILE_MAX_SECONDS", "0.2")
+    first = threading.Thread(target=profiler.sample, args=(5,))
+    started = time.perf_counter()
+    first.start()
+    time.sleep(0.05)
+    with pytest.raises(profiler.ProfilerBusy):
+        profiler.sample(0.1)
+    first.join()
+    assert time.perf_counter() - started < 2  # capped at SWARM_PROFILE_MAX_SECONDS
+    with pytest.raises(ValueError):
+        profiler.sample(0)
+    monkeypatch.setenv("SWARM_PROFILE_INTERVAL_MS", "0.01")
+    assert profiler.default_interval() == profiler.MIN_INTERVAL_MS / 1000
@@ -0,0 +1,52 @@
+"""Per-request ``Server-Timing`` phases."""
+
+from __future__ import annotations
+
+import contextvars
+import re
+import threading
+
+from swarm.core import server_timing
+from swarm.core.server_timing import ServerTiming
+
+
+def test_phases_accumulate_and_render_header():
+    timing = ServerTiming()
+    timing.add("persist", 1.0)
+    timing.add("persist", 2.5)
+    with timing.measure("auth"):
+        pass
+    timing.mark("first_chunk")
+    timing.mark("first_chunk")  # first mark wins
+    header = timing.header()
+    names = [entry.split(";")[0] for entry in header.split(", ")]
+    assert names == ["persist", "auth", "first_chunk", "total"]
+    assert "persist;dur=3.5" in header
+    assert all(re.fullmatch(r"[a-z_]+;dur=\d+\.\d", entry) for entry in header.split(", "))
+    assert timing.sse_comment().startswith(": server-timing persist;dur=3.5") and timing.sse_comment().endswith("\n\n")
+
+
+def test_module_helpers_follow_the_current_request(monkeypatch):
+    def request():
+        timing = server_timing.begin()
+        with server_timing.phase("validate"):
+            pass
+        # Worker threads started with a copied context report into the same request.
+        ctx = contextvars.copy_context()
+        worker = threading.Thread(target=ctx.run, args=(server_timing.mark, "first_chunk"))
+        worker.start()
+        worker.join()
+        return timing
+
+    timing = contextvars.Context().run(request)
+    assert set(timing.phases()) == {"validate", "first_chunk"}
+
+    def outside_request():
+        with server_timing.phase("outside"):  # nothing recorded, no error
+            server_timing.mark("first_chunk")
+        return server_timing.current()
+
+    assert contextvars.Context().run(outside_request) is None
+
+    monkeypatch.setenv("SWARM_SERVER_TIMING", "0")
+    assert contextvars.Context().run(server_timing.begin) is None
@@ -448,3 +448,236 @@ class TestHandleToolCalls:
         )
 
         assert response.agent is target_agent
+
+
+# =============================================================================
+# Concurrent execution tests
+# =============================================================================
+
+
+class TestConcurrentToolCalls:
+    """Parallel dispatch, per-agent cap, sync offload and cached metadata."""
+
+    @pytest.mark.asyncio
+    async def test_calls_run_concurrently_and_keep_request_order(self):
+        finished = []
+
+        async def slow(delay):
+            await asyncio.sleep(delay)
+            finished.append(delay)
+            return f"slept {delay}"
+
+        calls = [
+            make_tool_call(f"call-{i}", "slow", json.dumps({"delay": d}))
+            for i, d in enumerate([0.15, 0.05, 0.1])
+        ]
+        start = asyncio.get_running_loop().time()
+        response = await handle_tool_calls(calls, [slow], {}, debug=False)
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert elapsed < 0.25
+        assert finished == [0.05, 0.1, 0.15]
+        assert [m["tool_call_id"] for m in response.messages] == ["call-0", "call-1", "call-2"]
+        assert [m["content"] for m in response.messages] == ["slept 0.15", "slept 0.05", "slept 0.1"]
+
+    @pytest.mark.asyncio
+    async def test_agent_concurrency_cap(self):
+        in_flight = 0
+        peak = 0
+
+        async def tracked():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return "ok"
+
+        calls = [make_tool_call(f"call-{i}", "tracked", "{}") for i in range(6)]
+        agent = Agent(name="Capped", max_tool_concurrency=2)
+        response = await handle_tool_calls(calls, [tracked], {}, debug=False, agent=agent)
+
+        assert peak == 2
+        assert len(response.messages) == 6
+
+    @pytest.mark.asyncio
+    async def test_sync_tools_run_off_the_event_loop(self):
+        import threading
+        import time
+
+        threads = []
+
+        def blocking(label):
+            threads.append(threading.current_thread().name)
+            time.sleep(0.1)
+            return label
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            for _ in range(5):
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        calls = [make_tool_call(f"call-{i}", "blocking", json.dumps({"label": str(i)})) for i in range(2)]
+        start = asyncio.get_running_loop().time()
+        response, _ = await asyncio.gather(
+            handle_tool_calls(calls, [blocking], {}, debug=False), ticker()
+        )
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert ticks == 5  # the loop kept running while the tools slept
+        assert elapsed < 0.19  # both sync tools slept in parallel
+        assert all(name.startswith("swarm-tool") for name in threads)
+        assert [m["content"] for m in response.messages] == ["0", "1"]
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated_to_its_call(self):
+        async def ok():
+            return "fine"
+
+        def broken():
+            raise RuntimeError("boom")
+
+        calls = [
+            make_tool_call("call-a", "broken", "{}"),
+            make_tool_call("call-b", "missing", "{}"),
+            make_tool_call("call-c", "ok", "{}"),
+        ]
+        response = await handle_tool_calls(calls, [ok, broken], {}, debug=False)
+
+        assert [m["tool_call_id"] for m in response.messages] == ["call-a", "call-b", "call-c"]
+        assert "boom" in json.loads(response.messages[0]["content"])["error"]
+        assert response.messages[2]["content"] == "fine"
+
+    @pytest.mark.asyncio
+    async def test_signature_is_inspected_once_per_function(self):
+        import swarm.tool_executor as tool_executor
+
+        def ctx_tool(context_variables):
+            return context_variables["key"]
+
+        calls = [make_tool_call(f"call-{i}", "ctx_tool", "{}") for i in range(3)]
+        with patch.object(tool_executor.inspect, "signature", wraps=tool_executor.inspect.signature) as sig:
+            await handle_tool_calls(calls, [ctx_tool], {"key": "v"}, debug=False)
+            response = await handle_tool_calls(calls, [ctx_tool], {"key": "v"}, debug=False)
+
+        assert sig.call_count == 1
+        assert [m["content"] for m in response.messages] == ["v", "v", "v"]
+
+    @pytest.mark.asyncio
+    async def test_each_call_gets_its_own_context_copy(self):
+        import threading
+
+        both_started = threading.Barrier(2, timeout=5)
+
+        def tagger(tag, context_variables):
+            context_variables["seen"] = sorted(context_variables)
+            both_started.wait()  # both calls hold their context at once
+            context_variables["last"] = tag
+            context_variables.pop("drop_me", None)
+            return tag
+
+        ctx = {"keep": 1, "drop_me": 2}
+        calls = [make_tool_call(f"call-{t}", "tagger", json.dumps({"tag": t})) for t in ("a", "b")]
+        response = await handle_tool_calls(calls, [tagger], ctx, debug=False)
+
+        assert [m["content"] for m in response.messages] == ["a", "b"]
+        # Neither call saw the other's writes; changes merge in call order.
+        assert ctx == {"keep": 1, "seen": ["drop_me", "keep"], "last": "b"}
+
+
+# =============================================================================
+# run_tool_loop tests
+# =============================================================================
+
+
+def _completion(content=None, tool_calls=None):
+    from types import SimpleNamespace
+
+    from openai.types.chat import ChatCompletionMessage
+
+    message = ChatCompletionMessage.model_validate(
+        {"role": "assistant", "content": content, "tool_calls": tool_calls}
+    )
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _call_dict(call_id, name, arguments):
+    return {"id": call_id, "type": "function", "function": {"name": name, "arguments": arguments}}
+
+
+class FakeCompletions:
+    """Replays scripted completions and records each request."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.requests = []
+
+    async def create(self, **kwargs):
+        self.requests.append(kwargs)
+        return self.replies.pop(0)
+
+
+class TestRunToolLoop:
+    """Function-calling loop that feeds a turn's tool calls to handle_tool_calls."""
+
+    @staticmethod
+    def _client(replies):
+        from types import SimpleNamespace
+
+        completions = FakeCompletions(replies)
+        return SimpleNamespace(chat=SimpleNamespace(completions=completions)), completions
+
+    @pytest.mark.asyncio
+    async def test_runs_turn_tool_calls_concurrently_then_answers(self):
+        from swarm.tool_executor import run_tool_loop
+
+        async def lookup(key: str, context_variables: dict):
+            await asyncio.sleep(0.1)
+            return f"{key}={context_variables['env']}"
+
+        client, completions = self._client([
+            _completion(tool_calls=[
+                _call_dict("c1", "lookup", json.dumps({"key": "a"})),
+                _call_dict("c2", "lookup", json.dumps({"key": "b"})),
+            ]),
+            _completion(content="a and b looked up"),
+        ])
+        agent = Agent(name="Team", instructions="", functions=[lookup], parallel_tool_calls=True)
+
+        start = asyncio.get_running_loop().time()
+        response = await run_tool_loop(
+            client, "m", agent, [{"role": "user", "content": "go"}], {"env": "prod"}
+        )
+        elapsed = asyncio.get_running_loop().time() - start
+
+        assert elapsed < 0.19  # both lookups slept at the same time
+        assert [m["role"] for m in response.messages] == ["assistant", "tool", "tool", "assistant"]
+        assert [m["content"] for m in response.messages[1:3]] == ["a=prod", "b=prod"]
+        assert response.messages[-1]["content"] == "a and b looked up"
+        first, second = completions.requests
+        assert first["parallel_tool_calls"] is True
+        params = first["tools"][0]["function"]["parameters"]
+        assert "context_variables" not in params["properties"]
+        assert "context_variables" not in params["required"]
+        assert "system" not in [m["role"] for m in first["messages"]]
+        assert [m["role"] for m in second["messages"]] == ["user", "assistant", "tool", "tool"]
+
+    @pytest.mark.asyncio
+    async def test_stops_after_max_turns(self):
+        from swarm.tool_executor import run_tool_loop
+
+        def ping():
+            return "pong"
+
+        client, completions = self._client(
+            [_completion(tool_calls=[_call_dict(f"c{i}", "ping", "{}")]) for i in range(2)]
+        )
+        agent = Agent(name="Loopy", functions=[ping])
+        response = await run_tool_loop(client, "m", agent, [], max_turns=2)
+
+        assert len(completions.requests) == 2
+        assert completions.requests[0]["messages"][0] == {"role": "system", "content": agent.instructions}
+        assert response.messages[-1]["role"] == "tool"
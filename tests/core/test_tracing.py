@@ -0,0 +1,157 @@
+"""Request tracing: span nesting, JSONL export, Chrome conversion, CLI spans."""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import sys
+import threading
+
+import pytest
+
+from swarm.core import tracing
+from swarm.core.cli_adapter import CliAdapter
+from swarm.core.consensus import run_consensus
+from swarm.core.moa import MoAOrchestrator
+from swarm.core.moa.backends import FakeParticipantBackend
+
+PY = sys.executable
+
+
+@pytest.fixture
+def spans_file(tmp_path):
+    path = tmp_path / "spans.jsonl"
+    tracing.configure(path)
+    try:
+        yield path
+    finally:
+        tracing.configure(enabled=False)
+
+
+def _by_name(path) -> dict[str, dict]:
+    return {s["name"]: s for s in tracing.load_spans(path)}
+
+
+def test_disabled_tracing_is_a_noop():
+    tracing.configure(enabled=False)
+    assert not tracing.is_enabled()
+    with tracing.span("x", a=1) as s:
+        s.add_event("e")
+        tracing.set_attributes(b=2)
+    assert s is tracing.NOOP_SPAN
+    assert tracing.current_span() is None
+
+
+def test_spans_nest_and_export_as_jsonl(spans_file):
+    with tracing.span("outer", kind="SERVER", route="/x") as outer:
+        with tracing.span("inner") as inner:
+            inner.add_event("first_chunk", n=1)
+            tracing.set_attributes(model="m", skipped=None)
+        with pytest.raises(ValueError), tracing.span("boom"):
+            raise ValueError("bad")
+    assert tracing.current_span() is None
+
+    spans = _by_name(spans_file)
+    assert set(spans) == {"outer", "inner", "boom"}
+    assert spans["inner"]["trace_id"] == spans["outer"]["trace_id"] == outer.trace_id
+    assert spans["inner"]["parent_span_id"] == outer.span_id
+    assert spans["outer"]["parent_span_id"] is None and spans["outer"]["kind"] == "SERVER"
+    assert spans["inner"]["attributes"]["model"] == "m"
+    assert "skipped" not in spans["inner"]["attributes"]
+    assert spans["inner"]["events"][0]["name"] == "first_chunk"
+    assert spans["boom"]["status"] == {"code": "ERROR", "message": "ValueError: bad"}
+    assert spans["outer"]["start_time_unix_nano"] <= spans["inner"]["start_time_unix_nano"]
+    assert spans["inner"]["end_time_unix_nano"] <= spans["outer"]["end_time_unix_nano"]
+
+
+def test_spans_follow_copied_context_into_threads(spans_file):
+    with tracing.span("request") as request:
+        worker = threading.Thread(target=contextvars.copy_context().run, args=(lambda: tracing.span("worker").end(),))
+        worker.start()
+        worker.join()
+    spans = _by_name(spans_file)
+    assert spans["worker"]["parent_span_id"] == request.span_id
+    assert spans["worker"]["attributes"]["thread.id"] != spans["request"]["attributes"]["thread.id"]
+
+
+def test_load_spans_skips_torn_lines_and_chrome_export(spans_file):
+    with tracing.span("outer"), tracing.span("inner") as inner:
+        inner.add_event("first_byte")
+    with spans_file.open("a", encoding="utf-8") as fh:
+        fh.write('{"name": "torn"\n')
+
+    spans = tracing.load_spans(spans_file)
+    assert [s["name"] for s in spans] == ["inner", "outer"]
+    chrome = tracing.to_chrome_trace(spans)
+    complete = {e["name"]: e for e in chrome["traceEvents"] if e["ph"] == "X"}
+    assert set(complete) == {"outer", "inner"}
+    assert complete["inner"]["ts"] >= complete["outer"]["ts"]
+    assert complete["inner"]["dur"] <= complete["outer"]["dur"]
+    assert [e["name"] for e in chrome["traceEvents"] if e["ph"] == "i"] == ["inner:first_byte"]
+    json.dumps(chrome)  # serialisable as written by `swarm-cli trace --chrome`
+
+    tree = tracing.format_tree(spans).splitlines()
+    assert tree[0].startswith("trace ") and tree[1].strip().startswith("outer")
+    assert tree[2].startswith("    inner")
+
+
+@pytest.mark.asyncio
+async def test_cli_run_span_records_first_byte_and_exit(spans_file):
+    adapter = CliAdapter.from_config(
+        "slow",
+        {"cmd": [PY, "-u", "-c", "import sys, time; print('hi'); time.sleep(0.2); print(sys.argv[1])", "{prompt}"]},
+    )
+    with tracing.span("caller") as caller:
+        result = await adapter.run("bye")
+        assert tracing.current_span() is caller
+    assert result.ok
+
+    cli = _by_name(spans_file)["cli.run"]
+    assert cli["parent_span_id"] == caller.span_id and cli["kind"] == "CLIENT"
+    assert cli["attributes"]["agent"] == "slow" and cli["attributes"]["returncode"] == 0
+    (first_byte,) = cli["events"]
+    # The first chunk arrives well before the process exits.
+    assert cli["end_time_unix_nano"] - first_byte["time_unix_nano"] > 100_000_000
+
+
+@pytest.mark.asyncio
+async def test_consensus_panel_spans_nest(spans_file):
+    def echo(name):
+        return CliAdapter.from_config(name, {"cmd": [PY, "-c", "import sys; print(sys.argv[1])", "{prompt}"]})
+
+    await run_consensus("q", [echo("a"), echo("b")])
+    spans = tracing.load_spans(spans_file)
+    by_id = {s["span_id"]: s for s in spans}
+    runs = [s for s in spans if s["name"] == "cli.run"]
+    assert sorted(s["attributes"]["agent"] for s in runs) == ["a", "b"]
+    assert {by_id[s["parent_span_id"]]["name"] for s in runs} == {"consensus.panel"}
+    assert _by_name(spans_file)["consensus"]["attributes"]["panel_ok"] == 2
+
+
+@pytest.mark.asyncio
+async def test_moa_spans_cover_collect_consult_and_determine(spans_file):
+    backend = FakeParticipantBackend({"a": "yes", "b": "no"}, errors={"b": "down"})
+    await MoAOrchestrator(backend=backend).run("q", ["a", "b"])
+    spans = tracing.load_spans(spans_file)
+    by_id = {s["span_id"]: s for s in spans}
+    consults = {s["attributes"]["seat"]: s for s in spans if s["name"] == "moa.consult"}
+    assert {by_id[s["parent_span_id"]]["name"] for s in consults.values()} == {"moa.collect"}
+    assert consults["a"]["status"]["code"] == "OK" and consults["b"]["status"]["code"] == "ERROR"
+    parents = {s["name"]: by_id[s["parent_span_id"]]["name"] for s in spans if s["name"] in ("moa.collect", "moa.determine")}
+    assert parents == {"moa.collect": "moa.run", "moa.determine": "moa.run"}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_span_is_not_an_error(spans_file):
+    async def slow():
+        with tracing.span("slow"):
+            await asyncio.sleep(5)
+
+    task = asyncio.ensure_future(slow())
+    await asyncio.sleep(0.01)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    span = _by_name(spans_file)["slow"]
+    assert span["status"]["code"] == "OK" and span["attributes"]["cancelled"] is True
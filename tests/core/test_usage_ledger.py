@@ -0,0 +1,97 @@
+"""Usage ledger: append-only events, incremental hourly/daily rollups, queries."""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from swarm.core import usage_ledger
+from swarm.core.usage_ledger import UsageEvent, UsageLedger
+
+DAY1 = datetime(2026, 10, 5, 9, 30, tzinfo=timezone.utc).timestamp()
+DAY2 = datetime(2026, 10, 6, 14, 0, tzinfo=timezone.utc).timestamp()
+
+
+def _event(ts, owner="user:alice", model="cli_agent", prompt=10, completion=5):
+    return UsageEvent(ts=ts, owner=owner, model=model, endpoint="chat.completions",
+                      prompt_tokens=prompt, completion_tokens=completion)
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    led = UsageLedger(tmp_path / "usage.sqlite3")
+    yield led
+    led.close()
+
+
+def test_rollups_are_maintained_incrementally(ledger):
+    ledger.write([_event(DAY1), _event(DAY1 + 60, model="moa"), _event(DAY2, owner="token:abc")])
+    ledger.write([_event(DAY1 + 1800, prompt=1, completion=1)])  # same day, next hour
+
+    rows = ledger.query(since=DAY1 - 86400, group_by=("owner", "model"))
+    assert rows == [
+        {"owner": "user:alice", "model": "cli_agent", "requests": 2, "prompt_tokens": 11,
+         "completion_tokens": 6, "total_tokens": 17},
+        {"owner": "token:abc", "model": "cli_agent", "requests": 1, "prompt_tokens": 10,
+         "completion_tokens": 5, "total_tokens": 15},
+        {"owner": "user:alice", "model": "moa", "requests": 1, "prompt_tokens": 10,
+         "completion_tokens": 5, "total_tokens": 15},
+    ]
+    hourly = ledger.query(granularity="hour", since=DAY1 - 86400, owner="user:alice", group_by=("bucket",))
+    assert [(r["bucket"], r["requests"]) for r in hourly] == [("2026-10-05T09:00:00+00:00", 2), ("2026-10-05T10:00:00+00:00", 1)]
+    daily = ledger.query(since=DAY1, until=DAY2, group_by=("bucket",))  # widened to whole days
+    assert [(r["bucket"], r["total_tokens"]) for r in daily] == [("2026-10-05T00:00:00+00:00", 32), ("2026-10-06T00:00:00+00:00", 15)]
+    assert len(ledger.query(since=DAY1, until=DAY2 - 86400, group_by=("bucket",))) == 1
+    assert ledger.query(since=DAY1, group_by=()) == [
+        {"requests": 4, "prompt_tokens": 31, "completion_tokens": 16, "total_tokens": 47}
+    ]
+
+    # Queries read only the rollups: the event log is history, not an index.
+    conn = sqlite3.connect(ledger.path)
+    assert conn.execute("SELECT COUNT(*) FROM usage_events").fetchone()[0] == 4
+    with conn:
+        conn.execute("DELETE FROM usage_events")
+    conn.close()
+    assert ledger.query(since=DAY1, group_by=())[0]["requests"] == 4
+
+    with pytest.raises(ValueError):
+        ledger.query(granularity="minute")
+    with pytest.raises(ValueError):
+        ledger.query(group_by=("endpoint",))
+
+
+def test_record_queues_in_the_background(tmp_path, monkeypatch):
+    ledger = UsageLedger(tmp_path / "usage.sqlite3")
+    monkeypatch.setattr(usage_ledger, "USAGE_LEDGER", ledger)
+    monkeypatch.setenv("SWARM_USAGE_LEDGER", "1")
+    for _ in range(3):
+        assert usage_ledger.record(owner=None, model="echo", endpoint="responses", prompt_tokens=2, completion_tokens=3)
+    assert usage_ledger.flush_usage(5)
+    assert ledger.query(group_by=("owner",)) == [
+        {"owner": usage_ledger.ANONYMOUS, "requests": 3, "prompt_tokens": 6, "completion_tokens": 9, "total_tokens": 15}
+    ]
+    monkeypatch.setenv("SWARM_USAGE_LEDGER", "0")
+    assert not usage_ledger.record(owner=None, model="echo", endpoint="responses", prompt_tokens=1, completion_tokens=1)
+    ledger.close()
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    ledger = UsageLedger(tmp_path / "usage.sqlite3", max_queue=1)
+    ledger._ensure_worker = lambda: None  # no consumer: the queue stays full
+    assert ledger.submit(_event(DAY1))
+    assert not ledger.submit(_event(DAY1)) and ledger.dropped == 1
+    assert UsageLedger(tmp_path / "missing.sqlite3").query() == []
+
+
+def test_parse_time():
+    now = 1_000_000.0
+    assert usage_ledger.parse_time("7d", now=now) == now - 7 * 86400
+    assert usage_ledger.parse_time("24h", now=now) == now - 86400
+    assert usage_ledger.parse_time("1760000000") == 1_760_000_000.0
+    assert usage_ledger.parse_time("2026-10-05") == datetime(2026, 10, 5, tzinfo=timezone.utc).timestamp()
+    assert usage_ledger.parse_time("2026-10-05T09:30:00Z") == DAY1
+    assert usage_ledger.parse_time(None) is None
+    with pytest.raises(ValueError):
+        usage_ledger.parse_time("last week")
@@ -0,0 +1,297 @@
+"""AsyncGitHubClient against a local stub GitHub API (no network)."""
+
+import base64
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import pytest
+
+from swarm.services.github_client import (
+    AsyncGitHubClient,
+    ETagCache,
+    GitHubConfig,
+    get_etag_cache,
+)
+
+BLUEPRINT_PY = '''
+class DemoBlueprint:
+    metadata = {"name": "From Source", "description": "Parsed from python"}
+'''
+
+
+def _repo_files(name: str) -> dict[str, str]:
+    return {
+        "README.md": "# readme\n",
+        "swarm/blueprints/alpha/manifest.json": json.dumps({"name": f"{name}-alpha", "description": "a", "kind": "blueprint"}),
+        "swarm/blueprints/alpha/blueprint_alpha.py": "print('alpha')\n" * 10,
+        "swarm/blueprints/alpha/nested/ignored.py": "x = 1\n",
+        "swarm/blueprints/beta/manifest.json": json.dumps({"kind": "blueprint"}),
+        "swarm/blueprints/beta/blueprint_beta.py": BLUEPRINT_PY,
+        "swarm/mcp/tool/manifest.json": json.dumps({"name": f"{name}-mcp", "description": "m", "kind": "mcp"}),
+    }
+
+
+class StubGitHub:
+    """Serves search, git tree and contents endpoints with ETags."""
+
+    def __init__(self, repo_names: list[str], delay: float = 0.0):
+        self.repos = {f"org/{n}": _repo_files(n) for n in repo_names}
+        self.delay = delay
+        self.hits: list[tuple[str, int]] = []
+        self.forbidden: set[str] = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *_args):
+                pass
+
+            def do_GET(self):
+                stub._handle(self)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def _route(self, path: str):
+        if path == "/search/repositories":
+            items = [{"full_name": full, "html_url": f"https://github.com/{full}"} for full in self.repos]
+            return {"items": items}, "search-v1"
+        parts = path.strip("/").split("/")
+        full = "/".join(parts[1:3])
+        files = self.repos.get(full)
+        if files is None:
+            return None, None
+        if parts[3:5] == ["git", "trees"]:
+            tree = [{"path": p, "type": "blob", "size": len(c.encode())} for p, c in files.items()]
+            sha = f"tree-{full}-{len(files)}"
+            return {"sha": sha, "tree": tree, "truncated": False}, sha
+        if parts[3] == "contents":
+            file_path = "/".join(parts[4:])
+            if file_path not in files:
+                return None, None
+            content = base64.b64encode(files[file_path].encode()).decode()
+            return {"type": "file", "content": content}, f"blob-{full}-{file_path}"
+        return None, None
+
+    def _handle(self, handler: BaseHTTPRequestHandler):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.delay:
+                time.sleep(self.delay)
+            path = urlsplit(handler.path).path
+            body, etag = self._route(path)
+            if path in self.forbidden:
+                status = 403
+            elif body is None:
+                status = 404
+            elif handler.headers.get("If-None-Match") == f'"{etag}"':
+                status = 304
+            else:
+                status = 200
+            with self._lock:
+                self.hits.append((path, status))
+            handler.send_response(status)
+            if status == 200:
+                payload = json.dumps(body).encode()
+                handler.send_header("ETag", f'"{etag}"')
+                handler.send_header("Content-Type", "application/json")
+                handler.send_header("Content-Length", str(len(payload)))
+                handler.end_headers()
+                handler.wfile.write(payload)
+            else:
+                handler.send_header("Content-Length", "0")
+                handler.end_headers()
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def stub():
+    with StubGitHub(["one", "two"]) as server:
+        yield server
+
+
+def _config(stub: StubGitHub, tmp_path, **kwargs) -> GitHubConfig:
+    return GitHubConfig(
+        token=None,
+        base_url=stub.base_url,
+        etag_cache_path=str(tmp_path / "etags.json"),
+        **kwargs,
+    )
+
+
+async def test_fetch_manifests_uses_tree_for_metrics(stub, tmp_path):
+    async with AsyncGitHubClient(_config(stub, tmp_path)) as client:
+        repos = await client.search_repositories(["open-swarm-blueprint"])
+        results = await client.fetch_all_manifests(repos)
+
+    assert [r["full_name"] for r in repos] == ["org/one", "org/two"]
+    by_name = {m["name"]: m for m in results[0]}
+    alpha = by_name["one-alpha"]
+    assert alpha["file_count"] == 2  # direct children only; nested/ is excluded
+    files = _repo_files("one")
+    assert alpha["size_bytes"] == sum(
+        len(files[p].encode())
+        for p in ("swarm/blueprints/alpha/manifest.json", "swarm/blueprints/alpha/blueprint_alpha.py")
+    )
+    assert alpha["owner"] == "org"
+    # Missing name/description is recovered from the item's python source.
+    assert by_name["From Source"]["description"] == "Parsed from python"
+    assert "one-mcp" in by_name
+
+    fetched = [path for path, _ in stub.hits if "/contents/" in path]
+    # Manifests plus the one .py needed for metadata; no per-file line counting.
+    assert all(p.endswith("manifest.json") or p.endswith("blueprint_beta.py") for p in fetched)
+    assert sum(1 for path, _ in stub.hits if "/git/trees/" in path) == 2
+
+
+async def test_unchanged_repo_costs_single_304(stub, tmp_path):
+    async with AsyncGitHubClient(_config(stub, tmp_path)) as client:
+        first = await client.fetch_all_manifests([{"full_name": "org/one"}])
+    stub.hits.clear()
+
+    # A new client (e.g. next sync run) reloads the persisted ETag cache.
+    async with AsyncGitHubClient(_config(stub, tmp_path)) as client:
+        second = await client.fetch_all_manifests([{"full_name": "org/one"}])
+        assert client.not_modified == 1
+
+    assert second == first
+    assert stub.hits == [("/repos/org/one/git/trees/HEAD", 304)]
+
+
+async def test_changed_tree_refetches_with_conditional_contents(stub, tmp_path):
+    async with AsyncGitHubClient(_config(stub, tmp_path)) as client:
+        await client.fetch_all_manifests([{"full_name": "org/one"}])
+    stub.repos["org/one"]["docs.md"] = "new file\n"
+    stub.hits.clear()
+
+    async with AsyncGitHubClient(_config(stub, tmp_path)) as client:
+        results = await client.fetch_all_manifests([{"full_name": "org/one"}])
+
+    assert ("/repos/org/one/git/trees/HEAD", 200) in stub.hits
+    assert all(status == 304 for path, status in stub.hits if "/contents/" in path)
+    assert {m["name"] for m in results[0]} == {"one-alpha", "From Source", "one-mcp"}
+
+
+async def test_incomplete_fetch_is_not_reused_on_304(stub, tmp_path):
+    stub.forbidden.add("/repos/org/one/contents/swarm/mcp/tool/manifest.json")
+    async with AsyncGitHubClient(_config(stub, tmp_path)) as client:
+        partial = await client.fetch_all_manifests([{"full_name": "org/one"}])
+    assert {m["name"] for m in partial[0]} == {"one-alpha", "From Source"}
+    stub.forbidden.clear()
+
+    # The tree is unchanged, but the partial list must not be replayed.
+    async with AsyncGitHubClient(_config(stub, tmp_path)) as client:
+        results = await client.fetch_all_manifests([{"full_name": "org/one"}])
+
+    assert ("/repos/org/one/git/trees/HEAD", 304) not in stub.hits
+    assert {m["name"] for m in results[0]} == {"one-alpha", "From Source", "one-mcp"}
+
+
+async def test_tree_entry_keeps_only_manifests_and_sha(stub, tmp_path):
+    async with AsyncGitHubClient(_config(stub, tmp_path)) as client:
+        results = await client.fetch_all_manifests([{"full_name": "org/one"}])
+
+    saved = json.loads((tmp_path / "etags.json").read_text())
+    tree_entries = [entry for key, entry in saved.items() if "/git/trees/" in key]
+    assert len(tree_entries) == 1
+    assert set(tree_entries[0]["data"]) == {"sha", "manifests"}
+    assert tree_entries[0]["data"]["manifests"] == results[0]
+
+
+def test_clients_share_one_cache_per_path(tmp_path):
+    first = AsyncGitHubClient(GitHubConfig(etag_cache_path=str(tmp_path / "a.json")))
+    second = AsyncGitHubClient(GitHubConfig(etag_cache_path=str(tmp_path / "a.json")))
+    other = AsyncGitHubClient(GitHubConfig(etag_cache_path=str(tmp_path / "b.json")))
+
+    assert first.etag_cache is second.etag_cache is get_etag_cache(tmp_path / "a.json")
+    assert other.etag_cache is not first.etag_cache
+
+
+async def test_concurrency_is_bounded(tmp_path):
+    with StubGitHub([f"r{i}" for i in range(6)], delay=0.02) as server:
+        config = _config(server, tmp_path, max_concurrency=2)
+        async with AsyncGitHubClient(config) as client:
+            repos = [{"full_name": full} for full in server.repos]
+            results = await client.fetch_all_manifests(repos)
+
+    assert len(results) == 6 and all(len(r) == 3 for r in results)
+    assert 1 < server.max_in_flight <= 2
+
+
+async def test_missing_repo_and_bad_name_are_empty(stub, tmp_path):
+    async with AsyncGitHubClient(_config(stub, tmp_path)) as client:
+        results = await client.fetch_all_manifests([{"full_name": "org/missing"}, {"full_name": "bad"}])
+    assert results == [[], []]
+
+
+def test_etag_cache_persists_and_evicts_lru(tmp_path):
+    cache = ETagCache(tmp_path / "c.json", max_entries=2)
+    cache.put("a", "e1", {"v": 1})
+    cache.put("b", "e2", {"v": 2})
+    cache.get("a")  # refresh "a" so "b" is evicted next
+    cache.put("c", "e3", {"v": 3})
+    cache.save()
+
+    reloaded = ETagCache(tmp_path / "c.json")
+    assert reloaded.get("b") is None
+    assert reloaded.get("a") == {"etag": "e1", "data": {"v": 1}}
+    assert reloaded.get("c")["etag"] == "e3"
+
+
+def test_etag_cache_ignores_corrupt_file(tmp_path):
+    path = tmp_path / "c.json"
+    path.write_text("{not json")
+    assert ETagCache(path).get("anything") is None
+
+
+def test_sync_marketplace_items_collects_concurrently(stub, tmp_path, monkeypatch):
+    from unittest.mock import MagicMock
+
+    import swarm.services.github_client as github_client_module
+    from swarm.services.github_client import GitHubClient
+
+    models = MagicMock()
+    models.Blueprint.objects.update_or_create.return_value = (MagicMock(), True)
+    models.MCPConfig.objects.update_or_create.return_value = (MagicMock(), True)
+    monkeypatch.setattr(github_client_module, "Blueprint", models.Blueprint)
+    monkeypatch.setattr(github_client_module, "MCPConfig", models.MCPConfig)
+
+    created, updated = GitHubClient(_config(stub, tmp_path)).sync_marketplace_items()
+
+    # Two repos x (two blueprints + one MCP config).
+    assert (created, updated) == (6, 0)
+    assert models.Blueprint.objects.update_or_create.call_count == 4
+
+
+def test_sync_fetch_manifests_uses_tree_and_etags(stub, tmp_path):
+    from swarm.services.github_client import GitHubClient
+
+    client = GitHubClient(_config(stub, tmp_path))
+    first = client.fetch_manifests({"full_name": "org/one"})
+    assert {m["name"] for m in first} == {"one-alpha", "From Source", "one-mcp"}
+    assert all("line_count" not in m for m in first)
+    stub.hits.clear()
+
+    assert client.fetch_manifests({"full_name": "org/one"}) == first
+    assert stub.hits == [("/repos/org/one/git/trees/HEAD", 304)]
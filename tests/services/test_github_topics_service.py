@@ -1,7 +1,5 @@
 """Tests for src.swarm.services.github_topics_service."""
 
-import base64
-import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -168,136 +166,6 @@ class TestSearchReposByTopics:
             headers = mock_client.call_args.kwargs.get("headers") or {}
             assert headers.get("Authorization") == "Bearer mytoken"
 
-class TestFetchRepoManifests:
-    """Tests for fetch_repo_manifests function."""
-
-    def _create_mock_client(self, url_to_response):
-        """Create a mock httpx.Client that returns specific responses for URLs."""
-        def mock_get(url, **kwargs):
-            mock_resp = MagicMock()
-            for pattern, response in url_to_response.items():
-                if pattern in url:
-                    mock_resp.status_code = response.get("status_code", 200)
-                    mock_resp.json.return_value = response.get("json", {})
-                    return mock_resp
-            # Default: 404 for unmatched
-            mock_resp.status_code = 404
-            return mock_resp
-        
-        mock_client = MagicMock()
-        mock_client.get.side_effect = mock_get
-        return mock_client
-
-    def test_top_level_single_item(self):
-        """Fetches single item from top-level open-swarm.json."""
-        repo = {"full_name": "owner/testrepo"}
-        
-        content = json.dumps({"name": "test-item", "description": "A test"})
-        encoded = base64.b64encode(content.encode()).decode()
-        
-        url_to_response = {
-            "contents/open-swarm.json": {
-                "status_code": 200,
-                "json": {"type": "file", "content": encoded}
-            }
-        }
-        
-        with patch("src.swarm.services.github_topics_service.httpx.Client") as mock_client_cls:
-            mock_client = self._create_mock_client(url_to_response)
-            mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
-            mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
-
-            result = github_service.fetch_repo_manifests(repo)
-
-            assert len(result) == 1
-            assert result[0]["name"] == "test-item"
-
-    def test_top_level_list_items(self):
-        """Fetches list of items from top-level open-swarm.json."""
-        repo = {"full_name": "owner/testrepo"}
-        
-        content = json.dumps([
-            {"name": "item1", "description": "First"},
-            {"name": "item2", "description": "Second"}
-        ])
-        encoded = base64.b64encode(content.encode()).decode()
-        
-        url_to_response = {
-            "contents/open-swarm.json": {
-                "status_code": 200,
-                "json": {"type": "file", "content": encoded}
-            }
-        }
-        
-        with patch("src.swarm.services.github_topics_service.httpx.Client") as mock_client_cls:
-            mock_client = self._create_mock_client(url_to_response)
-            mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
-            mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
-
-            result = github_service.fetch_repo_manifests(repo)
-
-            assert len(result) == 2
-            assert result[0]["name"] == "item1"
-            assert result[1]["name"] == "item2"
-
-    def test_invalid_repo_format(self):
-        """Returns empty list for invalid repo full_name."""
-        repo = {"full_name": "invalid"}  # Missing second part
-        
-        result = github_service.fetch_repo_manifests(repo)
-
-        assert result == []
-
-    def test_fetch_error_handling(self, monkeypatch):
-        """Handles fetch errors gracefully."""
-        repo = {"full_name": "owner/testrepo"}
-        
-        def mock_get(url, **kwargs):
-            raise Exception("Network error")
-
-        monkeypatch.setattr(github_service.httpx.Client, "get", mock_get)
-
-        result = github_service.fetch_repo_manifests(repo)
-
-        # Should return empty on error
-        assert result == []
-
-    def test_invalid_json_content(self):
-        """Handles invalid JSON in manifest gracefully."""
-        repo = {"full_name": "owner/testrepo"}
-        
-        url_to_response = {
-            "contents/open-swarm.json": {
-                "status_code": 200,
-                "json": {"type": "file", "content": "!!!invalid!!!"}
-            }
-        }
-        
-        with patch("src.swarm.services.github_topics_service.httpx.Client") as mock_client_cls:
-            mock_client = self._create_mock_client(url_to_response)
-            mock_client_cls.return_value.__enter__ = MagicMock(return_value=mock_client)
-            mock_client_cls.return_value.__exit__ = MagicMock(return_value=False)
-
-            result = github_service.fetch_repo_manifests(repo)
-
-            assert result == []
-
-
-class TestEnrichItemWithMetrics:
-    """Tests for enrich_item_with_metrics function."""
-
-    def test_handles_listing_error(self):
-        """Handles directory listing errors gracefully."""
-        client = MagicMock()
-        client.get.return_value.status_code = 404
-
-        item = {}
-        github_service.enrich_item_with_metrics(client, "owner", "repo", "dir", item)
-
-        # Should not raise, item unchanged
-        assert item.get("file_count") is None
-
-
 class TestSafeExtractMetadataFromPy:
     """Tests for safe_extract_metadata_from_py function."""
 
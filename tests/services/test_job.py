@@ -10,6 +10,7 @@ import json
 from pathlib import Path
 from unittest.mock import patch, MagicMock, mock_open
 import pytest
+import sys
 import time
 
 # Import the module under test
@@ -18,6 +19,7 @@ from swarm.services.job import (
     Job,
     DefaultJobService,
     _is_under_job_outputs,
+    _read_tail_lines,
     _validated_output_file_path,
 )
 
@@ -319,20 +321,18 @@ class TestDefaultJobService:
     def test_get_log_tail_default_lines(self, job_service):
         """Test getting log tail with default lines."""
         job = Job(id="test_job_tail_default", command_list=["echo", "hello"])
-        
-        with patch.object(job_service, 'get_status', return_value=job), \
-             patch('pathlib.Path.open', new_callable=mock_open, read_data="Line 1\nLine 2\nLine 3"), \
-             patch('pathlib.Path.exists', return_value=True):
+        job.output_file_path.write_text("Line 1\nLine 2\nLine 3")
+
+        with patch.object(job_service, 'get_status', return_value=job):
             tail = job_service.get_log_tail("test_job_tail_default")
             assert tail == ["Line 1", "Line 2", "Line 3"]
 
     def test_get_log_tail_specific_lines(self, job_service):
         """Test getting log tail with specific number of lines."""
         job = Job(id="test_job_tail_specific", command_list=["echo", "hello"])
-        
-        with patch.object(job_service, 'get_status', return_value=job), \
-             patch('pathlib.Path.open', new_callable=mock_open, read_data="Line 1\nLine 2\nLine 3"), \
-             patch('pathlib.Path.exists', return_value=True):
+        job.output_file_path.write_text("Line 1\nLine 2\nLine 3")
+
+        with patch.object(job_service, 'get_status', return_value=job):
             tail = job_service.get_log_tail("test_job_tail_specific", n_lines=2)
             assert tail == ["Line 2", "Line 3"]
 
@@ -650,5 +650,215 @@ class TestJobServicePersistence:
                 job_service.prune_completed()
 
 
+# =============================================================================
+# Tests for log tail and follow
+# =============================================================================
+
+class TestJobLogTailAndFollow:
+    """Tail reads backwards from EOF; follow streams by byte offset."""
+
+    @pytest.mark.parametrize("trailing_newline", [True, False])
+    @pytest.mark.parametrize("n_lines", [1, 7, 500, 5000])
+    def test_tail_matches_splitlines_across_blocks(self, tmp_path, n_lines, trailing_newline):
+        content = "\n".join(f"line {i} " + "x" * (i % 37) for i in range(2000))
+        if trailing_newline:
+            content += "\n"
+        log = tmp_path / "big.log"
+        log.write_text(content)
+
+        assert _read_tail_lines(log, n_lines, block_size=64) == content.splitlines()[-n_lines:]
+
+    def test_tail_of_empty_log(self, tmp_path):
+        log = tmp_path / "empty.log"
+        log.write_bytes(b"")
+        assert _read_tail_lines(log, 5) == []
+
+    def test_tail_refuses_path_escape(self, job_service, tmp_path):
+        job = Job(id="escape_tail", command_list=["echo", "hi"])
+        outside = tmp_path / "outside_secret.log"
+        outside.write_text("secret-contents")
+        job.output_file_path = outside
+
+        with patch.object(job_service, "get_status", return_value=job):
+            tail = job_service.get_log_tail("escape_tail")
+
+        assert tail == ["[Error reading output file: path escapes job outputs directory]"]
+
+    def test_follow_finished_job_yields_whole_log(self, job_service):
+        job = Job(id="follow_done", command_list=["echo", "hi"], status="COMPLETED")
+        job.output_file_path.write_text("one\ntwo\n")
+        job_service._jobs[job.id] = job
+
+        chunks = list(job_service.follow_log(job.id))
+
+        assert "".join(text for _, text in chunks) == "one\ntwo\n"
+        assert chunks[-1][0] == len(b"one\ntwo\n")
+
+    def test_follow_resumes_from_offset_and_handles_split_utf8(self, job_service):
+        job = Job(id="follow_utf8", command_list=["echo", "hi"], status="COMPLETED")
+        payload = "héllo wörld\n".encode()
+        job.output_file_path.write_bytes(payload)
+        job_service._jobs[job.id] = job
+
+        # Two-byte reads split the multi-byte characters across chunks.
+        with patch("swarm.services.job._read_log_chunk", lambda path, offset: path.read_bytes()[offset:offset + 2]):
+            text = "".join(t for _, t in job_service.follow_log(job.id, offset=7))
+
+        assert text == payload[7:].decode()
+
+    def test_follow_offsets_resume_without_losing_split_characters(self, job_service):
+        job = Job(id="follow_resume", command_list=["echo", "hi"], status="COMPLETED")
+        payload = "aé€b\n".encode()
+        job.output_file_path.write_bytes(payload)
+        job_service._jobs[job.id] = job
+
+        with patch("swarm.services.job._read_log_chunk", lambda path, offset: path.read_bytes()[offset:offset + 2]):
+            for next_offset, text in job_service.follow_log(job.id):
+                resumed = "".join(t for _, t in job_service.follow_log(job.id, offset=next_offset))
+                assert payload[:next_offset].decode() + resumed == payload.decode()
+                assert payload[:next_offset].decode().endswith(text)
+
+    def test_follow_streams_running_job(self, job_service):
+        job_id = job_service.launch([sys.executable, "-c", "import time\nfor i in range(3): print(i, flush=True) or time.sleep(0.05)"])
+        text = "".join(t for _, t in job_service.follow_log(job_id, poll_interval=0.01))
+        assert text.split() == ["0", "1", "2"]
+
+    async def test_afollow_log(self, job_service):
+        job = Job(id="afollow", command_list=["echo", "hi"], status="COMPLETED")
+        job.output_file_path.write_text("async\n")
+        job_service._jobs[job.id] = job
+
+        chunks = [text async for _, text in job_service.afollow_log(job.id)]
+
+        assert "".join(chunks) == "async\n"
+
+    def test_follow_unknown_job_raises(self, job_service):
+        with pytest.raises(KeyError):
+            next(job_service.follow_log("missing"))
+
+
+# =============================================================================
+# Tests for the job journal and reattach-after-restart
+# =============================================================================
+
+class TestJobJournal:
+    """Status changes are journaled; the snapshot is only rewritten on compaction."""
+
+    def test_record_job_appends_without_rewriting_snapshot(self, job_service, mock_job_data_dir):
+        job = Job(id="journaled", command_list=["echo", "hi"], status="COMPLETED", exit_code=0)
+        job_service._jobs[job.id] = job
+        job_service._record_job(job)
+
+        assert not (mock_job_data_dir / "jobs_metadata.json").exists()
+        lines = (mock_job_data_dir / "jobs_journal.jsonl").read_text().splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0]) == {"op": "put", "job": job.to_dict()}
+
+    def test_load_replays_journal_and_compacts(self, job_service, mock_job_data_dir):
+        job = Job(id="replayed", command_list=["echo", "hi"], status="PENDING")
+        job_service._jobs[job.id] = job
+        job_service._record_job(job)
+        job.status = "COMPLETED"
+        job.exit_code = 0
+        job_service._record_job(job)
+
+        reloaded = DefaultJobService()
+        loaded = reloaded.get_status("replayed")
+        assert loaded.status == "COMPLETED"
+        assert loaded.exit_code == 0
+        # Replayed records are folded into the snapshot.
+        assert (mock_job_data_dir / "jobs_journal.jsonl").read_text() == ""
+        snapshot = json.loads((mock_job_data_dir / "jobs_metadata.json").read_text())
+        assert snapshot["replayed"]["status"] == "COMPLETED"
+
+    def test_torn_journal_line_is_ignored(self, job_service, mock_job_data_dir):
+        job = Job(id="torn", command_list=["echo", "hi"], status="COMPLETED", exit_code=0)
+        job_service._jobs[job.id] = job
+        job_service._record_job(job)
+        with (mock_job_data_dir / "jobs_journal.jsonl").open("a") as f:
+            f.write('{"op": "put", "job": {"id": "tor')
+
+        reloaded = DefaultJobService()
+        assert [j.id for j in reloaded.list_all()] == ["torn"]
+
+    def test_launch_journals_running_before_exit(self, job_service, mock_job_data_dir):
+        journal = mock_job_data_dir / "jobs_journal.jsonl"
+        job_id = job_service.launch(["true"])
+        deadline = time.monotonic() + 5
+        while len(journal.read_text().splitlines()) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        statuses = [json.loads(line)["job"]["status"] for line in journal.read_text().splitlines()]
+        assert statuses[0] == "RUNNING"
+        assert statuses[-1] == job_service.get_status(job_id).status != "RUNNING"
+        assert DefaultJobService().get_status(job_id).status == statuses[-1]
+
+    def test_load_compacts_stale_transitions_without_journal(self, job_service, mock_job_data_dir):
+        job = Job(id="stale", command_list=["echo", "hi"], status="RUNNING", pid=12345)
+        job_service._jobs[job.id] = job
+        job_service._save_jobs_to_disk()
+
+        DefaultJobService()
+        snapshot = json.loads((mock_job_data_dir / "jobs_metadata.json").read_text())
+        assert snapshot["stale"]["status"] == "UNKNOWN_STALE"
+
+    def test_journal_compacts_after_threshold(self, job_service, mock_job_data_dir):
+        job = Job(id="chatty", command_list=["echo", "hi"], status="RUNNING")
+        job_service._jobs[job.id] = job
+        with patch("swarm.services.job.JOURNAL_COMPACT_THRESHOLD", 3):
+            for _ in range(3):
+                job_service._record_job(job)
+
+        assert (mock_job_data_dir / "jobs_journal.jsonl").read_text() == ""
+        assert "chatty" in json.loads((mock_job_data_dir / "jobs_metadata.json").read_text())
+
+
+@pytest.mark.skipif(not Path("/proc/self/stat").exists(), reason="reattach requires /proc")
+class TestJobReattach:
+    """Running jobs are re-adopted after a restart when their pidfile still matches."""
+
+    def test_running_job_is_reattached_and_terminated(self, job_service, mock_job_data_dir):
+        job_id = job_service.launch(["sleep", "30"])
+        pid = job_service.get_status(job_id).pid
+        assert (mock_job_data_dir / "outputs" / f"{job_id}.pid").exists()
+
+        # Simulate a restart: a fresh service loads the journal from disk.
+        restarted = DefaultJobService()
+        adopted = restarted.get_status(job_id)
+        assert adopted.status == "RUNNING"
+        assert adopted.pid == pid
+        assert job_id in restarted._threads
+
+        assert restarted.terminate(job_id) == "TERMINATED"
+        assert restarted.get_status(job_id).status == "TERMINATED"
+        assert not (mock_job_data_dir / "outputs" / f"{job_id}.pid").exists()
+
+    def test_recycled_pid_is_not_reattached(self, job_service, mock_job_data_dir):
+        import os
+
+        job = Job(id="recycled", command_list=["echo", "hi"], status="RUNNING", pid=os.getpid())
+        job_service._jobs[job.id] = job
+        job_service._record_job(job)
+        # Same PID, different start time: the PID was reused by another process.
+        (mock_job_data_dir / "outputs" / "recycled.pid").write_text(
+            json.dumps({"pid": os.getpid(), "start_time": -1})
+        )
+
+        restarted = DefaultJobService()
+        assert restarted.get_status("recycled").status == "UNKNOWN_STALE"
+
+    def test_reattached_job_exit_is_detected(self, job_service):
+        job_id = job_service.launch(["sleep", "0.3"])
+        restarted = DefaultJobService()
+        assert restarted.get_status(job_id).status == "RUNNING"
+        with patch("swarm.services.job.REATTACH_POLL_INTERVAL", 0.05):
+            for service in (job_service, restarted):
+                thread = service._threads.get(job_id)
+                if thread is not None:
+                    thread.join(timeout=5)
+
+        assert restarted.get_status(job_id).status == "EXITED"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
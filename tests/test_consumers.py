@@ -3,12 +3,14 @@ Unit tests for src/swarm/consumers.py
 
 Covers:
 - connect: authenticated vs unauthenticated, ?blueprint= query param default
-- disconnect: cleanup, save, delete empty conversations
+- disconnect: cleanup, flush queued turns, delete empty conversations
 - receive: valid JSON, missing keys, invalid JSON, empty messages
 - blueprint selection: message field, connection default, override,
   unknown-blueprint error partial
 - fetch_conversation: cache hit, DB hit, DoesNotExist
 - save_conversation: create/update, idempotent replace on repeat save
+- incremental persistence: per-turn appends via the write-behind queue,
+  bounded LRU cache, rehydrate after eviction
 - delete_conversation: existing, missing
 """
 
@@ -20,7 +22,10 @@ from channels.testing import WebsocketCommunicator
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
 
+import swarm.consumers as consumers_module
 from swarm.consumers import (
+    ConversationCache,
+    ConversationWriteBehind,
     DjangoChatConsumer,
     IN_MEMORY_CONVERSATIONS,
     _conversation_cache_key,
@@ -81,6 +86,7 @@ def consumer(mock_scope, mock_user):
     consumer = DjangoChatConsumer()
     consumer.scope = mock_scope
     consumer.user = mock_user  # Set user attribute directly (normally set in connect)
+    consumer.conversation_id = "test-conv-123"
     consumer.messages = []
     return consumer
 
@@ -104,6 +110,15 @@ def isolated_memory_cache():
     IN_MEMORY_CONVERSATIONS.update(original)
 
 
+@pytest.fixture(autouse=True)
+def isolated_writer(monkeypatch):
+    """Give each test its own write-behind queue so turns never leak across tests."""
+    writer = ConversationWriteBehind(flush_interval=3600)
+    monkeypatch.setattr(consumers_module, "CONVERSATION_WRITER", writer)
+    yield writer
+    writer.discard()
+
+
 # =============================================================================
 # Connect Tests
 # =============================================================================
@@ -200,17 +215,19 @@ class TestDisconnect:
     """Tests for DjangoChatConsumer.disconnect method."""
 
     @pytest.mark.asyncio
-    async def test_disconnect_authenticated_saves_conversation(self, consumer):
-        """Authenticated user should have conversation saved on disconnect."""
+    async def test_disconnect_authenticated_flushes_queued_turns(self, consumer, isolated_writer):
+        """Disconnect drains the write-behind queue instead of rewriting the transcript."""
         consumer.messages = [{"role": "user", "content": "Hello"}]
         consumer.conversation_id = "test-conv-123"
-        
-        with patch.object(consumer, 'save_conversation', new_callable=AsyncMock) as mock_save:
-            with patch.object(consumer, 'delete_conversation', new_callable=AsyncMock) as mock_delete:
-                await consumer.disconnect(close_code=1000)
-                
-                mock_save.assert_called_once_with("test-conv-123", consumer.messages)
-                mock_delete.assert_not_called()
+
+        with patch.object(isolated_writer, 'flush', new_callable=AsyncMock) as mock_flush:
+            with patch.object(consumer, 'save_conversation', new_callable=AsyncMock) as mock_save:
+                with patch.object(consumer, 'delete_conversation', new_callable=AsyncMock) as mock_delete:
+                    await consumer.disconnect(close_code=1000)
+
+                    mock_flush.assert_awaited_once_with(consumer.user, "test-conv-123")
+                    mock_save.assert_not_called()
+                    mock_delete.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_disconnect_deletes_empty_conversation(self, consumer):
@@ -863,6 +880,165 @@ class TestDeleteConversation:
         assert ChatConversation.objects.filter(conversation_id="with-messages").exists()
 
 
+# =============================================================================
+# Incremental Persistence Tests
+# =============================================================================
+
+
+class TestIncrementalPersistence:
+    """Per-turn appends, write-behind batching and the bounded LRU cache."""
+
+    def test_cache_evicts_least_recently_used(self):
+        cache = ConversationCache(max_conversations=2, max_messages=100)
+        cache["a"] = [{"role": "user", "content": "1"}]
+        cache["b"] = []
+        cache["a"]  # refresh "a" so "b" is evicted next
+        cache["c"] = []
+
+        assert list(cache) == ["a", "c"]
+        assert cache.copy().max_conversations == 2
+
+    def test_cache_bounds_total_messages_as_transcripts_grow(self):
+        cache = ConversationCache(max_conversations=10, max_messages=4)
+        old, live = [{}, {}], [{}]
+        cache["old"] = old
+        cache["live"] = live
+        live.extend([{}, {}])  # transcript grows in place, as in append_message
+        cache.touch("live")
+
+        assert "old" not in cache
+        # The most recent entry survives even when it alone exceeds the bound.
+        live.extend([{}] * 10)
+        cache.touch("live")
+        assert list(cache) == ["live"]
+
+    def test_cache_message_count_is_kept_incrementally(self):
+        cache = ConversationCache(max_conversations=10, max_messages=100)
+        cache["a"] = [{}, {}]
+        cache["b"] = [{}]
+        cache["a"] = [{}]  # replaced, not added
+        cache["c"] = [{}] * 3
+        del cache["b"]
+        cache.pop("missing", None)
+        assert cache.total_messages() == 4
+
+        cache.pop("c")
+        assert cache.total_messages() == 1
+        cache.clear()
+        assert cache.total_messages() == 0
+
+    async def test_failed_flush_requeues_then_drops(self, isolated_writer, monkeypatch):
+        monkeypatch.setattr(consumers_module, "MESSAGE_FLUSH_MAX_ATTEMPTS", 2)
+        calls = []
+
+        def broken(batch):
+            calls.append(len(batch))
+            raise RuntimeError("db down")
+
+        monkeypatch.setattr(consumers_module, "persist_pending_messages", broken)
+        isolated_writer.enqueue(None, "conv", "user", "hello")
+
+        assert await isolated_writer.flush() == 0
+        assert [m.content for m in isolated_writer.pending] == ["hello"]
+        assert isolated_writer.dropped == 0
+
+        assert await isolated_writer.flush() == 0
+        assert isolated_writer.pending == []
+        assert isolated_writer.dropped == 1
+        assert calls == [1, 1]
+
+    async def test_conversation_flush_leaves_other_conversations_queued(self, isolated_writer, monkeypatch):
+        batches = []
+        monkeypatch.setattr(
+            consumers_module, "persist_pending_messages", lambda batch: batches.append(batch) or len(batch)
+        )
+        alice, bob = MagicMock(pk=1), MagicMock(pk=2)
+        isolated_writer.enqueue(alice, "conv", "user", "a1")
+        isolated_writer.enqueue(bob, "conv", "user", "b1")
+        isolated_writer.enqueue(alice, "other", "user", "a2")
+        isolated_writer.enqueue(alice, "conv", "assistant", "a3")
+
+        assert await isolated_writer.flush(alice, "conv") == 2
+        assert [[m.content for m in batch] for batch in batches] == [["a1", "a3"]]
+        assert [m.content for m in isolated_writer.pending] == ["b1", "a2"]
+
+        assert await isolated_writer.flush() == 2
+        assert isolated_writer.pending == []
+
+    @pytest.mark.django_db
+    def test_append_query_count_is_independent_of_transcript_length(self, test_user):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from swarm.models import ChatMessage
+
+        conv_id = "append-only-conv"
+        query_counts = []
+        for i in range(30):
+            turn = consumers_module.PendingMessage(test_user.pk, conv_id, "user", f"turn {i}")
+            with CaptureQueriesContext(connection) as ctx:
+                consumers_module.persist_pending_messages([turn])
+            query_counts.append(len(ctx.captured_queries))
+
+        contents = list(
+            ChatMessage.objects.filter(conversation__conversation_id=conv_id)
+            .order_by("timestamp", "pk")
+            .values_list("content", flat=True)
+        )
+        assert contents == [f"turn {i}" for i in range(30)]
+        assert query_counts[1] == query_counts[-1]
+
+    @pytest.mark.django_db
+    def test_append_refuses_other_users_conversation(self, test_user):
+        from django.contrib.auth import get_user_model
+
+        from swarm.models import ChatConversation, ChatMessage
+
+        attacker = get_user_model().objects.create_user(username="append-idor-attacker", password="x")
+        chat = ChatConversation.objects.create(conversation_id="owned-append", student=test_user)
+
+        written = consumers_module.persist_pending_messages(
+            [consumers_module.PendingMessage(attacker.pk, "owned-append", "user", "intrusion")]
+        )
+
+        assert written == 0
+        assert not ChatMessage.objects.filter(conversation=chat).exists()
+
+    @pytest.mark.asyncio
+    @pytest.mark.django_db(transaction=True)
+    async def test_turns_batch_and_rehydrate_after_eviction(self, test_user, isolated_writer):
+        from asgiref.sync import sync_to_async
+
+        from swarm.models import ChatMessage
+
+        consumers = []
+        for n in range(3):
+            c = DjangoChatConsumer()
+            c.user = test_user
+            c.conversation_id = f"batched-{n}"
+            c.messages = []
+            consumers.append(c)
+        for turn in range(2):
+            for c in consumers:
+                c.append_message("user", f"{c.conversation_id} q{turn}")
+                c.append_message("assistant", f"{c.conversation_id} a{turn}")
+
+        assert len(isolated_writer.pending) == 12
+        with patch.object(
+            consumers_module, "persist_pending_messages", wraps=consumers_module.persist_pending_messages
+        ) as mock_persist:
+            assert await isolated_writer.flush() == 12
+        # All conversations share one write-behind batch.
+        mock_persist.assert_called_once()
+        batched = ChatMessage.objects.filter(conversation__conversation_id__startswith="batched-")
+        assert await sync_to_async(batched.count)() == 12
+
+        # An evicted transcript is rehydrated from the DB in order.
+        IN_MEMORY_CONVERSATIONS.clear()
+        messages = await consumers[1].fetch_conversation("batched-1")
+        assert messages == consumers[1].messages
+
+
 # =============================================================================
 # Integration-style Tests with WebsocketCommunicator
 # =============================================================================
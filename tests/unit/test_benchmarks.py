@@ -0,0 +1,88 @@
+"""Benchmark suite plumbing: deterministic fakes, the runner and regression checks."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from benchmarks import suites  # noqa: E402,F401 - registers the benchmarks
+from benchmarks.compare import compare_results, has_failures  # noqa: E402
+from benchmarks.fakes import FakeCli, FakeLLMServer, fake_text  # noqa: E402
+from benchmarks.harness import REGISTRY, RESULT_SCHEMA, run_suite, summarize  # noqa: E402
+
+
+def _doc(**medians: float | str) -> dict:
+    results = {
+        name: {"error": value} if isinstance(value, str) else {"median": value}
+        for name, value in medians.items()
+    }
+    return {"schema": RESULT_SCHEMA, "results": results}
+
+
+def test_fake_cli_is_deterministic_and_can_fail(tmp_path: Path):
+    script = FakeCli(name="ok", latency=0.0, output_bytes=64, chunks=3, seed=7).write(tmp_path)
+    runs = [subprocess.run([str(script), "same prompt"], capture_output=True, text=True) for _ in range(2)]
+    assert runs[0].returncode == 0 and runs[0].stdout == runs[1].stdout
+    assert len(runs[0].stdout.strip()) == 64
+
+    failing = FakeCli(name="bad", latency=0.0, failure_rate=1.0).write(tmp_path)
+    out = subprocess.run([str(failing), "x"], capture_output=True, text=True)
+    assert out.returncode == 3 and "simulated failure" in out.stderr
+
+
+@pytest.mark.asyncio
+async def test_fake_llm_speaks_chat_completions():
+    from openai import AsyncOpenAI
+
+    with FakeLLMServer(ttft=0.0, token_delay=0.0, output_chars=80) as server:
+        client = AsyncOpenAI(base_url=server.base_url, api_key="sk-test")
+        messages = [{"role": "user", "content": "hi"}]
+        reply = await client.chat.completions.create(model="fake-model", messages=messages)
+        stream = await client.chat.completions.create(model="fake-model", messages=messages, stream=True)
+        streamed = "".join([c.choices[0].delta.content or "" async for c in stream if c.choices])
+        await client.close()
+    assert reply.choices[0].message.content == streamed
+    assert streamed == fake_text(0, json.dumps(messages, sort_keys=True), 80)
+    assert server.requests == 2
+
+
+def test_summarize_and_compare_flag_regressions():
+    stats = summarize([0.3, 0.1, 0.2])
+    assert (stats["n"], stats["min"], stats["median"], stats["max"]) == (3, 0.1, 0.2, 0.3)
+
+    rows = compare_results(
+        _doc(steady=0.100, slower=0.100, faster=0.100, tiny=0.0001, gone=0.1, broke=0.1),
+        _doc(steady=0.105, slower=0.150, faster=0.050, tiny=0.0005, new=0.2, broke="RuntimeError: x"),
+    )
+    status = {r.name: r.status for r in rows}
+    assert status == {
+        "broke": "error",
+        "faster": "improvement",
+        "gone": "missing",
+        "new": "new",
+        "slower": "regression",
+        "steady": "ok",
+        "tiny": "ok",  # 5x slower but under the 1 ms absolute floor
+    }
+    assert has_failures(rows)
+    assert not has_failures(compare_results(_doc(a=0.1), _doc(a=0.1)))
+
+
+def test_quick_run_produces_result_document(tmp_path: Path):
+    names = ["store.responses_ops", "fanout.moa_collect", "fanout.cli_single"]
+    assert set(names) <= set(REGISTRY)
+    doc = run_suite(names, workdir=tmp_path, quick=True)
+    assert doc["schema"] == RESULT_SCHEMA and list(doc["results"]) == names
+    for entry in doc["results"].values():
+        assert "error" not in entry, entry
+        assert entry["n"] >= 3 and 0 < entry["min"] <= entry["median"] <= entry["max"]
+    # Compared with itself, nothing regresses.
+    assert not has_failures(compare_results(doc, doc))
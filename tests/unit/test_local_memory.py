@@ -0,0 +1,149 @@
+"""Tests for the offline ``local`` memory backend and its ANN index."""
+from __future__ import annotations
+
+import operator
+import random
+import threading
+
+import pytest
+
+from swarm.memory import HashingEmbedder, LocalVectorMemory, get_memory_backend
+from swarm.memory.vector_index import (
+    TernaryIVFIndex,
+    code_score,
+    query_code,
+    ternary_code,
+)
+
+WORDS = [
+    "alpha", "river", "cloud", "banana", "teal", "deploy", "server", "kitchen", "python", "garden", "music",
+    "invoice", "travel", "budget", "coffee", "meeting", "report", "design", "cluster", "queue", "latency",
+    "storage", "backup", "release", "sprint", "ticket",
+]
+
+
+def _corpus(n: int, seed: int = 3) -> list[str]:
+    rng = random.Random(seed)
+    return [f"note {i}: " + " ".join(rng.choices(WORDS, k=rng.randint(4, 9))) for i in range(n)]
+
+
+def _memory(tmp_path, **config) -> LocalVectorMemory:
+    return LocalVectorMemory({"path": str(tmp_path / "mem.sqlite3"), **config})
+
+
+def test_hashing_embedder_is_deterministic_and_normalised():
+    emb = HashingEmbedder(dim=128)
+    a, b, c = emb.embed(["Deploy the server to the cluster", "deploying servers to clusters", "banana bread"])
+    assert emb.embed(["Deploy the server to the cluster"])[0] == a
+    assert len(a) == 128 and sum(x * x for x in a) == pytest.approx(1.0)
+    assert sum(map(operator.mul, a, b)) > sum(map(operator.mul, a, c))
+    assert not any(emb.embed([""])[0])
+
+
+def test_ternary_code_score_tracks_dot_product():
+    rng = random.Random(0)
+    q = [rng.gauss(0, 1) for _ in range(64)]
+    close = [x + rng.gauss(0, 0.3) for x in q]
+    far = [rng.gauss(0, 1) for _ in range(64)]
+    planes = query_code(q)
+    assert code_score(planes, *ternary_code(close)) > code_score(planes, *ternary_code(far))
+    assert ternary_code([]) == (0, 0)
+
+
+def test_add_search_filters_roles_users_and_duplicates(tmp_path):
+    mem = get_memory_backend({"backend": "local", "path": str(tmp_path / "mem.sqlite3")})
+    assert isinstance(mem, LocalVectorMemory)
+    mem.add(
+        [
+            {"role": "system", "content": "You are a helpful assistant"},
+            {"role": "user", "content": "My favourite colour is teal"},
+            {"role": "assistant", "content": "Noted, you like teal."},
+            {"role": "tool", "content": "teal teal teal"},
+        ],
+        user_id="alice",
+    )
+    mem.add("My favourite colour is teal", user_id="alice")  # duplicate
+    mem.add("The deployment runs on Kubernetes in eu-west-1", user_id="bob")
+    assert len(mem) == 3
+
+    assert mem.search("what colour do I like", user_id="alice") == [
+        "My favourite colour is teal", "Noted, you like teal.",
+    ]
+    assert mem.search("what colour do I like", user_id="bob") == []
+    assert mem.search("where is the deployment", user_id="bob") == [
+        "The deployment runs on Kubernetes in eu-west-1",
+    ]
+    assert mem.search("   ", user_id="alice") == []
+
+
+def test_add_many_and_reopen_from_disk(tmp_path):
+    mem = _memory(tmp_path)
+    mem.add_many([[{"role": "user", "content": text}] for text in _corpus(50)], user_id="u")
+    expected = mem.search("coffee budget meeting", user_id="u")
+    mem.close()
+
+    reopened = _memory(tmp_path)
+    assert len(reopened) == 50
+    assert reopened.search("coffee budget meeting", user_id="u") == expected
+
+
+def test_trained_index_recall_and_persisted_centroids(tmp_path, monkeypatch):
+    config = {"train_min": 300, "branching": 6, "probe_top": 3, "scan": 600, "rerank": 100, "min_score": -1}
+    mem = _memory(tmp_path, **config)
+    corpus = _corpus(1200)
+    mem.add_many(corpus, user_id="u")
+    assert mem.wait_for_training(30)
+    assert mem.index.trained and len(mem) == 1200
+
+    emb = mem.embedder
+    vectors = emb.embed(corpus)
+    recalls = []
+    for query in _corpus(20, seed=99):
+        q = emb.embed([query])[0]
+        exact = sorted(range(len(corpus)), key=lambda i: -sum(map(operator.mul, q, vectors[i])))[:5]
+        got = set(mem.search(query, user_id="u", limit=5))
+        recalls.append(len(got & {corpus[i] for i in exact}) / 5)
+    assert sum(recalls) / len(recalls) >= 0.8
+
+    mem.close()
+    monkeypatch.setattr(TernaryIVFIndex, "train", lambda *_a, **_k: pytest.fail("reopen must not retrain"))
+    reopened = _memory(tmp_path, **config)
+    assert reopened.index.trained
+    assert reopened.search(corpus[7], user_id="u", limit=1) == [corpus[7]]
+
+
+def test_training_runs_off_the_lock(tmp_path, monkeypatch):
+    gate = threading.Event()
+    train = TernaryIVFIndex.train
+
+    def gated_train(self, sample, **kwargs):
+        assert gate.wait(10)
+        train(self, sample, **kwargs)
+
+    monkeypatch.setattr(TernaryIVFIndex, "train", gated_train)
+    mem = _memory(tmp_path, train_min=100, branching=4, min_score=-1)
+    corpus = _corpus(150)
+    mem.add_many(corpus[:100], user_id="u")
+
+    # Training is parked: adds and searches still go through the old index.
+    mem.add_many(corpus[100:], user_id="u")
+    assert mem.search(corpus[120], user_id="u", limit=1) == [corpus[120]]
+    assert not mem.index.trained
+
+    gate.set()
+    assert mem.wait_for_training(30)
+    assert mem.index.trained and len(mem) == 150
+    assert mem.search(corpus[120], user_id="u", limit=1) == [corpus[120]]
+    mem.close()
+
+    reopened = _memory(tmp_path, train_min=100, branching=4, min_score=-1)
+    assert reopened.index.trained and len(reopened) == 150
+
+
+def test_embedder_change_reembeds_store(tmp_path):
+    mem = _memory(tmp_path, dim=64)
+    mem.add("quarterly budget review with finance", user_id="u")
+    mem.close()
+
+    reopened = LocalVectorMemory({"path": str(tmp_path / "mem.sqlite3")}, embedder=HashingEmbedder(dim=96))
+    assert reopened.search("budget review", user_id="u") == ["quarterly budget review with finance"]
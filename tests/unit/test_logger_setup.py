@@ -0,0 +1,185 @@
+import io
+import logging
+import queue
+import threading
+
+import pytest
+
+from swarm.utils import logger_setup
+from swarm.utils.logger_setup import (
+    RateLimitFilter,
+    SampleFilter,
+    apply_log_limits,
+    flush_queue_logging,
+    install_queue_logging,
+    parse_log_limits,
+    queue_logging_stats,
+    uninstall_queue_logging,
+)
+
+
+@pytest.fixture
+def captured():
+    """A private logger writing to a StringIO, with the pipeline torn down afterwards."""
+    stream = io.StringIO()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+    log = logging.getLogger("tests.logger_setup")
+    log.handlers[:] = [handler]
+    log.filters[:] = []
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+    yield log, handler, stream
+    uninstall_queue_logging()
+    log.handlers[:] = []
+    log.filters[:] = []
+
+
+def test_queue_writes_on_listener_thread(captured):
+    log, handler, stream = captured
+    threads = []
+    handler.emit = lambda record, _emit=handler.emit: (threads.append(threading.current_thread().name), _emit(record))
+    install_queue_logging([log])
+
+    log.debug("chunk %d of %s", 3, "stream")
+
+    assert flush_queue_logging()
+    assert stream.getvalue() == "DEBUG chunk 3 of stream\n"
+    assert threads == ["swarm-log-writer"]
+
+
+def test_handler_levels_are_respected(captured):
+    log, handler, stream = captured
+    handler.setLevel(logging.WARNING)
+    debug_stream = io.StringIO()
+    log.addHandler(logging.StreamHandler(debug_stream))
+    install_queue_logging([log])
+
+    log.info("only the debug handler")
+    log.warning("both")
+
+    assert flush_queue_logging()
+    assert stream.getvalue() == "WARNING both\n"
+    assert debug_stream.getvalue() == "only the debug handler\nboth\n"
+
+
+def test_mutable_args_are_merged_at_the_call(captured):
+    log, _, stream = captured
+    install_queue_logging([log])
+    state = {"n": 1}
+
+    log.debug("state=%s", state)
+    state["n"] = 2
+
+    assert flush_queue_logging()
+    assert stream.getvalue() == "DEBUG state={'n': 1}\n"
+
+
+def test_exceptions_are_rendered_at_the_call(captured):
+    log, handler, stream = captured
+    records = []
+    handler.emit = lambda record, _emit=handler.emit: (records.append(record), _emit(record))
+    install_queue_logging([log])
+
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        log.exception("failed")
+
+    assert flush_queue_logging()
+    assert records[0].exc_info is None and "RuntimeError: boom" in records[0].exc_text
+    assert stream.getvalue().startswith("ERROR failed\nTraceback (most recent call last):")
+    assert stream.getvalue().rstrip().endswith("RuntimeError: boom")
+
+
+def test_call_site_filter_is_abstract():
+    with pytest.raises(TypeError):
+        logger_setup._CallSiteFilter()
+
+
+def test_uninstall_restores_handlers(captured):
+    log, handler, stream = captured
+    before = list(log.handlers)
+    install_queue_logging([log])
+    assert handler not in log.handlers
+
+    uninstall_queue_logging()
+    log.debug("direct")
+
+    assert log.handlers == before
+    assert stream.getvalue() == "DEBUG direct\n"
+    assert not queue_logging_stats()["installed"]
+
+
+def test_full_queue_drops_debug_and_reports_it(captured, monkeypatch):
+    log, _, stream = captured
+    install_queue_logging([log], maxsize=10)
+    pipeline = logger_setup._pipeline
+    qh = log.handlers[0]
+    blocked = queue.Queue(maxsize=1)
+    blocked.put_nowait(None)
+    monkeypatch.setattr(qh, "queue", blocked)
+
+    log.debug("lost one")
+    log.debug("lost two")
+    assert pipeline.dropped_total == 2
+
+    monkeypatch.setattr(qh, "queue", pipeline.queue)
+    log.debug("after")
+
+    assert flush_queue_logging()
+    assert stream.getvalue() == "DEBUG after\nWARNING 2 log records dropped: logging queue full\n"
+
+
+def test_rate_limit_filter_suppresses_and_reports(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(logger_setup.time, "monotonic", lambda: now[0])
+    flt = RateLimitFilter(rate=2, burst=2)
+
+    def record(msg="hot %d", args=(1,), level=logging.DEBUG):
+        return logging.LogRecord("x", level, "hot.py", 10, msg, args, None)
+
+    assert [flt.filter(record()) for _ in range(5)] == [True, True, False, False, False]
+    assert flt.filter(record(level=logging.WARNING))
+
+    now[0] += 0.5
+    passed = record()
+    assert flt.filter(passed)
+    assert passed.getMessage() == "hot 1 [3 similar suppressed]"
+
+
+def test_rate_limit_is_per_call_site():
+    flt = RateLimitFilter(rate=1, burst=1)
+    a = logging.LogRecord("x", logging.DEBUG, "hot.py", 10, "a", None, None)
+    b = logging.LogRecord("x", logging.DEBUG, "hot.py", 11, "b", None, None)
+    assert flt.filter(a) and flt.filter(b)
+    assert not flt.filter(a)
+
+
+def test_sample_filter_keeps_one_in_n():
+    flt = SampleFilter(every=3)
+    rec = logging.LogRecord("x", logging.DEBUG, "hot.py", 10, "m", None, None)
+    assert [flt.filter(rec) for _ in range(7)] == [True, False, False, True, False, False, True]
+    assert flt.filter(logging.LogRecord("x", logging.INFO, "hot.py", 10, "m", None, None))
+
+
+def test_parse_log_limits():
+    limits = parse_log_limits("a.b=25/s, c=1/10")
+    assert isinstance(limits["a.b"], RateLimitFilter) and limits["a.b"].rate == 25
+    assert isinstance(limits["c"], SampleFilter) and limits["c"].every == 10
+    with pytest.raises(ValueError):
+        parse_log_limits("a.b=fast")
+
+
+def test_apply_log_limits_replaces_and_turns_off():
+    name = "tests.logger_setup.limited"
+    try:
+        apply_log_limits(f"{name}=5/s")
+        apply_log_limits(f"{name}=1/4")
+        filters = logging.getLogger(name).filters
+        assert len(filters) == 1 and isinstance(filters[0], SampleFilter)
+
+        apply_log_limits("off")
+        assert logging.getLogger(name).filters == []
+    finally:
+        apply_log_limits("off")
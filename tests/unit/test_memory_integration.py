@@ -7,11 +7,28 @@ import sys
 import pytest
 
 from swarm.core.blueprint_base import BlueprintBase
-from swarm.memory import MemoryBackend, get_memory_backend
+from swarm.memory import (
+    MEMORY_QUERY_CACHE,
+    AsyncMemoryBackend,
+    BaseMemory,
+    MemoryBackend,
+    MemoryQueryCache,
+    MemoryWriteBehind,
+    asearch_memory,
+    flush_memory_writes,
+    get_memory_backend,
+)
 
 
 # --- Helpers -----------------------------------------------------------------
 
+@pytest.fixture(autouse=True)
+def _clear_memory_query_cache():
+    MEMORY_QUERY_CACHE.clear()
+    yield
+    MEMORY_QUERY_CACHE.clear()
+
+
 class FakeMemoryBackend:
     """In-memory backend implementing the MemoryBackend protocol."""
 
@@ -35,7 +52,7 @@ class EchoBlueprint(BlueprintBase):
         self.seen_messages = None
         super().__init__(*args, **kwargs)
 
-    async def run(self, messages, **kwargs):
+    async def run(self, messages, **_kwargs):
         self.seen_messages = messages
         yield {"messages": [{"role": "assistant", "content": "hello back"}]}
 
@@ -87,7 +104,7 @@ def test_noop_with_memory_block_missing_backend_key():
 
 def test_memory_injected_and_stored_with_top_level_config(monkeypatch):
     fake = FakeMemoryBackend(memories=["User likes green tea"])
-    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda cfg, options=None: fake)
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: fake)
     cfg = base_config({"memory": {"backend": "fake", "user_id": "alice"}})
     bp = EchoBlueprint("echo_bp", config=cfg)
     assert bp.memory_backend is fake
@@ -102,7 +119,8 @@ def test_memory_injected_and_stored_with_top_level_config(monkeypatch):
     assert "User likes green tea" in bp.seen_messages[0]["content"]
     assert bp.seen_messages[1:] == messages
 
-    # (c) post-run storage called with user input + assistant output
+    # (c) post-run storage queued with user input + assistant output
+    assert flush_memory_writes(timeout=5)
     assert len(fake.add_calls) == 1
     stored, user_id = fake.add_calls[0]
     assert user_id == "alice"
@@ -114,7 +132,7 @@ def test_memory_injected_and_stored_with_top_level_config(monkeypatch):
 
 def test_memory_enabled_via_per_blueprint_config(monkeypatch):
     fake = FakeMemoryBackend()
-    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda cfg, options=None: fake)
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: fake)
     cfg = base_config()
     cfg["blueprints"] = {"echo_bp": {"memory": {"backend": "fake"}}}
     bp = EchoBlueprint("echo_bp", config=cfg)
@@ -122,12 +140,13 @@ def test_memory_enabled_via_per_blueprint_config(monkeypatch):
     # default user id used when none configured
     collect(bp.run([{"role": "user", "content": "hello"}]))
     assert fake.search_calls == [("hello", "default")]
+    assert flush_memory_writes(timeout=5)
     assert fake.add_calls and fake.add_calls[0][1] == "default"
 
 
 def test_no_injection_when_search_returns_nothing(monkeypatch):
     fake = FakeMemoryBackend(memories=[])
-    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda cfg, options=None: fake)
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: fake)
     cfg = base_config({"memory": {"backend": "fake"}})
     bp = EchoBlueprint("echo_bp", config=cfg)
     messages = [{"role": "user", "content": "hello"}]
@@ -137,14 +156,14 @@ def test_no_injection_when_search_returns_nothing(monkeypatch):
 
 def test_backend_errors_do_not_break_run(monkeypatch):
     class ExplodingBackend:
-        def search(self, query, user_id="default"):
+        def search(self, *_args, **_kwargs):
             raise RuntimeError("search boom")
 
-        def add(self, messages, user_id="default"):
+        def add(self, *_args, **_kwargs):
             raise RuntimeError("add boom")
 
     monkeypatch.setattr(
-        "swarm.memory.get_memory_backend", lambda cfg, options=None: ExplodingBackend()
+        "swarm.memory.get_memory_backend", lambda *_args, **_kwargs: ExplodingBackend()
     )
     cfg = base_config({"memory": {"backend": "fake"}})
     bp = EchoBlueprint("echo_bp", config=cfg)
@@ -152,6 +171,7 @@ def test_backend_errors_do_not_break_run(monkeypatch):
     chunks = collect(bp.run(messages))  # must not raise
     assert chunks == [{"messages": [{"role": "assistant", "content": "hello back"}]}]
     assert bp.seen_messages == messages
+    assert flush_memory_writes(timeout=5)  # the failed add is logged on the writer thread
 
 
 # --- (d) Graceful fallback when mem0 is not installed --------------------------
@@ -206,3 +226,419 @@ def test_placeholder_backends_disabled_and_raise():
 
 def test_fake_backend_satisfies_protocol():
     assert isinstance(FakeMemoryBackend(), MemoryBackend)
+
+
+# --- Async protocol + write-behind ----------------------------------------------
+
+class SlowMemory(BaseMemory):
+    """BaseMemory with blocking sync calls, to check nothing runs on the loop."""
+
+    def __init__(self, delay=0.3):
+        self.delay = delay
+        self.batches = []
+        self.search_threads = []
+
+    def add(self, messages, user_id="default", _metadata=None):
+        self.add_many([messages], user_id=user_id)
+
+    def add_many(self, conversations, user_id="default"):
+        import time
+
+        time.sleep(self.delay)
+        self.batches.append((list(conversations), user_id))
+
+    def search(self, *_args, **_kwargs):
+        import threading
+        import time
+
+        self.search_threads.append(threading.current_thread().name)
+        time.sleep(self.delay / 3)
+        return ["remembered fact"]
+
+
+def test_base_memory_async_defaults_run_off_the_loop():
+    import threading
+
+    backend = SlowMemory(delay=0.3)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        found = await backend.asearch("q", user_id="u")
+        await backend.aadd("note", user_id="u")
+        task.cancel()
+        return found, ticks
+
+    found, ticks = asyncio.run(main())
+    assert found == ["remembered fact"]
+    assert backend.batches == [(["note"], "u")]
+    assert backend.search_threads[0] != threading.main_thread().name
+    assert ticks >= 10  # the loop kept running while the backend blocked
+
+
+def test_asearch_memory_handles_protocol_only_backends():
+    import threading
+
+    class ThreadRecordingBackend(FakeMemoryBackend):
+        def search(self, query, user_id="default"):
+            self.thread = threading.current_thread()
+            return super().search(query, user_id)
+
+    plain = ThreadRecordingBackend(["plain fact"])
+    assert not isinstance(plain, AsyncMemoryBackend)
+    assert asyncio.run(asearch_memory(plain, "q", user_id="u")) == ["plain fact"]
+    assert plain.search_calls == [("q", "u")]
+    assert plain.thread is not threading.main_thread()
+
+    slow = SlowMemory(delay=0.03)
+    assert isinstance(slow, AsyncMemoryBackend)
+    assert asyncio.run(asearch_memory(slow, "q", user_id="u")) == ["remembered fact"]
+
+
+def test_prefetch_awaits_a_native_async_backend(monkeypatch):
+    import threading
+
+    class NativeAsyncBackend:
+        """Async-only client: no sync search at all."""
+
+        def __init__(self):
+            self.threads = []
+
+        async def asearch(self, query, user_id="default", _limit=None):
+            self.threads.append(threading.current_thread())
+            return [f"async fact for {user_id}: {query}"]
+
+        async def aadd(self, *_args, **_kwargs):
+            return None
+
+        def add(self, *_args, **_kwargs):
+            return None
+
+    backend = NativeAsyncBackend()
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: backend)
+    bp = EchoBlueprint("echo_bp", config=base_config({"memory": {"backend": "native", "deadline_ms": 2000}}))
+    collect(bp.run([{"role": "user", "content": "tea?"}], user_id="u"))
+
+    assert bp.seen_messages[0]["content"].endswith("- async fact for u: tea?")
+    assert backend.threads == [threading.main_thread()]  # awaited on the loop, not the search pool
+
+    from swarm.memory import asearch_cached
+
+    assert asyncio.run(asearch_cached(backend, "ns", "u", "coffee?")) == ["async fact for u: coffee?"]
+    assert MEMORY_QUERY_CACHE.get("ns", "u", "coffee?", 60) == ["async fact for u: coffee?"]
+
+
+def test_mem0_async_methods_run_the_client_on_a_worker_thread(monkeypatch):
+    import threading
+    import types
+
+    from swarm.memory import Mem0Memory
+
+    calls = []
+
+    class FakeMem0Client:
+        def add(self, messages, user_id, metadata):
+            calls.append(("add", messages, user_id, metadata, threading.current_thread()))
+
+        def search(self, query, user_id, limit):
+            calls.append(("search", query, user_id, limit, threading.current_thread()))
+            return {"results": [{"memory": "likes tea"}]}
+
+    fake_mem0 = types.ModuleType("mem0")
+    fake_mem0.Memory = FakeMem0Client
+    monkeypatch.setitem(sys.modules, "mem0", fake_mem0)
+    backend = Mem0Memory({"backend": "mem0", "limit": 3})
+
+    async def main():
+        found = await backend.asearch("drinks?", user_id="u")
+        await backend.aadd("prefers tea", metadata={"user_id": "u2"})
+        return found
+
+    assert asyncio.run(main()) == ["likes tea"]
+    assert [c[:4] for c in calls] == [
+        ("search", "drinks?", "u", 3),
+        ("add", "prefers tea", "u2", {"user_id": "u2"}),
+    ]
+    assert all(c[4] is not threading.main_thread() for c in calls)
+
+
+@pytest.mark.parametrize("backend_name", ["langmem", "papr"])
+def test_placeholder_backends_async_methods_raise(backend_name):
+    from swarm.memory import LangmemMemory, PaprMemory
+
+    cls = {"langmem": LangmemMemory, "papr": PaprMemory}[backend_name]
+    backend = cls.__new__(cls)  # __init__ refuses: the backend is a placeholder
+    with pytest.raises(NotImplementedError):
+        asyncio.run(backend.asearch("q"))
+    with pytest.raises(NotImplementedError):
+        asyncio.run(backend.aadd("note"))
+
+
+def test_store_does_not_delay_stream_completion(monkeypatch):
+    import time
+
+    backend = SlowMemory(delay=0.5)
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: backend)
+    bp = EchoBlueprint("echo_bp", config=base_config({"memory": {"backend": "slow", "user_id": "bob"}}))
+
+    start = time.perf_counter()
+    chunks = collect(bp.run([{"role": "user", "content": "hi"}]))
+    elapsed = time.perf_counter() - start
+
+    assert chunks == [{"messages": [{"role": "assistant", "content": "hello back"}]}]
+    assert elapsed < 0.45  # search (0.17s) only; the 0.5s add happens in the background
+    assert "remembered fact" in bp.seen_messages[0]["content"]
+    assert flush_memory_writes(timeout=5)
+    assert backend.batches[-1][1] == "bob"
+
+
+def test_write_behind_batches_per_backend_and_user():
+    import threading
+
+    gate, busy = threading.Event(), threading.Event()
+
+    class GatedMemory(SlowMemory):
+        def add_many(self, conversations, user_id="default"):
+            busy.set()
+            gate.wait(5)
+            self.batches.append((list(conversations), user_id))
+
+    a, b = GatedMemory(), GatedMemory()
+    writer = MemoryWriteBehind(max_queue=100, max_batch=10)
+    writer.submit(a, "first", "u1")
+    assert busy.wait(5)  # the worker holds "first" while the rest queue up
+    for item in [(a, "a1", "u1"), (a, "a2", "u1"), (b, "b1", "u1"), (a, "a3", "u2")]:
+        writer.submit(*item)
+    gate.set()
+    assert writer.flush(timeout=5)
+
+    assert a.batches[1:] == [(["a1", "a2"], "u1"), (["a3"], "u2")]
+    assert b.batches == [(["b1"], "u1")]
+    assert writer.written == 5 and writer.pending == 0
+
+
+def test_write_behind_is_bounded_and_survives_errors():
+    import threading
+
+    gate = threading.Event()
+
+    class Stuck:
+        def add(self, *_args, **_kwargs):
+            gate.wait(5)
+            raise RuntimeError("backend down")
+
+    writer = MemoryWriteBehind(max_queue=2, max_batch=1)
+    results = [writer.submit(Stuck(), f"m{i}") for i in range(5)]
+    # One write in flight, two queued, the rest dropped instead of blocking.
+    assert results.count(False) >= 2 and writer.dropped == results.count(False)
+    gate.set()
+    assert writer.flush(timeout=5)
+    assert writer.failed == results.count(True)
+    assert writer.submit(Stuck(), "after") is True  # worker still alive
+    assert writer.flush(timeout=5)
+
+
+# --- Retrieval overlap, deadline and query cache ----------------------------------
+
+def test_retrieval_overlaps_prepare_run(monkeypatch):
+    import time
+
+    backend = SlowMemory(delay=3.0)  # search takes 1s
+
+    class SlowSetupBlueprint(EchoBlueprint):
+        async def prepare_run(self, _messages, **_kwargs):
+            await asyncio.sleep(1.0)
+
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: backend)
+    bp = SlowSetupBlueprint("echo_bp", config=base_config({"memory": {"backend": "slow", "deadline_ms": 2000}}))
+
+    start = time.perf_counter()
+    collect(bp.run([{"role": "user", "content": "hi"}]))
+    elapsed = time.perf_counter() - start
+
+    assert "remembered fact" in bp.seen_messages[0]["content"]
+    assert elapsed < 1.6  # max(setup, search), not their sum
+
+
+class AgentBuildingBlueprint(EchoBlueprint):
+    """Builds its starting agent synchronously and slowly, like the agent blueprints."""
+
+    prebuild_starting_agent = True
+    delay = 1.0
+
+    def __init__(self, *args, **kwargs):
+        self.built = []
+        self.run_agent = None
+        super().__init__(*args, **kwargs)
+
+    def create_starting_agent(self, mcp_servers):
+        import time
+
+        time.sleep(self.delay)
+        agent = object()
+        self.built.append((mcp_servers, agent))
+        return agent
+
+    async def run(self, messages, **kwargs):
+        self.run_agent = self.starting_agent(kwargs.get("mcp_servers"))
+        async for chunk in super().run(messages, **kwargs):
+            yield chunk
+
+
+def test_starting_agent_is_built_during_retrieval(monkeypatch):
+    import time
+
+    backend = SlowMemory(delay=3.0)  # search takes 1s
+    backend.add_many = lambda *_args, **_kwargs: None  # keep the shared writer free
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: backend)
+    bp = AgentBuildingBlueprint("echo_bp", config=base_config({"memory": {"backend": "slow", "deadline_ms": 2000}}))
+
+    start = time.perf_counter()
+    collect(bp.run([{"role": "user", "content": "hi"}]))
+    elapsed = time.perf_counter() - start
+
+    assert "remembered fact" in bp.seen_messages[0]["content"]
+    assert len(bp.built) == 1
+    assert bp.run_agent is bp.built[0][1]  # run() used the prepared agent
+    assert elapsed < 1.6  # agent construction overlapped the search
+    assert bp._prepared_agent is None
+
+
+def test_starting_agent_is_not_prebuilt_without_opt_in(monkeypatch):
+    class NoPrebuild(AgentBuildingBlueprint):
+        prebuild_starting_agent = False
+        delay = 0
+
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: FakeMemoryBackend())
+    bp = NoPrebuild("echo_bp", config=base_config({"memory": {"backend": "fake"}}))
+    collect(bp.run([{"role": "user", "content": "hi"}]))
+
+    assert len(bp.built) == 1  # built once, by run() itself
+
+
+def test_unused_prepared_agent_is_dropped_when_the_run_ends(monkeypatch):
+    class IgnoresPrepared(AgentBuildingBlueprint):
+        delay = 0
+
+        async def run(self, messages, **kwargs):
+            async for chunk in EchoBlueprint.run(self, messages, **kwargs):
+                yield chunk
+
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: FakeMemoryBackend())
+    bp = IgnoresPrepared("echo_bp", config=base_config({"memory": {"backend": "fake"}}))
+    collect(bp.run([{"role": "user", "content": "hi"}]))
+
+    assert len(bp.built) == 1
+    assert bp._prepared_agent is None
+
+
+def test_starting_agent_builds_fresh_without_a_matching_prepared_agent():
+    bp = AgentBuildingBlueprint("echo_bp", config=base_config({}))
+    bp.delay = 0
+    bp._prepared_agent = (["other-server"], "stale")
+
+    assert bp.starting_agent([]) is bp.built[-1][1]
+    assert bp._prepared_agent is None  # a prepared agent is handed over at most once
+    assert bp.starting_agent() is bp.built[-1][1]
+    assert len(bp.built) == 2
+
+
+def test_deadline_skips_memory_and_late_result_warms_cache(monkeypatch):
+    import time
+
+    backend = SlowMemory(delay=3.0)  # search takes 1s
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: backend)
+    cfg = base_config({"memory": {"backend": "slow", "deadline_ms": 50}})
+    messages = [{"role": "user", "content": "What did I   say?"}]
+
+    bp = EchoBlueprint("echo_bp", config=cfg)
+    start = time.perf_counter()
+    collect(bp.run(messages))
+    assert time.perf_counter() - start < 0.8
+    assert bp.seen_messages == messages  # ran without memory context
+
+    deadline = time.monotonic() + 5
+    while len(MEMORY_QUERY_CACHE) == 0 and time.monotonic() < deadline:
+        time.sleep(0.02)
+    fresh = EchoBlueprint("echo_bp", config=cfg)  # new instance, as per API request
+    assert fresh.inject_memory_context([{"role": "user", "content": "what did i say?"}])[0]["content"].endswith(
+        "- remembered fact"
+    )
+    assert len(backend.search_threads) == 1  # served from the cache
+
+
+def test_query_cache_normalises_and_is_invalidated_by_store(monkeypatch):
+    fake = FakeMemoryBackend(memories=["User likes green tea"])
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: fake)
+    bp = EchoBlueprint("echo_bp", config=base_config({"memory": {"backend": "fake", "user_id": "alice"}}))
+
+    bp.inject_memory_context([{"role": "user", "content": "Green  tea?"}])
+    bp.inject_memory_context([{"role": "user", "content": "green tea?"}])
+    bp.inject_memory_context([{"role": "user", "content": "green tea?"}], user_id="bob")
+    assert [q for q, _ in fake.search_calls] == ["Green  tea?", "green tea?"]  # alice hit, bob missed
+
+    bp.store_run_memory([{"role": "user", "content": "I now prefer coffee"}])
+    assert flush_memory_writes(timeout=5)
+    bp.inject_memory_context([{"role": "user", "content": "green tea?"}])
+    assert len(fake.search_calls) == 3
+
+
+def test_search_racing_a_store_does_not_recache_stale_results(monkeypatch):
+    import threading
+
+    searching, release = threading.Event(), threading.Event()
+
+    class RacyMemory(FakeMemoryBackend):
+        def search(self, query, user_id="default"):
+            result = super().search(query, user_id)
+            searching.set()
+            assert release.wait(5)
+            return result
+
+        def add(self, messages, user_id="default"):
+            super().add(messages, user_id)
+            self.memories = ["User now prefers coffee"]
+
+    racy = RacyMemory(memories=["User likes green tea"])
+    monkeypatch.setattr("swarm.memory.get_memory_backend", lambda *_args, **_kwargs: racy)
+    bp = EchoBlueprint("echo_bp", config=base_config({"memory": {"backend": "racy", "user_id": "alice"}}))
+    messages = [{"role": "user", "content": "what do I drink?"}]
+
+    async def main():
+        pending = bp.prefetch_memory(messages)
+        assert await asyncio.to_thread(searching.wait, 5)
+        # The conversation lands while the search above is still in flight.
+        bp.store_run_memory([{"role": "user", "content": "I now prefer coffee"}])
+        assert await asyncio.to_thread(flush_memory_writes, 5)
+        release.set()
+        return await pending
+
+    assert asyncio.run(main()) == ["User likes green tea"]
+    assert MEMORY_QUERY_CACHE.get(bp._memory_namespace, "alice", messages[0]["content"]) is None
+    assert bp.inject_memory_context(messages)[0]["content"].endswith("- User now prefers coffee")
+
+
+def test_memory_query_cache_ttl_and_lru():
+    cache = MemoryQueryCache(max_entries=2)
+    cache.put("ns", "u", "a", ["1"])
+    cache.put("ns", "u", "b", ["2"])
+    assert cache.get("ns", "u", " A ") == ["1"]
+    cache.put("ns", "u", "c", ["3"])  # evicts "b", the least recently used
+    assert cache.get("ns", "u", "b") is None
+    assert cache.get("ns", "u", "a", ttl=0) is None
+    cache.invalidate("ns", "u")
+    assert len(cache) == 0
+
+    stale = cache.generation("ns", "u")
+    cache.invalidate("ns", "u")
+    cache.put("ns", "u", "a", ["old"], stale)
+    cache.put("ns", "other", "a", ["theirs"], cache.generation("ns", "other"))
+    assert cache.get("ns", "u", "a") is None
+    assert cache.get("ns", "other", "a") == ["theirs"]
@@ -30,3 +30,111 @@ def test_redact_custom_sensitive_keys_override_defaults():
     assert redacted["token"] == "tkn-should-stay"
     assert redacted["note"] == "public"
 
+
+
+def _segment_reference(key, keys):
+    """The original split-and-loop is_sensitive_key, for equivalence checks."""
+    kl = key.lower().replace("-", "_")
+    if kl in keys:
+        return True
+    parts = [p for p in kl.split("_") if p]
+    for sk in keys:
+        sk_parts = [p for p in sk.split("_") if p]
+        n = len(sk_parts)
+        if n and any(parts[i : i + n] == sk_parts for i in range(len(parts) - n + 1)):
+            return True
+    return False
+
+
+def test_compiled_matcher_agrees_with_segment_matching():
+    import itertools
+
+    from swarm.utils.redact import _DEFAULT_SENSITIVE_KEYS_LOWER, is_sensitive_key
+
+    words = ["api", "key", "token", "OPENAI", "access", "id", "my", "tokenized", "secret", "client", "url", "dsn", "", "x.y"]
+    custom = {"user_name", "a__b", "x.y"}
+    for n in (1, 2, 3):
+        for combo in itertools.product(words, repeat=n):
+            for sep in ("_", "-", "__"):
+                key = sep.join(combo)
+                assert is_sensitive_key(key) == _segment_reference(key, _DEFAULT_SENSITIVE_KEYS_LOWER), key
+                assert is_sensitive_key(key, custom) == _segment_reference(key, custom), key
+
+
+def test_untouched_subtrees_are_shared_and_depth_is_unbounded():
+    import pytest
+
+    clean = {"model": "gpt", "nested": {"a": [1, 2, {"b": "plain"}]}}
+    assert redact_sensitive_data(clean) is clean
+
+    data = {"public": {"x": [1, 2]}, "private": {"db": {"password": "p"}}, "items": ["ok", "sk-abc123"]}
+    out = redact_sensitive_data(data)
+    assert out is not data and out["public"] is data["public"]
+    assert out["private"]["db"] == {"password": "[REDACTED]"} and data["private"]["db"]["password"] == "p"
+    assert out["items"] == ["ok", "[REDACTED]"] and data["items"][1] == "sk-abc123"
+
+    deep = {"token": "t"}
+    for _ in range(5000):  # far past the recursion limit
+        deep = {"child": [deep]}
+    out = redact_sensitive_data(deep)
+    for _ in range(5000):
+        out = out["child"][0]
+    assert out == {"token": "[REDACTED]"}
+
+    loop = {"a": []}
+    loop["a"].append(loop)
+    with pytest.raises(ValueError):
+        redact_sensitive_data(loop)
+
+
+def _stream(redactor, text: str, sizes) -> str:
+    out, i = [], 0
+    for size in sizes:
+        out.append(redactor.feed(text[i:i + size]))
+        i += size
+    out.append(redactor.feed(text[i:]))
+    return "".join(out) + redactor.flush()
+
+
+def test_stream_redactor_matches_whole_text_for_any_split():
+    import random
+
+    from swarm.utils.redact import StreamRedactor, redact_text
+
+    pieces = ["hello ", "sk-abcDEF123 ", "password = hunter2 ", "password\n=\tx ", "Bearer abc.def-ghi ",
+              "ssh-rsa AAAAB3Nza== ", "postgres://u:pw@db/x ", "passwordless ", "Bear ", "\n", "mypassword=1 "]
+    rng = random.Random(0)
+    for _ in range(500):
+        text = "".join(rng.choice(pieces) for _ in range(rng.randint(1, 20)))
+        sizes = [rng.randint(1, 12) for _ in range(len(text))]
+        assert _stream(StreamRedactor(window=64), text, sizes) == redact_text(text), text
+
+
+def test_stream_redactor_holds_only_what_may_still_be_a_secret():
+    from swarm.utils.redact import StreamRedactor
+
+    r = StreamRedactor()
+    assert r.feed("ok here is sk-ab") == "ok here is "
+    assert r.pending == "sk-ab"
+    assert r.feed("c123 and Bearer ") == "[REDACTED] and "
+    assert r.feed("tok.en") == ""
+    assert r.feed("\nbye") == "[REDACTED]\n"
+    assert r.flush() == "bye" and r.pending == ""
+
+
+def test_stream_redactor_window_bounds_held_text():
+    import pytest
+
+    from swarm.utils.redact import StreamRedactor
+
+    with pytest.raises(ValueError):
+        StreamRedactor(window=0)
+    r = StreamRedactor(window=16)
+    out = []
+    for ch in "x" * 100:
+        out.append(r.feed(ch))
+        assert len(r.pending) <= 16
+    assert "".join(out) + r.flush() == "x" * 100
+    # A secret still open at the bound is masked through to the end of its run.
+    r = StreamRedactor(window=16)
+    assert _stream(r, "a sk-" + "k" * 40 + " tail", [1] * 50) == "a [REDACTED] tail"
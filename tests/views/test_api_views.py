@@ -635,22 +635,24 @@ class TestMarketplaceGitHubBlueprintsView:
         assert "error" in response.json()
 
     @patch("swarm.views.api_views.ENABLE_GITHUB_MARKETPLACE", True)
-    @patch("swarm.views.api_views.gh_service.fetch_repo_manifests", return_value=[])
+    @patch("swarm.views.api_views.gh_service.fetch_repos_manifests", return_value=[[{"name": "demo"}]])
     @patch("swarm.views.api_views.gh_service.search_repos_by_topics")
-    def test_list_github_blueprints_happy_path(self, mock_search, _mock_manifests, api_client):
-        """Successful search still returns 200 list payload."""
-        mock_search.return_value = [{"full_name": "o/r", "html_url": "https://github.com/o/r"}]
+    def test_list_github_blueprints_happy_path(self, mock_search, mock_manifests, api_client):
+        """Successful search returns one marketplace item per manifest, per repo."""
+        repos = [{"full_name": "o/r", "html_url": "https://github.com/o/r"}]
+        mock_search.return_value = repos
         response = api_client.get("/marketplace/github/blueprints/")
 
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         assert data["object"] == "list"
-        assert data["data"] == []
+        assert [(it["repo_full_name"], it["name"]) for it in data["data"]] == [("o/r", "demo")]
+        assert mock_manifests.call_args.args[0] == repos
 
     @patch("swarm.views.api_views.ENABLE_GITHUB_MARKETPLACE", True)
     @patch("swarm.views.api_views.GITHUB_MARKETPLACE_ORG_ALLOWLIST", ["allowed-org"])
     @patch("swarm.views.api_views.GITHUB_MARKETPLACE_TOPICS", ["open-swarm-blueprint"])
-    @patch("swarm.views.api_views.gh_service.fetch_repo_manifests", return_value=[])
+    @patch("swarm.views.api_views.gh_service.fetch_repos_manifests", return_value=[])
     @patch("swarm.views.api_views.gh_service.search_repos_by_topics")
     def test_allowlisted_org_ok(self, mock_search, _mock_manifests, api_client):
         """Allowlisted org query param is accepted and passed to search."""
@@ -729,7 +731,7 @@ class TestMarketplaceGitHubMCPConfigsView:
     @patch("swarm.views.api_views.ENABLE_GITHUB_MARKETPLACE", True)
     @patch("swarm.views.api_views.GITHUB_MARKETPLACE_ORG_ALLOWLIST", ["allowed-org"])
     @patch("swarm.views.api_views.GITHUB_MARKETPLACE_TOPICS", ["open-swarm-mcp-template"])
-    @patch("swarm.views.api_views.gh_service.fetch_repo_manifests", return_value=[])
+    @patch("swarm.views.api_views.gh_service.fetch_repos_manifests", return_value=[])
     @patch("swarm.views.api_views.gh_service.search_repos_by_topics")
     def test_allowlisted_org_ok(self, mock_search, _mock_manifests, api_client):
         """Allowlisted org query param is accepted for MCP configs."""